@@ -0,0 +1,120 @@
+"""
+API 공용 의존성
+
+LangGraph 워크플로우는 동기 함수(Supabase/Bedrock/ChromaDB 블로킹 호출)이므로
+async 라우트에서 직접 호출하면 이벤트 루프 전체가 40~60초 동안 멈춥니다.
+워크플로우는 전용 스레드 풀에서 실행하고, 풀 크기로 동시 실행 수를 제한합니다.
+"""
+
+import os
+import json
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict
+
+from fastapi.responses import StreamingResponse
+
+# 동시에 실행할 수 있는 워크플로우 수 (초과 요청은 풀 큐에서 대기)
+WORKFLOW_MAX_CONCURRENCY = int(os.getenv('WORKFLOW_MAX_CONCURRENCY', '4'))
+
+# 워크플로우 전용 스레드 풀
+workflow_executor = ThreadPoolExecutor(
+    max_workers=WORKFLOW_MAX_CONCURRENCY,
+    thread_name_prefix='workflow'
+)
+
+
+async def run_workflow(fn: Callable[..., Any], *args, **kwargs) -> Any:
+    """
+    동기 워크플로우 함수를 이벤트 루프 밖(워크플로우 스레드 풀)에서 실행합니다.
+
+    Args:
+        fn: 실행할 동기 함수 (예: run_alarm_analysis)
+        *args, **kwargs: 함수 인자
+
+    Returns:
+        함수 반환값
+
+    Examples:
+        >>> result = await run_workflow(run_question_answer, "EQP01 OEE 원인?")
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        workflow_executor,
+        functools.partial(fn, *args, **kwargs)
+    )
+
+
+def format_sse(event: Dict[str, Any]) -> str:
+    """
+    이벤트를 SSE 메시지 형식으로 변환합니다.
+
+    Args:
+        event: {'event': 이벤트 이름, ...데이터}
+
+    Returns:
+        str: "event: ...\ndata: {...}\n\n"
+    """
+    data = {key: value for key, value in event.items() if key != 'event'}
+    return f"event: {event['event']}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+def workflow_sse_response(
+    producer: Callable[[Callable[[Dict[str, Any]], None]], Dict[str, Any]]
+) -> StreamingResponse:
+    """
+    워크플로우를 스레드 풀에서 실행하면서 중간 이벤트를 SSE로 전송합니다.
+
+    producer는 워크플로우 스레드에서 emit(event)로 중간 이벤트를 보내고,
+    마지막 이벤트('result' 또는 'error')를 반환합니다.
+    producer에서 예외가 발생하면 'error' 이벤트로 전송합니다.
+
+    Args:
+        producer: emit 콜백을 받아 최종 이벤트를 반환하는 동기 함수
+
+    Returns:
+        StreamingResponse: text/event-stream 응답
+    """
+
+    async def event_stream():
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue()
+
+        def emit(event: Dict[str, Any]) -> None:
+            # 워크플로우 스레드 → 이벤트 루프로 전달
+            loop.call_soon_threadsafe(queue.put_nowait, event)
+
+        async def run() -> None:
+            try:
+                final_event = await run_workflow(producer, emit)
+            except Exception as e:
+                final_event = {'event': 'error', 'detail': str(e)}
+            await queue.put(final_event)
+
+        task = asyncio.create_task(run())
+
+        try:
+            while True:
+                event = await queue.get()
+                yield format_sse(event)
+
+                if event['event'] in ('result', 'error'):
+                    break
+        finally:
+            if not task.done():
+                task.cancel()
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no"
+        }
+    )
+
+
+def shutdown_workflow_executor() -> None:
+    """서버 종료 시 워크플로우 스레드 풀을 정리합니다."""
+    workflow_executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,207 @@
+"""
+알람 분석 작업(Job) 상태 저장소
+
+POST /api/alarm/jobs 로 생성된 작업의 상태를 저장합니다.
+- InMemoryJobStore: 기본값, 프로세스 메모리에 저장 (재시작 시 초기화)
+- SQLiteJobStore: 파일에 저장 (재시작 후에도 결과 조회 가능)
+
+JOB_STORE=memory|sqlite, JOB_STORE_PATH=./data/jobs.db 로 선택합니다.
+"""
+
+import os
+import json
+import sqlite3
+import threading
+import uuid
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+
+# 작업 상태
+JOB_QUEUED = 'queued'
+JOB_RUNNING = 'running'
+JOB_COMPLETED = 'completed'
+JOB_FAILED = 'failed'
+
+FINISHED_STATUSES = (JOB_COMPLETED, JOB_FAILED)
+
+
+class JobStore(ABC):
+    """
+    작업 저장소 인터페이스 (get / _save를 구현해야 생성 가능)
+
+    작업은 다음 필드를 가진 dict로 표현합니다.
+    - job_id, status, current_node, request, result, error, created_at, updated_at
+    """
+
+    def create(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """새 작업을 queued 상태로 생성합니다."""
+        now = datetime.now().isoformat()
+        job = {
+            'job_id': uuid.uuid4().hex,
+            'status': JOB_QUEUED,
+            'current_node': None,
+            'request': request,
+            'result': None,
+            'error': None,
+            'created_at': now,
+            'updated_at': now
+        }
+        self._save(job)
+        return job
+
+    def update(self, job_id: str, **fields) -> Optional[Dict[str, Any]]:
+        """작업 필드를 갱신합니다. 작업이 없으면 None을 반환합니다."""
+        job = self.get(job_id)
+        if job is None:
+            return None
+
+        job.update(fields)
+        job['updated_at'] = datetime.now().isoformat()
+        self._save(job)
+        return job
+
+    @abstractmethod
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """작업을 조회합니다."""
+
+    @abstractmethod
+    def _save(self, job: Dict[str, Any]) -> None:
+        """작업을 저장합니다 (같은 job_id면 덮어씀)."""
+
+
+class InMemoryJobStore(JobStore):
+    """
+    인메모리 작업 저장소
+
+    완료된 작업은 최대 max_jobs개까지만 보관하고 오래된 것부터 삭제합니다.
+    """
+
+    def __init__(self, max_jobs: int = 1000):
+        """
+        Args:
+            max_jobs: 보관할 최대 작업 수
+        """
+        self.jobs: 'OrderedDict[str, Dict[str, Any]]' = OrderedDict()
+        self.max_jobs = max_jobs
+        self._lock = threading.Lock()
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            job = self.jobs.get(job_id)
+            return dict(job) if job else None
+
+    def _save(self, job: Dict[str, Any]) -> None:
+        with self._lock:
+            self.jobs[job['job_id']] = dict(job)
+            self._prune()
+
+    def _prune(self) -> None:
+        """보관 한도를 넘으면 오래된 완료 작업부터 삭제합니다."""
+        if len(self.jobs) <= self.max_jobs:
+            return
+
+        for job_id in list(self.jobs.keys()):
+            if len(self.jobs) <= self.max_jobs:
+                break
+            if self.jobs[job_id]['status'] in FINISHED_STATUSES:
+                del self.jobs[job_id]
+
+
+class SQLiteJobStore(JobStore):
+    """
+    SQLite 작업 저장소
+
+    서버 재시작 후에도 완료된 작업 결과를 조회할 수 있습니다.
+    재시작 시 queued/running 상태로 남은 작업은 failed로 표시합니다.
+    InMemoryJobStore와 같이 완료된 작업은 최대 max_jobs개까지만 보관합니다.
+    """
+
+    def __init__(self, db_path: str = './data/jobs.db', max_jobs: int = 1000):
+        """
+        Args:
+            db_path: SQLite 파일 경로
+            max_jobs: 보관할 최대 작업 수
+        """
+        self.db_path = db_path
+        self.max_jobs = max_jobs
+        os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute(
+            '''
+            CREATE TABLE IF NOT EXISTS alarm_jobs (
+                job_id TEXT PRIMARY KEY,
+                status TEXT NOT NULL,
+                data TEXT NOT NULL,
+                updated_at TEXT NOT NULL
+            )
+            '''
+        )
+        self.conn.commit()
+
+        self._fail_interrupted_jobs()
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self.conn.execute(
+                'SELECT data FROM alarm_jobs WHERE job_id = ?', (job_id,)
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def _save(self, job: Dict[str, Any]) -> None:
+        with self._lock:
+            self.conn.execute(
+                'INSERT OR REPLACE INTO alarm_jobs (job_id, status, data, updated_at) '
+                'VALUES (?, ?, ?, ?)',
+                (job['job_id'], job['status'], json.dumps(job, ensure_ascii=False), job['updated_at'])
+            )
+            self._prune()
+            self.conn.commit()
+
+    def _prune(self) -> None:
+        """보관 한도를 넘으면 오래된(생성 시각 기준) 완료 작업부터 삭제합니다."""
+        (total,) = self.conn.execute('SELECT COUNT(*) FROM alarm_jobs').fetchone()
+        if total <= self.max_jobs:
+            return
+
+        self.conn.execute(
+            '''
+            DELETE FROM alarm_jobs WHERE job_id IN (
+                SELECT job_id FROM alarm_jobs
+                WHERE status IN (?, ?)
+                ORDER BY json_extract(data, '$.created_at')
+                LIMIT ?
+            )
+            ''',
+            (JOB_COMPLETED, JOB_FAILED, total - self.max_jobs)
+        )
+
+    def _fail_interrupted_jobs(self) -> None:
+        """이전 프로세스에서 끝나지 못한 작업을 failed로 표시합니다."""
+        with self._lock:
+            rows = self.conn.execute(
+                'SELECT job_id FROM alarm_jobs WHERE status IN (?, ?)',
+                (JOB_QUEUED, JOB_RUNNING)
+            ).fetchall()
+
+        for (job_id,) in rows:
+            self.update(job_id, status=JOB_FAILED, error='서버 재시작으로 작업이 중단되었습니다')
+
+
+def create_job_store() -> JobStore:
+    """환경 변수 설정에 맞는 작업 저장소를 생성합니다."""
+    store_type = os.getenv('JOB_STORE', 'memory').lower()
+
+    if store_type == 'sqlite':
+        return SQLiteJobStore(os.getenv('JOB_STORE_PATH', './data/jobs.db'))
+
+    return InMemoryJobStore()
+
+
+# 전역 작업 저장소
+job_store = create_job_store()
@@ -0,0 +1,198 @@
+"""
+/health 지연 시간 부하 테스트
+
+알람 분석 20건을 동시에 실행하는 동안 /health 응답 지연(p50/p99)이
+평상시와 비슷하게 유지되는지 확인합니다.
+(워크플로우가 이벤트 루프를 막으면 분석이 끝날 때까지 /health도 멈춥니다)
+
+실행:
+    python backend/api/main.py                       # 서버 먼저 실행
+    python backend/api/load_test_health.py [동시 분석 수]
+
+    # 워크플로우를 N초 대기로 대체한 앱을 이 프로세스에서 띄워 측정
+    # (Bedrock/Supabase 없이 이벤트 루프 블로킹 여부만 확인)
+    python backend/api/load_test_health.py [동시 분석 수] --stub 2
+"""
+
+import sys
+import time
+import argparse
+import threading
+import statistics
+import requests
+
+# API 베이스 URL
+BASE_URL = "http://localhost:8000"
+
+# --stub 모드에서 띄우는 서버 포트
+STUB_PORT = 8765
+
+
+def percentile(values: list, pct: float) -> float:
+    """정렬된 값 목록에서 백분위 값을 계산합니다 (nearest-rank)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, int(round(pct / 100 * len(ordered))) - 1))
+    return ordered[index]
+
+
+def sample_health(duration_s: float, interval_s: float = 0.05, stop_event: threading.Event = None) -> list:
+    """
+    /health를 주기적으로 호출하여 지연 시간(ms)을 수집합니다.
+
+    Args:
+        duration_s: 최대 측정 시간 (초)
+        interval_s: 호출 간격 (초)
+        stop_event: 설정되면 측정 중단
+
+    Returns:
+        list: 지연 시간 목록 (ms)
+    """
+    latencies = []
+    deadline = time.time() + duration_s
+
+    with requests.Session() as session:
+        while time.time() < deadline:
+            if stop_event and stop_event.is_set():
+                break
+            start = time.perf_counter()
+            session.get(f"{BASE_URL}/health", timeout=120)
+            latencies.append((time.perf_counter() - start) * 1000)
+            time.sleep(interval_s)
+
+    return latencies
+
+
+def run_analysis(results: list, index: int) -> None:
+    """최신 알람 분석 요청 1건 실행 (최신 알람은 캐시되지 않음)"""
+    start = time.perf_counter()
+    try:
+        response = requests.post(f"{BASE_URL}/api/alarm/analyze", json={}, timeout=600)
+        status = response.status_code
+    except Exception as e:
+        status = str(e)
+    results[index] = (status, time.perf_counter() - start)
+
+
+def start_stub_server(workflow_seconds: float) -> None:
+    """
+    워크플로우를 workflow_seconds초 대기로 대체한 API 서버를 백그라운드 스레드에서 실행합니다.
+
+    대기는 실제 워크플로우처럼 동기(time.sleep)이므로,
+    워크플로우가 이벤트 루프에서 실행되면 /health도 함께 멈춥니다.
+
+    Args:
+        workflow_seconds: 분석 1건당 대기 시간 (초)
+    """
+    global BASE_URL
+
+    import uvicorn
+    from pathlib import Path
+
+    sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+    from backend.api.main import app
+    from backend.api.routes import alarm
+
+    def stub_alarm_analysis(alarm_date=None, alarm_eqp_id=None, alarm_kpi=None, **kwargs):
+        time.sleep(workflow_seconds)
+        cause = {'cause': '스텁 원인', 'probability': 100, 'evidence': '스텁'}
+        return {
+            'alarm_date': alarm_date or '2026-01-20',
+            'alarm_eqp_id': alarm_eqp_id or 'EQP01',
+            'alarm_kpi': alarm_kpi or 'OEE',
+            'root_causes': [cause],
+            'selected_cause': cause,
+            'final_report': '# 스텁 리포트',
+            'report_id': 'report_stub',
+            'metadata': {'llm_calls': 0}
+        }
+
+    alarm.run_alarm_analysis = stub_alarm_analysis
+
+    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=STUB_PORT, log_level="warning"))
+    threading.Thread(target=server.run, daemon=True).start()
+    while not server.started:
+        time.sleep(0.05)
+
+    BASE_URL = f"http://127.0.0.1:{STUB_PORT}"
+    print(f"🧩 스텁 서버 실행: {BASE_URL} (워크플로우 {workflow_seconds}초 대기)\n")
+
+
+def print_latency(label: str, latencies: list) -> None:
+    """지연 시간 통계 출력"""
+    print(f"{label}")
+    print(f"   샘플: {len(latencies)}개")
+    print(f"   p50: {statistics.median(latencies):.1f} ms")
+    print(f"   p99: {percentile(latencies, 99):.1f} ms")
+    print(f"   max: {max(latencies):.1f} ms\n")
+
+
+def main():
+    """부하 테스트 실행"""
+
+    parser = argparse.ArgumentParser(description="/health 지연 시간 부하 테스트")
+    parser.add_argument("n_analyses", type=int, nargs="?", default=20, help="동시 분석 수")
+    parser.add_argument("--stub", type=float, metavar="SECONDS",
+                        help="워크플로우를 SECONDS초 대기로 대체한 서버를 직접 실행")
+    args = parser.parse_args()
+    n_analyses = args.n_analyses
+
+    if args.stub is not None:
+        start_stub_server(args.stub)
+
+    print("\n" + "=" * 60)
+    print(f"🧪 /health 부하 테스트 (동시 분석 {n_analyses}건)")
+    print("=" * 60 + "\n")
+
+    try:
+        # 1. 기준 지연 시간 (부하 없음)
+        baseline = sample_health(duration_s=5)
+        print_latency("1️⃣ 부하 없음", baseline)
+
+        # 2. 분석 n건 동시 실행
+        results = [None] * n_analyses
+        workers = [
+            threading.Thread(target=run_analysis, args=(results, i))
+            for i in range(n_analyses)
+        ]
+        for worker in workers:
+            worker.start()
+
+        # 3. 분석이 모두 끝날 때까지 /health 측정
+        stop_event = threading.Event()
+        under_load = []
+        sampler = threading.Thread(
+            target=lambda: under_load.extend(sample_health(600, stop_event=stop_event))
+        )
+        sampler.start()
+
+        for worker in workers:
+            worker.join()
+        stop_event.set()
+        sampler.join()
+
+        print_latency(f"2️⃣ 분석 {n_analyses}건 실행 중", under_load)
+
+        ok_count = sum(1 for r in results if r and r[0] == 200)
+        durations = [r[1] for r in results if r]
+        print(f"3️⃣ 분석 결과: {ok_count}/{n_analyses}건 성공, 최대 {max(durations):.1f}초 소요\n")
+
+        # 4. 판정: 부하 중 p99가 기준 대비 크게 늘지 않아야 함
+        baseline_p99 = percentile(baseline, 99)
+        load_p99 = percentile(under_load, 99)
+        assert load_p99 < max(baseline_p99 * 5, 100), (
+            f"/health p99 지연 증가: {baseline_p99:.1f}ms → {load_p99:.1f}ms"
+        )
+
+        print("=" * 60)
+        print("✅ /health 지연 시간 유지 확인!")
+        print("=" * 60 + "\n")
+
+    except requests.exceptions.ConnectionError:
+        print("\n❌ 서버에 연결할 수 없습니다!")
+        print("   서버가 실행 중인지 확인하세요.\n")
+
+
+if __name__ == "__main__":
+    main()
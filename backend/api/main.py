@@ -5,12 +5,14 @@ FastAPI 메인 애플리케이션
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
+from starlette.concurrency import run_in_threadpool
 from datetime import datetime
+import os
 import sys
 from pathlib import Path
 from pydantic import BaseModel
 from typing import List
-import boto3, json, os
+import json
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -21,6 +23,9 @@ sys.path.insert(0, str(project_root))
 
 from backend.api.routes import alarm, question, system
 from backend.api.models import HealthResponse, ErrorResponse
+from backend.api.dependencies import shutdown_workflow_executor
+from backend.config.aws_config import aws_config
+from backend.config.supabase_config import supabase_config
 
 # FastAPI 앱 생성 (한 번만!)
 app = FastAPI(
@@ -57,26 +62,38 @@ class ChatRequest(BaseModel):
 
 @app.post("/api/chat")
 async def chat(req: ChatRequest):
-    client = boto3.client(
-        "bedrock-runtime",
-        region_name=os.getenv("AWS_REGION", "us-east-1"),
-        aws_access_key_id=os.getenv("AWS_ACCESS_KEY_ID"),
-        aws_secret_access_key=os.getenv("AWS_SECRET_ACCESS_KEY"),
-    )
+    # 공유 Bedrock 클라이언트 재사용 (keep-alive 커넥션 풀)
+    client = aws_config.get_bedrock_runtime_client()
     body = {
         "anthropic_version": "bedrock-2023-05-31",
         "max_tokens": 1024,
         "system": req.system,
         "messages": [{"role": m.role, "content": m.content} for m in req.messages],
     }
-    response = client.invoke_model(
-        modelId=os.getenv("BEDROCK_MODEL_ID", "anthropic.claude-3-haiku-20240307-v1:0"),
+    # 블로킹 호출이므로 스레드 풀에서 실행
+    response = await run_in_threadpool(
+        client.invoke_model,
+        modelId=aws_config.model_id,
         body=json.dumps(body),
     )
     result = json.loads(response["body"].read())
     return {"content": result["content"][0]["text"]}
 
 
+@app.on_event("startup")
+async def startup_event():
+    # Supabase 스냅샷 주기 동기화 (SUPABASE_SNAPSHOT_SYNC_INTERVAL초, 0이면 사용 안 함)
+    interval = float(os.getenv('SUPABASE_SNAPSHOT_SYNC_INTERVAL', '0'))
+    if interval > 0:
+        supabase_config.start_snapshot_sync(interval)
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    shutdown_workflow_executor()
+    supabase_config.stop_snapshot_sync()
+
+
 # ── 전역 예외 핸들러 ─────────────────────────────────────────────
 @app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception):
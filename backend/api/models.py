@@ -76,11 +76,29 @@ class AlarmAnalyzeResponse(BaseModel):
     processing_time: Optional[float] = Field(None, description="처리 시간 (초)")
 
 
+class AlarmJobResponse(BaseModel):
+    """알람 분석 작업 상태 응답"""
+    
+    job_id: str = Field(..., description="작업 ID")
+    status: Literal["queued", "running", "completed", "failed"] = Field(..., description="작업 상태")
+    current_node: Optional[str] = Field(None, description="현재 실행 중인 노드 (예: node_6)")
+    
+    # 결과
+    result: Optional[AlarmAnalyzeResponse] = Field(None, description="분석 결과 (완료 시)")
+    error: Optional[str] = Field(None, description="에러 메시지 (실패 시)")
+    
+    # 메타데이터
+    created_at: str = Field(..., description="생성 시간")
+    updated_at: str = Field(..., description="마지막 갱신 시간")
+
+
 class SimilarReport(BaseModel):
     """유사 리포트"""
     
     id: str = Field(..., description="리포트 ID")
-    distance: float = Field(..., description="유사도 거리")
+    distance: Optional[float] = Field(None, description="벡터 유사도 거리 (어휘 검색으로만 찾은 경우 없음)")
+    retrieval: Optional[str] = Field(None, description="검색 방식 (vector/hybrid/lexical/exact)")
+    rrf_score: Optional[float] = Field(None, description="하이브리드 검색 RRF 점수")
     metadata: Dict[str, Any] = Field(..., description="메타데이터")
     preview: str = Field(..., description="내용 미리보기")
 
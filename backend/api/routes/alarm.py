@@ -4,15 +4,28 @@
 
 from fastapi import APIRouter, HTTPException
 from datetime import datetime
+from typing import Optional
 import time
 
 from backend.api.models import (
     AlarmAnalyzeRequest,
     AlarmAnalyzeResponse,
+    AlarmJobResponse,
     LatestAlarmResponse,
     ErrorResponse,
     RootCause
 )
+from backend.api.dependencies import (
+    run_workflow,
+    workflow_executor,
+    workflow_sse_response
+)
+from backend.api.job_store import (
+    job_store,
+    JOB_RUNNING,
+    JOB_COMPLETED,
+    JOB_FAILED
+)
 from backend.graph.workflow import run_alarm_analysis
 from backend.utils.data_utils import get_latest_alarm
 
@@ -37,8 +50,9 @@ async def analyze_alarm(request: AlarmAnalyzeRequest):
     try:
         start_time = time.time()
         
-        # 워크플로우 실행
-        result = run_alarm_analysis(
+        # 워크플로우 실행 (워크플로우 스레드 풀에서 실행, 이벤트 루프 블로킹 방지)
+        result = await run_workflow(
+            run_alarm_analysis,
             alarm_date=request.alarm_date,
             alarm_eqp_id=request.alarm_eqp_id,
             alarm_kpi=request.alarm_kpi
@@ -51,22 +65,7 @@ async def analyze_alarm(request: AlarmAnalyzeRequest):
         processing_time = time.time() - start_time
         
         # 응답 생성
-        return AlarmAnalyzeResponse(
-            success=True,
-            message="알람 분석 완료",
-            alarm_date=result['alarm_date'],
-            alarm_eqp_id=result['alarm_eqp_id'],
-            alarm_kpi=result['alarm_kpi'],
-            root_causes=[
-                RootCause(**cause) for cause in result['root_causes']
-            ],
-            selected_cause=RootCause(**result['selected_cause']),
-            final_report=result['final_report'],
-            report_id=result['report_id'],
-            rag_saved=result.get('rag_saved', False),
-            llm_calls=result['metadata']['llm_calls'],
-            processing_time=processing_time
-        )
+        return _build_analyze_response(result, processing_time)
     
     except HTTPException:
         raise
@@ -77,6 +76,91 @@ async def analyze_alarm(request: AlarmAnalyzeRequest):
         )
 
 
+@router.get(
+    "/analyze/stream",
+    summary="알람 분석 (진행 상황 스트리밍)",
+    description="알람 분석을 실행하면서 노드별 진행 상황을 Server-Sent Events로 전송합니다."
+)
+async def analyze_alarm_stream(
+    alarm_date: Optional[str] = None,
+    alarm_eqp_id: Optional[str] = None,
+    alarm_kpi: Optional[str] = None
+):
+    """
+    알람 분석 SSE API
+    
+    이벤트 종류:
+    - node_start: 노드 시작 (node, elapsed_ms, input_bytes)
+    - node_end: 노드 종료 (node, elapsed_ms, duration_ms, output_bytes)
+    - token: 리포트 텍스트 조각 (node, text) - Node 8 스트리밍
+    - result: 최종 분석 결과 (AlarmAnalyzeResponse)
+    - error: 분석 실패 (detail)
+    """
+    
+    def produce(emit) -> dict:
+        start_time = time.time()
+        
+        try:
+            result = run_alarm_analysis(
+                alarm_date=alarm_date,
+                alarm_eqp_id=alarm_eqp_id,
+                alarm_kpi=alarm_kpi,
+                on_progress=emit,
+                on_token=lambda text: emit({'event': 'token', 'node': 'node_8', 'text': text})
+            )
+        except Exception as e:
+            return {'event': 'error', 'detail': f"알람 분석 실패: {str(e)}"}
+        
+        if 'error' in result:
+            return {'event': 'error', 'detail': result['error']}
+        
+        response = _build_analyze_response(result, time.time() - start_time)
+        return {'event': 'result', 'data': response.dict()}
+    
+    return workflow_sse_response(produce)
+
+
+@router.post(
+    "/jobs",
+    response_model=AlarmJobResponse,
+    status_code=202,
+    summary="알람 분석 작업 생성",
+    description="알람 분석을 백그라운드 작업으로 등록하고 작업 ID를 즉시 반환합니다."
+)
+async def create_alarm_job(request: AlarmAnalyzeRequest):
+    """
+    알람 분석 작업 생성 API
+    
+    - 워크플로우 스레드 풀에 작업을 등록하고 바로 응답
+    - 진행 상황/결과는 GET /alarm/jobs/{job_id} 로 조회
+    - 동시 실행 한도를 넘는 작업은 큐에서 대기
+    """
+    
+    job = job_store.create(request.dict())
+    workflow_executor.submit(_run_alarm_job, job['job_id'], request)
+    
+    return AlarmJobResponse(**job)
+
+
+@router.get(
+    "/jobs/{job_id}",
+    response_model=AlarmJobResponse,
+    summary="알람 분석 작업 조회",
+    description="작업 상태, 현재 실행 중인 노드, 완료 시 분석 결과를 조회합니다."
+)
+async def get_alarm_job(job_id: str):
+    """
+    알람 분석 작업 조회 API
+    """
+    
+    job = job_store.get(job_id)
+    
+    if not job:
+        raise HTTPException(status_code=404, detail=f"작업을 찾을 수 없습니다: {job_id}")
+    
+    return AlarmJobResponse(**job)
+
+
 @router.get(
     "/latest",
     response_model=LatestAlarmResponse,
@@ -109,4 +193,68 @@ async def get_latest():
         raise HTTPException(
             status_code=500,
             detail=f"최신 알람 조회 실패: {str(e)}"
-        )
\ No newline at end of file
+        )
+
+
+def _build_analyze_response(result: dict, processing_time: float) -> AlarmAnalyzeResponse:
+    """
+    워크플로우 최종 State를 API 응답 모델로 변환합니다.
+    
+    Args:
+        result: run_alarm_analysis 결과 State
+        processing_time: 처리 시간 (초)
+    
+    Returns:
+        AlarmAnalyzeResponse: 알람 분석 응답
+    """
+    return AlarmAnalyzeResponse(
+        success=True,
+        message="알람 분석 완료",
+        alarm_date=result['alarm_date'],
+        alarm_eqp_id=result['alarm_eqp_id'],
+        alarm_kpi=result['alarm_kpi'],
+        root_causes=[
+            RootCause(**cause) for cause in result['root_causes']
+        ],
+        selected_cause=RootCause(**result['selected_cause']),
+        final_report=result['final_report'],
+        report_id=result['report_id'],
+        rag_saved=result.get('rag_saved', False),
+        llm_calls=result['metadata']['llm_calls'],
+        processing_time=processing_time
+    )
+
+
+def _run_alarm_job(job_id: str, request: AlarmAnalyzeRequest) -> None:
+    """
+    워크플로우 스레드 풀에서 알람 분석 작업을 실행합니다.
+    
+    노드가 시작될 때마다 current_node를 갱신하고,
+    끝나면 결과(completed) 또는 에러(failed)를 저장합니다.
+    진행 중인 동일 분석에 합류한 작업도 그 분석의 노드 진행 이벤트로 current_node를 갱신합니다.
+    """
+    
+    def on_progress(event: dict) -> None:
+        if event['event'] == 'node_start':
+            job_store.update(job_id, current_node=event['node'])
+    
+    job_store.update(job_id, status=JOB_RUNNING)
+    start_time = time.time()
+    
+    try:
+        result = run_alarm_analysis(
+            alarm_date=request.alarm_date,
+            alarm_eqp_id=request.alarm_eqp_id,
+            alarm_kpi=request.alarm_kpi,
+            on_progress=on_progress
+        )
+        
+        if 'error' in result:
+            job_store.update(job_id, status=JOB_FAILED, error=result['error'])
+            return
+        
+        response = _build_analyze_response(result, time.time() - start_time)
+        job_store.update(job_id, status=JOB_COMPLETED, result=response.dict())
+    
+    except Exception as e:
+        job_store.update(job_id, status=JOB_FAILED, error=f"알람 분석 실패: {str(e)}")
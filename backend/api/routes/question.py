@@ -11,6 +11,7 @@ from backend.api.models import (
     SimilarReport,
     ErrorResponse
 )
+from backend.api.dependencies import run_workflow, workflow_sse_response
 from backend.graph.workflow import run_question_answer
 
 router = APIRouter(prefix="/question", tags=["Question"])
@@ -34,8 +35,8 @@ async def answer_question(request: QuestionRequest):
     try:
         start_time = time.time()
         
-        # 워크플로우 실행
-        result = run_question_answer(request.question)
+        # 워크플로우 실행 (워크플로우 스레드 풀에서 실행, 이벤트 루프 블로킹 방지)
+        result = await run_workflow(run_question_answer, request.question)
         
         # 에러 체크
         if 'error' in result:
@@ -43,29 +44,8 @@ async def answer_question(request: QuestionRequest):
         
         processing_time = time.time() - start_time
         
-        # 유사 리포트 포맷팅
-        similar_reports = []
-        for report in result.get('similar_reports', []):
-            similar_reports.append(
-                SimilarReport(
-                    id=report['id'],
-                    distance=report['distance'],
-                    metadata=report['metadata'],
-                    preview=report['document'][:200] + "..."
-                )
-            )
-        
         # 응답 생성
-        return QuestionResponse(
-            success=True,
-            message="답변 생성 완료",
-            question=request.question,
-            answer=result['final_answer'],
-            report_exists=result.get('report_exists', False),
-            similar_reports=similar_reports,
-            llm_calls=result['metadata']['llm_calls'],
-            processing_time=processing_time
-        )
+        return _build_question_response(request.question, result, processing_time)
     
     except HTTPException:
         raise
@@ -73,4 +53,78 @@ async def answer_question(request: QuestionRequest):
         raise HTTPException(
             status_code=500,
             detail=f"질문 답변 실패: {str(e)}"
-        )
\ No newline at end of file
+        )
+
+
+@router.post(
+    "/answer/stream",
+    summary="질문 답변 (토큰 스트리밍)",
+    description="답변을 생성하면서 Claude가 만든 텍스트 조각을 Server-Sent Events로 바로 전송합니다."
+)
+async def answer_question_stream(request: QuestionRequest):
+    """
+    질문 답변 SSE API
+    
+    이벤트 종류:
+    - token: 답변 텍스트 조각 (text)
+    - result: 최종 답변 (QuestionResponse)
+    - error: 답변 실패 (detail)
+    """
+    
+    def produce(emit) -> dict:
+        start_time = time.time()
+        
+        try:
+            result = run_question_answer(
+                request.question,
+                on_token=lambda text: emit({'event': 'token', 'text': text})
+            )
+        except Exception as e:
+            return {'event': 'error', 'detail': f"질문 답변 실패: {str(e)}"}
+        
+        if 'error' in result:
+            return {'event': 'error', 'detail': result['error']}
+        
+        response = _build_question_response(request.question, result, time.time() - start_time)
+        return {'event': 'result', 'data': response.dict()}
+    
+    return workflow_sse_response(produce)
+
+
+def _build_question_response(question: str, result: dict, processing_time: float) -> QuestionResponse:
+    """
+    워크플로우 최종 State를 API 응답 모델로 변환합니다.
+    
+    Args:
+        question: 사용자 질문
+        result: run_question_answer 결과 State
+        processing_time: 처리 시간 (초)
+    
+    Returns:
+        QuestionResponse: 질문 답변 응답
+    """
+    
+    # 유사 리포트 포맷팅
+    similar_reports = []
+    for report in result.get('similar_reports', []):
+        similar_reports.append(
+            SimilarReport(
+                id=report['id'],
+                distance=report.get('distance'),
+                retrieval=report.get('retrieval'),
+                rrf_score=report.get('rrf_score'),
+                metadata=report['metadata'],
+                preview=report['document'][:200] + "..."
+            )
+        )
+    
+    return QuestionResponse(
+        success=True,
+        message="답변 생성 완료",
+        question=question,
+        answer=result['final_answer'],
+        report_exists=result.get('report_exists', False),
+        similar_reports=similar_reports,
+        llm_calls=result['metadata']['llm_calls'],
+        processing_time=processing_time
+    )
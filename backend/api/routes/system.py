@@ -3,7 +3,12 @@
 """
 
 from fastapi import APIRouter
+from starlette.concurrency import run_in_threadpool
+from backend.config.chroma_config import chroma_config
+from backend.config.supabase_config import supabase_config
 from backend.utils.cache import analysis_cache, qa_cache
+from backend.utils.semantic_cache import qa_semantic_cache
+from backend.utils.single_flight import analysis_flight, qa_flight
 
 router = APIRouter(prefix="/system", tags=["System"])
 
@@ -13,12 +18,19 @@ async def get_cache_stats():
     """
     캐시 통계 조회
     
-    알람 분석 캐시와 질문 답변 캐시의 상태를 확인합니다.
+    알람 분석 캐시와 질문 답변 캐시의 상태, 그리고 동시 요청 공유
+    (single-flight)로 절감한 LLM 호출 수를 확인합니다.
     """
     
     return {
         "analysis_cache": analysis_cache.get_stats(),
         "qa_cache": qa_cache.get_stats(),
+        "qa_semantic_cache": qa_semantic_cache.get_stats(),
+        "single_flight": {
+            "analysis": analysis_flight.get_stats(),
+            "qa": qa_flight.get_stats(),
+        },
+        "embeddings": chroma_config.get_embedding_stats(),
     }
 
 
@@ -36,8 +48,44 @@ async def clear_cache(cache_type: str = "all"):
     
     if cache_type in ["qa", "all"]:
         qa_cache.clear()
+        qa_semantic_cache.clear()
     
     return {
         "success": True,
         "message": f"{cache_type} 캐시가 초기화되었습니다.",
-    }
\ No newline at end of file
+    }
+
+
+@router.get("/snapshot/status")
+async def get_snapshot_status():
+    """
+    Supabase 로컬 스냅샷 상태 조회
+    
+    테이블별 마지막 동기화 시각, 경과 시간, high-water mark, 행 수를 확인합니다.
+    """
+    
+    # SQLite 조회이므로 스레드 풀에서 실행
+    stats = await run_in_threadpool(lambda: supabase_config.get_snapshot_store().get_stats())
+    
+    return {
+        "read_source": supabase_config.read_source,
+        **stats,
+    }
+
+
+@router.post("/snapshot/sync")
+async def sync_snapshot(full: bool = False):
+    """
+    Supabase 로컬 스냅샷 동기화
+    
+    Args:
+        full: True면 전체 다시 받기 (기본: high-water mark 이후 증분)
+    """
+    
+    # 네트워크 조회이므로 스레드 풀에서 실행
+    result = await run_in_threadpool(supabase_config.sync_snapshot, full=full)
+    
+    return {
+        "success": True,
+        "tables": result,
+    }
@@ -0,0 +1,240 @@
+"""
+알람 분석 작업(Job) API 테스트
+
+서버 없이 실행합니다.
+- 작업 저장소 (InMemoryJobStore / SQLiteJobStore)
+- POST /api/alarm/jobs → 202 → GET 상태 조회 (워크플로우는 고정 결과로 대체)
+"""
+
+import os
+import sys
+import time
+import tempfile
+from pathlib import Path
+
+# 프로젝트 루트를 경로에 추가
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from fastapi.testclient import TestClient
+
+from backend.api.main import app
+from backend.api.routes import alarm
+from backend.api.job_store import (
+    InMemoryJobStore,
+    SQLiteJobStore,
+    JOB_QUEUED,
+    JOB_RUNNING,
+    JOB_COMPLETED,
+    JOB_FAILED
+)
+
+
+def check_job_store(store) -> None:
+    """저장소 공통 동작: 생성 → 갱신 → 조회"""
+    
+    job = store.create({'alarm_eqp_id': 'EQP01'})
+    assert job['status'] == JOB_QUEUED
+    assert job['current_node'] is None
+    
+    updated = store.update(job['job_id'], status=JOB_RUNNING, current_node='node_3')
+    assert updated['status'] == JOB_RUNNING
+    
+    stored = store.get(job['job_id'])
+    assert stored['current_node'] == 'node_3'
+    assert stored['request'] == {'alarm_eqp_id': 'EQP01'}
+    
+    # 조회 결과를 바꿔도 저장된 작업은 그대로
+    stored['status'] = JOB_FAILED
+    assert store.get(job['job_id'])['status'] == JOB_RUNNING
+    
+    # 없는 작업
+    assert store.get('missing') is None
+    assert store.update('missing', status=JOB_FAILED) is None
+
+
+def check_prune(store) -> None:
+    """보관 한도(max_jobs=3): 오래된 완료 작업부터 삭제, 실행 중인 작업은 유지"""
+    
+    running = store.create({})
+    store.update(running['job_id'], status=JOB_RUNNING)
+    
+    finished = []
+    for _ in range(4):
+        job = store.create({})
+        store.update(job['job_id'], status=JOB_COMPLETED)
+        finished.append(job['job_id'])
+        time.sleep(0.001)  # 생성 시각 순서 보장
+    
+    assert store.get(running['job_id']) is not None
+    assert store.get(finished[0]) is None
+    assert store.get(finished[1]) is None
+    assert store.get(finished[-1]) is not None
+
+
+def test_in_memory_job_store():
+    """인메모리 작업 저장소 테스트"""
+    
+    print("=" * 60)
+    print("🧪 InMemoryJobStore 테스트")
+    print("=" * 60 + "\n")
+    
+    check_job_store(InMemoryJobStore())
+    
+    store = InMemoryJobStore(max_jobs=3)
+    check_prune(store)
+    assert len(store.jobs) == 3
+    
+    print("✅ InMemoryJobStore 테스트 통과!\n")
+
+
+def test_sqlite_job_store():
+    """SQLite 작업 저장소 테스트 (재시작 시 중단 작업 처리, 보관 한도)"""
+    
+    print("=" * 60)
+    print("🧪 SQLiteJobStore 테스트")
+    print("=" * 60 + "\n")
+    
+    db_path = os.path.join(tempfile.mkdtemp(), 'jobs.db')
+    store = SQLiteJobStore(db_path)
+    check_job_store(store)
+    
+    # 재시작: 끝나지 못한 작업은 failed, 완료된 작업은 그대로
+    queued = store.create({})
+    running = store.create({})
+    store.update(running['job_id'], status=JOB_RUNNING)
+    completed = store.create({})
+    store.update(completed['job_id'], status=JOB_COMPLETED, result={'report_id': 'r1'})
+    
+    restarted = SQLiteJobStore(db_path)
+    for job_id in (queued['job_id'], running['job_id']):
+        job = restarted.get(job_id)
+        assert job['status'] == JOB_FAILED
+        assert '재시작' in job['error']
+    assert restarted.get(completed['job_id'])['result'] == {'report_id': 'r1'}
+    
+    # 보관 한도
+    store = SQLiteJobStore(os.path.join(tempfile.mkdtemp(), 'jobs.db'), max_jobs=3)
+    check_prune(store)
+    (count,) = store.conn.execute('SELECT COUNT(*) FROM alarm_jobs').fetchone()
+    assert count == 3
+    
+    print("✅ SQLiteJobStore 테스트 통과!\n")
+
+
+def wait_for_job(client: TestClient, job_id: str, timeout: float = 10) -> dict:
+    """작업이 끝날 때까지 GET으로 상태 조회"""
+    deadline = time.time() + timeout
+    
+    while time.time() < deadline:
+        response = client.get(f"/api/alarm/jobs/{job_id}")
+        assert response.status_code == 200
+        job = response.json()
+        if job['status'] in (JOB_COMPLETED, JOB_FAILED):
+            return job
+        time.sleep(0.05)
+    
+    raise AssertionError(f"작업이 끝나지 않음: {job_id}")
+
+
+def test_job_api():
+    """POST /api/alarm/jobs → 202 → GET 상태 조회 테스트"""
+    
+    print("=" * 60)
+    print("🧪 알람 분석 작업 API 테스트")
+    print("=" * 60 + "\n")
+    
+    cause = {'cause': '로더 모듈 통신 장애', 'probability': 60, 'evidence': '다운타임 3시간'}
+    observed_nodes = []
+    
+    def stub_alarm_analysis(alarm_date=None, alarm_eqp_id=None, alarm_kpi=None, on_progress=None, **kwargs):
+        if alarm_eqp_id == 'EQP_ERROR':
+            return {'error': 'KPI 데이터 없음'}
+        if alarm_eqp_id == 'EQP_RAISE':
+            raise RuntimeError('Bedrock 연결 실패')
+        
+        on_progress({'event': 'node_start', 'node': 'node_6', 'elapsed_ms': 1.0, 'input_bytes': 10})
+        # 실행 중에 current_node가 갱신됨
+        observed_nodes.extend(
+            job['current_node'] for job in alarm.job_store.jobs.values() if job['status'] == JOB_RUNNING
+        )
+        
+        return {
+            'alarm_date': alarm_date,
+            'alarm_eqp_id': alarm_eqp_id,
+            'alarm_kpi': alarm_kpi,
+            'root_causes': [cause],
+            'selected_cause': cause,
+            'final_report': '# 분석 리포트',
+            'report_id': f'report_{alarm_date}_{alarm_eqp_id}_{alarm_kpi}',
+            'rag_saved': True,
+            'metadata': {'llm_calls': 2}
+        }
+    
+    run_alarm_analysis = alarm.run_alarm_analysis
+    job_store = alarm.job_store
+    alarm.run_alarm_analysis = stub_alarm_analysis
+    alarm.job_store = InMemoryJobStore()
+    
+    try:
+        client = TestClient(app)
+        
+        # 1. 성공
+        print("1. 작업 생성 → 완료")
+        request = {'alarm_date': '2026-01-20', 'alarm_eqp_id': 'EQP01', 'alarm_kpi': 'OEE'}
+        response = client.post("/api/alarm/jobs", json=request)
+        assert response.status_code == 202
+        created = response.json()
+        assert created['status'] in (JOB_QUEUED, JOB_RUNNING, JOB_COMPLETED)
+        
+        job = wait_for_job(client, created['job_id'])
+        print(f"   상태: {job['status']}, 노드: {job['current_node']}")
+        assert job['status'] == JOB_COMPLETED
+        assert job['current_node'] == 'node_6'
+        assert observed_nodes == ['node_6']
+        assert job['result']['report_id'] == 'report_2026-01-20_EQP01_OEE'
+        assert job['result']['llm_calls'] == 2
+        assert job['error'] is None
+        
+        # 2. 워크플로우 에러 / 예외 → failed
+        print("2. 작업 실패")
+        for eqp_id, expected in (('EQP_ERROR', 'KPI 데이터 없음'), ('EQP_RAISE', 'Bedrock 연결 실패')):
+            response = client.post("/api/alarm/jobs", json={**request, 'alarm_eqp_id': eqp_id})
+            assert response.status_code == 202
+            job = wait_for_job(client, response.json()['job_id'])
+            print(f"   {eqp_id}: {job['status']} ({job['error']})")
+            assert job['status'] == JOB_FAILED
+            assert expected in job['error']
+            assert job['result'] is None
+        
+        # 3. 없는 작업
+        print("3. 없는 작업 조회")
+        assert client.get("/api/alarm/jobs/missing").status_code == 404
+    finally:
+        alarm.run_alarm_analysis = run_alarm_analysis
+        alarm.job_store = job_store
+    
+    print("\n✅ 알람 분석 작업 API 테스트 통과!\n")
+
+
+def main():
+    """모든 테스트 실행"""
+    
+    print("\n🧪 알람 분석 작업 API 테스트 시작\n")
+    
+    try:
+        test_in_memory_job_store()
+        test_sqlite_job_store()
+        test_job_api()
+        
+        print("=" * 60)
+        print("🎊 모든 테스트 통과!")
+        print("=" * 60 + "\n")
+    
+    except AssertionError as e:
+        print(f"\n❌ 테스트 실패: {e}\n")
+        raise
+
+
+if __name__ == "__main__":
+    main()
@@ -3,10 +3,12 @@ AWS Bedrock 설정 및 클라이언트 초기화
 """
 
 import os
+import threading
 import boto3
 import json
+from botocore.config import Config
 from dotenv import load_dotenv
-from typing import List
+from typing import Callable, List, Dict, Iterator
 
 # .env 파일에서 환경 변수 로드
 load_dotenv()
@@ -33,6 +35,19 @@ class AWSConfig:
             'amazon.titan-embed-text-v1'
         )
         
+        # Bedrock 엔드포인트 (None이면 리전 기본값, 로컬 스텁 테스트용)
+        self.endpoint_url = os.getenv('BEDROCK_ENDPOINT_URL') or None
+        
+        # 커넥션 풀 / 타임아웃 설정
+        self.max_pool_size = int(os.getenv('BEDROCK_MAX_POOL_SIZE', '10'))
+        self.connect_timeout = float(os.getenv('BEDROCK_CONNECT_TIMEOUT', '5'))
+        self.read_timeout = float(os.getenv('BEDROCK_READ_TIMEOUT', '120'))
+        self.max_retries = int(os.getenv('BEDROCK_MAX_RETRIES', '3'))
+        
+        # 공유 클라이언트 풀 (타임아웃 설정별로 1개씩 재사용)
+        self._clients: Dict[float, object] = {}
+        self._client_lock = threading.Lock()
+        
         # 설정 유효성 검사
         self._validate_config()
     
@@ -43,41 +58,191 @@ class AWSConfig:
         if not self.secret_access_key:
             raise ValueError("❌ AWS_SECRET_ACCESS_KEY가 .env 파일에 설정되지 않았습니다.")
     
-    def get_bedrock_runtime_client(self):
+    def create_bedrock_runtime_client(self, read_timeout: float = None):
         """
-        Bedrock Runtime 클라이언트를 반환합니다.
+        새 Bedrock Runtime 클라이언트를 생성합니다.
+        
+        호출할 때마다 엔드포인트 해석과 TLS 연결을 새로 하므로
+        일반 호출 경로에서는 get_bedrock_runtime_client()를 사용하세요.
+        
+        Args:
+            read_timeout: 응답 대기 시간 (초, None이면 기본값)
         
         Returns:
             boto3.client: Bedrock Runtime 클라이언트
         """
+        client_config = Config(
+            max_pool_connections=self.max_pool_size,
+            connect_timeout=self.connect_timeout,
+            read_timeout=read_timeout or self.read_timeout,
+            retries={'max_attempts': self.max_retries, 'mode': 'standard'},
+            tcp_keepalive=True
+        )
+        
         return boto3.client(
             service_name='bedrock-runtime',
             region_name=self.region,
+            endpoint_url=self.endpoint_url,
             aws_access_key_id=self.access_key_id,
-            aws_secret_access_key=self.secret_access_key
+            aws_secret_access_key=self.secret_access_key,
+            config=client_config
         )
     
+    def get_bedrock_runtime_client(self, read_timeout: float = None):
+        """
+        공유 Bedrock Runtime 클라이언트를 반환합니다.
+        
+        boto3 클라이언트는 스레드 안전하므로 타임아웃 설정별로 하나만 만들어
+        재사용합니다. 내부 urllib3 풀(max_pool_size)이 keep-alive 연결을
+        유지하므로 호출마다 클라이언트 생성/TLS 핸드셰이크 비용이 들지 않습니다.
+        
+        Args:
+            read_timeout: 응답 대기 시간 (초, None이면 기본값)
+        
+        Returns:
+            boto3.client: Bedrock Runtime 클라이언트
+        """
+        timeout_key = read_timeout or self.read_timeout
+        
+        client = self._clients.get(timeout_key)
+        if client is not None:
+            return client
+        
+        with self._client_lock:
+            # 다른 스레드가 먼저 생성했는지 다시 확인
+            client = self._clients.get(timeout_key)
+            if client is None:
+                client = self.create_bedrock_runtime_client(timeout_key)
+                self._clients[timeout_key] = client
+        
+        return client
+    
+    def reset_clients(self) -> None:
+        """공유 클라이언트 풀을 비웁니다 (자격 증명 변경 시 사용)."""
+        with self._client_lock:
+            self._clients.clear()
+    
     def invoke_claude(
         self, 
         prompt: str, 
         max_tokens: int = 2000,
         temperature: float = 0.7,
-        system_prompt: str = None
+        system_prompt: str = None,
+        timeout: float = None,
+        on_token: Callable[[str], None] = None
     ) -> str:
         """
         Claude 모델을 호출하여 응답을 받습니다.
         
+        on_token이 주어지면 스트리밍으로 호출하여 텍스트 조각이 도착할 때마다
+        콜백을 호출하고, 마지막에 전체 텍스트를 반환합니다.
+        
         Args:
             prompt: 사용자 프롬프트
             max_tokens: 최대 생성 토큰 수 (기본: 2000)
             temperature: 생성 다양성 0.0~1.0 (기본: 0.7)
             system_prompt: 시스템 프롬프트 (선택)
+            timeout: 응답 대기 시간 (초, None이면 BEDROCK_READ_TIMEOUT)
+            on_token: 텍스트 조각 콜백 (선택, 스트리밍 모드)
         
         Returns:
             str: Claude의 응답 텍스트
         """
-        client = self.get_bedrock_runtime_client()
+        if on_token is not None:
+            chunks = []
+            for text in self.invoke_claude_stream(
+                prompt, max_tokens, temperature, system_prompt, timeout
+            ):
+                on_token(text)
+                chunks.append(text)
+            return ''.join(chunks)
+        
+        client = self.get_bedrock_runtime_client(timeout)
+        
+        # 요청 본문
+        body = self._build_claude_body(prompt, max_tokens, temperature, system_prompt)
         
+        # 모델 호출
+        response = client.invoke_model(
+            modelId=self.model_id,
+            body=json.dumps(body)
+        )
+        
+        # 응답 파싱
+        response_body = json.loads(response['body'].read())
+        return response_body['content'][0]['text']
+    
+    def invoke_claude_stream(
+        self,
+        prompt: str,
+        max_tokens: int = 2000,
+        temperature: float = 0.7,
+        system_prompt: str = None,
+        timeout: float = None
+    ) -> Iterator[str]:
+        """
+        Claude 모델을 스트리밍으로 호출하여 생성되는 텍스트 조각을 순서대로 반환합니다.
+        
+        invoke_model_with_response_stream을 사용하므로 전체 응답을 기다리지 않고
+        첫 토큰부터 바로 받을 수 있습니다. 조각을 모두 이어 붙이면
+        invoke_claude()의 반환값과 같습니다.
+        
+        Args:
+            prompt: 사용자 프롬프트
+            max_tokens: 최대 생성 토큰 수 (기본: 2000)
+            temperature: 생성 다양성 0.0~1.0 (기본: 0.7)
+            system_prompt: 시스템 프롬프트 (선택)
+            timeout: 응답 대기 시간 (초, None이면 BEDROCK_READ_TIMEOUT)
+        
+        Yields:
+            str: 생성된 텍스트 조각
+        
+        Raises:
+            RuntimeError: 스트림 도중 Bedrock 예외 이벤트(modelStreamErrorException,
+                throttlingException, internalServerException 등)나 error 메시지를 받은 경우
+                (잘린 응답을 정상 응답처럼 반환하지 않음)
+        
+        Examples:
+            >>> for text in aws_config.invoke_claude_stream("안녕하세요"):
+            ...     print(text, end="", flush=True)
+        """
+        client = self.get_bedrock_runtime_client(timeout)
+        
+        body = self._build_claude_body(prompt, max_tokens, temperature, system_prompt)
+        
+        response = client.invoke_model_with_response_stream(
+            modelId=self.model_id,
+            body=json.dumps(body)
+        )
+        
+        # 이벤트 스트림에서 텍스트 델타만 추출
+        for event in response['body']:
+            chunk = event.get('chunk')
+            if not chunk:
+                # 예외 이벤트는 {'<이름>Exception': {'message': ...}} 형식
+                for name, error in event.items():
+                    if name.endswith('Exception'):
+                        message = error.get('message') if isinstance(error, dict) else error
+                        raise RuntimeError(f"Bedrock 스트림 오류 ({name}): {message}")
+                continue
+            
+            data = json.loads(chunk['bytes'])
+            if data.get('type') == 'error':
+                error = data.get('error', {})
+                raise RuntimeError(f"Bedrock 스트림 오류 ({error.get('type')}): {error.get('message')}")
+            if data.get('type') == 'content_block_delta':
+                text = data.get('delta', {}).get('text')
+                if text:
+                    yield text
+    
+    def _build_claude_body(
+        self,
+        prompt: str,
+        max_tokens: int,
+        temperature: float,
+        system_prompt: str = None
+    ) -> dict:
+        """Claude Messages API 요청 본문을 생성합니다."""
         # 메시지 구성
         messages = [{"role": "user", "content": prompt}]
         
@@ -93,27 +258,20 @@ class AWSConfig:
         if system_prompt:
             body["system"] = system_prompt
         
-        # 모델 호출
-        response = client.invoke_model(
-            modelId=self.model_id,
-            body=json.dumps(body)
-        )
-        
-        # 응답 파싱
-        response_body = json.loads(response['body'].read())
-        return response_body['content'][0]['text']
+        return body
     
-    def get_embeddings(self, text: str) -> List[float]:
+    def get_embeddings(self, text: str, timeout: float = None) -> List[float]:
         """
         텍스트를 임베딩 벡터로 변환합니다.
         
         Args:
             text: 임베딩할 텍스트
+            timeout: 응답 대기 시간 (초, None이면 BEDROCK_READ_TIMEOUT)
         
         Returns:
             List[float]: 임베딩 벡터 (1536차원)
         """
-        client = self.get_bedrock_runtime_client()
+        client = self.get_bedrock_runtime_client(timeout)
         
         # 요청 본문
         body = json.dumps({
@@ -0,0 +1,138 @@
+"""
+Bedrock 클라이언트 호출 오버헤드 벤치마크
+
+로컬 스텁 엔드포인트(Bedrock invoke_model 응답 흉내)를 띄우고
+- 호출마다 클라이언트 새로 생성 (기존 방식)
+- 공유 클라이언트 풀 재사용 (현재 방식)
+두 경우의 호출당 오버헤드를 비교합니다.
+
+실행:
+    python backend/config/bench_bedrock_client.py [호출 횟수]
+"""
+
+import os
+import sys
+import json
+import time
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+# 프로젝트 루트를 경로에 추가
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+
+class StubBedrockHandler(BaseHTTPRequestHandler):
+    """Bedrock Runtime invoke_model 스텁 (keep-alive 지원)"""
+
+    protocol_version = "HTTP/1.1"
+    # 헤더/본문 분할 전송 시 delayed ACK로 keep-alive 응답이 지연되지 않도록
+    disable_nagle_algorithm = True
+
+    def do_POST(self):
+        length = int(self.headers.get('Content-Length', 0))
+        request_body = json.loads(self.rfile.read(length) or b'{}')
+
+        if 'inputText' in request_body:
+            payload = {'embedding': [0.0] * 1536, 'inputTextTokenCount': 8}
+        else:
+            payload = {'content': [{'type': 'text', 'text': 'ok'}]}
+
+        body = json.dumps(payload).encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_stub_server() -> ThreadingHTTPServer:
+    """스텁 서버를 백그라운드 스레드로 시작합니다."""
+    server = ThreadingHTTPServer(('127.0.0.1', 0), StubBedrockHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server
+
+
+def run_benchmark(n_calls: int = 200) -> dict:
+    """
+    호출당 평균 오버헤드를 측정합니다.
+
+    Args:
+        n_calls: 각 모드별 호출 횟수
+
+    Returns:
+        dict: 모드별 평균 지연 시간 (ms)
+    """
+    server = start_stub_server()
+    host, port = server.server_address
+
+    # aws_config 임포트 전에 스텁 엔드포인트와 더미 자격 증명 설정
+    os.environ['BEDROCK_ENDPOINT_URL'] = f"http://{host}:{port}"
+    os.environ.setdefault('AWS_ACCESS_KEY_ID', 'bench')
+    os.environ.setdefault('AWS_SECRET_ACCESS_KEY', 'bench')
+
+    from backend.config.aws_config import AWSConfig
+    config = AWSConfig()
+
+    body = json.dumps({
+        "anthropic_version": "bedrock-2023-05-31",
+        "max_tokens": 10,
+        "messages": [{"role": "user", "content": "ping"}]
+    })
+
+    def call(client):
+        response = client.invoke_model(modelId=config.model_id, body=body)
+        json.loads(response['body'].read())
+
+    # 워밍업 (임포트/로더 캐시 효과 제거)
+    call(config.create_bedrock_runtime_client())
+    call(config.get_bedrock_runtime_client())
+
+    # 1. 호출마다 새 클라이언트 (기존 방식)
+    start = time.perf_counter()
+    for _ in range(n_calls):
+        call(config.create_bedrock_runtime_client())
+    per_call_new = (time.perf_counter() - start) / n_calls * 1000
+
+    # 2. 공유 클라이언트 풀
+    start = time.perf_counter()
+    for _ in range(n_calls):
+        call(config.get_bedrock_runtime_client())
+    per_call_pooled = (time.perf_counter() - start) / n_calls * 1000
+
+    server.shutdown()
+
+    return {
+        'n_calls': n_calls,
+        'new_client_ms': per_call_new,
+        'pooled_client_ms': per_call_pooled,
+        'speedup': per_call_new / per_call_pooled if per_call_pooled else 0
+    }
+
+
+def main():
+    """벤치마크 실행"""
+
+    n_calls = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+
+    print("\n" + "=" * 60)
+    print("⏱️ Bedrock 클라이언트 호출 오버헤드 벤치마크")
+    print("=" * 60 + "\n")
+
+    result = run_benchmark(n_calls)
+
+    print(f"호출 횟수: {result['n_calls']}회 (모드별)")
+    print(f"   - 호출마다 새 클라이언트: {result['new_client_ms']:.2f} ms/call")
+    print(f"   - 공유 클라이언트 풀:     {result['pooled_client_ms']:.2f} ms/call")
+    print(f"   - 개선: {result['speedup']:.1f}x")
+
+    print("\n" + "=" * 60 + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+"""
+LOT_STATE 페이지 단위 조회 메모리 벤치마크
+
+24시간 윈도우의 행 수를 늘려 가며
+- 한 번에 조회 (get_lot_state → 리스트 전체 보관 후 집계)
+- 페이지 단위 조회 (iter_lot_state → 받으면서 바로 집계)
+두 방식의 최대 메모리 사용량(tracemalloc)과 처리 시간을 비교합니다.
+
+PostgREST 대신 요청한 range만큼 행을 만들어 주는 가짜 클라이언트를 사용하므로
+네트워크 없이 실행됩니다.
+
+실행:
+    python backend/config/bench_pagination.py
+"""
+
+import io
+import sys
+import time
+import tracemalloc
+from contextlib import redirect_stdout
+from pathlib import Path
+
+# 프로젝트 루트를 경로에 추가
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from backend.config.supabase_config import SupabaseConfig
+from backend.utils.data_utils import aggregate_lot_states
+
+WINDOW_SIZES = [10_000, 100_000, 1_000_000]
+PAGE_SIZE = 1000
+LOT_STATES = ['WAIT', 'RUN', 'RUN', 'HOLD', 'END']
+
+
+class FakeQuery:
+    """PostgREST 쿼리 빌더 흉내 (range 요청마다 행 생성)"""
+
+    def __init__(self, n_rows: int):
+        self.n_rows = n_rows
+        self.start = 0
+        self.end = n_rows - 1
+
+    def select(self, *args):
+        return self
+
+    def gte(self, *args):
+        return self
+
+    def lte(self, *args):
+        return self
+
+    def eq(self, *args):
+        return self
+
+    def order(self, *args):
+        return self
+
+    def range(self, start: int, end: int):
+        self.start, self.end = start, end
+        return self
+
+    def execute(self):
+        class Response:
+            data = [
+                {
+                    'event_time': f'2026-01-20T{i % 24:02d}:00:00',
+                    'lot_id': f'LOT{i:07d}',
+                    'eqp_id': 'EQP01',
+                    'lot_state': LOT_STATES[i % len(LOT_STATES)],
+                    'in_cnt': 25
+                }
+                for i in range(self.start, min(self.end + 1, self.n_rows))
+            ]
+        return Response
+
+
+class FakeClient:
+    def __init__(self, n_rows: int):
+        self.n_rows = n_rows
+
+    def table(self, name: str):
+        return FakeQuery(self.n_rows)
+
+
+def measure(fn) -> dict:
+    """최대 메모리(MB)와 시간(ms)"""
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = fn()
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {'peak_mb': peak / 1024 / 1024, 'ms': elapsed_ms, 'result': result}
+
+
+def run_benchmark() -> list:
+    """윈도우 크기별 측정"""
+    config = SupabaseConfig.__new__(SupabaseConfig)
+    config.read_source = 'remote'
+
+    results = []
+    for n_rows in WINDOW_SIZES:
+        config.client = FakeClient(n_rows)
+
+        with redirect_stdout(io.StringIO()):
+            # 한 번에 조회: 서버 max-rows 제한이 없다고 가정하고 전체를 한 페이지(리스트)로 받음
+            materialized = measure(lambda: aggregate_lot_states(
+                list(config.iter_lot_state('2026-01-20 00:00:00', '2026-01-21 00:00:00', 'EQP01', page_size=n_rows))
+            ))
+            streamed = measure(lambda: aggregate_lot_states(
+                config.iter_lot_state('2026-01-20 00:00:00', '2026-01-21 00:00:00', 'EQP01', page_size=PAGE_SIZE)
+            ))
+
+        assert materialized['result'] == streamed['result']
+        results.append({'rows': n_rows, 'materialized': materialized, 'streamed': streamed})
+
+    return results
+
+
+def main():
+    """벤치마크 실행"""
+
+    print("\n" + "=" * 60)
+    print("⏱️ LOT_STATE 페이지 단위 조회 메모리 벤치마크")
+    print("=" * 60 + "\n")
+    print(f"페이지 크기 {PAGE_SIZE}행\n")
+
+    for result in run_benchmark():
+        materialized, streamed = result['materialized'], result['streamed']
+        print(f"[{result['rows']:,}행]")
+        print(f"   한 번에 조회   최대 {materialized['peak_mb']:8.1f}MB   {materialized['ms']:8.0f}ms")
+        print(f"   페이지 단위    최대 {streamed['peak_mb']:8.1f}MB   {streamed['ms']:8.0f}ms")
+        print()
+
+    print("=" * 60 + "\n")
+
+
+if __name__ == "__main__":
+    main()
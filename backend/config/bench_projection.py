@@ -0,0 +1,195 @@
+"""
+컬럼 프로젝션 / 서버 필터 벤치마크
+
+LOT_STATE 전체 컬럼(select('*'))과 컨텍스트에 필요한 컬럼만 조회했을 때의
+응답 크기(JSON 바이트)와 처리 시간(서버 직렬화 + 클라이언트 파싱 + 전송)을 비교합니다.
+EQP_STATE는 전체 행과 DOWN 이벤트만 서버에서 필터링한 경우를 비교합니다.
+
+기본은 Supabase 테이블과 같은 스키마의 합성 데이터
+(lot_state 5771행 / eqp_state 3042행, 그리고 100배)로 측정하고,
+전송 시간은 BANDWIDTH_MBPS 대역폭을 가정해 계산합니다.
+--live를 주면 실제 Supabase 테이블을 페이지 단위로 받아 측정합니다.
+
+실행:
+    python backend/config/bench_projection.py [--live]
+"""
+
+import sys
+import json
+import time
+import random
+from pathlib import Path
+
+# 프로젝트 루트를 경로에 추가
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from backend.nodes.node_3_context_fetch import LOT_COLUMNS, EQP_COLUMNS
+
+# 가정한 PostgREST → 서버 전송 대역폭
+BANDWIDTH_MBPS = 50
+
+LOT_STATE_ROWS = 5771
+EQP_STATE_ROWS = 3042
+LOT_STATES = ['WAIT', 'RUN', 'RUN', 'RUN', 'HOLD', 'END']
+EQP_STATES = ['RUN', 'RUN', 'RUN', 'IDLE', 'IDLE', 'PM', 'DOWN']
+
+
+def make_lot_rows(n_rows: int) -> list:
+    """LOT_STATE 스키마의 합성 행"""
+    rng = random.Random(0)
+    return [
+        {
+            'event_time': f'2026-01-{i % 28 + 1:02d}T{i % 24:02d}:{i % 60:02d}:00',
+            'lot_id': f'LOT{i:07d}',
+            'line_id': 'LINE1',
+            'oper_id': f'OPER{i % 5 + 1}',
+            'eqp_id': f'EQP{i % 12 + 1:02d}',
+            'rcp_id': f'RCP{i % 24 + 1:02d}',
+            'lot_state': rng.choice(LOT_STATES),
+            'in_cnt': 25,
+            'hold_cnt': rng.randint(0, 2),
+            'scrap_cnt': rng.randint(0, 1)
+        }
+        for i in range(n_rows)
+    ]
+
+
+def make_eqp_rows(n_rows: int) -> list:
+    """EQP_STATE 스키마의 합성 행"""
+    rng = random.Random(1)
+    return [
+        {
+            'event_time': f'2026-01-{i % 28 + 1:02d}T{i % 24:02d}:00:00',
+            'end_time': f'2026-01-{i % 28 + 1:02d}T{i % 24:02d}:40:00',
+            'eqp_id': f'EQP{i % 12 + 1:02d}',
+            'line_id': 'LINE1',
+            'oper_id': f'OPER{i % 5 + 1}',
+            'lot_id': f'LOT{i:07d}',
+            'rcp_id': f'RCP{i % 24 + 1:02d}',
+            'eqp_state': rng.choice(EQP_STATES)
+        }
+        for i in range(n_rows)
+    ]
+
+
+def measure(rows: list) -> dict:
+    """응답 JSON 크기와 직렬화/파싱/전송 시간 (ms)"""
+    start = time.perf_counter()
+    payload = json.dumps(rows, ensure_ascii=False).encode('utf-8')
+    json.loads(payload)
+    cpu_ms = (time.perf_counter() - start) * 1000
+
+    transfer_ms = len(payload) * 8 / (BANDWIDTH_MBPS * 1e6) * 1000
+
+    return {
+        'rows': len(rows),
+        'bytes': len(payload),
+        'cpu_ms': cpu_ms,
+        'total_ms': cpu_ms + transfer_ms
+    }
+
+
+def run_synthetic(scale: int = 1) -> dict:
+    """
+    합성 데이터로 전체 조회와 프로젝션/필터 조회를 비교합니다.
+
+    Args:
+        scale: 행 수 배수 (1 = 실제 테이블 크기)
+
+    Returns:
+        dict: {비교 항목: {'full': 측정값, 'projected': 측정값}}
+    """
+    lot_rows = make_lot_rows(LOT_STATE_ROWS * scale)
+    eqp_rows = make_eqp_rows(EQP_STATE_ROWS * scale)
+
+    return {
+        'lot_state (columns)': {
+            'full': measure(lot_rows),
+            'projected': measure([{column: row[column] for column in LOT_COLUMNS} for row in lot_rows])
+        },
+        'eqp_state (columns + DOWN)': {
+            'full': measure(eqp_rows),
+            'projected': measure([
+                {column: row[column] for column in EQP_COLUMNS}
+                for row in eqp_rows if row['eqp_state'] == 'DOWN'
+            ])
+        }
+    }
+
+
+def run_live() -> dict:
+    """실제 Supabase 테이블을 전체 컬럼 / 필요한 컬럼으로 받아 비교합니다."""
+    from backend.config.supabase_config import supabase_config
+
+    def fetch(table: str, columns: list = None, eqp_state: str = None) -> dict:
+        rows = []
+        start = time.perf_counter()
+        offset = 0
+        while True:
+            query = supabase_config._select(table, columns)
+            if eqp_state:
+                query = query.eq('eqp_state', eqp_state)
+            page = query.range(offset, offset + 999).execute().data
+            rows.extend(page)
+            if len(page) < 1000:
+                break
+            offset += 1000
+        elapsed_ms = (time.perf_counter() - start) * 1000
+
+        return {
+            'rows': len(rows),
+            'bytes': len(json.dumps(rows, ensure_ascii=False).encode('utf-8')),
+            'cpu_ms': 0.0,
+            'total_ms': elapsed_ms
+        }
+
+    return {
+        'lot_state (columns)': {
+            'full': fetch('lot_state'),
+            'projected': fetch('lot_state', LOT_COLUMNS)
+        },
+        'eqp_state (columns + DOWN)': {
+            'full': fetch('eqp_state'),
+            'projected': fetch('eqp_state', EQP_COLUMNS, 'DOWN')
+        }
+    }
+
+
+def print_results(title: str, results: dict) -> None:
+    """측정 결과 출력"""
+    print(f"[{title}]")
+    for name, result in results.items():
+        full, projected = result['full'], result['projected']
+        print(f"   {name}")
+        for label, value in (('full', full), ('projected', projected)):
+            print(
+                f"      {label:<9} {value['rows']:>8,}행  {value['bytes'] / 1024:>9,.0f}KB  "
+                f"{value['total_ms']:>8.1f}ms"
+            )
+        print(
+            f"      → 크기 {1 - projected['bytes'] / full['bytes']:.0%} 감소, "
+            f"시간 {1 - projected['total_ms'] / full['total_ms']:.0%} 감소"
+        )
+    print()
+
+
+def main():
+    """벤치마크 실행"""
+
+    print("\n" + "=" * 60)
+    print("⏱️ 컬럼 프로젝션 / 서버 필터 벤치마크")
+    print("=" * 60 + "\n")
+
+    if '--live' in sys.argv:
+        print_results("Supabase 실측", run_live())
+    else:
+        print(f"합성 데이터, 전송 대역폭 {BANDWIDTH_MBPS}Mbps 가정\n")
+        print_results("실제 크기 (x1)", run_synthetic(1))
+        print_results("100배 (x100)", run_synthetic(100))
+
+    print("=" * 60 + "\n")
+
+
+if __name__ == "__main__":
+    main()
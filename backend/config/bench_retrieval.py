@@ -0,0 +1,213 @@
+"""
+리포트 검색 방식 벤치마크 (벡터 / BM25 / 하이브리드)
+
+합성 리포트 N건을 임시 ChromaDB에 적재하고 두 종류의 질문으로
+recall@3과 평균 검색 지연을 비교합니다.
+- 식별자 질문: "EQP07 THP 리포트", "2026-01-26 EQP07 분석 결과"
+- 내용 질문: 리포트 근본 원인 두 문장 (식별자 없음)
+
+Bedrock 없이 실행할 수 있도록 임베딩은 단어 해시 벡터로 대체하고,
+Titan 호출 지연(EMBED_LATENCY_MS)을 sleep으로 흉내 냅니다.
+Titan이 숫자만 다른 식별자(EQP07/EQP17)를 잘 구분하지 못하는 점을 반영해
+영문/숫자 토큰의 가중치는 낮게 둡니다.
+
+실행:
+    python backend/config/bench_retrieval.py [리포트 수]
+"""
+
+import io
+import os
+import sys
+import time
+import random
+import shutil
+import tempfile
+import zlib
+from contextlib import redirect_stdout
+from pathlib import Path
+
+import numpy as np
+
+# 프로젝트 루트를 경로에 추가
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+# chroma_config 전역 인스턴스가 임시 경로를 사용하도록 import 전에 설정
+BENCH_DIR = tempfile.mkdtemp(prefix='bench_retrieval_')
+os.environ['CHROMA_DB_PATH'] = os.path.join(BENCH_DIR, 'chromadb')
+os.environ['EMBEDDING_CACHE_PATH'] = ''
+os.environ['CHROMA_QUERY_EMBEDDING_CACHE_SIZE'] = '0'
+
+from backend.config.aws_config import aws_config
+from backend.config.chroma_config import chroma_config
+from backend.utils.lexical_index import tokenize
+
+EMBED_LATENCY_MS = 150
+EMBED_DIM = 256
+TOP_K = 3
+
+KPIS = ['OEE', 'THP', 'TAT', 'WIP_EXCEED', 'WIP_SHORTAGE']
+
+# 근본 원인 문장 = 부품 + 증상 조합
+COMPONENTS = [
+    '자재 공급 라인', '로더 모듈', '챔버 온도 센서', '진공 펌프', '레시피 파라미터', '이송 로봇',
+    '가스 유량 컨트롤러', '냉각수 순환 장치', '검사 장비 판정 기준', '척 클램프', 'RF 전원부', '배기 댐퍼'
+]
+SYMPTOMS = [
+    '통신 장애로 인한 설비 유휴 시간 증가', '드리프트로 인한 공정 중단', '압력 저하로 인한 반복 알람',
+    '오설정으로 인한 재작업 증가', '교정 불량으로 인한 홀드 증가', '마모로 인한 비계획 다운타임',
+    '과열로 인한 인터락 발생', '응답 지연으로 인한 택트 타임 증가'
+]
+
+
+def fake_embedding(text: str) -> list:
+    """단어 해시 임베딩 (Titan 호출 지연 포함)"""
+    time.sleep(EMBED_LATENCY_MS / 1000)
+
+    vector = np.zeros(EMBED_DIM, dtype=np.float32)
+    for token in tokenize(text):
+        weight = 1.0 if '가' <= token[0] <= '힣' else 0.1
+        vector[zlib.crc32(token.encode('utf-8')) % EMBED_DIM] += weight
+
+    norm = np.linalg.norm(vector)
+    return (vector / norm if norm else vector).tolist()
+
+
+def make_reports(n_reports: int) -> list:
+    """합성 리포트 생성 (장비/KPI/날짜/원인 조합)"""
+    rng = random.Random(42)
+    reports = []
+
+    for i in range(n_reports):
+        eqp_id = f'EQP{i % 40 + 1:02d}'
+        kpi = KPIS[i % len(KPIS)]
+        date = f'2026-{i // 28 % 12 + 1:02d}-{i % 28 + 1:02d}'
+        causes = [f'{rng.choice(COMPONENTS)} {rng.choice(SYMPTOMS)}' for _ in range(3)]
+
+        text = (
+            f"KPI 알람 분석 보고서\n"
+            f"## 기본 정보\n- 날짜: {date}\n- 장비: {eqp_id}\n- 라인: LINE1\n"
+            f"## 문제 정의\n- 문제 KPI: {kpi}\n- 목표 대비 미달\n"
+            f"## 근본 원인\n" + '\n'.join(f'{n}. {cause}' for n, cause in enumerate(causes, 1)) + '\n'
+            f"## 해결 시나리오\n1. 원인별 조치 수행\n2. 모니터링 강화\n"
+        )
+        reports.append({
+            'id': f'report_{date.replace("-", "")}_{eqp_id}_{kpi}_{i}',
+            'text': text,
+            'metadata': {'eqp_id': eqp_id, 'kpi': kpi, 'date': date},
+            'causes': causes
+        })
+
+    return reports
+
+
+def make_queries(reports: list, n_queries: int = 40) -> dict:
+    """질문 종류별 (질문, 정답 리포트 ID) 목록"""
+    rng = random.Random(7)
+    sample = rng.sample(reports, min(n_queries, len(reports)))
+
+    return {
+        'identifier': [
+            (f"{r['metadata']['date']} {r['metadata']['eqp_id']} {r['metadata']['kpi']} 분석 결과", r['id'])
+            for r in sample
+        ],
+        'content': [
+            (f"{r['causes'][0]} 및 {r['causes'][1]} 사례", r['id'])
+            for r in sample
+        ]
+    }
+
+
+def evaluate(queries: list, search) -> dict:
+    """recall@TOP_K와 평균 지연(ms) 측정"""
+    hits = 0
+    start = time.perf_counter()
+
+    with redirect_stdout(io.StringIO()):
+        for question, expected_id in queries:
+            results = search(question)
+            if expected_id in [result['id'] for result in results[:TOP_K]]:
+                hits += 1
+
+    elapsed = time.perf_counter() - start
+
+    return {
+        'recall': hits / len(queries),
+        'avg_ms': elapsed / len(queries) * 1000
+    }
+
+
+def run_benchmark(n_reports: int = 200) -> dict:
+    """
+    검색 방식별 recall@3/지연을 측정합니다.
+
+    Args:
+        n_reports: 적재할 합성 리포트 수
+
+    Returns:
+        dict: {질문 종류: {방식: {'recall', 'avg_ms'}}}
+    """
+    aws_config.get_embeddings = fake_embedding
+    reports = make_reports(n_reports)
+
+    with redirect_stdout(io.StringIO()):
+        prepared = [
+            chroma_config.prepare_report(report['id'], report['text'], report['metadata'])
+            for report in reports
+        ]
+        chroma_config.upsert_reports(prepared)
+
+    def vector_search(question):
+        chroma_config.hybrid_search = False
+        try:
+            return chroma_config.search_similar_reports(question, n_results=TOP_K)
+        finally:
+            chroma_config.hybrid_search = True
+
+    def lexical_search(question):
+        return chroma_config._search_lexical(question, TOP_K)
+
+    def hybrid_search(question):
+        return chroma_config.search_similar_reports(question, n_results=TOP_K)
+
+    # 어휘 인덱스 생성 시간은 측정에서 제외
+    with redirect_stdout(io.StringIO()):
+        chroma_config._get_lexical_index()
+
+    results = {}
+    for kind, queries in make_queries(reports).items():
+        results[kind] = {
+            'vector': evaluate(queries, vector_search),
+            'bm25': evaluate(queries, lexical_search),
+            'hybrid': evaluate(queries, hybrid_search)
+        }
+
+    return results
+
+
+def main():
+    """벤치마크 실행"""
+
+    n_reports = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+
+    print("\n" + "=" * 60)
+    print("⏱️ 리포트 검색 방식 벤치마크")
+    print("=" * 60 + "\n")
+    print(f"리포트 {n_reports}개, 임베딩 지연 {EMBED_LATENCY_MS}ms, recall@{TOP_K}\n")
+
+    try:
+        results = run_benchmark(n_reports)
+    finally:
+        shutil.rmtree(BENCH_DIR, ignore_errors=True)
+
+    for kind, modes in results.items():
+        print(f"[{kind} 질문]")
+        for mode, result in modes.items():
+            print(f"   {mode:<7} recall {result['recall']:.0%}   평균 {result['avg_ms']:7.1f}ms")
+        print()
+
+    print("=" * 60 + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,15 +3,63 @@ ChromaDB Vector Database 설정 및 연결
 """
 
 import os
+import hashlib
+import threading
 import chromadb
+import numpy as np
 from chromadb.config import Settings
 from dotenv import load_dotenv
+from collections import OrderedDict
 from typing import List, Dict, Any
 from datetime import datetime
 
+from backend.utils.report_chunker import split_report_sections
+from backend.utils.lexical_index import BM25Index, METADATA_FIELDS, tokenize
+from backend.utils.question_filters import extract_metadata_filter
+from backend.utils.prompt_templates import MAX_REPORT_CHARS
+
 # 환경 변수 로드
 load_dotenv()
 
+# 청크 메타데이터 필드 (검색 결과의 리포트 메타데이터에서는 제외)
+CHUNK_METADATA_KEYS = ('parent_id', 'chunk_index', 'section')
+
+# 리포트 1개당 조회할 청크 후보 수 (리포트 섹션 수 정도)
+# 검색 결과에 포함하는 청크는 개수가 아니라 MAX_REPORT_CHARS(질문 답변 프롬프트 한도)로 제한
+CHUNK_CANDIDATES_PER_REPORT = 5
+
+# 질문 메타데이터 필터 결과가 이보다 적으면 필터 없는 검색으로 보충
+MIN_FILTERED_RESULTS = int(os.getenv('CHROMA_MIN_FILTERED_RESULTS', '1'))
+
+
+def describe_match(report: Dict[str, Any]) -> str:
+    """
+    검색 결과의 일치 정보를 로그용 문자열로 만듭니다.
+    
+    distance는 벡터 비교를 한 결과에만 있으므로,
+    어휘 검색으로만 찾은 결과는 검색 방식과 RRF/BM25 점수를 표시합니다.
+    
+    Examples:
+        >>> describe_match({'retrieval': 'vector', 'distance': 0.42})
+        '거리: 0.4200'
+        >>> describe_match({'retrieval': 'lexical', 'rrf_score': 0.01613})
+        '어휘 검색, RRF: 0.01613'
+    """
+    parts = []
+    
+    if report.get('distance') is not None:
+        parts.append(f"거리: {report['distance']:.4f}")
+    else:
+        parts.append({'exact': '식별자 일치', 'lexical': '어휘 검색'}.get(report.get('retrieval'), '거리 없음'))
+    
+    if report.get('rrf_score') is not None:
+        parts.append(f"RRF: {report['rrf_score']:.5f}")
+    elif report.get('score') is not None:
+        parts.append(f"BM25: {report['score']:.3f}")
+    
+    return ', '.join(parts)
+
+
 class ChromaDBConfig:
     """ChromaDB 설정 및 관리 클래스"""
     
@@ -35,41 +83,112 @@ class ChromaDBConfig:
         # 컬렉션 생성 또는 가져오기
         self.collection = self._get_or_create_collection()
         
+        # 섹션 청크 컬렉션 (검색은 청크 단위, 결과는 리포트 단위로 묶음)
+        self.chunk_collection_name = "kpi_analysis_report_chunks"
+        self.chunk_collection = self._get_or_create_collection(
+            self.chunk_collection_name, "KPI 분석 리포트 섹션 청크"
+        )
+        
+        # 리포트 추가/삭제 시 증가 (리포트 기반 캐시 무효화용)
+        self.report_version = 0
+        
+        # 질문 임베딩 메모 (같은 질문 텍스트는 Titan을 다시 호출하지 않음)
+        self.query_embedding_cache_size = int(os.getenv('CHROMA_QUERY_EMBEDDING_CACHE_SIZE', '512'))
+        self._query_embeddings: 'OrderedDict[str, List[float]]' = OrderedDict()
+        self._query_embedding_lock = threading.Lock()
+        self.query_embedding_hits = 0
+        self.query_embedding_misses = 0
+        
+        # 하이브리드 검색용 BM25 어휘 인덱스 (리포트가 바뀌면 다시 생성)
+        self.hybrid_search = os.getenv('CHROMA_HYBRID_SEARCH', 'true').lower() == 'true'
+        self._lexical_index = BM25Index()
+        self._lexical_version = None
+        self._lexical_lock = threading.Lock()
+        
         print(f"✅ ChromaDB 초기화 완료: {self.db_path}")
     
-    def _get_or_create_collection(self):
+    def _get_or_create_collection(self, name: str = None, description: str = "KPI 분석 리포트 저장소"):
         """컬렉션을 가져오거나 없으면 생성합니다."""
+        name = name or self.collection_name
         try:
-            collection = self.client.get_collection(name=self.collection_name)
-            print(f"📂 기존 컬렉션 로드: {self.collection_name}")
+            collection = self.client.get_collection(name=name)
+            print(f"📂 기존 컬렉션 로드: {name}")
         except Exception:
             collection = self.client.create_collection(
-                name=self.collection_name,
+                name=name,
                 metadata={
-                    "description": "KPI 분석 리포트 저장소",
+                    "description": description,
                     "created_at": datetime.now().isoformat()
                 }
             )
-            print(f"✨ 새 컬렉션 생성: {self.collection_name}")
+            print(f"✨ 새 컬렉션 생성: {name}")
         
         return collection
     
+    def prepare_report(self, report_id: str, report_text: str, metadata: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        리포트를 섹션 청크로 나누고 청크별 임베딩을 계산합니다.
+        
+        청크 임베딩에는 장비/KPI/날짜를 앞에 붙여 식별자 검색에도 걸리게 하고,
+        리포트 임베딩은 청크 임베딩의 평균(정규화)으로 계산해 추가 호출이 없습니다.
+        
+        Args:
+            report_id: 리포트 ID
+            report_text: 리포트 전문
+            metadata: 리포트 메타데이터
+        
+        Returns:
+            dict: {'id', 'document', 'metadata', 'embedding', 'chunks': [{'id', 'document', 'metadata', 'embedding'}]}
+        """
+        context = ' '.join(
+            str(metadata[key]) for key in ('eqp_id', 'kpi', 'date') if metadata.get(key)
+        )
+        
+        chunks = []
+        for index, chunk in enumerate(split_report_sections(report_text)):
+            chunks.append({
+                'id': f"{report_id}#{index}",
+                'document': chunk['text'],
+                'metadata': {
+                    **metadata,
+                    'parent_id': report_id,
+                    'chunk_index': index,
+                    'section': chunk['section']
+                },
+                'embedding': self.embed_text(f"{context}\n{chunk['text']}" if context else chunk['text'])
+            })
+        
+        if chunks:
+            mean = np.mean([chunk['embedding'] for chunk in chunks], axis=0)
+            norm = np.linalg.norm(mean)
+            embedding = (mean / norm if norm else mean).tolist()
+        else:
+            embedding = self.embed_text(report_text)
+        
+        return {
+            'id': report_id,
+            'document': report_text,
+            'metadata': metadata,
+            'embedding': embedding,
+            'chunks': chunks
+        }
+    
     def add_report(self, report_id: str, report_text: str, metadata: Dict[str, Any]) -> bool:
-        """분석 리포트를 ChromaDB에 저장합니다."""
+        """분석 리포트를 섹션 청크 단위로 임베딩하여 ChromaDB에 저장합니다."""
         try:
-            # AWS Bedrock으로 임베딩 생성
-            from .aws_config import aws_config
-            
             print(f"🔄 임베딩 생성 중: {report_id}")
-            embedding = aws_config.get_embeddings(report_text)
+            report = self.prepare_report(report_id, report_text, metadata)
             
-            # ChromaDB에 저장
-            self.collection.add(
-                documents=[report_text],
-                embeddings=[embedding],
-                metadatas=[metadata],
-                ids=[report_id]
+            # ChromaDB에 저장 (리포트 원문 + 섹션 청크)
+            # 같은 리포트 ID를 다시 저장하면 원문도 덮어써서 청크와 맞춤
+            self.collection.upsert(
+                documents=[report['document']],
+                embeddings=[report['embedding']],
+                metadatas=[report['metadata']],
+                ids=[report['id']]
             )
+            self._replace_chunks([report])
+            self.report_version += 1
             
             print(f"✅ 리포트 저장 완료: {report_id}")
             return True
@@ -78,31 +197,201 @@ class ChromaDBConfig:
             print(f"❌ 리포트 저장 실패: {str(e)}")
             return False
     
-    def search_similar_reports(self, query_text: str, n_results: int = 5, filter_metadata: Dict[str, Any] = None) -> List[Dict[str, Any]]:
-        """유사한 과거 리포트를 검색합니다."""
+    def upsert_reports(self, reports: List[Dict[str, Any]], batch_size: int = 64) -> int:
+        """
+        임베딩이 계산된 리포트들을 배치로 upsert 합니다.
+        
+        같은 ID가 이미 있으면 덮어쓰므로 재적재 시 중복 ID 오류가 나지 않습니다.
+        리포트에 'chunks'가 있으면 기존 청크를 지우고 새 청크로 교체합니다.
+        
+        Args:
+            reports: prepare_report() 결과 목록
+                [{'id', 'document', 'embedding', 'metadata', 'chunks'(선택)}, ...]
+            batch_size: upsert 1회당 리포트 수
+        
+        Returns:
+            int: 저장한 리포트 수
+        """
+        saved = 0
+        
+        for start in range(0, len(reports), batch_size):
+            batch = reports[start:start + batch_size]
+            self.collection.upsert(
+                ids=[report['id'] for report in batch],
+                documents=[report['document'] for report in batch],
+                embeddings=[report['embedding'] for report in batch],
+                metadatas=[report['metadata'] for report in batch]
+            )
+            self._replace_chunks([report for report in batch if 'chunks' in report], batch_size)
+            saved += len(batch)
+        
+        if saved:
+            self.report_version += 1
+        
+        return saved
+    
+    def _replace_chunks(self, reports: List[Dict[str, Any]], batch_size: int = 64) -> None:
+        """리포트들의 기존 청크를 삭제하고 새 청크를 저장합니다."""
+        if not reports:
+            return
+        
+        self.chunk_collection.delete(where={'parent_id': {'$in': [report['id'] for report in reports]}})
+        
+        chunks = [chunk for report in reports for chunk in report['chunks']]
+        for start in range(0, len(chunks), batch_size * 4):
+            batch = chunks[start:start + batch_size * 4]
+            self.chunk_collection.upsert(
+                ids=[chunk['id'] for chunk in batch],
+                documents=[chunk['document'] for chunk in batch],
+                embeddings=[chunk['embedding'] for chunk in batch],
+                metadatas=[chunk['metadata'] for chunk in batch]
+            )
+    
+    def rebuild_chunk_index(self, batch_size: int = 64) -> int:
+        """
+        청크 인덱스 없이 저장된 기존 리포트를 섹션 청크로 다시 색인합니다.
+        
+        Returns:
+            int: 다시 색인한 리포트 수
+        """
+        stored = self.collection.get(include=['documents', 'metadatas'])
+        reports = [
+            self.prepare_report(report_id, document, metadata or {})
+            for report_id, document, metadata in zip(stored['ids'], stored['documents'], stored['metadatas'])
+        ]
+        
+        rebuilt = self.upsert_reports(reports, batch_size=batch_size)
+        print(f"🔄 청크 인덱스 재구성 완료: 리포트 {rebuilt}개, 청크 {self.chunk_collection.count()}개")
+        return rebuilt
+    
+    def embed_text(self, text: str) -> List[float]:
+        """
+        텍스트 임베딩을 반환합니다.
+        
+        영구 임베딩 캐시(모델 ID + 정규화 텍스트 SHA-256)에 있으면 재사용하고,
+        없으면 AWS Bedrock Titan으로 생성한 뒤 캐시에 저장합니다.
+        """
+        from .aws_config import aws_config
+        from backend.utils.embedding_cache import embedding_cache
+        
+        model_id = aws_config.embedding_model_id
+        
+        if embedding_cache is not None:
+            embedding = embedding_cache.get(model_id, text)
+            if embedding is not None:
+                return embedding
+        
+        embedding = aws_config.get_embeddings(text)
+        
+        if embedding_cache is not None:
+            embedding_cache.set(model_id, text, embedding)
+        
+        return embedding
+    
+    def get_embedding_stats(self) -> Dict[str, Any]:
+        """질문 임베딩 메모와 영구 임베딩 캐시 통계"""
+        from backend.utils.embedding_cache import embedding_cache
+        
+        with self._query_embedding_lock:
+            query_memo = {
+                'total_items': len(self._query_embeddings),
+                'max_entries': self.query_embedding_cache_size,
+                'hits': self.query_embedding_hits,
+                'misses': self.query_embedding_misses
+            }
+        
+        return {
+            'query_memo': query_memo,
+            'persistent': embedding_cache.get_stats() if embedding_cache is not None else None
+        }
+    
+    def get_query_embedding(self, query_text: str) -> List[float]:
+        """
+        질문 임베딩을 반환합니다 (최근 질문은 메모에서 재사용).
+        
+        키는 정규화(앞뒤 공백 제거, 연속 공백 축약)한 텍스트의 SHA-256이며,
+        메모는 최대 query_embedding_cache_size개까지 LRU로 유지합니다.
+        """
+        normalized = ' '.join(query_text.split())
+        key = hashlib.sha256(normalized.encode('utf-8')).hexdigest()
+        
+        with self._query_embedding_lock:
+            embedding = self._query_embeddings.get(key)
+            if embedding is not None:
+                self._query_embeddings.move_to_end(key)
+                self.query_embedding_hits += 1
+                return embedding
+            self.query_embedding_misses += 1
+        
+        embedding = self.embed_text(normalized)
+        
+        with self._query_embedding_lock:
+            self._query_embeddings[key] = embedding
+            while len(self._query_embeddings) > self.query_embedding_cache_size:
+                self._query_embeddings.popitem(last=False)
+        
+        return embedding
+    
+    def search_similar_reports(
+        self,
+        query_text: str,
+        n_results: int = 5,
+        filter_metadata: Dict[str, Any] = None,
+        query_embedding: List[float] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        유사한 과거 리포트를 검색합니다.
+        
+        섹션 청크를 검색한 뒤 리포트(parent_id) 단위로 묶어 반환합니다.
+        각 결과의 document는 리포트 전문이 아니라 질문과 가까운 섹션들이며,
+        distance는 그 리포트에서 가장 가까운 청크의 거리입니다.
+        청크 인덱스가 비어 있으면(이전 버전 데이터) 리포트 단위로 검색합니다.
+        
+        하이브리드 검색(CHROMA_HYBRID_SEARCH, 기본 사용)에서는 BM25 어휘 검색 결과와
+        벡터 검색 결과를 RRF(reciprocal rank fusion)로 합칩니다.
+        질문의 장비 ID/날짜 식별자와 메타데이터가 정확히 일치하는 리포트가 있으면
+        임베딩 호출 없이 어휘 검색 결과만 반환합니다.
+        
+        각 결과의 retrieval은 검색 방식입니다.
+        - 'vector': 벡터 검색 (distance 있음)
+        - 'hybrid': 벡터/어휘 검색 모두에서 찾음 (distance, rrf_score 있음)
+        - 'lexical': 어휘 검색에서만 찾음 (rrf_score만 있음, distance 없음)
+        - 'exact': 식별자 일치 (BM25 score만 있음, distance 없음)
+        
+        query_embedding을 주면 임베딩을 다시 계산하지 않습니다.
+        """
         try:
-            from .aws_config import aws_config
-            
             print(f"🔍 유사 리포트 검색 중...")
-            query_embedding = aws_config.get_embeddings(query_text)
             
-            results = self.collection.query(
-                query_embeddings=[query_embedding],
-                n_results=n_results,
-                where=filter_metadata
-            )
+            lexical_results = []
+            if self.hybrid_search:
+                # 검색과 식별자 확인에 같은 인덱스 사용 (도중에 다시 생성되어도 일관됨)
+                index = self._get_lexical_index()
+                lexical_results = self._search_lexical(query_text, n_results * 2, filter_metadata, index)
+                
+                if query_embedding is None:
+                    exact_matches = self._exact_identifier_matches(query_text, lexical_results, index)
+                    if exact_matches:
+                        print(f"⚡ 식별자 일치 리포트 {len(exact_matches[:n_results])}개 (임베딩 생략)")
+                        return exact_matches[:n_results]
             
-            formatted_results = []
+            if query_embedding is None:
+                query_embedding = self.get_query_embedding(query_text)
             
-            if results['ids'] and len(results['ids'][0]) > 0:
-                for i in range(len(results['ids'][0])):
-                    formatted_results.append({
-                        'id': results['ids'][0][i],
-                        'document': results['documents'][0][i],
-                        'metadata': results['metadatas'][0][i],
-                        'distance': results['distances'][0][i] if 'distances' in results else None
-                    })
-                
+            # 융합 시 후보를 넉넉히 확보
+            n_candidates = n_results * 2 if lexical_results else n_results
+            
+            if self.chunk_collection.count() == 0:
+                vector_results = self._search_reports(query_embedding, n_candidates, filter_metadata)
+            else:
+                vector_results = self._search_chunks(query_embedding, n_candidates, filter_metadata)
+            
+            if lexical_results:
+                formatted_results = self._fuse_results(vector_results, lexical_results, n_results)
+            else:
+                formatted_results = vector_results[:n_results]
+            
+            if formatted_results:
                 print(f"✅ {len(formatted_results)}개의 유사 리포트 발견")
             else:
                 print(f"⚠️ 유사 리포트를 찾지 못했습니다")
@@ -113,6 +402,281 @@ class ChromaDBConfig:
             print(f"❌ 검색 실패: {str(e)}")
             return []
     
+    def search_reports_for_question(
+        self,
+        question: str,
+        n_results: int = 5,
+        query_embedding: List[float] = None,
+        min_results: int = MIN_FILTERED_RESULTS
+    ) -> List[Dict[str, Any]]:
+        """
+        질문의 장비 ID/KPI/날짜로 메타데이터 필터를 걸어 유사 리포트를 검색합니다.
+        
+        필터 결과가 min_results개보다 적으면 필터 없이 다시 검색하여
+        필터 결과 뒤에 (중복 없이) n_results개까지 채웁니다.
+        질문에 식별자가 없으면 일반 검색과 같습니다.
+        
+        Args:
+            question: 사용자 질문
+            n_results: 반환할 리포트 수
+            query_embedding: 미리 계산된 질문 임베딩 (선택)
+            min_results: 필터 결과가 이보다 적으면 필터 없는 검색으로 보충
+        
+        Returns:
+            List[Dict]: search_similar_reports와 같은 형식
+        """
+        where = extract_metadata_filter(question)
+        
+        if where is None:
+            return self.search_similar_reports(question, n_results=n_results, query_embedding=query_embedding)
+        
+        print(f"🏷️ 메타데이터 필터: {where}")
+        results = self.search_similar_reports(
+            question,
+            n_results=n_results,
+            filter_metadata=where,
+            query_embedding=query_embedding
+        )
+        
+        if len(results) >= min(min_results, n_results):
+            return results
+        
+        print(f"↩️ 필터 결과 {len(results)}개, 필터 없이 보충 검색")
+        found_ids = {result['id'] for result in results}
+        for result in self.search_similar_reports(question, n_results=n_results, query_embedding=query_embedding):
+            if len(results) >= n_results:
+                break
+            if result['id'] not in found_ids:
+                results.append(result)
+        
+        return results
+    
+    def _search_reports(
+        self,
+        query_embedding: List[float],
+        n_results: int,
+        filter_metadata: Dict[str, Any] = None
+    ) -> List[Dict[str, Any]]:
+        """리포트 단위 검색 (청크 인덱스가 없을 때)"""
+        results = self.collection.query(
+            query_embeddings=[query_embedding],
+            n_results=n_results,
+            where=filter_metadata
+        )
+        
+        formatted_results = []
+        
+        if results['ids'] and len(results['ids'][0]) > 0:
+            for i in range(len(results['ids'][0])):
+                formatted_results.append({
+                    'id': results['ids'][0][i],
+                    'document': results['documents'][0][i],
+                    'metadata': results['metadatas'][0][i],
+                    'distance': results['distances'][0][i] if 'distances' in results else None,
+                    'retrieval': 'vector'
+                })
+        
+        return formatted_results
+    
+    def _search_chunks(
+        self,
+        query_embedding: List[float],
+        n_results: int,
+        filter_metadata: Dict[str, Any] = None
+    ) -> List[Dict[str, Any]]:
+        """청크 단위 검색 후 리포트별로 묶기"""
+        # 리포트 n_results개를 채울 수 있도록 청크를 넉넉히 조회
+        results = self.chunk_collection.query(
+            query_embeddings=[query_embedding],
+            n_results=n_results * CHUNK_CANDIDATES_PER_REPORT * 2,
+            where=filter_metadata
+        )
+        
+        if not results['ids'] or not results['ids'][0]:
+            return []
+        
+        # 거리 오름차순으로 반환되므로 처음 나온 청크가 리포트의 최고 점수
+        hits = zip(results['ids'][0], results['documents'][0], results['metadatas'][0], results['distances'][0])
+        return self._group_by_report(hits, n_results, 'distance')
+    
+    def _search_lexical(
+        self,
+        query_text: str,
+        n_results: int,
+        filter_metadata: Dict[str, Any] = None,
+        index: BM25Index = None
+    ) -> List[Dict[str, Any]]:
+        """BM25 어휘 검색 후 리포트별로 묶기 (점수 내림차순)"""
+        # 인덱스 참조를 한 번만 읽음 (검색 중 다시 생성되어도 이 인덱스는 바뀌지 않음)
+        if index is None:
+            index = self._get_lexical_index()
+        
+        ranked = index.search(query_text, n_results * CHUNK_CANDIDATES_PER_REPORT * 2, where=filter_metadata)
+        hits = [
+            (index.doc_ids[i], index.documents[i], index.metadatas[i], score)
+            for i, score in ranked
+        ]
+        return self._group_by_report(hits, n_results, 'score')
+    
+    @staticmethod
+    def _group_by_report(hits, n_results: int, value_key: str) -> List[Dict[str, Any]]:
+        """
+        (id, document, metadata, 거리/점수) 목록을 리포트 단위로 묶습니다.
+        
+        hits는 좋은 순서로 정렬되어 있어야 하며, 리포트마다 처음 나온 값이 대표값입니다.
+        리포트마다 가까운 청크부터 합친 길이가 MAX_REPORT_CHARS 이하가 되도록 포함합니다
+        (첫 청크는 항상 포함, 한도보다 길면 프롬프트에서 잘림).
+        청크가 아닌 리포트 문서(parent_id 없음)는 자기 ID를 리포트 ID로 사용합니다.
+        """
+        grouped: 'OrderedDict[str, Dict[str, Any]]' = OrderedDict()
+        
+        for doc_id, document, metadata, value in hits:
+            parent_id = metadata.get('parent_id', doc_id)
+            
+            if parent_id not in grouped:
+                if len(grouped) >= n_results:
+                    continue
+                grouped[parent_id] = {
+                    'id': parent_id,
+                    'metadata': {key: item for key, item in metadata.items() if key not in CHUNK_METADATA_KEYS},
+                    'retrieval': 'vector' if value_key == 'distance' else 'lexical',
+                    value_key: value,
+                    'chunks': [],
+                    'chars': 0
+                }
+            
+            report = grouped[parent_id]
+            # 청크 사이 구분자('\n\n') 길이 포함
+            chars = report['chars'] + len(document) + (2 if report['chunks'] else 0)
+            if not report['chunks'] or chars <= MAX_REPORT_CHARS:
+                report['chars'] = chars
+                report['chunks'].append({
+                    'section': metadata.get('section'),
+                    'chunk_index': metadata.get('chunk_index', 0),
+                    'document': document,
+                    value_key: value
+                })
+        
+        formatted_results = []
+        for report in grouped.values():
+            # 프롬프트에는 리포트 내 원래 순서대로 섹션을 이어 붙임
+            chunks = sorted(report['chunks'], key=lambda chunk: chunk['chunk_index'])
+            report['document'] = '\n\n'.join(chunk['document'] for chunk in chunks)
+            report['chunks'] = [
+                {'section': chunk['section'], value_key: chunk[value_key]} for chunk in chunks
+            ]
+            del report['chars']
+            formatted_results.append(report)
+        
+        return formatted_results
+    
+    def _get_lexical_index(self) -> BM25Index:
+        """
+        BM25 인덱스를 반환합니다 (리포트가 바뀌었으면 다시 생성).
+        
+        다른 스레드가 이전 인덱스로 검색 중일 수 있으므로 제자리에서 다시 만들지 않고
+        새 인덱스를 만든 뒤 참조만 교체합니다.
+        """
+        version = self.get_data_version()
+        
+        with self._lexical_lock:
+            if version != self._lexical_version:
+                # 청크 인덱스가 있으면 청크 단위, 없으면 리포트 단위로 색인
+                source = self.chunk_collection if self.chunk_collection.count() > 0 else self.collection
+                stored = source.get(include=['documents', 'metadatas'])
+                index = BM25Index()
+                index.build(stored['ids'], stored['documents'], stored['metadatas'])
+                self._lexical_index = index
+                self._lexical_version = version
+                print(f"📇 어휘 인덱스 생성: 문서 {len(index)}개")
+            
+            return self._lexical_index
+    
+    def has_exact_identifier_match(self, question: str, n_results: int = 5) -> bool:
+        """
+        질문의 장비 ID/날짜와 메타데이터가 정확히 일치하는 리포트가 있는지 확인합니다.
+        
+        True이면 search_similar_reports가 임베딩 없이 결과를 반환하므로,
+        호출 측(run_question_answer)도 질문 임베딩 계산을 생략할 수 있습니다.
+        """
+        if not self.hybrid_search:
+            return False
+        
+        index = self._get_lexical_index()
+        lexical_results = self._search_lexical(question, n_results * 2, index=index)
+        return bool(self._exact_identifier_matches(question, lexical_results, index))
+    
+    @staticmethod
+    def _exact_identifier_matches(
+        query_text: str,
+        lexical_results: List[Dict[str, Any]],
+        index: BM25Index
+    ) -> List[Dict[str, Any]]:
+        """
+        질문의 장비 ID/날짜가 메타데이터와 정확히 일치하는 어휘 검색 결과를 반환합니다.
+        
+        질문에 장비 ID나 날짜가 없거나(KPI만으로는 후보가 너무 많음),
+        질문의 식별자(장비 ID, KPI, 날짜)를 모두 만족하는 리포트가 없으면 빈 목록입니다.
+        벡터 비교를 하지 않았으므로 결과에 distance는 없습니다 (retrieval='exact').
+        
+        index는 lexical_results를 만든 인덱스여야 합니다.
+        """
+        query_tokens = set(tokenize(query_text))
+        
+        # 식별자 값은 인덱스 생성 시 한 번 계산
+        identifier_values = index.identifier_values
+        
+        identifiers = {}
+        for field in METADATA_FIELDS:
+            values = query_tokens & identifier_values[field]
+            if values:
+                identifiers[field] = values
+        
+        if not ({'eqp_id', 'date'} & identifiers.keys()):
+            return []
+        
+        matches = []
+        for report in lexical_results:
+            metadata = report['metadata']
+            if all(str(metadata.get(field, '')).lower() in values for field, values in identifiers.items()):
+                matches.append({**report, 'retrieval': 'exact'})
+        
+        return matches
+    
+    @staticmethod
+    def _fuse_results(
+        vector_results: List[Dict[str, Any]],
+        lexical_results: List[Dict[str, Any]],
+        n_results: int,
+        k: int = 60
+    ) -> List[Dict[str, Any]]:
+        """
+        벡터/어휘 검색 결과를 RRF로 합칩니다. score = Σ 1 / (k + 순위)
+        
+        점수는 rrf_score, 검색 방식은 retrieval('vector'/'lexical'/'hybrid')에 담습니다.
+        어휘 검색에만 나온 리포트는 벡터 거리를 알 수 없으므로 distance가 없습니다.
+        """
+        scores: Dict[str, float] = {}
+        reports: Dict[str, Dict[str, Any]] = {}
+        sources: Dict[str, set] = {}
+        
+        for source, results in (('vector', vector_results), ('lexical', lexical_results)):
+            for rank, report in enumerate(results, 1):
+                scores[report['id']] = scores.get(report['id'], 0.0) + 1.0 / (k + rank)
+                sources.setdefault(report['id'], set()).add(source)
+                # 벡터 결과(거리 있음)를 우선 사용
+                reports.setdefault(report['id'], report)
+        
+        fused = []
+        for report_id in sorted(scores, key=scores.get, reverse=True)[:n_results]:
+            report = dict(reports[report_id])
+            report.pop('score', None)
+            report['retrieval'] = 'hybrid' if len(sources[report_id]) > 1 else next(iter(sources[report_id]))
+            report['rrf_score'] = round(scores[report_id], 5)
+            fused.append(report)
+        
+        return fused
+    
     def get_report_by_id(self, report_id: str) -> Dict[str, Any]:
         """특정 ID의 리포트를 조회합니다."""
         try:
@@ -135,10 +699,21 @@ class ChromaDBConfig:
         """저장된 리포트 개수를 반환합니다."""
         return self.collection.count()
     
+    def get_data_version(self) -> tuple:
+        """
+        리포트 저장소 버전을 반환합니다.
+        
+        이 프로세스의 추가/삭제 횟수와 컬렉션 개수를 함께 사용하므로
+        별도 스크립트(load_reports_to_rag)로 적재한 리포트도 감지합니다.
+        """
+        return (self.report_version, self.collection.count())
+    
     def delete_report(self, report_id: str) -> bool:
         """특정 리포트를 삭제합니다."""
         try:
             self.collection.delete(ids=[report_id])
+            self.chunk_collection.delete(where={'parent_id': report_id})
+            self.report_version += 1
             print(f"🗑️ 리포트 삭제 완료: {report_id}")
             return True
         except Exception as e:
@@ -149,7 +724,12 @@ class ChromaDBConfig:
         """컬렉션의 모든 데이터를 삭제합니다."""
         try:
             self.client.delete_collection(name=self.collection_name)
+            self.client.delete_collection(name=self.chunk_collection_name)
             self.collection = self._get_or_create_collection()
+            self.chunk_collection = self._get_or_create_collection(
+                self.chunk_collection_name, "KPI 분석 리포트 섹션 청크"
+            )
+            self.report_version += 1
             print(f"🔄 컬렉션 초기화 완료")
             return True
         except Exception as e:
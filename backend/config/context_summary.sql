@@ -0,0 +1,60 @@
+-- 알람 컨텍스트 요약 RPC
+--
+-- Node 3이 LOT_STATE / EQP_STATE 원본 행을 모두 받아 Python에서 집계하는 대신
+-- (장비, 시간 윈도우) 단위 집계 결과만 받을 수 있도록 하는 함수입니다.
+-- 반환 형식은 data_utils.aggregate_lot_states / get_downtime_info 결과와 같습니다.
+--
+-- 적용: Supabase SQL Editor에서 실행
+-- 호출: supabase_config.client.rpc('context_summary', {
+--           'p_eqp_id': 'EQP01',
+--           'p_start': '2026-01-20 00:00:00',
+--           'p_end': '2026-01-21 00:00:00'
+--       }).execute()
+
+create index if not exists idx_lot_state_eqp_time on lot_state (eqp_id, event_time);
+create index if not exists idx_eqp_state_eqp_time on eqp_state (eqp_id, event_time);
+
+create or replace function context_summary(p_eqp_id text, p_start timestamp, p_end timestamp)
+returns json
+language sql
+stable
+as $$
+    select json_build_object(
+        'lot_summary', (
+            select json_build_object(
+                'total_lots', coalesce(sum(cnt), 0),
+                'state_counts', coalesce(json_object_agg(state, cnt), '{}'::json),
+                'hold_count', coalesce(sum(cnt) filter (where state = 'HOLD'), 0),
+                'avg_in_cnt', case when sum(cnt) > 0 then sum(in_sum)::float / sum(cnt) else 0 end
+            )
+            from (
+                select coalesce(l.lot_state, 'UNKNOWN') as state,
+                       count(*) as cnt,
+                       sum(coalesce(l.in_cnt, 0)) as in_sum
+                from lot_state l
+                where l.eqp_id = p_eqp_id
+                  and l.event_time::timestamp between p_start and p_end
+                group by 1
+            ) s
+        ),
+        'downtime_info', (
+            select json_build_object(
+                'total_downtime_hours',
+                    coalesce(sum(extract(epoch from e.end_time::timestamp - e.event_time::timestamp)) / 3600, 0),
+                'downtime_count', count(*),
+                'downtime_events', coalesce(json_agg(json_build_object(
+                    'start_time', e.event_time,
+                    'end_time', e.end_time,
+                    'duration_hours', extract(epoch from e.end_time::timestamp - e.event_time::timestamp) / 3600
+                ) order by e.event_time), '[]'::json)
+            )
+            from eqp_state e
+            where e.eqp_id = p_eqp_id
+              and e.eqp_state = 'DOWN'
+              and e.end_time is not null
+              -- 윈도우 전에 시작해 윈도우로 이어지는 DOWN도 포함 (구간 겹침)
+              and e.event_time::timestamp <= p_end
+              and e.end_time::timestamp >= p_start
+        )
+    );
+$$;
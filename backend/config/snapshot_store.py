@@ -0,0 +1,415 @@
+"""
+Supabase 테이블 로컬 스냅샷 (SQLite)
+
+알람 분석은 매번 PostgREST로 kpi_daily / lot_state / eqp_state / rcp_state를 조회하지만,
+이 이력 데이터는 추가만 되고(append-only) 크기도 수 MB 수준입니다.
+테이블을 로컬 SQLite에 복사해 두고 (eqp_id, 시간) 인덱스로 조회하면
+네트워크 왕복 없이 수백 µs 안에 읽을 수 있습니다.
+
+- 증분 동기화: 테이블별 high-water mark(event_time/date 최댓값) 이후 행만 가져옴
+  (같은 시각의 행이 나중에 추가될 수 있으므로 high-water mark 시각의 행은 다시 받아 교체)
+- 시간 컬럼이 없는 테이블(rcp_state)은 매번 전체 교체
+- 행은 원본 그대로 JSON으로 저장하고, 필터용 eqp_id / 시간 키만 별도 컬럼으로 색인
+
+pyarrow가 설치되어 있지 않아 Parquet/Arrow 대신 표준 라이브러리 sqlite3를 사용합니다.
+"""
+
+import os
+import json
+import time
+import sqlite3
+import threading
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from backend.utils.date_utils import parse_datetime
+
+# 테이블별 증분 기준 컬럼 (None이면 매번 전체 교체)
+SNAPSHOT_TABLES = {
+    'kpi_daily': 'date',
+    'lot_state': 'event_time',
+    'eqp_state': 'event_time',
+    'rcp_state': None
+}
+
+# 페이지 경계가 흔들리지 않도록 정렬할 컬럼 (증분 기준 컬럼 + 같은 시각의 행을 구분하는 키)
+SNAPSHOT_ORDER = {
+    'kpi_daily': ['date', 'eqp_id'],
+    'lot_state': ['event_time', 'lot_id'],
+    'eqp_state': ['event_time', 'eqp_id'],
+    'rcp_state': ['rcp_id', 'eqp_id']
+}
+
+# PostgREST 한 번에 받을 행 수 (서버 max-rows 기본값 1000)
+PAGE_SIZE = 1000
+
+# 행 JSON의 end_time을 normalize_time 형식('YYYY-MM-DD HH:MM:SS')으로 맞춘 SQL 식 (구간 겹침 조회용)
+# normalize_time은 연결마다 SQL 함수로 등록 (타임존 변환을 Python 쪽과 같게)
+END_TIME_KEY = "normalize_time(json_extract(row, '$.end_time'))"
+
+
+class SnapshotRows(list):
+    """
+    스냅샷 조회 결과 (list와 동일하게 사용)
+
+    freshness 속성에 스냅샷 시점 정보가 들어 있습니다.
+    """
+
+    freshness: Dict[str, Any]
+
+
+def normalize_time(value: Any) -> Optional[str]:
+    """
+    시간 값을 'YYYY-MM-DD HH:MM:SS' 문자열로 맞춥니다 (문자열 비교로 범위 조회).
+
+    타임존이 포함된 값은 parse_datetime과 같이 UTC로 변환하므로
+    스냅샷 조회와 원격 조회가 같은 시간 윈도우를 사용합니다.
+
+    Examples:
+        >>> normalize_time('2026-01-20T10:25:00+09:00')
+        '2026-01-20 01:25:00'
+        >>> normalize_time('2026-01-20')
+        '2026-01-20 00:00:00'
+    """
+    if value is None:
+        return None
+
+    text = str(value).replace('T', ' ')
+
+    # 타임존 / 소수 초가 붙은 값 (파싱할 수 없으면 앞 19자만 사용)
+    if len(text) > 19:
+        try:
+            return parse_datetime(text).strftime('%Y-%m-%d %H:%M:%S')
+        except ValueError:
+            text = text[:19]
+
+    if len(text) == 10:
+        text += ' 00:00:00'
+    elif len(text) == 16:
+        text += ':00'
+
+    return text
+
+
+class SnapshotStore:
+    """SQLite 스냅샷 저장소 (스레드 안전)"""
+
+    def __init__(self, db_path: str = './data/supabase_snapshot.db'):
+        """
+        Args:
+            db_path: SQLite 파일 경로
+        """
+        self.db_path = db_path
+        os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.conn.create_function('normalize_time', 1, normalize_time, deterministic=True)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        self.conn.execute(
+            '''
+            CREATE TABLE IF NOT EXISTS snapshot_meta (
+                table_name TEXT PRIMARY KEY,
+                high_water_mark TEXT,
+                synced_at REAL NOT NULL,
+                row_count INTEGER NOT NULL
+            )
+            '''
+        )
+        for table in SNAPSHOT_TABLES:
+            self.conn.execute(
+                f'CREATE TABLE IF NOT EXISTS snap_{table} '
+                f'(eqp_id TEXT, time_key TEXT, row TEXT NOT NULL)'
+            )
+            self.conn.execute(
+                f'CREATE INDEX IF NOT EXISTS idx_snap_{table}_eqp_time ON snap_{table} (eqp_id, time_key)'
+            )
+        self.conn.commit()
+
+        self._sync_thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+
+    # ── 동기화 ────────────────────────────────────────────────────
+
+    def sync(self, client, tables: List[str] = None, full: bool = False) -> Dict[str, Dict[str, Any]]:
+        """
+        Supabase 테이블을 스냅샷으로 가져옵니다.
+
+        Args:
+            client: Supabase Client
+            tables: 동기화할 테이블 (None이면 전체)
+            full: True면 high-water mark를 무시하고 전체 다시 받기
+
+        Returns:
+            dict: {테이블: {'fetched', 'row_count', 'high_water_mark', 'elapsed_ms'}}
+        """
+        summary = {}
+
+        for table in tables or SNAPSHOT_TABLES:
+            start = time.perf_counter()
+            time_column = SNAPSHOT_TABLES[table]
+            high_water_mark = None if full or time_column is None else self._get_meta(table).get('high_water_mark')
+
+            rows = self._fetch_rows(client, table, time_column, high_water_mark)
+            row_count, new_high_water_mark = self._store_rows(table, time_column, rows, high_water_mark)
+
+            summary[table] = {
+                'fetched': len(rows),
+                'row_count': row_count,
+                'high_water_mark': new_high_water_mark,
+                'elapsed_ms': round((time.perf_counter() - start) * 1000, 1)
+            }
+            print(f"🔄 스냅샷 동기화 {table}: {len(rows)}행 수신, 총 {row_count}행")
+
+        return summary
+
+    def _fetch_rows(
+        self,
+        client,
+        table: str,
+        time_column: Optional[str],
+        high_water_mark: Optional[str]
+    ) -> List[Dict[str, Any]]:
+        """
+        high-water mark 이후 행을 페이지 단위로 모두 가져옵니다.
+
+        정렬하지 않은 range 페이지는 순서가 보장되지 않아 행이 빠지거나 중복될 수 있으므로
+        항상 SNAPSHOT_ORDER 순으로 정렬합니다 (시간 컬럼이 없는 테이블 포함).
+        """
+        rows = []
+        offset = 0
+
+        while True:
+            query = client.table(table).select('*')
+            if high_water_mark is not None:
+                query = query.gte(time_column, high_water_mark)
+            for column in SNAPSHOT_ORDER[table]:
+                query = query.order(column)
+
+            page = query.range(offset, offset + PAGE_SIZE - 1).execute().data
+            rows.extend(page)
+
+            if len(page) < PAGE_SIZE:
+                return rows
+            offset += PAGE_SIZE
+
+    def _store_rows(
+        self,
+        table: str,
+        time_column: Optional[str],
+        rows: List[Dict[str, Any]],
+        high_water_mark: Optional[str]
+    ):
+        """받은 행을 저장하고 (전체 행 수, 새 high-water mark)를 반환합니다."""
+        records = [
+            (
+                row.get('eqp_id'),
+                normalize_time(row.get(time_column)) if time_column else None,
+                json.dumps(row, ensure_ascii=False, default=str)
+            )
+            for row in rows
+        ]
+
+        new_high_water_mark = high_water_mark
+        if time_column is not None:
+            times = [row[time_column] for row in rows if row.get(time_column)]
+            if times:
+                new_high_water_mark = max(times, key=normalize_time)
+
+        with self._lock:
+            with self.conn:
+                if high_water_mark is None:
+                    self.conn.execute(f'DELETE FROM snap_{table}')
+                else:
+                    # high-water mark 시각의 행은 다시 받았으므로 교체
+                    self.conn.execute(
+                        f'DELETE FROM snap_{table} WHERE time_key = ?',
+                        (normalize_time(high_water_mark),)
+                    )
+
+                self.conn.executemany(
+                    f'INSERT INTO snap_{table} (eqp_id, time_key, row) VALUES (?, ?, ?)',
+                    records
+                )
+
+                (row_count,) = self.conn.execute(f'SELECT COUNT(*) FROM snap_{table}').fetchone()
+                self.conn.execute(
+                    'INSERT OR REPLACE INTO snapshot_meta (table_name, high_water_mark, synced_at, row_count) '
+                    'VALUES (?, ?, ?, ?)',
+                    (table, new_high_water_mark, time.time(), row_count)
+                )
+
+        return row_count, new_high_water_mark
+
+    def start_background_sync(self, client, interval_seconds: float) -> None:
+        """interval_seconds마다 증분 동기화하는 백그라운드 스레드를 시작합니다."""
+        if self._sync_thread is not None and self._sync_thread.is_alive():
+            return
+
+        self._stop_event.clear()
+
+        def loop():
+            while True:
+                try:
+                    self.sync(client)
+                except Exception as e:
+                    print(f"⚠️ 스냅샷 동기화 실패: {e}")
+                if self._stop_event.wait(interval_seconds):
+                    return
+
+        self._sync_thread = threading.Thread(target=loop, name='snapshot-sync', daemon=True)
+        self._sync_thread.start()
+        print(f"⏱️ 스냅샷 주기 동기화 시작 ({interval_seconds:.0f}초 간격)")
+
+    def stop_background_sync(self) -> None:
+        """백그라운드 동기화 중지"""
+        self._stop_event.set()
+        if self._sync_thread is not None:
+            self._sync_thread.join(timeout=5)
+            self._sync_thread = None
+
+    # ── 조회 ──────────────────────────────────────────────────────
+
+    def is_synced(self, table: str) -> bool:
+        """한 번이라도 동기화된 테이블인지 여부"""
+        return bool(self._get_meta(table))
+
+    def query(
+        self,
+        table: str,
+        eqp_id: str = None,
+        start_time: str = None,
+        end_time: str = None,
+        columns: List[str] = None,
+        filters: Dict[str, Any] = None,
+        overlap: bool = False
+    ) -> SnapshotRows:
+        """
+        스냅샷에서 행을 조회합니다 (SupabaseConfig.get_*와 같은 조건).
+
+        Args:
+            table: 테이블 이름
+            eqp_id: 장비 ID
+            start_time: 시간 키 하한 (포함)
+            end_time: 시간 키 상한 (포함)
+            columns: 반환할 컬럼 (None이면 전체)
+            filters: 그 밖의 컬럼 일치 조건 (예: {'eqp_state': 'DOWN'})
+            overlap: True면 start_time 하한을 end_time에 적용 (구간이 윈도우와 겹치는 행)
+
+        Returns:
+            SnapshotRows: 원본 행 목록 (freshness 속성 포함)
+        """
+        clauses = []
+        params = []
+
+        if eqp_id:
+            clauses.append('eqp_id = ?')
+            params.append(eqp_id)
+        if start_time:
+            clauses.append(f'{END_TIME_KEY} >= ?' if overlap else 'time_key >= ?')
+            params.append(normalize_time(start_time))
+        if end_time:
+            clauses.append('time_key <= ?')
+            params.append(normalize_time(end_time))
+
+        sql = f'SELECT row FROM snap_{table}'
+        if clauses:
+            sql += ' WHERE ' + ' AND '.join(clauses)
+        sql += ' ORDER BY rowid'
+
+        with self._lock:
+            records = self.conn.execute(sql, params).fetchall()
+
+        rows = SnapshotRows()
+        for record in records:
+            row = json.loads(record[0])
+            if filters and any(row.get(key) != value for key, value in filters.items()):
+                continue
+            rows.append({column: row.get(column) for column in columns} if columns else row)
+
+        rows.freshness = self.get_freshness(table)
+        return rows
+
+    def summarize_context(self, eqp_id: str, start_time: str, end_time: str) -> Dict[str, Any]:
+        """
+        (장비, 시간 윈도우)의 로트 상태 분포와 다운타임을 SQL로 집계합니다.
+
+        LOT_STATE는 원본 행을 읽지 않고 SQLite에서 상태별 개수/투입 수량 합계만 계산하며,
+        EQP_STATE는 윈도우와 겹치는 DOWN 이벤트만 읽어 get_downtime_info로 계산합니다.
+
+        Returns:
+            dict: {'lot_summary', 'downtime_info'} (aggregate_lot_states / get_downtime_info와 같은 형식)
+        """
+        from backend.utils.data_utils import get_downtime_info
+
+        window = (eqp_id, normalize_time(start_time), normalize_time(end_time))
+
+        with self._lock:
+            histogram = self.conn.execute(
+                "SELECT COALESCE(json_extract(row, '$.lot_state'), 'UNKNOWN'), COUNT(*), "
+                "SUM(COALESCE(json_extract(row, '$.in_cnt'), 0)) "
+                "FROM snap_lot_state WHERE eqp_id = ? AND time_key BETWEEN ? AND ? GROUP BY 1",
+                window
+            ).fetchall()
+            # 윈도우 전에 시작해 윈도우로 이어지는 DOWN도 포함 (구간 겹침)
+            down_rows = self.conn.execute(
+                f"SELECT row FROM snap_eqp_state WHERE eqp_id = ? AND {END_TIME_KEY} >= ? AND time_key <= ? "
+                "AND json_extract(row, '$.eqp_state') = 'DOWN' ORDER BY time_key",
+                window
+            ).fetchall()
+
+        state_counts = {state: count for state, count, _ in histogram}
+        total_lots = sum(state_counts.values())
+        total_in_cnt = sum(in_sum for _, _, in_sum in histogram)
+
+        return {
+            'lot_summary': {
+                'total_lots': total_lots,
+                'state_counts': state_counts,
+                'hold_count': state_counts.get('HOLD', 0),
+                'avg_in_cnt': total_in_cnt / total_lots if total_lots else 0
+            },
+            'downtime_info': get_downtime_info(json.loads(record[0]) for record in down_rows)
+        }
+
+    def get_freshness(self, table: str) -> Dict[str, Any]:
+        """
+        테이블 스냅샷 시점 정보
+
+        Returns:
+            dict: source, table, synced_at(ISO), age_seconds, high_water_mark, row_count
+        """
+        meta = self._get_meta(table)
+
+        if not meta:
+            return {'source': 'snapshot', 'table': table, 'synced_at': None}
+
+        return {
+            'source': 'snapshot',
+            'table': table,
+            'synced_at': datetime.fromtimestamp(meta['synced_at']).isoformat(timespec='seconds'),
+            'age_seconds': round(time.time() - meta['synced_at'], 1),
+            'high_water_mark': meta['high_water_mark'],
+            'row_count': meta['row_count']
+        }
+
+    def get_stats(self) -> Dict[str, Any]:
+        """테이블별 스냅샷 상태"""
+        return {
+            'db_path': self.db_path,
+            'background_sync': self._sync_thread is not None and self._sync_thread.is_alive(),
+            'tables': {table: self.get_freshness(table) for table in SNAPSHOT_TABLES}
+        }
+
+    def _get_meta(self, table: str) -> Dict[str, Any]:
+        with self._lock:
+            row = self.conn.execute(
+                'SELECT high_water_mark, synced_at, row_count FROM snapshot_meta WHERE table_name = ?',
+                (table,)
+            ).fetchone()
+
+        if row is None:
+            return {}
+
+        return {'high_water_mark': row[0], 'synced_at': row[1], 'row_count': row[2]}
@@ -3,13 +3,22 @@ Supabase 데이터베이스 설정 및 연결
 """
 
 import os
+import threading
 from supabase import create_client, Client
 from dotenv import load_dotenv
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterator
+
+from backend.config.snapshot_store import SnapshotStore
 
 # 환경 변수 로드
 load_dotenv()
 
+# PostgREST 한 번에 받을 행 수 (서버 max-rows 기본값 1000을 넘으면 잘림)
+PAGE_SIZE = int(os.getenv('SUPABASE_PAGE_SIZE', '1000'))
+
+# PostgREST "함수를 찾을 수 없음" 오류 코드 (RPC 함수가 배포되지 않음)
+MISSING_FUNCTION_CODES = ('PGRST202', '404')
+
 class SupabaseConfig:
     """
     Supabase 설정 클래스
@@ -26,6 +35,15 @@ class SupabaseConfig:
         
         # Supabase 클라이언트 생성
         self.client: Client = create_client(self.url, self.key)
+        
+        # 조회 기본 위치: 'remote' (PostgREST) 또는 'snapshot' (로컬 SQLite 스냅샷)
+        self.read_source = os.getenv('SUPABASE_READ_SOURCE', 'remote')
+        self.snapshot_path = os.getenv('SUPABASE_SNAPSHOT_PATH', './data/supabase_snapshot.db')
+        self._snapshot: SnapshotStore = None
+        self._snapshot_lock = threading.Lock()
+        
+        # context_summary RPC 사용 가능 여부 (함수가 없으면 페이지 단위 집계로 전환)
+        self._summary_rpc_available = True
     
     def _validate_config(self):
         """필수 설정 값이 있는지 확인합니다."""
@@ -50,6 +68,51 @@ class SupabaseConfig:
             print(f"❌ 연결 실패: {str(e)}")
             return False
     
+    def get_snapshot_store(self) -> SnapshotStore:
+        """로컬 스냅샷 저장소 (처음 사용할 때 생성, 동기화 스레드와 요청 스레드가 함께 호출)"""
+        if self._snapshot is None:
+            with self._snapshot_lock:
+                if self._snapshot is None:
+                    self._snapshot = SnapshotStore(self.snapshot_path)
+        return self._snapshot
+    
+    def sync_snapshot(self, tables: List[str] = None, full: bool = False) -> Dict[str, Dict[str, Any]]:
+        """
+        분석용 테이블을 로컬 스냅샷으로 동기화합니다 (기본: high-water mark 이후 증분).
+        
+        Args:
+            tables: 동기화할 테이블 (None이면 kpi_daily, lot_state, eqp_state, rcp_state)
+            full: True면 전체 다시 받기
+        
+        Returns:
+            dict: 테이블별 동기화 결과
+        """
+        return self.get_snapshot_store().sync(self.client, tables=tables, full=full)
+    
+    def start_snapshot_sync(self, interval_seconds: float) -> None:
+        """interval_seconds마다 스냅샷을 증분 동기화합니다 (백그라운드 스레드)."""
+        self.get_snapshot_store().start_background_sync(self.client, interval_seconds)
+    
+    def stop_snapshot_sync(self) -> None:
+        """주기 동기화 중지"""
+        if self._snapshot is not None:
+            self._snapshot.stop_background_sync()
+    
+    def _use_snapshot(self, table: str, source: str = None) -> bool:
+        """
+        스냅샷에서 읽을지 결정합니다.
+        
+        snapshot 모드라도 아직 동기화되지 않은 테이블은 원격에서 읽습니다.
+        """
+        if (source or self.read_source) != 'snapshot':
+            return False
+        
+        if not self.get_snapshot_store().is_synced(table):
+            print(f"⚠️ {table} 스냅샷이 없어 원격에서 조회합니다 (sync_snapshot 필요)")
+            return False
+        
+        return True
+    
     def get_scenario_map(self, date: str = None) -> List[Dict[str, Any]]:
         """
         SCENARIO_MAP 테이블에서 알람 데이터 조회
@@ -68,10 +131,45 @@ class SupabaseConfig:
         response = query.execute()
         return response.data
     
+    def _select(self, table: str, columns: List[str] = None):
+        """테이블 조회 쿼리 시작 (columns가 있으면 해당 컬럼만 전송)"""
+        return self.client.table(table).select(','.join(columns) if columns else '*')
+    
+    def _iter_pages(self, build_query, order_columns: List[str], page_size: int = None) -> Iterator[Dict[str, Any]]:
+        """
+        range 페이지 단위로 조회하며 행을 하나씩 내보냅니다.
+        
+        한 번에 한 페이지만 메모리에 두므로 조회 범위가 커져도 메모리 사용량이 일정하고,
+        서버 max-rows 제한으로 결과가 잘리지 않습니다.
+        페이지 경계가 흔들리지 않도록 order_columns 순서로 정렬합니다
+        (선택하지 않은 컬럼으로도 정렬 가능).
+        
+        Args:
+            build_query: 필터까지 적용한 쿼리를 새로 만드는 함수
+            order_columns: 정렬 컬럼
+            page_size: 페이지 크기 (None이면 SUPABASE_PAGE_SIZE)
+        """
+        page_size = page_size or PAGE_SIZE
+        offset = 0
+        
+        while True:
+            query = build_query()
+            for column in order_columns:
+                query = query.order(column)
+            
+            page = query.range(offset, offset + page_size - 1).execute().data
+            yield from page
+            
+            if len(page) < page_size:
+                return
+            offset += page_size
+    
     def get_kpi_daily(
         self, 
         date: str = None, 
-        eqp_id: str = None
+        eqp_id: str = None,
+        source: str = None,
+        columns: List[str] = None
     ) -> List[Dict[str, Any]]:
         """
         KPI_DAILY 테이블에서 일별 KPI 데이터 조회
@@ -79,11 +177,18 @@ class SupabaseConfig:
         Args:
             date: 특정 날짜 (YYYY-MM-DD)
             eqp_id: 장비 ID (예: EQP01)
+            source: 'remote' 또는 'snapshot' (None이면 SUPABASE_READ_SOURCE)
+            columns: 조회할 컬럼 (None이면 전체)
         
         Returns:
-            List[Dict]: KPI 데이터 리스트
+            List[Dict]: KPI 데이터 리스트 (snapshot이면 freshness 속성 포함)
         """
-        query = self.client.table('kpi_daily').select('*')
+        if self._use_snapshot('kpi_daily', source):
+            return self.get_snapshot_store().query(
+                'kpi_daily', eqp_id=eqp_id, start_time=date, end_time=date, columns=columns
+            )
+        
+        query = self._select('kpi_daily', columns)
         
         if date:
             query = query.eq('date', date)
@@ -97,7 +202,9 @@ class SupabaseConfig:
         self,
         start_time: str = None,
         end_time: str = None,
-        eqp_id: str = None
+        eqp_id: str = None,
+        source: str = None,
+        columns: List[str] = None
     ) -> List[Dict[str, Any]]:
         """
         LOT_STATE 테이블에서 로트 상태 이력 조회
@@ -106,27 +213,61 @@ class SupabaseConfig:
             start_time: 시작 시간 (YYYY-MM-DD HH:MM)
             end_time: 종료 시간 (YYYY-MM-DD HH:MM)
             eqp_id: 장비 ID
+            source: 'remote' 또는 'snapshot' (None이면 SUPABASE_READ_SOURCE)
+            columns: 조회할 컬럼 (None이면 전체, 예: ['lot_state', 'in_cnt'])
         
         Returns:
-            List[Dict]: 로트 상태 데이터
+            List[Dict]: 로트 상태 데이터 (snapshot이면 freshness 속성 포함)
         """
-        query = self.client.table('lot_state').select('*')
+        if self._use_snapshot('lot_state', source):
+            return self.get_snapshot_store().query(
+                'lot_state', eqp_id=eqp_id, start_time=start_time, end_time=end_time, columns=columns
+            )
         
-        if start_time:
-            query = query.gte('event_time', start_time)
-        if end_time:
-            query = query.lte('event_time', end_time)
-        if eqp_id:
-            query = query.eq('eqp_id', eqp_id)
+        return list(self.iter_lot_state(start_time, end_time, eqp_id, columns=columns))
+    
+    def iter_lot_state(
+        self,
+        start_time: str = None,
+        end_time: str = None,
+        eqp_id: str = None,
+        columns: List[str] = None,
+        page_size: int = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        LOT_STATE 이력을 페이지 단위로 조회하며 행을 하나씩 반환합니다 (원격 전용).
         
-        response = query.execute()
-        return response.data
+        Args:
+            start_time: 시작 시간
+            end_time: 종료 시간
+            eqp_id: 장비 ID
+            columns: 조회할 컬럼 (None이면 전체)
+            page_size: 페이지 크기 (None이면 SUPABASE_PAGE_SIZE)
+        
+        Examples:
+            >>> summary = aggregate_lot_states(supabase_config.iter_lot_state(start, end, 'EQP01'))
+        """
+        def build_query():
+            query = self._select('lot_state', columns)
+            if start_time:
+                query = query.gte('event_time', start_time)
+            if end_time:
+                query = query.lte('event_time', end_time)
+            if eqp_id:
+                query = query.eq('eqp_id', eqp_id)
+            return query
+        
+        return self._iter_pages(build_query, ['event_time', 'lot_id'], page_size)
     
     def get_eqp_state(
         self,
         start_time: str = None,
         end_time: str = None,
-        eqp_id: str = None
+        eqp_id: str = None,
+        source: str = None,
+        columns: List[str] = None,
+        eqp_state: str = None,
+        overlap: bool = False
     ) -> List[Dict[str, Any]]:
         """
         EQP_STATE 테이블에서 장비 상태 이력 조회
@@ -135,33 +276,85 @@ class SupabaseConfig:
             start_time: 시작 시간
             end_time: 종료 시간
             eqp_id: 장비 ID
+            source: 'remote' 또는 'snapshot' (None이면 SUPABASE_READ_SOURCE)
+            columns: 조회할 컬럼 (None이면 전체)
+            eqp_state: 장비 상태 필터 (예: 'DOWN', 서버에서 필터링)
+            overlap: True면 시작 시각이 아니라 구간이 윈도우와 겹치는 행 조회
+                (event_time <= end_time AND end_time >= start_time, 윈도우 전에 시작한 DOWN 포함)
         
         Returns:
-            List[Dict]: 장비 상태 데이터
+            List[Dict]: 장비 상태 데이터 (snapshot이면 freshness 속성 포함)
         """
-        query = self.client.table('eqp_state').select('*')
+        if self._use_snapshot('eqp_state', source):
+            return self.get_snapshot_store().query(
+                'eqp_state', eqp_id=eqp_id, start_time=start_time, end_time=end_time,
+                columns=columns, filters={'eqp_state': eqp_state} if eqp_state else None, overlap=overlap
+            )
         
-        if start_time:
-            query = query.gte('event_time', start_time)
-        if end_time:
-            query = query.lte('event_time', end_time)
-        if eqp_id:
-            query = query.eq('eqp_id', eqp_id)
+        return list(self.iter_eqp_state(
+            start_time, end_time, eqp_id, columns=columns, eqp_state=eqp_state, overlap=overlap
+        ))
+    
+    def iter_eqp_state(
+        self,
+        start_time: str = None,
+        end_time: str = None,
+        eqp_id: str = None,
+        columns: List[str] = None,
+        eqp_state: str = None,
+        page_size: int = None,
+        overlap: bool = False
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        EQP_STATE 이력을 페이지 단위로 조회하며 행을 하나씩 반환합니다 (원격 전용).
         
-        response = query.execute()
-        return response.data
+        Args:
+            start_time: 시작 시간
+            end_time: 종료 시간
+            eqp_id: 장비 ID
+            columns: 조회할 컬럼 (None이면 전체)
+            eqp_state: 장비 상태 필터 (예: 'DOWN')
+            page_size: 페이지 크기 (None이면 SUPABASE_PAGE_SIZE)
+            overlap: True면 구간이 윈도우와 겹치는 행 조회 (end_time >= start_time)
+        
+        Examples:
+            >>> downtime = get_downtime_info(supabase_config.iter_eqp_state(start, end, 'EQP01', eqp_state='DOWN'))
+        """
+        def build_query():
+            query = self._select('eqp_state', columns)
+            if start_time:
+                query = query.gte('end_time' if overlap else 'event_time', start_time)
+            if end_time:
+                query = query.lte('event_time', end_time)
+            if eqp_id:
+                query = query.eq('eqp_id', eqp_id)
+            if eqp_state:
+                query = query.eq('eqp_state', eqp_state)
+            return query
+        
+        return self._iter_pages(build_query, ['event_time', 'eqp_id'], page_size)
     
-    def get_rcp_state(self, eqp_id: str = None) -> List[Dict[str, Any]]:
+    def get_rcp_state(
+        self,
+        eqp_id: str = None,
+        source: str = None,
+        columns: List[str] = None
+    ) -> List[Dict[str, Any]]:
         """
         RCP_STATE 테이블에서 레시피 정보 조회
         
         Args:
             eqp_id: 장비 ID
+            source: 'remote' 또는 'snapshot' (None이면 SUPABASE_READ_SOURCE)
+            columns: 조회할 컬럼 (None이면 전체)
         
         Returns:
-            List[Dict]: 레시피 데이터
+            List[Dict]: 레시피 데이터 (snapshot이면 freshness 속성 포함)
         """
-        query = self.client.table('rcp_state').select('*')
+        if self._use_snapshot('rcp_state', source):
+            return self.get_snapshot_store().query('rcp_state', eqp_id=eqp_id, columns=columns)
+        
+        query = self._select('rcp_state', columns)
         
         if eqp_id:
             query = query.eq('eqp_id', eqp_id)
@@ -169,5 +362,68 @@ class SupabaseConfig:
         response = query.execute()
         return response.data
 
+    def get_context_summary(
+        self,
+        eqp_id: str,
+        start_time: str,
+        end_time: str,
+        source: str = None
+    ) -> Dict[str, Any]:
+        """
+        (장비, 시간 윈도우)의 로트 상태 분포, HOLD 수, 평균 투입 수량, DOWN 시간을
+        원본 행 전송 없이 집계합니다.
+        
+        - snapshot: 로컬 스냅샷에서 SQL 집계
+        - remote: context_summary RPC (backend/config/context_summary.sql),
+          함수가 없으면 페이지 단위로 받으면서 집계 (summarize_context_stream)
+        
+        Args:
+            eqp_id: 장비 ID
+            start_time: 시작 시간
+            end_time: 종료 시간
+            source: 'remote' 또는 'snapshot' (None이면 SUPABASE_READ_SOURCE)
+        
+        Returns:
+            dict: lot_summary, downtime_info, source('snapshot' | 'rpc' | 'stream')
+        """
+        if self._use_snapshot('lot_state', source) and self._use_snapshot('eqp_state', source):
+            store = self.get_snapshot_store()
+            summary = store.summarize_context(eqp_id, start_time, end_time)
+            summary['source'] = 'snapshot'
+            summary['freshness'] = {
+                table: store.get_freshness(table) for table in ('lot_state', 'eqp_state')
+            }
+            return summary
+        
+        if self._summary_rpc_available:
+            try:
+                summary = self.client.rpc('context_summary', {
+                    'p_eqp_id': eqp_id,
+                    'p_start': start_time,
+                    'p_end': end_time
+                }).execute().data
+                summary['source'] = 'rpc'
+                return summary
+            except Exception as e:
+                # 함수가 없을 때만 RPC를 끄고, 타임아웃/5xx 등은 이번 호출만 페이지 단위로 집계
+                if _is_missing_function(e):
+                    self._summary_rpc_available = False
+                    print(f"⚠️ context_summary RPC 사용 불가, 페이지 단위 집계로 전환: {e}")
+                else:
+                    print(f"⚠️ context_summary RPC 실패, 이번 조회만 페이지 단위 집계: {e}")
+        
+        from backend.utils.data_utils import summarize_context_stream
+        
+        summary = summarize_context_stream(eqp_id, start_time, end_time)
+        summary['source'] = 'stream'
+        return summary
+
+
+def _is_missing_function(error: Exception) -> bool:
+    """RPC 오류가 "함수를 찾을 수 없음"(PGRST202 / HTTP 404)인지 확인합니다."""
+    code = str(getattr(error, 'code', '') or '')
+    return code in MISSING_FUNCTION_CODES or 'PGRST202' in str(error)
+
+
 # 싱글톤 패턴으로 전역 설정 객체 생성
 supabase_config = SupabaseConfig()
\ No newline at end of file
@@ -9,7 +9,7 @@ from pathlib import Path
 project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
-from backend.config.chroma_config import chroma_config
+from backend.config.chroma_config import chroma_config, describe_match
 
 
 def main():
@@ -96,7 +96,7 @@ def main():
         print(f"✅ {len(similar_reports)}개의 유사 리포트 발견:\n")
         for i, report in enumerate(similar_reports, 1):
             print(f"{i}. ID: {report['id']}")
-            print(f"   유사도 거리: {report['distance']:.4f}")
+            print(f"   유사도: {describe_match(report)}")
             print(f"   메타데이터: {report['metadata']}")
             print(f"   내용: {report['document'][:80]}...")
             print()
@@ -2,11 +2,74 @@
 AWS Bedrock 연결 테스트
 """
 
+import json
+
 from aws_config import aws_config
 
+
+class FakeStreamClient:
+    """invoke_model_with_response_stream 응답을 고정 이벤트로 대체하는 클라이언트"""
+    
+    def __init__(self, events):
+        self.events = events
+    
+    def invoke_model_with_response_stream(self, **kwargs):
+        return {'body': iter(self.events)}
+
+
+def delta(text):
+    """텍스트 델타 chunk 이벤트"""
+    data = {'type': 'content_block_delta', 'index': 0, 'delta': {'type': 'text_delta', 'text': text}}
+    return {'chunk': {'bytes': json.dumps(data).encode('utf-8')}}
+
+
+def test_stream_errors():
+    """스트리밍 도중 예외 이벤트 처리 테스트 (가짜 이벤트 스트림, 오프라인)"""
+    
+    print("\n" + "=" * 60)
+    print("🧪 Claude 스트림 예외 이벤트 테스트")
+    print("=" * 60 + "\n")
+    
+    error_chunk = {'type': 'error', 'error': {'type': 'overloaded_error', 'message': 'Overloaded'}}
+    cases = [
+        ("정상", [delta("# 리포트"), delta(" 본문"), {'metadata': {}}], None),
+        ("modelStreamErrorException", [delta("# 리포트"), {'modelStreamErrorException': {'message': 'stream broke'}}], 'modelStreamErrorException'),
+        ("throttlingException", [delta("# 리포트"), {'throttlingException': {'message': 'Too many requests'}}], 'throttlingException'),
+        ("internalServerException", [{'internalServerException': {'message': 'internal'}}], 'internalServerException'),
+        ("error chunk", [delta("# 리포트"), {'chunk': {'bytes': json.dumps(error_chunk).encode('utf-8')}}], 'overloaded_error')
+    ]
+    
+    get_client = aws_config.get_bedrock_runtime_client
+    
+    try:
+        for name, events, expected_error in cases:
+            aws_config.get_bedrock_runtime_client = lambda read_timeout=None, events=events: FakeStreamClient(events)
+            tokens = []
+            
+            try:
+                text = aws_config.invoke_claude("프롬프트", on_token=tokens.append)
+                error = None
+            except RuntimeError as e:
+                text, error = None, str(e)
+            
+            print(f"   {name}: {'에러 - ' + error if error else repr(text)}")
+            
+            if expected_error is None:
+                assert error is None and text == "# 리포트 본문"
+            else:
+                # 잘린 응답을 성공으로 반환하지 않음
+                assert error is not None and expected_error in error
+    finally:
+        aws_config.get_bedrock_runtime_client = get_client
+    
+    print("\n✅ 스트림 예외 이벤트 테스트 통과!\n")
+
+
 def main():
     """AWS Bedrock 연결 테스트 실행"""
     
+    test_stream_errors()
+    
     print("\n" + "=" * 60)
     print("🔍 AWS Bedrock 연결 테스트")
     print("=" * 60 + "\n")
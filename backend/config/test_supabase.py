@@ -1,12 +1,186 @@
 """
 Supabase 연결 및 데이터 조회 테스트
+
+로컬 스냅샷 테스트는 가짜 PostgREST 클라이언트로 서버 없이 먼저 실행합니다.
 """
 
+import sys
+import tempfile
+from pathlib import Path
+
+# 프로젝트 루트를 경로에 추가
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
 from supabase_config import supabase_config
 
+from backend.config import snapshot_store
+from backend.config.snapshot_store import SnapshotStore, normalize_time
+from backend.utils.downtime_intervals import downtime_stats
+
+
+class FakeQuery:
+    """PostgREST 쿼리 흉내 (select/gte/lte/eq/order/range/execute)"""
+    
+    def __init__(self, rows):
+        self.rows = rows
+        self.filters = []
+        self.orders = []
+        self.bounds = None
+    
+    def select(self, columns):
+        return self
+    
+    def gte(self, column, value):
+        self.filters.append(lambda row: row.get(column) is not None and row[column] >= value)
+        return self
+    
+    def lte(self, column, value):
+        self.filters.append(lambda row: row.get(column) is not None and row[column] <= value)
+        return self
+    
+    def eq(self, column, value):
+        self.filters.append(lambda row: row.get(column) == value)
+        return self
+    
+    def order(self, column):
+        self.orders.append(column)
+        return self
+    
+    def range(self, start, end):
+        self.bounds = (start, end)
+        return self
+    
+    def execute(self):
+        rows = [row for row in self.rows if all(check(row) for check in self.filters)]
+        for column in reversed(self.orders):
+            rows.sort(key=lambda row: row.get(column))
+        if self.bounds:
+            rows = rows[self.bounds[0]:self.bounds[1] + 1]
+        return type('Response', (), {'data': [dict(row) for row in rows]})()
+
+
+class FakeSupabaseClient:
+    """테이블별 행 목록을 가진 Supabase Client 흉내 (조회한 테이블 기록)"""
+    
+    def __init__(self, tables):
+        self.tables = tables
+        self.queries = []
+    
+    def table(self, name):
+        query = FakeQuery(self.tables.get(name, []))
+        self.queries.append((name, query))
+        return query
+
+
+def test_snapshot_sync():
+    """스냅샷 증분 동기화 테스트 (가짜 PostgREST 클라이언트)"""
+    
+    print("\n" + "=" * 60)
+    print("🗂️ 스냅샷 증분 동기화 테스트")
+    print("=" * 60 + "\n")
+    
+    lot_rows = [
+        {'lot_id': 'LOT3', 'eqp_id': 'EQP01', 'lot_state': 'RUN', 'event_time': '2026-01-20 02:00'},
+        {'lot_id': 'LOT1', 'eqp_id': 'EQP01', 'lot_state': 'RUN', 'event_time': '2026-01-20 01:00'},
+        {'lot_id': 'LOT2', 'eqp_id': 'EQP01', 'lot_state': 'HOLD', 'event_time': '2026-01-20 02:00'}
+    ]
+    rcp_rows = [{'rcp_id': f'RCP{i}', 'eqp_id': 'EQP01', 'complex_level': i} for i in (3, 1, 2)]
+    client = FakeSupabaseClient({'lot_state': lot_rows, 'rcp_state': rcp_rows})
+    store = SnapshotStore(tempfile.mkdtemp() + '/snapshot.db')
+    
+    # 페이지 경계를 확인하도록 페이지 크기를 줄임
+    page_size = snapshot_store.PAGE_SIZE
+    snapshot_store.PAGE_SIZE = 2
+    
+    try:
+        # 1. 전체 동기화 (모든 테이블을 정렬해서 페이지 조회)
+        print("1. 전체 동기화")
+        summary = store.sync(client, ['lot_state', 'rcp_state'])
+        assert summary['lot_state']['row_count'] == 3
+        assert summary['lot_state']['high_water_mark'] == '2026-01-20 02:00'
+        assert summary['rcp_state']['row_count'] == 3
+        orders = {name: query.orders for name, query in client.queries}
+        assert orders == {'lot_state': ['event_time', 'lot_id'], 'rcp_state': ['rcp_id', 'eqp_id']}
+        
+        # 2. 증분: high-water mark 시각에 늦게 적재된 행 + 새 행
+        print("\n2. 증분 동기화")
+        lot_rows.append({'lot_id': 'LOT4', 'eqp_id': 'EQP01', 'lot_state': 'WAIT', 'event_time': '2026-01-20 02:00'})
+        lot_rows.append({'lot_id': 'LOT5', 'eqp_id': 'EQP01', 'lot_state': 'RUN', 'event_time': '2026-01-20 03:00'})
+        summary = store.sync(client, ['lot_state'])
+        # high-water mark 시각부터 다시 받고 그 시각의 기존 행은 교체 (중복 없음)
+        assert summary['lot_state']['fetched'] == 4
+        assert summary['lot_state']['row_count'] == 5
+        assert summary['lot_state']['high_water_mark'] == '2026-01-20 03:00'
+        assert sorted(row['lot_id'] for row in store.query('lot_state')) == ['LOT1', 'LOT2', 'LOT3', 'LOT4', 'LOT5']
+        
+        # 3. 변경 없음 → high-water mark 시각의 행만 다시 받음
+        summary = store.sync(client, ['lot_state'])
+        assert summary['lot_state']['fetched'] == 1 and summary['lot_state']['row_count'] == 5
+        
+        # 4. 시간 컬럼이 없는 테이블은 매번 전체 교체
+        rcp_rows.pop()
+        assert store.sync(client, ['rcp_state'])['rcp_state']['row_count'] == 2
+        
+        # 5. 타임존 포함 시각은 parse_datetime과 같이 UTC로 (원격 조회와 같은 윈도우)
+        print("\n5. 타임존 포함 시각")
+        assert normalize_time('2026-01-20T10:25:00+09:00') == '2026-01-20 01:25:00'
+        assert normalize_time('2026-01-20T01:25:00.123Z') == '2026-01-20 01:25:00'
+        eqp_rows = [{
+            'eqp_id': 'EQP01', 'eqp_state': 'DOWN',
+            'event_time': '2026-01-20T09:00:00+09:00', 'end_time': '2026-01-20T11:00:00+09:00'
+        }]
+        store.sync(FakeSupabaseClient({'eqp_state': eqp_rows}), ['eqp_state'])
+        # UTC 00:00~02:00 구간 → UTC 01:00~03:00 윈도우와 겹침, 02:30 이후 윈도우와는 겹치지 않음
+        assert len(store.query('eqp_state', 'EQP01', '2026-01-20 01:00', '2026-01-20 03:00', overlap=True)) == 1
+        assert len(store.query('eqp_state', 'EQP01', '2026-01-20 02:30', '2026-01-20 03:00', overlap=True)) == 0
+        assert len(store.query('eqp_state', 'EQP01', '2026-01-19 23:00', '2026-01-20 00:30')) == 1
+    finally:
+        snapshot_store.PAGE_SIZE = page_size
+    
+    print("\n✅ 스냅샷 증분 동기화 테스트 완료!\n")
+
+
+def test_snapshot_overlap():
+    """윈도우 전에 시작한 DOWN 구간 조회 테스트 (구간 겹침)"""
+    
+    print("\n" + "=" * 60)
+    print("⛓️ 스냅샷 구간 겹침 조회 테스트")
+    print("=" * 60 + "\n")
+    
+    window = ('2026-01-20 00:00:00', '2026-01-21 00:00:00')
+    eqp_data = [
+        # 윈도우 이전에 시작 (00:00부터 계산)
+        {'eqp_id': 'EQP01', 'eqp_state': 'DOWN', 'event_time': '2026-01-19 22:00', 'end_time': '2026-01-20 03:00'},
+        {'eqp_id': 'EQP01', 'eqp_state': 'DOWN', 'event_time': '2026-01-20 02:00', 'end_time': '2026-01-20 04:00'},
+        {'eqp_id': 'EQP01', 'eqp_state': 'RUN', 'event_time': '2026-01-20 04:00', 'end_time': '2026-01-20 10:00'},
+        # 윈도우 이전에 끝남
+        {'eqp_id': 'EQP01', 'eqp_state': 'DOWN', 'event_time': '2026-01-19 20:00', 'end_time': '2026-01-19 21:00'},
+        # 다른 장비
+        {'eqp_id': 'EQP02', 'eqp_state': 'DOWN', 'event_time': '2026-01-20 23:00', 'end_time': '2026-01-21 02:00'}
+    ]
+    
+    store = SnapshotStore(tempfile.mkdtemp() + '/snapshot.db')
+    store.sync(FakeSupabaseClient({'eqp_state': eqp_data}), ['eqp_state'])
+    fetched = store.query('eqp_state', eqp_id='EQP01', start_time=window[0], end_time=window[1],
+                          filters={'eqp_state': 'DOWN'}, overlap=True)
+    print(f"   조회: {[row['event_time'] for row in fetched]}")
+    assert [row['event_time'] for row in fetched] == ['2026-01-19 22:00', '2026-01-20 02:00']
+    assert downtime_stats(fetched, *window) == downtime_stats(eqp_data[:2], *window)
+    
+    summary = store.summarize_context('EQP01', *window)
+    assert summary['downtime_info']['downtime_count'] == 2
+    
+    print("\n✅ 스냅샷 구간 겹침 조회 테스트 완료!\n")
+
+
 def main():
     """Supabase 연결 테스트"""
     
+    # 0. 로컬 스냅샷 (서버 없이)
+    test_snapshot_sync()
+    test_snapshot_overlap()
+    
     print("\n" + "=" * 60)
     print("🔍 Supabase 연결 테스트")
     print("=" * 60 + "\n")
@@ -80,6 +254,50 @@ def main():
         except Exception as e:
             print(f"❌ {table}: 오류 - {str(e)}")
     
+    # 5. 로컬 스냅샷 동기화 및 조회 비교
+    print("\n" + "=" * 60)
+    print("🗂️ 로컬 스냅샷 동기화")
+    print("=" * 60 + "\n")
+    
+    try:
+        supabase_config.sync_snapshot()
+        
+        remote = supabase_config.get_eqp_state(eqp_id='EQP01', source='remote')
+        snapshot = supabase_config.get_eqp_state(eqp_id='EQP01', source='snapshot')
+        
+        print(f"\n   원격 {len(remote)}행 / 스냅샷 {len(snapshot)}행")
+        print(f"   스냅샷 시점: {snapshot.freshness['synced_at']}")
+        print(f"{'✅ 일치' if len(remote) == len(snapshot) else '⚠️ 행 수 불일치'}")
+        
+    except Exception as e:
+        print(f"❌ 스냅샷 동기화 실패: {str(e)}")
+    
+    # 6. 컨텍스트 집계 (RPC 또는 페이지 단위 집계 / 스냅샷 SQL) 비교
+    print("\n" + "=" * 60)
+    print("🧮 컨텍스트 집계 비교")
+    print("=" * 60 + "\n")
+    
+    try:
+        window = ('EQP01', '2026-01-20 00:00:00', '2026-01-21 00:00:00')
+        
+        remote = supabase_config.get_context_summary(*window, source='remote')
+        snapshot = supabase_config.get_context_summary(*window, source='snapshot')
+        
+        for summary in (remote, snapshot):
+            print(
+                f"   {summary['source']}: 로트 {summary['lot_summary']['total_lots']}개, "
+                f"다운타임 {summary['downtime_info']['total_downtime_hours']:.2f}시간"
+            )
+        
+        same = (
+            remote['lot_summary']['state_counts'] == snapshot['lot_summary']['state_counts']
+            and remote['downtime_info']['downtime_count'] == snapshot['downtime_info']['downtime_count']
+        )
+        print(f"{'✅ 일치' if same else '⚠️ 집계 불일치'}")
+        
+    except Exception as e:
+        print(f"❌ 컨텍스트 집계 실패: {str(e)}")
+    
     print("\n" + "=" * 60)
     print("🎊 Supabase 테스트 완료!")
     print("=" * 60 + "\n")
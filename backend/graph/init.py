@@ -5,6 +5,7 @@ LangGraph 워크플로우 패키지
 from .state import AgentState, create_initial_state, print_state_summary
 from .workflow import (
     get_workflow_app,
+    invoke_workflow,
     run_alarm_analysis,
     run_question_answer,
     create_workflow
@@ -18,6 +19,7 @@ __all__ = [
     
     # Workflow
     'get_workflow_app',
+    'invoke_workflow',
     'run_alarm_analysis',
     'run_question_answer',
     'create_workflow',
@@ -67,6 +67,9 @@ class AgentState(TypedDict, total=False):
     question_text: Optional[str]
     """정제된 질문 텍스트"""
     
+    question_embedding: Optional[List[float]]
+    """질문 임베딩 (Node 4에서 한 번 계산하여 재사용)"""
+    
     final_answer: Optional[str]
     """질문에 대한 최종 답변 (LLM 생성)"""
     
@@ -90,6 +93,12 @@ class AgentState(TypedDict, total=False):
     selected_cause_index: Optional[int]
     """선택된 원인의 인덱스"""
     
+    draft_report: Optional[str]
+    """단일 호출 모드에서 Node 6이 근본 원인과 함께 작성한 리포트 (Node 7 검증 후 Node 8에서 사용)"""
+    
+    draft_report_cause_index: Optional[int]
+    """draft_report가 다루는 원인의 인덱스"""
+    
     # ========== 최종 출력 ==========
     final_report: Optional[str]
     """LLM이 작성한 최종 분석 리포트 (마크다운 형식)"""
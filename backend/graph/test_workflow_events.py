@@ -0,0 +1,232 @@
+"""
+워크플로우 진행 이벤트 테스트 (invoke_workflow)
+
+노드를 고정 결과를 반환하는 함수로 대체하여 서버/LLM 없이 실행합니다.
+LangGraph debug/values 스트림에서 만든 node_start/node_end 이벤트의
+순서와 필드, 최종 State, 토큰 콜백 전달을 확인합니다.
+질문 답변 캐시에 질문 임베딩이 저장되지 않는지도 확인합니다.
+"""
+
+import sys
+import time
+from pathlib import Path
+
+# 프로젝트 루트를 경로에 추가
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from backend.graph import workflow
+from backend.utils.cache import BoundedCache
+
+ALARM_PATH = ['node_1', 'node_2', 'node_3', 'node_6', 'node_7', 'node_8', 'node_9']
+
+# 노드 함수 이름 → 고정 출력
+STUB_OUTPUTS = {
+    'node_1_input_router': {'input_type': 'alarm'},
+    'node_2_load_alarm_kpi': {'alarm_date': '2026-01-20', 'alarm_eqp_id': 'EQP01', 'alarm_kpi': 'OEE'},
+    'node_3_context_fetch': {'context_text': '컨텍스트 ' * 50},
+    'node_6_root_cause_analysis': {'root_causes': [{'cause': '원인', 'probability': 60, 'evidence': '근거'}]},
+    'node_7_human_choice': {'selected_cause': {'cause': '원인', 'probability': 60, 'evidence': '근거'}},
+    'node_9_persist_report': {'rag_saved': True}
+}
+
+NODE_DELAY = 0.02
+
+
+def make_stub(output: dict):
+    """output을 반환하는 노드 함수"""
+    
+    def stub(state: dict) -> dict:
+        time.sleep(NODE_DELAY)
+        return dict(output)
+    
+    return stub
+
+
+def stub_report_writer(state: dict, config: dict = None) -> dict:
+    """Node 8 대체: 토큰 콜백으로 리포트를 두 조각으로 전달"""
+    on_token = (config or {}).get('configurable', {}).get('on_token')
+    chunks = ['# 분석 리포트\n', '## 1. 문제 정의']
+    
+    for text in chunks:
+        if on_token:
+            on_token(text)
+    
+    time.sleep(NODE_DELAY)
+    return {'final_report': ''.join(chunks), 'report_id': 'report_2026-01-20_EQP01_OEE'}
+
+
+def run_with_stub_nodes(**kwargs) -> dict:
+    """노드를 대체한 워크플로우로 invoke_workflow 실행 (실행 후 원래 노드로 복구)"""
+    originals = {name: getattr(workflow, name) for name in list(STUB_OUTPUTS) + ['node_8_report_writer']}
+    
+    for name, output in STUB_OUTPUTS.items():
+        setattr(workflow, name, make_stub(output))
+    workflow.node_8_report_writer = stub_report_writer
+    workflow._workflow_app = None
+    
+    try:
+        return workflow.invoke_workflow({'input_type': 'alarm', 'metadata': {'llm_calls': 0}}, **kwargs)
+    finally:
+        for name, function in originals.items():
+            setattr(workflow, name, function)
+        workflow._workflow_app = None
+
+
+def test_progress_events():
+    """node_start/node_end 이벤트 순서와 필드 테스트"""
+    
+    print("\n" + "=" * 60)
+    print("🧪 워크플로우 진행 이벤트 테스트")
+    print("=" * 60 + "\n")
+    
+    events = []
+    tokens = []
+    final_state = run_with_stub_nodes(on_progress=events.append, on_token=tokens.append)
+    
+    for event in events:
+        print(f"   {event['event']:<10} {event['node']}  {event['elapsed_ms']:>7.1f}ms")
+    print()
+    
+    # 1. 순서: 노드마다 node_start → node_end, 알람 경로 순서대로
+    assert [(event['event'], event['node']) for event in events] == [
+        (name, node) for node in ALARM_PATH for name in ('node_start', 'node_end')
+    ]
+    
+    # 2. 필드
+    elapsed = [event['elapsed_ms'] for event in events]
+    assert elapsed == sorted(elapsed), "elapsed_ms가 감소함"
+    
+    for event in events:
+        if event['event'] == 'node_start':
+            assert set(event) == {'event', 'node', 'elapsed_ms', 'input_bytes'}
+            assert event['input_bytes'] > 0
+        else:
+            assert set(event) == {'event', 'node', 'elapsed_ms', 'duration_ms', 'output_bytes', 'error'}
+            assert event['duration_ms'] >= NODE_DELAY * 1000 * 0.9
+            assert event['output_bytes'] > 0
+            assert event['error'] is None
+    
+    # 노드 입력 크기는 State가 쌓일수록 커짐 (node_3 컨텍스트 이후 node_6 입력이 더 큼)
+    input_bytes = {event['node']: event['input_bytes'] for event in events if event['event'] == 'node_start'}
+    assert input_bytes['node_6'] > input_bytes['node_3']
+    
+    # 3. 최종 State (values 스트림의 마지막 값)
+    assert final_state['final_report'] == '# 분석 리포트\n## 1. 문제 정의'
+    assert final_state['rag_saved'] is True
+    assert final_state['alarm_eqp_id'] == 'EQP01'
+    
+    # 4. 토큰 콜백은 config로 Node 8에 전달
+    assert tokens == ['# 분석 리포트\n', '## 1. 문제 정의']
+    
+    print("✅ 워크플로우 진행 이벤트 테스트 통과!\n")
+
+
+def test_invoke_without_progress():
+    """콜백이 없으면 invoke()와 같은 최종 State"""
+    
+    print("=" * 60)
+    print("🧪 진행 콜백 없는 실행 테스트")
+    print("=" * 60 + "\n")
+    
+    final_state = run_with_stub_nodes()
+    
+    assert final_state['final_report'] == '# 분석 리포트\n## 1. 문제 정의'
+    assert final_state['report_id'] == 'report_2026-01-20_EQP01_OEE'
+    
+    print("✅ 진행 콜백 없는 실행 테스트 통과!\n")
+
+
+class FakeChromaConfig:
+    """질문 임베딩/식별자 확인만 흉내 (임베딩 API 호출 없음)"""
+    
+    def has_exact_identifier_match(self, question: str) -> bool:
+        return False
+    
+    def get_query_embedding(self, question: str) -> list:
+        return [0.1] * 1024
+    
+    def get_data_version(self) -> int:
+        return 1
+
+
+class FakeSemanticCache:
+    """저장된 State만 기록하는 의미 캐시"""
+    
+    def __init__(self):
+        self.saved = []
+    
+    def get(self, embedding, data_version=None, entities=None):
+        return None
+    
+    def set(self, question, embedding, data, **kwargs):
+        self.saved.append(data)
+
+
+def test_question_cache_without_embedding():
+    """질문 답변 캐시에는 question_embedding을 빼고 저장"""
+    
+    print("=" * 60)
+    print("🧪 질문 답변 캐시 저장 테스트")
+    print("=" * 60 + "\n")
+    
+    qa_cache = BoundedCache()
+    semantic_cache = FakeSemanticCache()
+    patches = {
+        'node_1_input_router': make_stub({'input_type': 'question'}),
+        'node_4_report_lookup': make_stub({'similar_reports': [], 'report_exists': False}),
+        'node_5_rag_answer': make_stub({'final_answer': '로더 모듈 통신 장애가 원인입니다.'}),
+        'chroma_config': FakeChromaConfig(),
+        'qa_cache': qa_cache,
+        'qa_semantic_cache': semantic_cache
+    }
+    originals = {name: getattr(workflow, name) for name in patches}
+    
+    for name, value in patches.items():
+        setattr(workflow, name, value)
+    workflow._workflow_app = None
+    
+    try:
+        final_state = workflow.run_question_answer('EQP01 OEE 하락 원인은?')
+    finally:
+        for name, value in originals.items():
+            setattr(workflow, name, value)
+        workflow._workflow_app = None
+    
+    # 실행 결과에는 임베딩이 있지만 (Node 4/5 재사용) 캐시에는 없음
+    assert len(final_state['question_embedding']) == 1024
+    
+    (cached,) = [entry['data'] for entry in qa_cache.cache.values()]
+    assert 'question_embedding' not in cached
+    assert cached['final_answer'] == '로더 모듈 통신 장애가 원인입니다.'
+    
+    (semantic,) = semantic_cache.saved
+    assert 'question_embedding' not in semantic
+    
+    # 임베딩(float 1,024개 → JSON 약 5KB)이 빠져 항목 크기가 작음
+    total_bytes = qa_cache.get_stats()['total_bytes']
+    print(f"   캐시 항목 크기: {total_bytes} bytes")
+    assert total_bytes < 1024
+    
+    print("\n✅ 질문 답변 캐시 저장 테스트 통과!\n")
+
+
+def main():
+    """모든 테스트 실행"""
+    
+    try:
+        test_progress_events()
+        test_invoke_without_progress()
+        test_question_cache_without_embedding()
+        
+        print("=" * 60)
+        print("🎊 모든 테스트 통과!")
+        print("=" * 60 + "\n")
+    
+    except AssertionError as e:
+        print(f"\n❌ 테스트 실패: {e}\n")
+        raise
+
+
+if __name__ == "__main__":
+    main()
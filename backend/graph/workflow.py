@@ -7,8 +7,10 @@ LangGraph 워크플로우 정의
 """
 
 import sys
+import json
+import time
 from pathlib import Path
-from typing import Literal
+from typing import Any, Callable, Dict, Literal, Optional
 
 # 프로젝트 루트 경로 추가
 project_root = Path(__file__).parent.parent.parent
@@ -17,6 +19,10 @@ sys.path.insert(0, str(project_root))
 from langgraph.graph import StateGraph, END
 from backend.graph.state import AgentState
 from backend.utils.cache import analysis_cache, qa_cache
+from backend.utils.semantic_cache import qa_semantic_cache
+from backend.utils.question_filters import extract_question_entities
+from backend.utils.single_flight import analysis_flight, qa_flight, isolate_callback
+from backend.config.chroma_config import chroma_config
 
 # 각 노드 함수 개별 import
 from backend.nodes.node_1_input_router import node_1_input_router
@@ -121,16 +127,100 @@ def get_workflow_app():
     return _workflow_app
 
 
-def run_alarm_analysis(alarm_date: str = None, alarm_eqp_id: str = None, alarm_kpi: str = None) -> AgentState:
+def invoke_workflow(
+    initial_state: Dict[str, Any],
+    on_progress: Optional[Callable[[Dict[str, Any]], None]] = None,
+    on_token: Optional[Callable[[str], None]] = None
+) -> AgentState:
+    """
+    워크플로우를 실행하고, 콜백이 있으면 노드 진행 상황을 전달합니다.
+    
+    콜백이 없으면 기존처럼 invoke()로 실행합니다.
+    콜백이 있으면 LangGraph debug 스트림으로 실행하여 각 노드의
+    시작(node_start)과 종료(node_end) 시점에 이벤트를 전달합니다.
+    
+    Args:
+        initial_state: 초기 State
+        on_progress: 진행 이벤트 콜백 (선택)
+            {'event': 'node_start' | 'node_end', 'node': 'node_3',
+             'elapsed_ms': 워크플로우 시작 후 경과 시간,
+             'input_bytes' | 'output_bytes': State 입력/노드 출력 크기,
+             'duration_ms': 노드 실행 시간 (node_end)}
+        on_token: LLM 텍스트 조각 콜백 (선택)
+            Node 5 (답변), Node 8 (리포트)이 Claude를 스트리밍으로 호출합니다.
+    
+    Returns:
+        AgentState: 최종 State
+    """
+    app = get_workflow_app()
+    
+    # 토큰 콜백은 LangGraph config로 노드에 전달
+    config = {'configurable': {'on_token': on_token}} if on_token else None
+    
+    if on_progress is None:
+        return app.invoke(initial_state, config=config)
+    
+    final_state = initial_state
+    workflow_start = time.perf_counter()
+    node_starts = {}
+    
+    for mode, chunk in app.stream(initial_state, config=config, stream_mode=['debug', 'values']):
+        if mode == 'values':
+            final_state = chunk
+            continue
+        
+        payload = chunk.get('payload', {})
+        node = payload.get('name')
+        now = time.perf_counter()
+        
+        if chunk.get('type') == 'task':
+            node_starts[node] = now
+            on_progress({
+                'event': 'node_start',
+                'node': node,
+                'elapsed_ms': round((now - workflow_start) * 1000, 1),
+                'input_bytes': _payload_size(payload.get('input'))
+            })
+        elif chunk.get('type') == 'task_result':
+            on_progress({
+                'event': 'node_end',
+                'node': node,
+                'elapsed_ms': round((now - workflow_start) * 1000, 1),
+                'duration_ms': round((now - node_starts.get(node, now)) * 1000, 1),
+                'output_bytes': _payload_size(dict(payload.get('result') or [])),
+                'error': payload.get('error')
+            })
+    
+    return final_state
+
+
+def _payload_size(payload: Any) -> int:
+    """State 조각을 JSON으로 직렬화했을 때의 크기 (bytes)"""
+    if payload is None:
+        return 0
+    return len(json.dumps(payload, ensure_ascii=False, default=str).encode('utf-8'))
+
+
+def run_alarm_analysis(
+    alarm_date: str = None,
+    alarm_eqp_id: str = None,
+    alarm_kpi: str = None,
+    on_progress: Optional[Callable[[Dict[str, Any]], None]] = None,
+    on_token: Optional[Callable[[str], None]] = None
+) -> AgentState:
     """
     알람 분석 워크플로우를 실행합니다.
     
     캐싱을 사용하여 동일한 알람 재분석 시 LLM 비용을 절감합니다.
+    같은 알람 분석이 이미 진행 중이면 새로 실행하지 않고 그 결과를 공유합니다.
     
     Args:
         alarm_date: 알람 날짜 (None이면 최신 알람)
         alarm_eqp_id: 장비 ID (None이면 최신 알람)
         alarm_kpi: KPI (None이면 최신 알람)
+        on_progress: 노드 진행 이벤트 콜백 (선택, invoke_workflow 참고)
+            진행 중인 동일 분석에 합류하면 그 분석의 진행 이벤트를 받습니다.
+        on_token: 리포트 텍스트 조각 콜백 (선택, Node 8 스트리밍)
     
     Returns:
         AgentState: 최종 State
@@ -155,25 +245,48 @@ def run_alarm_analysis(alarm_date: str = None, alarm_eqp_id: str = None, alarm_k
             print("=" * 60 + "\n")
             return cached_result
     
-    # 3. 초기 State
-    initial_state = {
-        'input_type': 'alarm',
-        'metadata': {'llm_calls': 0}
-    }
+    # 3. 워크플로우 실행 (동일 알람 분석이 진행 중이면 결과 공유)
+    # 최신 알람 요청끼리도 동시에 들어오면 한 번만 분석
+    flight_key = cache_key or analysis_cache.generate_key('alarm', 'latest')
     
-    # 특정 알람 지정 시
-    if alarm_date and alarm_eqp_id and alarm_kpi:
-        initial_state['alarm_date'] = alarm_date
-        initial_state['alarm_eqp_id'] = alarm_eqp_id
-        initial_state['alarm_kpi'] = alarm_kpi
+    # 이 요청의 콜백이 실패해도 결과를 기다리는 다른 요청은 영향받지 않도록 격리
+    leader_on_progress = isolate_callback(on_progress)
+    leader_on_token = isolate_callback(on_token)
     
-    # 4. 워크플로우 실행
-    app = get_workflow_app()
-    final_state = app.invoke(initial_state)
+    def on_leader_progress(event: Dict[str, Any]) -> None:
+        # 이 요청의 클라이언트 + 합류한 요청(follower)들에게 진행 상황 전달
+        if leader_on_progress:
+            leader_on_progress(event)
+        analysis_flight.publish(flight_key, event)
     
-    # 5. 결과 캐싱 (에러가 없고, 특정 알람인 경우만)
-    if cache_key and 'error' not in final_state and final_state.get('rag_saved'):
-        analysis_cache.set(cache_key, final_state)
+    def run() -> AgentState:
+        initial_state = {
+            'input_type': 'alarm',
+            'metadata': {'llm_calls': 0}
+        }
+        
+        # 특정 알람 지정 시
+        if alarm_date and alarm_eqp_id and alarm_kpi:
+            initial_state['alarm_date'] = alarm_date
+            initial_state['alarm_eqp_id'] = alarm_eqp_id
+            initial_state['alarm_kpi'] = alarm_kpi
+        
+        state = invoke_workflow(initial_state, on_leader_progress, leader_on_token)
+        
+        # 결과 캐싱 (에러가 없고, 특정 알람인 경우만)
+        # 대기 중인 호출이 풀리기 전에 저장해야 이후 요청이 캐시를 사용함
+        if cache_key and 'error' not in state and state.get('rag_saved'):
+            analysis_cache.set(cache_key, state)
+        
+        return state
+    
+    # 합류한 요청은 leader의 노드 진행 이벤트를 on_progress로 받음
+    final_state, shared = analysis_flight.do(flight_key, run, listener=on_progress)
+    
+    if shared:
+        if on_token and final_state.get('final_report'):
+            on_token(final_state['final_report'])
+        print("✅ 진행 중이던 동일 분석 결과 공유 (LLM 호출 생략)")
     
     print("\n" + "=" * 60)
     print("✅ 알람 분석 워크플로우 완료")
@@ -182,14 +295,21 @@ def run_alarm_analysis(alarm_date: str = None, alarm_eqp_id: str = None, alarm_k
     return final_state
 
 
-def run_question_answer(question: str) -> AgentState:
+def run_question_answer(
+    question: str,
+    on_token: Optional[Callable[[str], None]] = None
+) -> AgentState:
     """
     질문 답변 워크플로우를 실행합니다.
     
     동일한 질문에 대해 캐싱을 사용합니다.
+    표현만 다른 질문은 임베딩 유사도(의미 캐시)로 이전 답변을 재사용합니다.
+    같은 질문이 이미 처리 중이면 새로 실행하지 않고 그 결과를 공유합니다.
     
     Args:
         question: 사용자 질문
+        on_token: 답변 텍스트 조각 콜백 (선택, Node 5 스트리밍)
+            캐시 히트/결과 공유 시에는 답변 전체를 한 번에 전달합니다.
     
     Returns:
         AgentState: 최종 State
@@ -207,24 +327,85 @@ def run_question_answer(question: str) -> AgentState:
     # 2. 캐시 확인
     cached_result = qa_cache.get(cache_key)
     if cached_result:
+        if on_token:
+            on_token(cached_result['final_answer'])
         print("✅ 캐시된 답변 사용 (LLM 호출 생략)")
         print("=" * 60 + "\n")
         return cached_result
     
-    # 3. 초기 State
-    initial_state = {
-        'input_type': 'question',
-        'input_data': question,
-        'metadata': {'llm_calls': 0}
-    }
+    # 3. 의미 캐시 확인 (질문 임베딩 유사도, 장비/KPI/날짜가 같은 질문만)
+    question_embedding = None
+    data_version = None
+    entities = extract_question_entities(question)
+    semantic_hit = None
+    
+    # 장비 ID/날짜가 정확히 일치하는 리포트가 있으면 검색이 임베딩 없이 끝나므로
+    # 의미 캐시(임베딩 필요)도 건너뛰어 Titan 호출을 생략
+    try:
+        exact_match = chroma_config.has_exact_identifier_match(question)
+    except Exception as e:
+        print(f"⚠️ 식별자 일치 확인 실패: {e}")
+        exact_match = False
+    
+    if exact_match:
+        print("⚡ 식별자 일치 리포트 있음, 질문 임베딩 생략")
+    else:
+        try:
+            question_embedding = chroma_config.get_query_embedding(question)
+            data_version = chroma_config.get_data_version()
+            semantic_hit = qa_semantic_cache.get(question_embedding, data_version, entities)
+        except Exception as e:
+            print(f"⚠️ 의미 캐시 조회 실패: {e}")
+    
+    if semantic_hit:
+        cached_result, _ = semantic_hit
+        if on_token:
+            on_token(cached_result['final_answer'])
+        print("✅ 유사 질문의 답변 사용 (LLM 호출 생략)")
+        print("=" * 60 + "\n")
+        return cached_result
     
-    # 4. 워크플로우 실행
-    app = get_workflow_app()
-    final_state = app.invoke(initial_state)
+    # 4. 워크플로우 실행 (동일 질문이 처리 중이면 결과 공유)
+    leader_on_token = isolate_callback(on_token)
     
-    # 5. 결과 캐싱 (에러가 없는 경우만)
-    if 'error' not in final_state and final_state.get('final_answer'):
-        qa_cache.set(cache_key, final_state)
+    def run() -> AgentState:
+        initial_state = {
+            'input_type': 'question',
+            'input_data': question,
+            'metadata': {'llm_calls': 0}
+        }
+        
+        # 의미 캐시에서 계산한 임베딩을 Node 4/5가 재사용
+        if question_embedding is not None:
+            initial_state['question_embedding'] = question_embedding
+        
+        started = time.perf_counter()
+        state = invoke_workflow(initial_state, on_token=leader_on_token)
+        
+        # 결과 캐싱 (에러가 없는 경우만)
+        # 질문 임베딩(float 1,000여 개)은 캐시 용량(JSON 바이트)만 차지하므로 빼고 저장
+        if 'error' not in state and state.get('final_answer'):
+            cached_state = {key: value for key, value in state.items() if key != 'question_embedding'}
+            qa_cache.set(cache_key, cached_state)
+            
+            if question_embedding is not None:
+                qa_semantic_cache.set(
+                    question,
+                    question_embedding,
+                    cached_state,
+                    duration_seconds=time.perf_counter() - started,
+                    data_version=data_version,
+                    entities=entities
+                )
+        
+        return state
+    
+    final_state, shared = qa_flight.do(cache_key, run)
+    
+    if shared:
+        if on_token and final_state.get('final_answer'):
+            on_token(final_state['final_answer'])
+        print("✅ 처리 중이던 동일 질문 답변 공유 (LLM 호출 생략)")
     
     print("\n" + "=" * 60)
     print("✅ 질문 답변 워크플로우 완료")
@@ -12,10 +12,24 @@ Node 3: Context Fetch
 - eqp_data: 장비 상태 데이터 리스트
 - rcp_data: 레시피 정보 리스트
 - context_text: LLM에 제공할 포맷팅된 텍스트
+- metadata['context_fetch']: 테이블별 조회 시간 (ms)
+
+세 테이블 조회는 서로 독립적이므로 기본적으로 스레드 풀에서 동시에 실행합니다.
+(CONTEXT_FETCH_CONCURRENT=false 로 순차 실행)
+컨텍스트에 쓰이는 컬럼만 조회하고 EQP_STATE는 DOWN 이벤트만 받습니다.
+(CONTEXT_FETCH_PROJECTION=false 로 전체 행 조회)
+CONTEXT_FETCH_SUMMARY_ONLY=true 이면 LOT/EQP 원본 행 대신
+(장비, 시간 윈도우) 집계 결과만 받습니다 (RPC 또는 로컬 스냅샷 SQL).
+CONTEXT_TOKEN_BUDGET을 지정하면 알람 KPI 관련도 순으로 섹션을 배치하고
+추정 토큰 수가 예산을 넘지 않도록 섹션을 요약합니다 (context_builder).
 """
 
+import os
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 # 프로젝트 루트 경로 추가
 project_root = Path(__file__).parent.parent.parent
@@ -24,6 +38,29 @@ sys.path.insert(0, str(project_root))
 from backend.config.supabase_config import supabase_config
 from backend.utils.date_utils import get_time_window
 from backend.utils.data_utils import format_context_data
+from backend.utils.context_builder import build_context, estimate_tokens
+from backend.utils.downtime_intervals import downtime_stats
+
+# LOT/EQP/RCP 조회를 병렬로 실행할지 여부 (기본: 병렬)
+CONTEXT_FETCH_CONCURRENT = os.getenv('CONTEXT_FETCH_CONCURRENT', 'true').lower() == 'true'
+
+# 컨텍스트 생성(format_context_data)에 필요한 컬럼만 조회할지 여부 (기본: 사용)
+# EQP_STATE는 다운타임 계산에 DOWN 이벤트만 필요하므로 서버에서 필터링
+CONTEXT_FETCH_PROJECTION = os.getenv('CONTEXT_FETCH_PROJECTION', 'true').lower() == 'true'
+
+LOT_COLUMNS = ['lot_state', 'in_cnt']
+EQP_COLUMNS = ['eqp_state', 'event_time', 'end_time']
+RCP_COLUMNS = ['rcp_id', 'complex_level']
+
+# LOT/EQP 원본 행 대신 집계 결과만 조회할지 여부 (기본: 원본 행 조회)
+# 사용 시 lot_data / eqp_data는 빈 리스트이고 컨텍스트는 집계 결과로 만듭니다.
+CONTEXT_FETCH_SUMMARY_ONLY = os.getenv('CONTEXT_FETCH_SUMMARY_ONLY', 'false').lower() == 'true'
+
+# 컨텍스트 최대 추정 토큰 수 (0이면 제한 없이 format_context_data 사용)
+CONTEXT_TOKEN_BUDGET = int(os.getenv('CONTEXT_TOKEN_BUDGET', '0'))
+
+# 토큰 예산 컨텍스트(build_context)의 시간대별 HOLD 분포에 추가로 필요한 로트 컬럼
+LOT_BUDGET_COLUMNS = ['event_time']
 
 
 def node_3_context_fetch(state: dict) -> dict:
@@ -45,6 +82,7 @@ def node_3_context_fetch(state: dict) -> dict:
             - eqp_data: 장비 상태 데이터
             - rcp_data: 레시피 정보
             - context_text: 포맷팅된 컨텍스트
+            - metadata: context_fetch 항목에 쿼리별 소요 시간 기록
             - error: 에러 메시지 (실패 시)
     """
     
@@ -76,44 +114,108 @@ def node_3_context_fetch(state: dict) -> dict:
     
     print(f"⏰ 조회 시간 범위: {start_time} ~ {end_time}")
     
-    # 3. LOT_STATE 조회
-    print(f"\n📦 LOT_STATE 조회 중...")
-    try:
-        lot_data = supabase_config.get_lot_state(
-            start_time=start_time,
-            end_time=end_time,
-            eqp_id=alarm_eqp_id
-        )
-        print(f"   ✅ {len(lot_data)}개 로트 이벤트 조회")
-        
-    except Exception as e:
-        print(f"   ⚠️ LOT_STATE 조회 실패: {e}")
-        lot_data = []
+    # 3. LOT / EQP / RCP 조회 (동시 실행 또는 순차 실행)
+    queries = {
+        'lot_state': (supabase_config.get_lot_state, {
+            'start_time': start_time,
+            'end_time': end_time,
+            'eqp_id': alarm_eqp_id
+        }),
+        'eqp_state': (supabase_config.get_eqp_state, {
+            'start_time': start_time,
+            'end_time': end_time,
+            'eqp_id': alarm_eqp_id
+        }),
+        'rcp_state': (supabase_config.get_rcp_state, {
+            'eqp_id': alarm_eqp_id
+        }),
+    }
     
-    # 4. EQP_STATE 조회
-    print(f"🔧 EQP_STATE 조회 중...")
-    try:
-        eqp_data = supabase_config.get_eqp_state(
-            start_time=start_time,
-            end_time=end_time,
-            eqp_id=alarm_eqp_id
+    if CONTEXT_FETCH_PROJECTION:
+        queries['lot_state'][1]['columns'] = (
+            LOT_COLUMNS + LOT_BUDGET_COLUMNS if CONTEXT_TOKEN_BUDGET > 0 else LOT_COLUMNS
         )
-        print(f"   ✅ {len(eqp_data)}개 장비 상태 이벤트 조회")
-        
-        # 다운타임 정보 출력
-        downtime_count = sum(1 for e in eqp_data if e.get('eqp_state') == 'DOWN')
-        if downtime_count > 0:
-            print(f"   ⚠️ 다운타임 발생: {downtime_count}회")
+        queries['eqp_state'][1]['columns'] = EQP_COLUMNS
+        queries['eqp_state'][1]['eqp_state'] = 'DOWN'
+        # 윈도우 전에 시작해 윈도우로 이어지는 DOWN도 조회 (downtime_stats가 윈도우로 자름)
+        queries['eqp_state'][1]['overlap'] = True
+        queries['rcp_state'][1]['columns'] = RCP_COLUMNS
+    
+    if CONTEXT_FETCH_SUMMARY_ONLY:
+        # LOT/EQP는 집계 결과만 (한 번의 호출)
+        del queries['lot_state'], queries['eqp_state']
+        queries['context_summary'] = (supabase_config.get_context_summary, {
+            'eqp_id': alarm_eqp_id,
+            'start_time': start_time,
+            'end_time': end_time
+        })
+    
+    mode = 'concurrent' if CONTEXT_FETCH_CONCURRENT else 'sequential'
+    if CONTEXT_FETCH_SUMMARY_ONLY:
+        mode += '+summary'
+    print(f"\n📦 LOT_STATE / EQP_STATE / RCP_STATE 조회 중... ({mode})")
+    
+    fetch_start = time.perf_counter()
+    
+    if CONTEXT_FETCH_CONCURRENT:
+        with ThreadPoolExecutor(max_workers=len(queries)) as executor:
+            futures = {
+                name: executor.submit(_timed_query, fn, kwargs)
+                for name, (fn, kwargs) in queries.items()
+            }
+            results = {name: future.result() for name, future in futures.items()}
+    else:
+        results = {
+            name: _timed_query(fn, kwargs)
+            for name, (fn, kwargs) in queries.items()
+        }
+    
+    fetch_total_ms = (time.perf_counter() - fetch_start) * 1000
+    
+    lot_summary = None
+    downtime_info = None
+    
+    if CONTEXT_FETCH_SUMMARY_ONLY:
+        summary, summary_ms, summary_error = results.pop('context_summary')
+        if not summary_error:
+            lot_summary = summary['lot_summary']
+            downtime_info = summary['downtime_info']
+        # 원본 행은 받지 않음 (집계 결과로 컨텍스트 생성)
+        results['lot_state'] = ([], summary_ms, summary_error)
+        results['eqp_state'] = ([], summary_ms, summary_error)
+    
+    lot_data, lot_ms, lot_error = results['lot_state']
+    eqp_data, eqp_ms, eqp_error = results['eqp_state']
+    rcp_data, rcp_ms, rcp_error = results['rcp_state']
+    
+    # 4. 조회 결과 출력 (실패한 쿼리는 빈 리스트로 대체)
+    if CONTEXT_FETCH_SUMMARY_ONLY:
+        if lot_error:
+            print(f"   ⚠️ 컨텍스트 집계 조회 실패: {lot_error}")
+        else:
+            print(f"   ✅ {lot_summary['total_lots']}개 로트 이벤트 집계 ({summary['source']}, {lot_ms:.0f}ms)")
+            if downtime_info['downtime_count'] > 0:
+                print(f"   ⚠️ 다운타임 발생: {downtime_info['downtime_count']}회")
+    else:
+        if lot_error:
+            print(f"   ⚠️ LOT_STATE 조회 실패: {lot_error}")
+        else:
+            print(f"   ✅ {len(lot_data)}개 로트 이벤트 조회 ({lot_ms:.0f}ms)")
         
-    except Exception as e:
-        print(f"   ⚠️ EQP_STATE 조회 실패: {e}")
-        eqp_data = []
+        if eqp_error:
+            print(f"   ⚠️ EQP_STATE 조회 실패: {eqp_error}")
+        else:
+            print(f"   ✅ {len(eqp_data)}개 장비 상태 이벤트 조회 ({eqp_ms:.0f}ms)")
+            
+            # 다운타임 정보 출력
+            downtime_count = sum(1 for e in eqp_data if e.get('eqp_state') == 'DOWN')
+            if downtime_count > 0:
+                print(f"   ⚠️ 다운타임 발생: {downtime_count}회")
     
-    # 5. RCP_STATE 조회
-    print(f"📋 RCP_STATE 조회 중...")
-    try:
-        rcp_data = supabase_config.get_rcp_state(eqp_id=alarm_eqp_id)
-        print(f"   ✅ {len(rcp_data)}개 레시피 정보 조회")
+    if rcp_error:
+        print(f"   ⚠️ RCP_STATE 조회 실패: {rcp_error}")
+    else:
+        print(f"   ✅ {len(rcp_data)}개 레시피 정보 조회 ({rcp_ms:.0f}ms)")
         
         # 복잡도 정보 출력
         if rcp_data:
@@ -121,21 +223,77 @@ def node_3_context_fetch(state: dict) -> dict:
             avg_complexity = sum(complexities) / len(complexities)
             max_complexity = max(complexities)
             print(f"   📊 레시피 복잡도: 평균 {avg_complexity:.1f}, 최대 {max_complexity}")
-        
-    except Exception as e:
-        print(f"   ⚠️ RCP_STATE 조회 실패: {e}")
-        rcp_data = []
+    
+    print(f"   ⏱️ 전체 조회 시간: {fetch_total_ms:.0f}ms")
+    
+    # 5. 쿼리별 소요 시간 기록
+    metadata = state.get('metadata', {})
+    metadata['context_fetch'] = {
+        'mode': mode,
+        'lot_state_ms': round(lot_ms, 1),
+        'eqp_state_ms': round(eqp_ms, 1),
+        'rcp_state_ms': round(rcp_ms, 1),
+        'total_ms': round(fetch_total_ms, 1)
+    }
+    
+    if lot_summary is not None:
+        metadata['context_fetch']['summary_source'] = summary['source']
+    
+    # 스냅샷에서 읽은 테이블은 스냅샷 시점 기록
+    freshness = {
+        name: rows.freshness
+        for name, (rows, _, _) in results.items()
+        if hasattr(rows, 'freshness')
+    }
+    if lot_summary is not None and 'freshness' in summary:
+        freshness.update(summary['freshness'])
+    if freshness:
+        metadata['context_fetch']['snapshot'] = freshness
+        oldest = max(info.get('age_seconds') or 0 for info in freshness.values())
+        print(f"   🗂️ 로컬 스냅샷 사용 (가장 오래된 동기화: {oldest:.0f}초 전)")
     
     # 6. 컨텍스트 텍스트 생성
     print(f"\n📝 컨텍스트 텍스트 생성 중...")
     try:
-        context_text = format_context_data(
-            kpi_data=kpi_data,
-            lot_data=lot_data,
-            eqp_data=eqp_data,
-            rcp_data=rcp_data
-        )
-        print(f"   ✅ 컨텍스트 생성 완료 ({len(context_text)}자)")
+        # 겹치거나 중복된 DOWN 구간을 합치고 조회 윈도우로 자른 다운타임 통계
+        if downtime_info is not None:
+            down_rows = [
+                {'eqp_state': 'DOWN', 'event_time': event['start_time'], 'end_time': event['end_time']}
+                for event in downtime_info['downtime_events']
+            ]
+        else:
+            down_rows = eqp_data
+        merged_downtime = downtime_stats(down_rows, start_time, end_time)
+        
+        if CONTEXT_TOKEN_BUDGET > 0:
+            built = build_context(
+                kpi_data=kpi_data,
+                alarm_kpi=state.get('alarm_kpi'),
+                lot_data=lot_data,
+                eqp_data=eqp_data,
+                rcp_data=rcp_data,
+                lot_summary=lot_summary,
+                downtime_info=downtime_info,
+                downtime_stats=merged_downtime,
+                token_budget=CONTEXT_TOKEN_BUDGET
+            )
+            context_text = built['text']
+            metadata['context_fetch']['context_sections'] = built['sections']
+            if not built['within_budget']:
+                print(f"   ⚠️ 토큰 예산 초과: {built['estimated_tokens']} > {CONTEXT_TOKEN_BUDGET}")
+        else:
+            context_text = format_context_data(
+                kpi_data=kpi_data,
+                lot_data=lot_data,
+                eqp_data=eqp_data,
+                rcp_data=rcp_data,
+                lot_summary=lot_summary,
+                downtime_info=downtime_info,
+                downtime_stats=merged_downtime
+            )
+        
+        metadata['context_fetch']['context_tokens'] = estimate_tokens(context_text)
+        print(f"   ✅ 컨텍스트 생성 완료 ({len(context_text)}자, 약 {metadata['context_fetch']['context_tokens']}토큰)")
         
     except Exception as e:
         error_msg = f"컨텍스트 생성 실패: {e}"
@@ -156,5 +314,33 @@ def node_3_context_fetch(state: dict) -> dict:
         'lot_data': lot_data,
         'eqp_data': eqp_data,
         'rcp_data': rcp_data,
-        'context_text': context_text
-    }
\ No newline at end of file
+        'context_text': context_text,
+        'metadata': metadata
+    }
+
+
+def _timed_query(fn: Callable, kwargs: Dict[str, Any]) -> Tuple[List[Dict[str, Any]], float, Optional[str]]:
+    """
+    조회 함수를 실행하고 소요 시간을 측정합니다.
+    
+    실패해도 예외를 올리지 않고 빈 리스트와 에러 메시지를 반환하여
+    다른 테이블 조회 결과는 그대로 사용할 수 있게 합니다.
+    
+    Args:
+        fn: supabase_config 조회 함수
+        kwargs: 조회 함수 인자
+    
+    Returns:
+        Tuple: (조회 결과, 소요 시간 ms, 에러 메시지 또는 None)
+    """
+    start = time.perf_counter()
+    
+    try:
+        rows = fn(**kwargs)
+        error = None
+    except Exception as e:
+        rows = []
+        error = str(e)
+    
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    return rows, elapsed_ms, error
\ No newline at end of file
@@ -9,6 +9,8 @@ Node 4: Report Lookup
 출력:
 - report_exists: 관련 리포트 존재 여부 (True/False)
 - question_text: 정제된 질문 텍스트
+- question_embedding: 질문 임베딩 (Node 5에서 재사용)
+- similar_reports: 상위 유사 리포트 (Node 5에서 재사용, 검색 실패 시 None → Node 5가 다시 검색)
 """
 
 import sys
@@ -18,7 +20,28 @@ from pathlib import Path
 project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
-from backend.config.chroma_config import chroma_config
+from backend.config.chroma_config import chroma_config, describe_match
+
+# Node 5가 참고할 리포트 수 (여기서 한 번에 검색해 State로 전달)
+TOP_K = 3
+
+# 벡터 거리가 이보다 작으면 관련 리포트로 판단
+RELEVANCE_DISTANCE = 1.5
+
+
+def is_relevant(report: dict) -> bool:
+    """
+    검색 결과가 질문과 관련 있는지 판단합니다.
+    
+    - 식별자(장비 ID/날짜 등) 일치 결과(retrieval='exact')는 관련 있음
+    - 벡터 거리가 있으면 RELEVANCE_DISTANCE 미만일 때만 관련 있음
+    - 어휘 검색에서만 찾은 결과(거리 없음)는 유사도를 알 수 없으므로 판단에서 제외
+    """
+    if report.get('retrieval') == 'exact':
+        return True
+    
+    distance = report.get('distance')
+    return distance is not None and distance < RELEVANCE_DISTANCE
 
 
 def node_4_report_lookup(state: dict) -> dict:
@@ -28,11 +51,15 @@ def node_4_report_lookup(state: dict) -> dict:
     Args:
         state: 현재 Agent State
             - input_data: 사용자 질문 텍스트
+            - question_embedding: 이미 계산된 질문 임베딩 (optional)
     
     Returns:
         dict: 업데이트할 State
             - report_exists: 리포트 존재 여부
             - question_text: 정제된 질문
+            - question_embedding: 질문 임베딩
+            - similar_reports: 상위 TOP_K개 유사 리포트
+                (검색 결과가 없으면 [], 검색 실패 시 None)
     """
     
     print("\n" + "=" * 60)
@@ -54,29 +81,32 @@ def node_4_report_lookup(state: dict) -> dict:
     # 2. ChromaDB에서 유사 리포트 검색
     print("🔍 ChromaDB에서 관련 리포트 검색 중...")
     
+    question_embedding = state.get('question_embedding')
+    results = []
+    
     try:
-        # 유사도가 높은 리포트 1개만 확인
-        results = chroma_config.search_similar_reports(
-            query_text=question,
-            n_results=1
+        # Node 5가 참고할 상위 TOP_K개까지 함께 검색
+        # - 질문의 장비 ID/KPI/날짜로 메타데이터 필터 (결과가 부족하면 필터 없이 보충)
+        # - 임베딩이 없으면 검색 쪽에서 필요할 때만 계산 (식별자 일치 시 생략)
+        results = chroma_config.search_reports_for_question(
+            question,
+            n_results=TOP_K,
+            query_embedding=question_embedding
         )
         
         if results and len(results) > 0:
-            # 유사도 확인 (거리가 낮을수록 유사)
-            # 거리 < 1.5 정도면 관련 있다고 판단
-            distance = results[0]['distance']
+            print(f"   ✅ 검색 결과 {len(results)}개")
+            for report in results:
+                print(f"   📄 {report['id']} ({report.get('retrieval')}, {describe_match(report)})")
             
-            print(f"   ✅ 관련 리포트 발견")
-            print(f"   📊 유사도 거리: {distance:.4f}")
-            print(f"   📄 리포트 ID: {results[0]['id']}")
-            
-            # 유사도 임계값 확인
-            if distance < 1.5:
+            # 관련성 확인: 식별자 일치 또는 벡터 거리 < RELEVANCE_DISTANCE
+            # (어휘 검색에서만 찾은 결과는 거리가 없으므로 관련성 판단에 쓰지 않음)
+            if any(is_relevant(report) for report in results):
                 report_exists = True
-                print(f"   ✅ 관련성 높음 (거리 < 1.5)")
+                print(f"   ✅ 관련성 높음 (식별자 일치 또는 거리 < {RELEVANCE_DISTANCE})")
             else:
                 report_exists = False
-                print(f"   ⚠️ 관련성 낮음 (거리 >= 1.5)")
+                print(f"   ⚠️ 관련성 낮음 (거리 >= {RELEVANCE_DISTANCE} 또는 어휘 검색 결과만 있음)")
         else:
             report_exists = False
             print(f"   ⚠️ 관련 리포트 없음")
@@ -84,6 +114,9 @@ def node_4_report_lookup(state: dict) -> dict:
     except Exception as e:
         print(f"   ❌ 검색 실패: {e}")
         report_exists = False
+        
+        # 빈 결과와 구분: None이면 Node 5가 다시 검색
+        results = None
     
     print(f"\n결과: {'과거 리포트 있음' if report_exists else '과거 리포트 없음'}")
     print("=" * 60 + "\n")
@@ -91,5 +124,7 @@ def node_4_report_lookup(state: dict) -> dict:
     # 3. State 업데이트
     return {
         'report_exists': report_exists,
-        'question_text': question
+        'question_text': question,
+        'question_embedding': question_embedding,
+        'similar_reports': results
     }
\ No newline at end of file
@@ -5,6 +5,7 @@ Node 5: RAG Answer
 입력:
 - question_text: 사용자 질문
 - report_exists: 리포트 존재 여부
+- similar_reports: Node 4에서 검색한 유사 리포트
 
 출력:
 - final_answer: LLM이 생성한 답변
@@ -18,12 +19,12 @@ from pathlib import Path
 project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
-from backend.config.chroma_config import chroma_config
+from backend.config.chroma_config import chroma_config, describe_match
 from backend.config.aws_config import aws_config
 from backend.utils.prompt_templates import get_question_answer_prompt
 
 
-def node_5_rag_answer(state: dict) -> dict:
+def node_5_rag_answer(state: dict, config: dict = None) -> dict:
     """
     과거 리포트를 참고하여 사용자 질문에 답변합니다.
     
@@ -31,6 +32,10 @@ def node_5_rag_answer(state: dict) -> dict:
         state: 현재 Agent State
             - question_text: 사용자 질문
             - report_exists: 리포트 존재 여부 (optional)
+            - similar_reports: Node 4 검색 결과 (없으면 직접 검색)
+            - question_embedding: 질문 임베딩 (optional)
+        config: LangGraph 실행 설정 (선택)
+            - configurable.on_token: 텍스트 조각 콜백 (있으면 스트리밍 호출)
     
     Returns:
         dict: 업데이트할 State
@@ -53,19 +58,24 @@ def node_5_rag_answer(state: dict) -> dict:
     
     print(f"💬 질문: {question}\n")
     
-    # 2. ChromaDB에서 유사 리포트 검색
-    print("🔍 유사 리포트 검색 중...")
+    # 2. 유사 리포트 (Node 4 결과 재사용, 없으면 검색)
+    similar_reports = state.get('similar_reports')
     
     try:
-        similar_reports = chroma_config.search_similar_reports(
-            query_text=question,
-            n_results=3  # 최대 3개 참고
-        )
+        if similar_reports is None:
+            print("🔍 유사 리포트 검색 중...")
+            similar_reports = chroma_config.search_reports_for_question(
+                question,
+                n_results=3,  # 최대 3개 참고
+                query_embedding=state.get('question_embedding')
+            )
+        else:
+            print("♻️ Node 4 검색 결과 재사용")
         
         if similar_reports:
             print(f"   ✅ {len(similar_reports)}개 리포트 발견")
             for i, report in enumerate(similar_reports, 1):
-                print(f"   {i}. {report['id']} (거리: {report['distance']:.4f})")
+                print(f"   {i}. {report['id']} ({describe_match(report)})")
         else:
             print(f"   ⚠️ 유사 리포트 없음")
             similar_reports = []
@@ -90,8 +100,9 @@ def node_5_rag_answer(state: dict) -> dict:
         llm_calls = metadata.get('llm_calls', 0)
         metadata['llm_calls'] = llm_calls + 1
         
-        # Claude 호출
-        answer = aws_config.invoke_claude(prompt)
+        # Claude 호출 (토큰 콜백이 있으면 스트리밍)
+        on_token = (config or {}).get('configurable', {}).get('on_token')
+        answer = aws_config.invoke_claude(prompt, on_token=on_token)
         
         print(f"   ✅ 답변 생성 완료 ({len(answer)}자)")
         
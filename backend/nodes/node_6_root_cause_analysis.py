@@ -8,8 +8,14 @@ LLM을 사용하여 알람의 근본 원인을 분석합니다.
 
 출력:
 - root_causes: 근본 원인 후보 리스트 (확률, 근거 포함)
+
+단일 호출 모드 (ALARM_SINGLE_SHOT=true):
+- 자동 선택 경로(selected_cause_index 없음)에서 근본 원인 JSON과 최종 리포트를
+  한 번의 호출로 함께 받습니다 (Node 8의 두 번째 호출 생략).
+- 리포트는 draft_report로 넘기고, Node 7이 선택과 일치하는지 검증합니다.
 """
 
+import os
 import sys
 from pathlib import Path
 import json
@@ -19,7 +25,19 @@ project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
 from backend.config.aws_config import aws_config
-from backend.utils.prompt_templates import get_root_cause_analysis_prompt
+from backend.utils.prompt_templates import (
+    REPORT_MARKER,
+    REPORT_LAST_SECTION,
+    get_root_cause_analysis_prompt,
+    get_root_cause_and_report_prompt
+)
+from backend.utils.data_utils import generate_problem_summary
+
+# 자동 선택 경로에서 근본 원인 분석 + 리포트 작성을 한 번의 LLM 호출로 처리할지 여부 (기본: 사용 안 함)
+ALARM_SINGLE_SHOT = os.getenv('ALARM_SINGLE_SHOT', 'false').lower() == 'true'
+
+# 단일 호출 응답은 근본 원인 JSON과 리포트를 함께 담으므로 최대 생성 토큰을 늘림
+SINGLE_SHOT_MAX_TOKENS = 4000
 
 
 def node_6_root_cause_analysis(state: dict) -> dict:
@@ -30,6 +48,8 @@ def node_6_root_cause_analysis(state: dict) -> dict:
         state: 현재 Agent State
             - context_text: 분석할 컨텍스트 데이터
             - alarm_kpi: 문제가 된 KPI
+            - kpi_data: KPI 데이터 (단일 호출 모드의 문제 요약용)
+            - selected_cause_index: 사용자가 선택한 인덱스 (있으면 단일 호출 모드 사용 안 함)
     
     Returns:
         dict: 업데이트할 State
@@ -42,6 +62,8 @@ def node_6_root_cause_analysis(state: dict) -> dict:
                     },
                     ...
                 ]
+            - draft_report: 함께 작성된 리포트 (단일 호출 모드)
+            - draft_report_cause_index: 리포트가 다루는 원인의 인덱스 (단일 호출 모드)
             - error: 에러 메시지 (실패 시)
     """
     
@@ -52,6 +74,7 @@ def node_6_root_cause_analysis(state: dict) -> dict:
     # 1. State에서 필요한 정보 가져오기
     context_text = state.get('context_text')
     alarm_kpi = state.get('alarm_kpi')
+    kpi_data = state.get('kpi_data')
     
     if not context_text:
         error_msg = "컨텍스트 데이터가 없습니다"
@@ -61,9 +84,18 @@ def node_6_root_cause_analysis(state: dict) -> dict:
     print(f"📊 KPI: {alarm_kpi}")
     print(f"📝 컨텍스트 크기: {len(context_text)}자")
     
-    # 2. 프롬프트 생성
+    # 2. 프롬프트 생성 (자동 선택 경로 + 단일 호출 모드면 리포트까지 함께 요청)
+    single_shot = ALARM_SINGLE_SHOT and state.get('selected_cause_index') is None and bool(kpi_data)
+    
     print(f"\n📋 프롬프트 생성 중...")
-    prompt = get_root_cause_analysis_prompt(context_text)
+    if single_shot:
+        print(f"   ⚡ 단일 호출 모드: 근본 원인 + 리포트")
+        prompt = get_root_cause_and_report_prompt(
+            problem_summary=generate_problem_summary(kpi_data, alarm_kpi),
+            context_data=context_text
+        )
+    else:
+        prompt = get_root_cause_analysis_prompt(context_text)
     print(f"   ✅ 프롬프트 생성 완료 ({len(prompt)}자)")
     
     # 3. LLM 호출
@@ -76,7 +108,10 @@ def node_6_root_cause_analysis(state: dict) -> dict:
         metadata['llm_calls'] = llm_calls + 1
         
         # Claude 호출
-        response_text = aws_config.invoke_claude(prompt)
+        if single_shot:
+            response_text = aws_config.invoke_claude(prompt, max_tokens=SINGLE_SHOT_MAX_TOKENS)
+        else:
+            response_text = aws_config.invoke_claude(prompt)
         
         print(f"   ✅ Claude 응답 받음 ({len(response_text)}자)")
         
@@ -88,6 +123,9 @@ def node_6_root_cause_analysis(state: dict) -> dict:
     # 4. 응답 파싱 (JSON 추출)
     print(f"\n🔍 응답 파싱 중...")
     
+    # 단일 호출 응답은 구분선 뒤가 리포트
+    response_text, draft_report = _split_report(response_text) if single_shot else (response_text, None)
+    
     try:
         # JSON 블록 추출 (```json ... ``` 또는 {...})
         json_text = _extract_json(response_text)
@@ -124,15 +162,77 @@ def node_6_root_cause_analysis(state: dict) -> dict:
         print(f"   확률: {cause['probability']}%")
         print(f"   근거: {cause['evidence'][:100]}...")
     
+    # 6. 단일 호출 리포트 확인 (리포트가 다루는 원인 번호가 없거나 잘못되면 Node 8에서 다시 작성)
+    draft_report_cause_index = None
+    
+    if single_shot:
+        draft_report_cause_index = _report_cause_index(result, len(root_causes))
+        metadata['single_shot'] = True
+        
+        if draft_report and draft_report_cause_index is not None:
+            print(f"\n📝 리포트 함께 작성됨: {draft_report_cause_index + 1}번 원인 ({len(draft_report)}자)")
+        else:
+            print(f"\n⚠️ 단일 호출 응답에 완전한 리포트가 없어 Node 8에서 작성합니다")
+            draft_report = None
+            draft_report_cause_index = None
+    
     print("\n" + "=" * 60 + "\n")
     
-    # 6. State 업데이트
+    # 7. State 업데이트
     return {
         'root_causes': root_causes,
+        'draft_report': draft_report,
+        'draft_report_cause_index': draft_report_cause_index,
         'metadata': metadata
     }
 
 
+def _split_report(text: str) -> tuple:
+    """
+    단일 호출 응답을 근본 원인 부분과 리포트로 나눕니다.
+    
+    구분선이 없거나, 마지막 필수 섹션(REPORT_LAST_SECTION)이 없어
+    max_tokens에서 잘린 것으로 보이는 리포트는 None입니다.
+    
+    Args:
+        text: LLM 응답 텍스트
+    
+    Returns:
+        tuple: (근본 원인 부분, 리포트 또는 None)
+    """
+    
+    if REPORT_MARKER not in text:
+        return text, None
+    
+    head, report = text.split(REPORT_MARKER, 1)
+    report = report.strip()
+    
+    if REPORT_LAST_SECTION not in report:
+        return head, None
+    
+    return head, report
+
+
+def _report_cause_index(result: dict, n_causes: int):
+    """
+    단일 호출 응답의 report_cause_index(1부터)를 0부터 시작하는 인덱스로 변환합니다.
+    
+    Args:
+        result: 파싱된 근본 원인 JSON
+        n_causes: 근본 원인 후보 수
+    
+    Returns:
+        int: 원인 인덱스 (없거나 범위를 벗어나면 None)
+    """
+    
+    try:
+        index = int(result.get('report_cause_index')) - 1
+    except (TypeError, ValueError):
+        return None
+    
+    return index if 0 <= index < n_causes else None
+
+
 def _extract_json(text: str) -> str:
     """
     텍스트에서 JSON 블록을 추출합니다.
@@ -9,6 +9,10 @@ Node 7: Human Choice
 
 테스트/개발:
 - 자동으로 첫 번째 또는 가장 높은 확률의 원인 선택
+
+단일 호출 모드:
+- Node 6이 리포트를 함께 작성했으면(draft_report) 리포트가 다루는 원인이
+  선택된 원인과 같은지만 검증합니다. 다르면 리포트를 버리고 Node 8에서 다시 작성합니다.
 """
 
 import sys
@@ -27,6 +31,7 @@ def node_7_human_choice(state: dict) -> dict:
         state: 현재 Agent State
             - root_causes: 근본 원인 후보 리스트
             - selected_cause_index: 사용자가 선택한 인덱스 (optional)
+            - draft_report / draft_report_cause_index: Node 6 단일 호출 리포트 (optional)
     
     Returns:
         dict: 업데이트할 State
@@ -36,6 +41,7 @@ def node_7_human_choice(state: dict) -> dict:
                     "probability": 40,
                     "evidence": "근거"
                 }
+            - draft_report: 선택과 다른 원인의 리포트면 None
             - error: 에러 메시지 (실패 시)
     """
     
@@ -91,13 +97,23 @@ def node_7_human_choice(state: dict) -> dict:
     print(f"   확률: {selected_cause['probability']}%")
     print(f"   근거: {selected_cause['evidence'][:100]}...")
     
-    print("=" * 60 + "\n")
-    
-    # 5. State 업데이트
-    return {
+    result = {
         'selected_cause': selected_cause,
         'selected_cause_index': selected_index
     }
+    
+    # 5. 단일 호출 리포트 검증
+    if state.get('draft_report'):
+        if state.get('draft_report_cause_index') == selected_index:
+            print(f"\n📝 단일 호출 리포트 사용 (Node 8 LLM 호출 생략)")
+        else:
+            print(f"\n⚠️ 단일 호출 리포트의 원인이 선택과 달라 Node 8에서 다시 작성합니다")
+            result['draft_report'] = None
+    
+    print("=" * 60 + "\n")
+    
+    # 6. State 업데이트
+    return result
 
 
 def display_causes_for_selection(root_causes: list) -> None:
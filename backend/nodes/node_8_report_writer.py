@@ -10,6 +10,8 @@ Node 8: Report Writer
 출력:
 - final_report: 최종 분석 리포트 (마크다운)
 - report_id: 리포트 고유 ID
+
+단일 호출 모드에서 draft_report가 선택된 원인의 리포트면 LLM을 다시 호출하지 않습니다.
 """
 
 import sys
@@ -22,9 +24,10 @@ sys.path.insert(0, str(project_root))
 
 from backend.config.aws_config import aws_config
 from backend.utils.prompt_templates import get_report_writer_prompt
+from backend.utils.data_utils import generate_problem_summary
 
 
-def node_8_report_writer(state: dict) -> dict:
+def node_8_report_writer(state: dict, config: dict = None) -> dict:
     """
     선택된 근본 원인을 바탕으로 최종 분석 리포트를 작성합니다.
     
@@ -36,6 +39,9 @@ def node_8_report_writer(state: dict) -> dict:
             - alarm_date: 알람 날짜
             - alarm_eqp_id: 장비 ID
             - alarm_kpi: KPI
+            - draft_report / draft_report_cause_index: Node 6 단일 호출 리포트 (optional)
+        config: LangGraph 실행 설정 (선택)
+            - configurable.on_token: 텍스트 조각 콜백 (있으면 스트리밍 호출)
     
     Returns:
         dict: 업데이트할 State
@@ -75,37 +81,51 @@ def node_8_report_writer(state: dict) -> dict:
     print(f"   {selected_cause['cause']}")
     print(f"   확률: {selected_cause['probability']}%")
     
-    # 2. 문제 요약 생성
-    problem_summary = _generate_problem_summary(kpi_data, alarm_kpi)
-    
-    # 3. 프롬프트 생성
-    print(f"\n📋 프롬프트 생성 중...")
-    prompt = get_report_writer_prompt(
-        problem_summary=problem_summary,
-        selected_cause=selected_cause['cause'],
-        evidence=selected_cause['evidence'],
-        context_data=context_text
-    )
-    print(f"   ✅ 프롬프트 생성 완료 ({len(prompt)}자)")
-    
-    # 4. LLM 호출
-    print(f"\n🤖 Claude 호출 중... (이 작업은 몇 초 걸릴 수 있습니다)")
+    on_token = (config or {}).get('configurable', {}).get('on_token')
+    draft_report = state.get('draft_report')
     
-    try:
-        # metadata 업데이트
+    # 단일 호출 모드: Node 6이 함께 작성하고 Node 7이 검증한 리포트를 그대로 사용
+    if draft_report and state.get('draft_report_cause_index') == state.get('selected_cause_index'):
+        print(f"\n⚡ 단일 호출 리포트 사용 (LLM 호출 생략)")
         metadata = state.get('metadata', {})
-        llm_calls = metadata.get('llm_calls', 0)
-        metadata['llm_calls'] = llm_calls + 1
+        final_report = draft_report
         
-        # Claude 호출
-        final_report = aws_config.invoke_claude(prompt)
+        # 스트리밍 클라이언트도 리포트를 받도록 한 번에 전달
+        if on_token is not None:
+            on_token(final_report)
+    
+    else:
+        # 2. 문제 요약 생성
+        problem_summary = generate_problem_summary(kpi_data, alarm_kpi)
         
-        print(f"   ✅ Claude 응답 받음 ({len(final_report)}자)")
+        # 3. 프롬프트 생성
+        print(f"\n📋 프롬프트 생성 중...")
+        prompt = get_report_writer_prompt(
+            problem_summary=problem_summary,
+            selected_cause=selected_cause['cause'],
+            evidence=selected_cause['evidence'],
+            context_data=context_text
+        )
+        print(f"   ✅ 프롬프트 생성 완료 ({len(prompt)}자)")
         
-    except Exception as e:
-        error_msg = f"LLM 호출 실패: {str(e)}"
-        print(f"   ❌ {error_msg}")
-        return {'error': error_msg}
+        # 4. LLM 호출
+        print(f"\n🤖 Claude 호출 중... (이 작업은 몇 초 걸릴 수 있습니다)")
+        
+        try:
+            # metadata 업데이트
+            metadata = state.get('metadata', {})
+            llm_calls = metadata.get('llm_calls', 0)
+            metadata['llm_calls'] = llm_calls + 1
+            
+            # Claude 호출 (토큰 콜백이 있으면 스트리밍)
+            final_report = aws_config.invoke_claude(prompt, on_token=on_token)
+            
+            print(f"   ✅ Claude 응답 받음 ({len(final_report)}자)")
+            
+        except Exception as e:
+            error_msg = f"LLM 호출 실패: {str(e)}"
+            print(f"   ❌ {error_msg}")
+            return {'error': error_msg}
     
     # 5. 리포트 ID 생성
     # 형식: report_YYYYMMDD_EQPXX_KPI
@@ -135,55 +155,3 @@ def node_8_report_writer(state: dict) -> dict:
         'report_id': report_id,
         'metadata': metadata
     }
-
-
-def _generate_problem_summary(kpi_data: dict, alarm_kpi: str) -> str:
-    """
-    KPI 데이터를 바탕으로 문제 요약을 생성합니다.
-    
-    Args:
-        kpi_data: KPI 데이터
-        alarm_kpi: 문제가 된 KPI
-    
-    Returns:
-        str: 문제 요약 텍스트
-    """
-    
-    # KPI별 목표/실제값 추출
-    if alarm_kpi == 'OEE':
-        target = kpi_data.get('oee_t')
-        actual = kpi_data.get('oee_v')
-        unit = '%'
-        kpi_name = 'OEE (Overall Equipment Effectiveness)'
-    elif alarm_kpi == 'THP':
-        target = kpi_data.get('thp_t')
-        actual = kpi_data.get('thp_v')
-        unit = '개'
-        kpi_name = '처리량 (Throughput)'
-    elif alarm_kpi == 'TAT':
-        target = kpi_data.get('tat_t')
-        actual = kpi_data.get('tat_v')
-        unit = '시간'
-        kpi_name = '처리 시간 (Turn Around Time)'
-    else:  # WIP
-        target = kpi_data.get('wip_t')
-        actual = kpi_data.get('wip_v')
-        unit = '개'
-        kpi_name = '재공품 (Work In Process)'
-    
-    # 차이 계산
-    gap = actual - target
-    gap_percent = (gap / target * 100) if target != 0 else 0
-    
-    # 문제 요약 생성
-    summary = f"""
-{kpi_name} 지표에 문제가 발생했습니다.
-
-- 목표치: {target}{unit}
-- 실제치: {actual}{unit}
-- 차이: {gap:+.2f}{unit} ({gap_percent:+.1f}%)
-
-장비 {kpi_data.get('eqp_id')}에서 {kpi_data.get('date')}에 발생한 문제입니다.
-    """.strip()
-    
-    return summary
\ No newline at end of file
@@ -46,6 +46,12 @@ def test_full_context_fetch():
     assert state.get('rcp_data') is not None, "rcp_data 없음"
     assert state.get('context_text') is not None, "context_text 없음"
     
+    # 쿼리별 소요 시간 기록 확인
+    fetch_timing = state.get('metadata', {}).get('context_fetch')
+    assert fetch_timing is not None, "context_fetch 타이밍 없음"
+    for key in ['lot_state_ms', 'eqp_state_ms', 'rcp_state_ms', 'total_ms']:
+        assert key in fetch_timing, f"{key} 없음"
+    
     # 결과 출력
     print("\n✅ 모든 데이터 조회 성공!")
     print(f"\n📊 최종 State:")
@@ -56,6 +62,7 @@ def test_full_context_fetch():
     print(f"   - eqp_data: {len(state.get('eqp_data', []))}개")
     print(f"   - rcp_data: {len(state.get('rcp_data', []))}개")
     print(f"   - context_text: {len(state.get('context_text', ''))}자")
+    print(f"   - 조회 시간: {fetch_timing}")
     
     # 컨텍스트 미리보기
     context = state.get('context_text', '')
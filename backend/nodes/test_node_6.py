@@ -12,7 +12,9 @@ sys.path.insert(0, str(project_root))
 from backend.nodes.node_1_input_router import node_1_input_router
 from backend.nodes.node_2_load_alarm_kpi import node_2_load_alarm_kpi
 from backend.nodes.node_3_context_fetch import node_3_context_fetch
+from backend.nodes import node_6_root_cause_analysis as node_6
 from backend.nodes.node_6_root_cause_analysis import node_6_root_cause_analysis
+from backend.config.aws_config import aws_config
 
 
 def test_root_cause_analysis():
@@ -117,12 +119,69 @@ def test_specific_alarm_analysis():
     print("\n✅ 특정 알람 분석 테스트 통과!\n")
 
 
+def test_single_shot_parsing():
+    """단일 호출 응답 파싱 테스트 (LLM 응답을 고정 문자열로 대체, 오프라인)"""
+    
+    print("=" * 60)
+    print("🧪 단일 호출 응답 파싱 테스트")
+    print("=" * 60 + "\n")
+    
+    causes_json = (
+        '```json\n{"problem_summary": "OEE 미달", "root_causes": ['
+        '{"cause": "로더 모듈 통신 장애", "probability": 30, "evidence": "다운타임 3시간"}, '
+        '{"cause": "고복잡도 레시피", "probability": 60, "evidence": "복잡도 10/10"}], '
+        '"report_cause_index": %s}\n```\n'
+    )
+    report = (
+        "# 분석 리포트\n## 1. 문제 정의\nOEE 미달\n## 2. 근본 원인 분석\n로더 모듈\n"
+        "## 3. 영향 분석\n출하 감소\n## 4. 권장 조치사항\n케이블 교체\n## 5. 예상 효과\nOEE 회복"
+    )
+    
+    state = {
+        'context_text': '컨텍스트',
+        'alarm_kpi': 'OEE',
+        'kpi_data': {'date': '2026-01-20', 'eqp_id': 'EQP01', 'oee_v': 53.5, 'oee_t': 70},
+        'metadata': {'llm_calls': 0}
+    }
+    
+    cases = [
+        # (설명, 응답, 기대 draft_report_cause_index)
+        ("정상 응답", causes_json % 2 + "===REPORT===\n" + report, 1),
+        ("구분선 없음", causes_json % 2 + report, None),
+        ("범위를 벗어난 report_cause_index", causes_json % 5 + "===REPORT===\n" + report, None),
+        ("max_tokens에서 잘린 리포트", causes_json % 2 + "===REPORT===\n" + report.split("## 5.")[0], None)
+    ]
+    
+    invoke_claude = aws_config.invoke_claude
+    single_shot = node_6.ALARM_SINGLE_SHOT
+    node_6.ALARM_SINGLE_SHOT = True
+    
+    try:
+        for name, response, expected_index in cases:
+            print(f"▶ {name}")
+            aws_config.invoke_claude = lambda prompt, **kwargs: response
+            result = node_6_root_cause_analysis(dict(state, metadata={'llm_calls': 0}))
+            
+            # 근본 원인은 항상 파싱되고, 리포트는 완전할 때만 사용
+            assert 'error' not in result, f"에러 발생: {result.get('error')}"
+            assert len(result['root_causes']) == 2
+            assert result['metadata']['llm_calls'] == 1
+            assert result['draft_report_cause_index'] == expected_index, name
+            assert (result['draft_report'] is not None) == (expected_index is not None), name
+    finally:
+        aws_config.invoke_claude = invoke_claude
+        node_6.ALARM_SINGLE_SHOT = single_shot
+    
+    print("\n✅ 단일 호출 응답 파싱 테스트 통과!\n")
+
+
 def main():
     """모든 테스트 실행"""
     
     print("\n🧪 Node 6: Root Cause Analysis 테스트 시작\n")
     
     try:
+        test_single_shot_parsing()
         test_root_cause_analysis()
         test_specific_alarm_analysis()
         
@@ -160,12 +160,40 @@ def test_no_causes():
     print("\n✅ 원인 후보 없는 경우 테스트 통과!\n")
 
 
+def test_single_shot_draft_validation():
+    """단일 호출 리포트 검증 테스트 (선택과 다른 원인의 리포트는 버림)"""
+    
+    print("=" * 60)
+    print("🧪 단일 호출 리포트 검증 테스트")
+    print("=" * 60 + "\n")
+    
+    root_causes = [
+        {'cause': '원인1', 'probability': 30, 'evidence': '근거1'},
+        {'cause': '원인2', 'probability': 60, 'evidence': '근거2'}
+    ]
+    
+    # 자동 선택(2번)과 리포트 원인이 같으면 유지
+    state = {'root_causes': root_causes, 'draft_report': '# 분석 리포트', 'draft_report_cause_index': 1}
+    result = node_7_human_choice(state)
+    assert result['selected_cause_index'] == 1
+    assert 'draft_report' not in result, "일치하는 리포트가 지워짐"
+    
+    # 리포트 원인이 선택과 다르면 버림 (Node 8에서 다시 작성)
+    state = {'root_causes': root_causes, 'draft_report': '# 분석 리포트', 'draft_report_cause_index': 0}
+    result = node_7_human_choice(state)
+    assert result['selected_cause_index'] == 1
+    assert result['draft_report'] is None, "다른 원인의 리포트가 남아 있음"
+    
+    print("\n✅ 단일 호출 리포트 검증 테스트 통과!\n")
+
+
 def main():
     """모든 테스트 실행"""
     
     print("\n🧪 Node 7: Human Choice 테스트 시작\n")
     
     try:
+        test_single_shot_draft_validation()
         test_auto_selection()
         test_manual_selection()
         test_invalid_selection()
@@ -15,6 +15,7 @@ from backend.nodes.node_3_context_fetch import node_3_context_fetch
 from backend.nodes.node_6_root_cause_analysis import node_6_root_cause_analysis
 from backend.nodes.node_7_human_choice import node_7_human_choice
 from backend.nodes.node_8_report_writer import node_8_report_writer
+from backend.config.aws_config import aws_config
 
 
 def test_report_generation():
@@ -171,12 +172,59 @@ def test_llm_call_count():
     print("\n✅ LLM 호출 횟수 테스트 통과!\n")
 
 
+def test_single_shot_draft_reuse():
+    """단일 호출 리포트 재사용 테스트 (LLM 호출 없음, 오프라인)"""
+    
+    print("=" * 60)
+    print("🧪 단일 호출 리포트 재사용 테스트")
+    print("=" * 60 + "\n")
+    
+    draft_report = (
+        "# 분석 리포트\n## 1. 문제 정의\nOEE 미달\n## 2. 근본 원인 분석\n로더 모듈\n"
+        "## 3. 영향 분석\n출하 감소\n## 4. 권장 조치사항\n케이블 교체\n## 5. 예상 효과\nOEE 회복"
+    )
+    state = {
+        'selected_cause': {'cause': '고복잡도 레시피', 'probability': 60, 'evidence': '복잡도 10/10'},
+        'selected_cause_index': 1,
+        'draft_report': draft_report,
+        'draft_report_cause_index': 1,
+        'context_text': '컨텍스트',
+        'kpi_data': {'date': '2026-01-20', 'eqp_id': 'EQP01', 'oee_v': 53.5, 'oee_t': 70},
+        'alarm_date': '2026-01-20',
+        'alarm_eqp_id': 'EQP01',
+        'alarm_kpi': 'OEE',
+        'metadata': {'llm_calls': 1}
+    }
+    tokens = []
+    
+    def fail(*args, **kwargs):
+        raise AssertionError("LLM이 호출됨")
+    
+    invoke_claude = aws_config.invoke_claude
+    aws_config.invoke_claude = fail
+    
+    try:
+        result = node_8_report_writer(state, {'configurable': {'on_token': tokens.append}})
+    finally:
+        aws_config.invoke_claude = invoke_claude
+    
+    # 검증: 리포트 그대로 사용, LLM 호출 횟수 그대로, 스트리밍 클라이언트에 한 번 전달
+    assert 'error' not in result, f"에러 발생: {result.get('error')}"
+    assert result['final_report'] == draft_report
+    assert result['report_id'] == 'report_2026-01-20_EQP01_OEE'
+    assert result['metadata']['llm_calls'] == 1, "LLM 호출 횟수 증가"
+    assert tokens == [draft_report]
+    
+    print("\n✅ 단일 호출 리포트 재사용 테스트 통과!\n")
+
+
 def main():
     """모든 테스트 실행"""
     
     print("\n🧪 Node 8: Report Writer 테스트 시작\n")
     
     try:
+        test_single_shot_draft_reuse()
         test_report_generation()
         test_report_content()
         test_llm_call_count()
@@ -16,7 +16,7 @@ from backend.nodes.node_6_root_cause_analysis import node_6_root_cause_analysis
 from backend.nodes.node_7_human_choice import node_7_human_choice
 from backend.nodes.node_8_report_writer import node_8_report_writer
 from backend.nodes.node_9_persist_report import node_9_persist_report
-from backend.config.chroma_config import chroma_config
+from backend.config.chroma_config import chroma_config, describe_match
 
 
 def test_persist_report():
@@ -160,7 +160,7 @@ def test_search_saved_report():
         
         for i, report in enumerate(results, 1):
             print(f"{i}. ID: {report['id']}")
-            print(f"   유사도: {report['distance']:.4f}")
+            print(f"   유사도: {describe_match(report)}")
             print(f"   메타데이터: {report['metadata']}")
             print(f"   내용: {report['document'][:100]}...")
             print()
@@ -0,0 +1,158 @@
+"""
+컨텍스트 집계 벤치마크 (dict 행 순회 vs 컬럼 기반 NumPy)
+
+LOT_STATE / EQP_STATE 합성 데이터 10^3 ~ 10^7행에 대해
+- rows: aggregate_lot_states + get_downtime_info (기존 방식)
+- convert: 행 → 컬럼 변환 (lot_columns / eqp_columns) + 컬럼 집계
+- columnar: 이미 컬럼 배열인 데이터의 집계만
+세 가지 시간을 비교하고, 결과가 기존 함수와 같은지 확인합니다.
+
+dict 행은 10^7행이면 수 GB를 차지하므로 ROW_LIMIT 행까지만 만들고
+그 이상은 columnar만 측정합니다 (--full이면 모든 크기에서 행도 생성).
+
+실행:
+    python backend/utils/bench_aggregation.py [--full]
+"""
+
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+# 프로젝트 루트를 경로에 추가
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from backend.utils.data_utils import aggregate_lot_states, get_downtime_info
+from backend.utils.columnar_aggregation import (
+    TIME_DTYPE,
+    lot_columns,
+    eqp_columns,
+    aggregate_lot_columns,
+    downtime_from_columns
+)
+
+SIZES = [10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6, 10 ** 7]
+ROW_LIMIT = 10 ** 6
+
+LOT_STATES = ['WAIT', 'RUN', 'HOLD', 'END']
+DOWN_RATIO = 0.15
+
+
+def make_columns(n_rows: int) -> tuple:
+    """4주 범위의 LOT / EQP 컬럼 배열 (같은 seed면 같은 데이터)"""
+    rng = np.random.default_rng(0)
+
+    lot = {
+        'state_code': rng.integers(0, len(LOT_STATES), n_rows).astype(np.int32),
+        'states': list(LOT_STATES),
+        'in_cnt': rng.integers(20, 26, n_rows).astype(np.int64)
+    }
+
+    start = np.datetime64('2026-01-01T00:00:00', 's') + rng.integers(0, 28 * 86400, n_rows)
+    end = start + rng.integers(10 * 60, 4 * 3600, n_rows)
+    eqp = {
+        'is_down': rng.random(n_rows) < DOWN_RATIO,
+        'start': start.astype(TIME_DTYPE),
+        'end': end.astype(TIME_DTYPE)
+    }
+
+    return lot, eqp
+
+
+def make_rows(lot: dict, eqp: dict) -> tuple:
+    """컬럼 배열과 같은 내용의 dict 행 (Supabase 응답 형식)"""
+    states = np.array(lot['states'], dtype=object)[lot['state_code']]
+    lot_rows = [
+        {'lot_state': state, 'in_cnt': in_cnt}
+        for state, in_cnt in zip(states.tolist(), lot['in_cnt'].tolist())
+    ]
+
+    start = np.char.replace(np.datetime_as_string(eqp['start'], unit='s'), 'T', ' ').tolist()
+    end = np.char.replace(np.datetime_as_string(eqp['end'], unit='s'), 'T', ' ').tolist()
+    eqp_rows = [
+        {'eqp_state': 'DOWN' if down else 'RUN', 'event_time': s, 'end_time': e}
+        for down, s, e in zip(eqp['is_down'].tolist(), start, end)
+    ]
+
+    return lot_rows, eqp_rows
+
+
+def timed(fn, *args) -> tuple:
+    """(결과, 소요 시간 ms)"""
+    start = time.perf_counter()
+    result = fn(*args)
+    return result, (time.perf_counter() - start) * 1000
+
+
+def run_benchmark(sizes: list, row_limit: int) -> list:
+    """
+    크기별 집계 시간을 측정합니다.
+
+    Returns:
+        list: [{'rows', 'rows_ms', 'convert_ms', 'columnar_ms'}] (측정하지 않은 값은 None)
+    """
+    results = []
+
+    for n_rows in sizes:
+        lot, eqp = make_columns(n_rows)
+
+        columnar, columnar_ms = timed(
+            lambda: (aggregate_lot_columns(lot), downtime_from_columns(eqp))
+        )
+        result = {'rows': n_rows, 'rows_ms': None, 'convert_ms': None, 'columnar_ms': columnar_ms}
+
+        if n_rows <= row_limit:
+            lot_rows, eqp_rows = make_rows(lot, eqp)
+
+            expected, result['rows_ms'] = timed(
+                lambda: (aggregate_lot_states(lot_rows), get_downtime_info(eqp_rows))
+            )
+            converted, result['convert_ms'] = timed(
+                lambda: (
+                    aggregate_lot_columns(lot_columns(lot_rows)),
+                    downtime_from_columns(eqp_columns(eqp_rows))
+                )
+            )
+
+            # 기존 함수와 같은 결과인지 확인
+            assert converted == expected, f"{n_rows}행 결과 불일치 (convert)"
+            assert columnar == expected, f"{n_rows}행 결과 불일치 (columnar)"
+
+            del lot_rows, eqp_rows
+
+        results.append(result)
+
+    return results
+
+
+def main():
+    """벤치마크 실행"""
+
+    row_limit = max(SIZES) if '--full' in sys.argv else ROW_LIMIT
+
+    print("\n" + "=" * 60)
+    print("⏱️ 컨텍스트 집계 벤치마크 (rows vs columnar)")
+    print("=" * 60 + "\n")
+    print(f"LOT/EQP 각 N행, DOWN 비율 {DOWN_RATIO:.0%}, dict 행은 {row_limit:,}행까지\n")
+
+    def fmt(value):
+        return f"{value:>10.1f}" if value is not None else f"{'-':>10}"
+
+    print(f"   {'rows':>10}  {'rows ms':>10}  {'convert ms':>10}  {'columnar ms':>11}  {'speedup':>8}")
+    for result in run_benchmark(SIZES, row_limit):
+        speedup = (
+            f"{result['rows_ms'] / result['columnar_ms']:>7.1f}x"
+            if result['rows_ms'] is not None else f"{'-':>8}"
+        )
+        print(
+            f"   {result['rows']:>10,}  {fmt(result['rows_ms'])}  {fmt(result['convert_ms'])}  "
+            f"{result['columnar_ms']:>11.1f}  {speedup}"
+        )
+
+    print("\n" + "=" * 60 + "\n")
+
+
+if __name__ == "__main__":
+    main()
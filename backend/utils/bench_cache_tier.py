@@ -0,0 +1,139 @@
+"""
+디스크 캐시 계층 콜드 스타트 벤치마크
+
+분석 결과 N건을 캐시에 저장한 뒤 서버 재시작(메모리 캐시 초기화)을 흉내 내고,
+같은 알람을 다시 조회했을 때
+- 메모리 캐시만 사용 (기존 방식)
+- 메모리 + SQLite 디스크 계층
+두 경우의 히트율, 조회 지연, 다시 호출해야 하는 LLM 횟수를 비교합니다.
+
+실행:
+    python backend/utils/bench_cache_tier.py [분석 결과 수]
+"""
+
+import io
+import os
+import sys
+import time
+import tempfile
+from contextlib import redirect_stdout
+from pathlib import Path
+
+# 프로젝트 루트를 경로에 추가
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from backend.utils.cache import BoundedCache, DiskCacheTier
+
+# 알람 1건 분석 시 LLM 호출 수 (Node 6 원인 분석 + Node 8 리포트)
+LLM_CALLS_PER_ANALYSIS = 2
+
+
+def make_state(index: int) -> dict:
+    """분석 결과 AgentState 흉내 (lot/eqp 데이터 포함)"""
+    return {
+        'input_type': 'alarm',
+        'alarm_date': '2026-01-20',
+        'alarm_eqp_id': f'EQP{index:03d}',
+        'alarm_kpi': 'OEE',
+        'lot_data': [
+            {'lot_id': f'LOT{i}', 'lot_state': 'RUN', 'event_time': '2026-01-20 10:00', 'in_cnt': 25}
+            for i in range(500)
+        ],
+        'eqp_data': [
+            {'eqp_state': 'DOWN', 'event_time': '2026-01-20 01:25', 'end_time': '2026-01-20 04:25'}
+            for _ in range(50)
+        ],
+        'final_report': '# 분석 리포트\n' + '원인 분석 내용 ' * 300,
+        'rag_saved': True,
+        'metadata': {'llm_calls': LLM_CALLS_PER_ANALYSIS}
+    }
+
+
+def lookup_all(cache: BoundedCache, keys: list) -> dict:
+    """모든 키를 조회하여 히트율과 평균 지연을 측정합니다."""
+    hits = 0
+    start = time.perf_counter()
+
+    with redirect_stdout(io.StringIO()):
+        for key in keys:
+            if cache.get(key) is not None:
+                hits += 1
+
+    elapsed = time.perf_counter() - start
+
+    return {
+        'hit_rate': hits / len(keys),
+        'avg_ms': elapsed / len(keys) * 1000,
+        'llm_calls': (len(keys) - hits) * LLM_CALLS_PER_ANALYSIS
+    }
+
+
+def run_benchmark(n_entries: int = 200) -> dict:
+    """
+    콜드 스타트 히트율/지연을 측정합니다.
+
+    Args:
+        n_entries: 캐시에 저장할 분석 결과 수
+
+    Returns:
+        dict: 모드별 측정 결과
+    """
+    db_path = os.path.join(tempfile.mkdtemp(), 'cache.db')
+    keys = [f'alarm:2026-01-20:EQP{i:03d}:OEE' for i in range(n_entries)]
+
+    # 1. 재시작 전: 분석 결과 저장
+    before = BoundedCache(ttl_seconds=3600, max_entries=n_entries, disk_tier=DiskCacheTier(db_path))
+    with redirect_stdout(io.StringIO()):
+        for i, key in enumerate(keys):
+            before.set(key, make_state(i))
+
+    # 2. 재시작 후: 메모리만 사용
+    memory_only = lookup_all(BoundedCache(ttl_seconds=3600, max_entries=n_entries), keys)
+
+    # 3. 재시작 후: 디스크 계층 사용 (첫 조회 = 디스크, 두 번째 = 메모리 적재 후)
+    tiered_cache = BoundedCache(ttl_seconds=3600, max_entries=n_entries, disk_tier=DiskCacheTier(db_path))
+    tiered_cold = lookup_all(tiered_cache, keys)
+    tiered_warm = lookup_all(tiered_cache, keys)
+
+    return {
+        'n_entries': n_entries,
+        # WAL 모드이므로 -wal 파일 포함
+        'db_bytes': sum(
+            os.path.getsize(path) for path in (db_path, db_path + '-wal') if os.path.exists(path)
+        ),
+        'memory_only': memory_only,
+        'tiered_cold': tiered_cold,
+        'tiered_warm': tiered_warm
+    }
+
+
+def main():
+    """벤치마크 실행"""
+
+    n_entries = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+
+    print("\n" + "=" * 60)
+    print("⏱️ 디스크 캐시 계층 콜드 스타트 벤치마크")
+    print("=" * 60 + "\n")
+
+    result = run_benchmark(n_entries)
+
+    print(f"분석 결과: {result['n_entries']}건 (디스크 {result['db_bytes'] / 1024:.0f} KB)\n")
+
+    rows = [
+        ("메모리만 (재시작 직후)", result['memory_only']),
+        ("디스크 계층 (재시작 직후)", result['tiered_cold']),
+        ("디스크 계층 (메모리 적재 후)", result['tiered_warm'])
+    ]
+    for label, stats in rows:
+        print(f"{label}")
+        print(f"   히트율: {stats['hit_rate'] * 100:.0f}%")
+        print(f"   조회 지연: {stats['avg_ms']:.3f} ms/건")
+        print(f"   다시 필요한 LLM 호출: {stats['llm_calls']}회\n")
+
+    print("=" * 60 + "\n")
+
+
+if __name__ == "__main__":
+    main()
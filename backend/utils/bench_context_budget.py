@@ -0,0 +1,159 @@
+"""
+컨텍스트 크기 대비 LLM 지연 벤치마크 (로컬 스텁)
+
+데이터 규모(로트/다운타임/레시피 행 수)를 키우면서
+- format_context_data: 제한 없는 기존 컨텍스트
+- build_context: 토큰 예산(TOKEN_BUDGET) 컨텍스트
+로 근본 원인 분석 + 리포트 작성 프롬프트(같은 컨텍스트가 두 번 들어감)를 만들고,
+입력 토큰당 지연을 흉내 내는 스텁 LLM으로 호출 지연과 입력 비용을 비교합니다.
+
+스텁 지연 = 기본 지연 + 입력 토큰 x PREFILL_MS_PER_TOKEN + 출력 토큰 x DECODE_MS_PER_TOKEN
+(실제로는 TIME_SCALE 비율만큼만 sleep 하고 환산한 값을 출력)
+
+실행:
+    python backend/utils/bench_context_budget.py [토큰 예산]
+"""
+
+import sys
+import time
+import random
+from pathlib import Path
+
+# 프로젝트 루트를 경로에 추가
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from backend.utils.context_builder import build_context, estimate_tokens
+from backend.utils.data_utils import format_context_data
+from backend.utils.prompt_templates import get_root_cause_analysis_prompt, get_report_writer_prompt
+
+TOKEN_BUDGET = 800
+
+# 스텁 LLM 지연 모델 (ms)
+BASE_LATENCY_MS = 400
+PREFILL_MS_PER_TOKEN = 0.2
+DECODE_MS_PER_TOKEN = 20
+OUTPUT_TOKENS = 600
+TIME_SCALE = 0.02
+
+# 입력 토큰 1K당 비용 (USD)
+INPUT_COST_PER_1K = 0.003
+
+SCALES = [1, 10, 100, 1000]
+
+
+class StubLLM:
+    """입력 토큰 수에 비례해 지연되는 LLM 스텁"""
+
+    def __init__(self):
+        self.calls = []
+
+    def invoke(self, prompt: str) -> float:
+        """프롬프트를 '처리'하고 환산 지연(ms)을 반환합니다."""
+        input_tokens = estimate_tokens(prompt)
+        latency_ms = BASE_LATENCY_MS + input_tokens * PREFILL_MS_PER_TOKEN + OUTPUT_TOKENS * DECODE_MS_PER_TOKEN
+
+        start = time.perf_counter()
+        time.sleep(latency_ms * TIME_SCALE / 1000)
+        measured_ms = (time.perf_counter() - start) * 1000 / TIME_SCALE
+
+        self.calls.append(input_tokens)
+        return measured_ms
+
+
+def make_data(scale: int) -> dict:
+    """데이터 규모 배수별 합성 컨텍스트 입력"""
+    rng = random.Random(scale)
+
+    return {
+        'kpi_data': {
+            'date': '2026-01-20', 'eqp_id': 'EQP01', 'line_id': 'LINE1', 'oper_id': 'OPER1',
+            'oee_v': 53.51, 'oee_t': 70, 'thp_v': 980, 'thp_t': 1200,
+            'tat_v': 5.2, 'tat_t': 4.0, 'wip_v': 310, 'wip_t': 250, 'good_out_qty': 950
+        },
+        'lot_data': [
+            {
+                'lot_state': rng.choice(['RUN', 'RUN', 'WAIT', 'HOLD', 'END']),
+                'in_cnt': rng.randint(20, 25),
+                'event_time': f'2026-01-20 {rng.randint(0, 23):02d}:{rng.randint(0, 59):02d}:00'
+            }
+            for _ in range(288 * scale)
+        ],
+        'eqp_data': [
+            {
+                'eqp_state': 'DOWN',
+                'event_time': f'2026-01-20 {hour:02d}:{minute:02d}:00',
+                'end_time': f'2026-01-20 {hour:02d}:{minute + 10:02d}:00'
+            }
+            for hour, minute in ((rng.randint(0, 23), rng.randint(0, 45)) for _ in range(4 * scale))
+        ],
+        'rcp_data': [
+            {'rcp_id': f'RCP{i:05d}', 'complex_level': rng.randint(1, 10)}
+            for i in range(3 * scale)
+        ]
+    }
+
+
+def run_pipeline(llm: StubLLM, context_text: str) -> float:
+    """근본 원인 분석(Node 6) + 리포트 작성(Node 8) 호출 지연 합계 (ms)"""
+    latency = llm.invoke(get_root_cause_analysis_prompt(context_text))
+    latency += llm.invoke(get_report_writer_prompt('문제 요약', '선택한 원인', '근거', context_text))
+    return latency
+
+
+def run_benchmark(token_budget: int) -> list:
+    """
+    규모별 기존 / 예산 컨텍스트의 토큰 수와 스텁 지연을 측정합니다.
+
+    Returns:
+        list: [{'scale', 'mode', 'context_tokens', 'input_tokens', 'latency_ms', 'cost'}]
+    """
+    results = []
+
+    for scale in SCALES:
+        data = make_data(scale)
+        contexts = {
+            'unbounded': format_context_data(**data),
+            'budgeted': build_context(alarm_kpi='OEE', token_budget=token_budget, **data)['text']
+        }
+
+        for mode, context_text in contexts.items():
+            llm = StubLLM()
+            latency_ms = run_pipeline(llm, context_text)
+            results.append({
+                'scale': scale,
+                'mode': mode,
+                'context_tokens': estimate_tokens(context_text),
+                'input_tokens': sum(llm.calls),
+                'latency_ms': latency_ms,
+                'cost': sum(llm.calls) / 1000 * INPUT_COST_PER_1K
+            })
+
+    return results
+
+
+def main():
+    """벤치마크 실행"""
+
+    token_budget = int(sys.argv[1]) if len(sys.argv) > 1 else TOKEN_BUDGET
+
+    print("\n" + "=" * 60)
+    print("⏱️ 컨텍스트 크기 대비 LLM 지연 벤치마크 (스텁)")
+    print("=" * 60 + "\n")
+    print(
+        f"예산 {token_budget}토큰, 지연 = {BASE_LATENCY_MS}ms + 입력 x {PREFILL_MS_PER_TOKEN}ms "
+        f"+ 출력 {OUTPUT_TOKENS} x {DECODE_MS_PER_TOKEN}ms, 호출 2회 (Node 6 + Node 8)\n"
+    )
+
+    print(f"   {'scale':>6} {'mode':<10} {'context':>8} {'input':>8} {'latency':>10} {'cost':>9}")
+    for result in run_benchmark(token_budget):
+        print(
+            f"   x{result['scale']:<5} {result['mode']:<10} {result['context_tokens']:>8,} "
+            f"{result['input_tokens']:>8,} {result['latency_ms']:>8,.0f}ms ${result['cost']:>8.4f}"
+        )
+
+    print("\n" + "=" * 60 + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""
+시각 문자열 파싱 벤치마크
+
+시각 문자열 N개(기본 100만)를
+- strptime: 기존 parse_datetime (길이/구분자 검사 후 strptime)
+- fromisoformat: 현재 parse_datetime
+- parse_many: NumPy datetime64 일괄 변환
+으로 파싱하는 시간을 형식별로 비교합니다.
+PostgREST 형식(T 구분자, 타임존)은 기존 방식이 지원하지 않아 '-'로 표시합니다.
+
+실행:
+    python backend/utils/bench_timestamps.py [문자열 수]
+"""
+
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# 프로젝트 루트를 경로에 추가
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from backend.utils.date_utils import parse_datetime, parse_many
+
+FORMATS = {
+    'YYYY-MM-DD HH:MM': '%Y-%m-%d %H:%M',
+    'YYYY-MM-DD HH:MM:SS': '%Y-%m-%d %H:%M:%S',
+    'ISO T (PostgREST)': '%Y-%m-%dT%H:%M:%S',
+    'ISO T + timezone': '%Y-%m-%dT%H:%M:%S+00:00'
+}
+
+
+def legacy_parse_datetime(date_str: str) -> datetime:
+    """기존 parse_datetime (형식 자동 감지 + strptime)"""
+    if len(date_str) == 10 and date_str.count('-') == 2:
+        return datetime.strptime(date_str, '%Y-%m-%d')
+    elif len(date_str) == 16 and date_str.count(':') == 1:
+        return datetime.strptime(date_str, '%Y-%m-%d %H:%M')
+    elif len(date_str) == 19 and date_str.count(':') == 2:
+        return datetime.strptime(date_str, '%Y-%m-%d %H:%M:%S')
+    else:
+        raise ValueError(f"지원하지 않는 날짜 형식입니다: {date_str}")
+
+
+def make_timestamps(n: int, format: str) -> list:
+    """4주 범위의 시각 문자열 n개"""
+    base = datetime(2026, 1, 1)
+    return [(base + timedelta(seconds=i * 2419 % (28 * 86400))).strftime(format) for i in range(n)]
+
+
+def timed(fn) -> float:
+    """소요 시간 (ms)"""
+    start = time.perf_counter()
+    fn()
+    return (time.perf_counter() - start) * 1000
+
+
+def run_benchmark(n: int) -> dict:
+    """
+    형식별 파싱 시간을 측정합니다.
+
+    Returns:
+        dict: {형식: {'strptime', 'fromisoformat', 'parse_many'}} (ms, 지원하지 않으면 None)
+    """
+    results = {}
+
+    for name, format in FORMATS.items():
+        values = make_timestamps(n, format)
+
+        try:
+            legacy_parse_datetime(values[0])
+            legacy_ms = timed(lambda: [legacy_parse_datetime(value) for value in values])
+        except ValueError:
+            legacy_ms = None
+
+        results[name] = {
+            'strptime': legacy_ms,
+            'fromisoformat': timed(lambda: [parse_datetime(value) for value in values]),
+            'parse_many': timed(lambda: parse_many(values))
+        }
+
+        # 세 방식의 결과가 같은지 확인
+        expected = [parse_datetime(value) for value in values[:1000]]
+        assert parse_many(values[:1000]).tolist() == expected
+        if legacy_ms is not None:
+            assert [legacy_parse_datetime(value) for value in values[:1000]] == expected
+
+    return results
+
+
+def main():
+    """벤치마크 실행"""
+
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+
+    print("\n" + "=" * 60)
+    print("⏱️ 시각 문자열 파싱 벤치마크")
+    print("=" * 60 + "\n")
+    print(f"문자열 {n:,}개\n")
+
+    def fmt(value):
+        return f"{value:>10.0f}" if value is not None else f"{'-':>10}"
+
+    print(f"   {'format':<22} {'strptime':>10} {'isoformat':>10} {'parse_many':>10}  (ms)")
+    for name, result in run_benchmark(n).items():
+        print(
+            f"   {name:<22} {fmt(result['strptime'])} {fmt(result['fromisoformat'])} "
+            f"{fmt(result['parse_many'])}"
+        )
+
+    print("\n" + "=" * 60 + "\n")
+
+
+if __name__ == "__main__":
+    main()
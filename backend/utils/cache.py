@@ -1,28 +1,74 @@
 """
-간단한 인메모리 캐시
+인메모리 캐시 (+ 선택적 디스크 계층)
 동일한 알람 분석 결과를 캐싱하여 LLM 비용 절감
+
+캐시 값은 lot_data/eqp_data를 포함한 AgentState 전체이므로
+항목 수(max_entries)와 전체 크기(max_bytes)를 제한하고,
+한도를 넘으면 가장 오래 사용되지 않은 항목(LRU)부터 제거합니다.
+
+CACHE_DISK_PATH를 지정하면 SQLite 디스크 계층을 뒤에 두어
+서버 재시작/배포 후에도 이미 분석한 알람은 LLM을 다시 호출하지 않습니다.
 """
 
-from typing import Optional, Dict, Any
-from datetime import datetime, timedelta
+import os
 import json
+import time
+import zlib
+import heapq
+import sqlite3
+import threading
+from collections import OrderedDict
+from typing import Optional, Dict, Any, Tuple
+from datetime import datetime, timedelta
 
 
-class SimpleCache:
+class BoundedCache:
     """
-    간단한 인메모리 캐시
+    LRU + TTL 인메모리 캐시 (스레드 안전)
     
     알람 분석 결과를 메모리에 저장하여
     동일한 알람 재분석 시 LLM 호출을 방지합니다.
+    
+    - max_entries / max_bytes 한도 초과 시 LRU 제거
+    - 만료 항목은 get 시 즉시, set 시 만료 힙 앞부분부터 정리 (분할 상환)
+    - hits / misses / evictions 통계
+    - disk_tier 지정 시 메모리 미스를 디스크에서 찾아 메모리로 적재
     """
     
-    def __init__(self, ttl_seconds: int = 3600):
+    def __init__(
+        self,
+        ttl_seconds: int = 3600,
+        max_entries: int = 256,
+        max_bytes: int = 64 * 1024 * 1024,
+        disk_tier: Optional['DiskCacheTier'] = None,
+        namespace: str = 'default'
+    ):
         """
         Args:
             ttl_seconds: 캐시 유효 시간 (초, 기본 1시간)
+            max_entries: 최대 항목 수
+            max_bytes: 최대 전체 크기 (JSON 직렬화 기준 bytes)
+            disk_tier: 디스크 계층 (선택)
+            namespace: 디스크 계층에서 캐시를 구분하는 이름
         """
-        self.cache: Dict[str, Dict[str, Any]] = {}
+        self.cache: 'OrderedDict[str, Dict[str, Any]]' = OrderedDict()
         self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.disk_tier = disk_tier
+        self.namespace = namespace
+        
+        # 만료 힙 (expires_at, key)
+        self._expiry_heap: list = []
+        self._total_bytes = 0
+        self._lock = threading.RLock()
+        
+        # 통계
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expired_cleaned = 0
+        self.disk_hits = 0
     
     def get(self, key: str) -> Optional[Dict[str, Any]]:
         """
@@ -34,19 +80,39 @@ class SimpleCache:
         Returns:
             캐시된 데이터 또는 None
         """
-        if key not in self.cache:
-            return None
+        with self._lock:
+            cached_item = self.cache.get(key)
+            
+            if cached_item is not None and time.monotonic() > cached_item['expires_at']:
+                # 만료된 캐시 삭제
+                self._remove(key)
+                self.expired_cleaned += 1
+                cached_item = None
+            
+            if cached_item is not None:
+                # 최근 사용으로 이동
+                self.cache.move_to_end(key)
+                self.hits += 1
         
-        cached_item = self.cache[key]
+        if cached_item is not None:
+            print(f"✅ 캐시 히트: {key}")
+            return cached_item['data']
         
-        # TTL 확인
-        if datetime.now() > cached_item['expires_at']:
-            # 만료된 캐시 삭제
-            del self.cache[key]
-            return None
+        # 디스크 계층 확인 (재시작 후 첫 조회)
+        if self.disk_tier is not None:
+            stored = self.disk_tier.get(self.namespace, key)
+            if stored is not None:
+                data, remaining_seconds = stored
+                self._store(key, data, remaining_seconds)
+                with self._lock:
+                    self.hits += 1
+                    self.disk_hits += 1
+                print(f"✅ 디스크 캐시 히트: {key}")
+                return data
         
-        print(f"✅ 캐시 히트: {key}")
-        return cached_item['data']
+        with self._lock:
+            self.misses += 1
+        return None
     
     def set(self, key: str, data: Dict[str, Any]) -> None:
         """
@@ -56,15 +122,13 @@ class SimpleCache:
             key: 캐시 키
             data: 저장할 데이터
         """
-        expires_at = datetime.now() + timedelta(seconds=self.ttl_seconds)
+        self._store(key, data, self.ttl_seconds)
         
-        self.cache[key] = {
-            'data': data,
-            'expires_at': expires_at,
-            'created_at': datetime.now()
-        }
+        if self.disk_tier is not None:
+            self.disk_tier.set(self.namespace, key, data, self.ttl_seconds)
         
-        print(f"💾 캐시 저장: {key} (만료: {expires_at.strftime('%H:%M:%S')})")
+        expires_label = (datetime.now() + timedelta(seconds=self.ttl_seconds)).strftime('%H:%M:%S')
+        print(f"💾 캐시 저장: {key} (만료: {expires_label})")
     
     def delete(self, key: str) -> None:
         """
@@ -73,14 +137,28 @@ class SimpleCache:
         Args:
             key: 캐시 키
         """
-        if key in self.cache:
-            del self.cache[key]
+        with self._lock:
+            found = key in self.cache
+            if found:
+                self._remove(key)
+        
+        if self.disk_tier is not None:
+            found = self.disk_tier.delete(self.namespace, key) or found
+        
+        if found:
             print(f"🗑️ 캐시 삭제: {key}")
     
     def clear(self) -> None:
         """모든 캐시 삭제"""
-        count = len(self.cache)
-        self.cache.clear()
+        with self._lock:
+            count = len(self.cache)
+            self.cache.clear()
+            self._expiry_heap.clear()
+            self._total_bytes = 0
+        
+        if self.disk_tier is not None:
+            count = max(count, self.disk_tier.clear(self.namespace))
+        
         print(f"🗑️ 전체 캐시 삭제: {count}개")
     
     def get_stats(self) -> Dict[str, Any]:
@@ -90,21 +168,29 @@ class SimpleCache:
         Returns:
             캐시 통계 정보
         """
-        # 만료된 항목 정리
-        now = datetime.now()
-        expired_keys = [
-            key for key, item in self.cache.items()
-            if now > item['expires_at']
-        ]
+        with self._lock:
+            self._sweep_expired()
+            
+            lookups = self.hits + self.misses
+            
+            stats = {
+                'total_items': len(self.cache),
+                'total_bytes': self._total_bytes,
+                'max_entries': self.max_entries,
+                'max_bytes': self.max_bytes,
+                'ttl_seconds': self.ttl_seconds,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': round(self.hits / lookups, 3) if lookups else 0.0,
+                'evictions': self.evictions,
+                'expired_cleaned': self.expired_cleaned
+            }
         
-        for key in expired_keys:
-            del self.cache[key]
+        if self.disk_tier is not None:
+            stats['disk_hits'] = self.disk_hits
+            stats['disk_items'] = self.disk_tier.count(self.namespace)
         
-        return {
-            'total_items': len(self.cache),
-            'ttl_seconds': self.ttl_seconds,
-            'expired_cleaned': len(expired_keys)
-        }
+        return stats
     
     def generate_key(self, *args) -> str:
         """
@@ -118,11 +204,211 @@ class SimpleCache:
         """
         key_parts = [str(arg) for arg in args]
         return ':'.join(key_parts)
+    
+    def _store(self, key: str, data: Dict[str, Any], ttl_seconds: float) -> None:
+        """메모리 계층에 저장 (한도 초과 시 LRU 제거)"""
+        size = _estimate_size(data)
+        
+        if size > self.max_bytes:
+            print(f"⚠️ 캐시 저장 생략 (크기 초과): {key} ({size:,} bytes)")
+            return
+        
+        expires_at = time.monotonic() + ttl_seconds
+        
+        with self._lock:
+            self._sweep_expired()
+            
+            if key in self.cache:
+                self._remove(key)
+            
+            self.cache[key] = {
+                'data': data,
+                'size': size,
+                'expires_at': expires_at,
+                'created_at': datetime.now()
+            }
+            self._total_bytes += size
+            heapq.heappush(self._expiry_heap, (expires_at, key))
+            
+            self._evict_over_limit()
+    
+    def _remove(self, key: str) -> None:
+        """항목 제거 (락을 잡은 상태에서 호출)"""
+        item = self.cache.pop(key)
+        self._total_bytes -= item['size']
+    
+    def _sweep_expired(self) -> None:
+        """
+        만료 힙 앞부분의 만료 항목을 정리합니다 (락을 잡은 상태에서 호출).
+        
+        이미 갱신/삭제된 키의 힙 항목은 expires_at이 달라 그냥 버립니다.
+        """
+        now = time.monotonic()
+        
+        while self._expiry_heap and self._expiry_heap[0][0] < now:
+            expires_at, key = heapq.heappop(self._expiry_heap)
+            item = self.cache.get(key)
+            if item is not None and item['expires_at'] == expires_at:
+                self._remove(key)
+                self.expired_cleaned += 1
+        
+        # 갱신/삭제로 남은 오래된 힙 항목이 많으면 재구성
+        if len(self._expiry_heap) > 2 * len(self.cache) + 64:
+            self._expiry_heap = [(item['expires_at'], key) for key, item in self.cache.items()]
+            heapq.heapify(self._expiry_heap)
+    
+    def _evict_over_limit(self) -> None:
+        """한도를 넘으면 LRU 항목부터 제거합니다 (락을 잡은 상태에서 호출)."""
+        while self.cache and (
+            len(self.cache) > self.max_entries or self._total_bytes > self.max_bytes
+        ):
+            key = next(iter(self.cache))
+            self._remove(key)
+            self.evictions += 1
+            print(f"♻️ 캐시 제거 (LRU): {key}")
+
+
+# 기존 이름 호환
+SimpleCache = BoundedCache
+
+
+class DiskCacheTier:
+    """
+    SQLite 디스크 캐시 계층
+    
+    값은 JSON + zlib으로 압축해 저장하고, 만료 시각(epoch)을 함께 저장하여
+    재시작 후에도 남은 TTL을 그대로 지킵니다.
+    여러 캐시가 namespace로 구분하여 한 파일을 공유합니다.
+    """
+    
+    def __init__(self, db_path: str = './data/cache.db'):
+        """
+        Args:
+            db_path: SQLite 파일 경로
+        """
+        self.db_path = db_path
+        os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+        
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        self.conn.execute(
+            '''
+            CREATE TABLE IF NOT EXISTS cache_entries (
+                namespace TEXT NOT NULL,
+                key TEXT NOT NULL,
+                value BLOB NOT NULL,
+                expires_at REAL NOT NULL,
+                PRIMARY KEY (namespace, key)
+            )
+            '''
+        )
+        self.conn.commit()
+        
+        self.purge_expired()
+    
+    def get(self, namespace: str, key: str) -> Optional[Tuple[Dict[str, Any], float]]:
+        """
+        디스크에서 조회
+        
+        Returns:
+            (데이터, 남은 TTL 초) 또는 None (없거나 만료)
+        """
+        with self._lock:
+            row = self.conn.execute(
+                'SELECT value, expires_at FROM cache_entries WHERE namespace = ? AND key = ?',
+                (namespace, key)
+            ).fetchone()
+        
+        if row is None:
+            return None
+        
+        remaining_seconds = row[1] - time.time()
+        if remaining_seconds <= 0:
+            self.delete(namespace, key)
+            return None
+        
+        return json.loads(zlib.decompress(row[0])), remaining_seconds
+    
+    def set(self, namespace: str, key: str, data: Dict[str, Any], ttl_seconds: float) -> None:
+        """디스크에 저장"""
+        value = zlib.compress(json.dumps(data, ensure_ascii=False, default=str).encode('utf-8'))
+        
+        with self._lock:
+            self.conn.execute(
+                'INSERT OR REPLACE INTO cache_entries (namespace, key, value, expires_at) '
+                'VALUES (?, ?, ?, ?)',
+                (namespace, key, value, time.time() + ttl_seconds)
+            )
+            self.conn.commit()
+    
+    def delete(self, namespace: str, key: str) -> bool:
+        """디스크에서 삭제. 삭제한 항목이 있으면 True"""
+        with self._lock:
+            cursor = self.conn.execute(
+                'DELETE FROM cache_entries WHERE namespace = ? AND key = ?', (namespace, key)
+            )
+            self.conn.commit()
+        return cursor.rowcount > 0
+    
+    def clear(self, namespace: str) -> int:
+        """namespace 전체 삭제. 삭제한 항목 수 반환"""
+        with self._lock:
+            cursor = self.conn.execute('DELETE FROM cache_entries WHERE namespace = ?', (namespace,))
+            self.conn.commit()
+        return cursor.rowcount
+    
+    def count(self, namespace: str) -> int:
+        """namespace의 유효 항목 수"""
+        with self._lock:
+            row = self.conn.execute(
+                'SELECT COUNT(*) FROM cache_entries WHERE namespace = ? AND expires_at > ?',
+                (namespace, time.time())
+            ).fetchone()
+        return row[0]
+    
+    def purge_expired(self) -> int:
+        """만료 항목 일괄 삭제. 삭제한 항목 수 반환"""
+        with self._lock:
+            cursor = self.conn.execute('DELETE FROM cache_entries WHERE expires_at <= ?', (time.time(),))
+            self.conn.commit()
+        return cursor.rowcount
+
+
+def create_disk_tier() -> Optional[DiskCacheTier]:
+    """CACHE_DISK_PATH가 설정되어 있으면 디스크 계층을 생성합니다."""
+    db_path = os.getenv('CACHE_DISK_PATH')
+    
+    if not db_path:
+        return None
+    
+    return DiskCacheTier(db_path)
+
+
+def _estimate_size(data: Any) -> int:
+    """캐시 값의 크기 추정 (JSON 직렬화 bytes)"""
+    return len(json.dumps(data, ensure_ascii=False, default=str).encode('utf-8'))
 
 
 # 전역 캐시 인스턴스
+# 디스크 계층 (CACHE_DISK_PATH 미설정 시 None → 메모리만 사용)
+disk_tier = create_disk_tier()
+
 # 알람 분석 결과 캐싱 (1시간 유효)
-analysis_cache = SimpleCache(ttl_seconds=3600)
+analysis_cache = BoundedCache(
+    ttl_seconds=3600,
+    max_entries=int(os.getenv('ANALYSIS_CACHE_MAX_ENTRIES', '256')),
+    max_bytes=int(os.getenv('ANALYSIS_CACHE_MAX_BYTES', str(128 * 1024 * 1024))),
+    disk_tier=disk_tier,
+    namespace='analysis'
+)
 
 # 질문 답변 캐싱 (30분 유효)
-qa_cache = SimpleCache(ttl_seconds=1800)
\ No newline at end of file
+qa_cache = BoundedCache(
+    ttl_seconds=1800,
+    max_entries=int(os.getenv('QA_CACHE_MAX_ENTRIES', '1024')),
+    max_bytes=int(os.getenv('QA_CACHE_MAX_BYTES', str(32 * 1024 * 1024))),
+    disk_tier=disk_tier,
+    namespace='qa'
+)
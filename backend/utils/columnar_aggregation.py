@@ -0,0 +1,182 @@
+"""
+컬럼 기반 (NumPy) 컨텍스트 집계
+
+aggregate_lot_states / get_downtime_info는 dict 리스트를 한 행씩 순회하고,
+DOWN 이벤트마다 calculate_duration에서 시각 문자열을 두 번 파싱합니다.
+여기서는 같은 데이터를 컬럼 배열(상태 코드, in_cnt, datetime64 시각)로 바꿔
+bincount / 배열 뺄셈으로 한 번에 집계합니다. 결과(값, dict 순서)는 기존 함수와 같습니다.
+
+전체 장비(fleet) / 여러 주 범위처럼 행이 많은 집계에 사용합니다.
+
+사용:
+    columns = lot_columns(lot_data)
+    lot_summary = aggregate_lot_columns(columns)
+
+    columns = eqp_columns(eqp_data)
+    downtime_info = downtime_from_columns(columns)
+"""
+
+from typing import Any, Dict, Iterable
+
+import numpy as np
+
+from .date_utils import DATETIME_DTYPE, format_many, parse_many
+
+# 시각 컬럼 단위 (timedelta.total_seconds()와 같은 마이크로초 해상도)
+TIME_DTYPE = DATETIME_DTYPE
+
+
+def lot_columns(lot_data: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    LOT_STATE 행을 컬럼 배열로 변환합니다.
+
+    Args:
+        lot_data: LOT_STATE 테이블 데이터 (리스트 또는 이터레이터)
+
+    Returns:
+        dict:
+            - state_code: 상태 코드 (int32, 처음 나온 상태부터 0, 1, ...)
+            - states: 코드별 상태 이름
+            - in_cnt: 투입 수량
+    """
+    codes = {}
+    state_code = []
+    in_cnt = []
+
+    for lot in lot_data or []:
+        state = lot.get('lot_state', 'UNKNOWN')
+        state_code.append(codes.setdefault(state, len(codes)))
+        in_cnt.append(lot.get('in_cnt', 0))
+
+    return {
+        'state_code': np.array(state_code, dtype=np.int32),
+        'states': list(codes),
+        'in_cnt': np.array(in_cnt) if in_cnt else np.zeros(0, dtype=np.int64)
+    }
+
+
+def eqp_columns(eqp_data: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    EQP_STATE 행을 컬럼 배열로 변환합니다.
+
+    시각 문자열은 parse_many로 한 번에 파싱합니다 ('2026-01-20 01:25',
+    '2026-01-20T01:25:00+00:00' 등 parse_datetime과 같은 형식). 값이 없으면 NaT입니다.
+
+    Args:
+        eqp_data: EQP_STATE 테이블 데이터 (리스트 또는 이터레이터)
+
+    Returns:
+        dict:
+            - is_down: eqp_state == 'DOWN' (bool)
+            - start / end: event_time / end_time (datetime64[us])
+            - event_time / end_time: 원본 시각 문자열 (다운타임 이벤트 표시용)
+    """
+    is_down = []
+    event_time = []
+    end_time = []
+
+    for event in eqp_data or []:
+        is_down.append(event.get('eqp_state') == 'DOWN')
+        event_time.append(event.get('event_time') or None)
+        end_time.append(event.get('end_time') or None)
+
+    return {
+        'is_down': np.array(is_down, dtype=bool),
+        'start': parse_many(event_time),
+        'end': parse_many(end_time),
+        'event_time': event_time,
+        'end_time': end_time
+    }
+
+
+def _sequential_sum(values: np.ndarray):
+    """
+    Python의 누적 덧셈과 같은 결과의 합계
+
+    정수는 순서와 관계없이 같지만, 실수는 np.sum(pairwise)과
+    앞에서부터 더한 값이 마지막 자리에서 다를 수 있어 cumsum을 사용합니다.
+    """
+    if values.size == 0:
+        return 0
+    if np.issubdtype(values.dtype, np.integer):
+        return int(values.sum())
+    return float(np.cumsum(values)[-1])
+
+
+def aggregate_lot_columns(columns: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    컬럼 배열로 로트 상태를 집계합니다 (aggregate_lot_states와 같은 결과).
+
+    Args:
+        columns: lot_columns 결과 또는 같은 형식의 배열
+            (state_code, states, in_cnt)
+
+    Returns:
+        Dict: total_lots, state_counts, hold_count, avg_in_cnt
+    """
+    state_code = np.asarray(columns['state_code'])
+    states = columns['states']
+
+    total_lots = int(state_code.size)
+    counts = np.bincount(state_code, minlength=len(states))
+
+    # state_counts는 기존 함수처럼 처음 나온 상태 순서
+    present = np.flatnonzero(counts)
+    first_seen = [int(np.argmax(state_code == code)) for code in present]
+    state_counts = {
+        states[code]: int(counts[code])
+        for _, code in sorted(zip(first_seen, present))
+    }
+
+    total_in_cnt = _sequential_sum(np.asarray(columns['in_cnt']))
+
+    return {
+        'total_lots': total_lots,
+        'state_counts': state_counts,
+        'hold_count': state_counts.get('HOLD', 0),
+        'avg_in_cnt': total_in_cnt / total_lots if total_lots else 0
+    }
+
+
+def downtime_from_columns(columns: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    컬럼 배열로 다운타임 정보를 계산합니다 (get_downtime_info와 같은 결과).
+
+    event_time / end_time 원본 문자열이 없으면 이벤트 시각은
+    'YYYY-MM-DD HH:MM:SS' 형식으로 표시합니다.
+
+    Args:
+        columns: eqp_columns 결과 또는 같은 형식의 배열
+            (is_down, start, end, 선택: event_time, end_time)
+
+    Returns:
+        Dict: total_downtime_hours, downtime_count, downtime_events
+    """
+    start = np.asarray(columns['start'], dtype=TIME_DTYPE)
+    end = np.asarray(columns['end'], dtype=TIME_DTYPE)
+
+    # 시작/종료 시각이 모두 있는 DOWN 이벤트
+    mask = np.asarray(columns['is_down'], dtype=bool) & ~np.isnat(start) & ~np.isnat(end)
+    index = np.flatnonzero(mask)
+
+    # 마이크로초 차이 → 초 → 시간 (timedelta.total_seconds() / 3600과 같은 반올림)
+    micros = (end[index] - start[index]).astype(np.int64)
+    hours = micros / 1e6 / 3600
+
+    if 'event_time' in columns:
+        start_text = [columns['event_time'][i] for i in index]
+        end_text = [columns['end_time'][i] for i in index]
+    else:
+        start_text = format_many(start[index])
+        end_text = format_many(end[index])
+
+    downtime_events = [
+        {'start_time': s, 'end_time': e, 'duration_hours': duration}
+        for s, e, duration in zip(start_text, end_text, hours.tolist())
+    ]
+
+    return {
+        'total_downtime_hours': _sequential_sum(hours),
+        'downtime_count': len(downtime_events),
+        'downtime_events': downtime_events
+    }
@@ -0,0 +1,262 @@
+"""
+토큰 예산 기반 컨텍스트 생성
+
+format_context_data는 크기 제한 없이 컨텍스트를 만들고, 같은 context_text가
+근본 원인 분석 프롬프트와 리포트 작성 프롬프트에 모두 들어갑니다.
+Bedrock 지연/비용은 입력 토큰 수에 비례하므로 여기서는
+- 원본 행을 나열하지 않고 통계 / 히스토그램으로 압축하고
+- 알람 KPI와 관련이 큰 섹션부터 배치하며
+- 예산을 넘으면 관련도가 낮은 섹션부터 단계적으로 줄입니다 (상세 → 요약 → 최소 → 생략).
+
+KPI 정보 / KPI 수치 섹션은 항상 포함합니다.
+
+사용:
+    result = build_context(kpi_data, 'OEE', lot_data=..., downtime_info=..., token_budget=800)
+    result['text'], result['estimated_tokens']
+"""
+
+import math
+from collections import Counter
+from typing import Any, Dict, List, Optional
+
+from .data_utils import aggregate_lot_states, get_downtime_info
+
+# 섹션 축소 단계
+LEVELS = ['full', 'compact', 'minimal', 'omitted']
+
+# KPI별 섹션 관련도 (클수록 먼저 배치하고 나중에 줄임)
+SECTION_RELEVANCE = {
+    'OEE': {'downtime': 3, 'lot': 2, 'recipe': 1},
+    'THP': {'downtime': 3, 'lot': 3, 'recipe': 1},
+    'TAT': {'lot': 3, 'recipe': 2, 'downtime': 1},
+    'WIP_EXCEED': {'lot': 3, 'downtime': 2, 'recipe': 1},
+    'WIP_SHORTAGE': {'lot': 3, 'downtime': 2, 'recipe': 1},
+}
+DEFAULT_RELEVANCE = {'downtime': 2, 'lot': 2, 'recipe': 1}
+
+# 상세 단계에서 나열할 최대 항목 수 (다운타임 이벤트 / 레시피)
+MAX_LISTED_ITEMS = 20
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Claude 입력 토큰 수를 추정합니다 (토크나이저 없이).
+
+    영문/숫자/기호는 약 4자, 한글 등 나머지는 약 1.5자에 1토큰으로 계산하고 올림합니다.
+    실제보다 약간 크게 잡히므로 예산을 넘기지 않는 쪽으로 동작합니다.
+    """
+    ascii_chars = len(text.encode('ascii', 'ignore'))
+    return math.ceil(ascii_chars / 4 + (len(text) - ascii_chars) / 1.5)
+
+
+def _stats_text(values: List[float], unit: str) -> str:
+    """수치 목록 → '평균 / 중앙값 / 최소 / 최대' 요약"""
+    ordered = sorted(values)
+    middle = len(ordered) // 2
+    median = ordered[middle] if len(ordered) % 2 else (ordered[middle - 1] + ordered[middle]) / 2
+    return (
+        f"평균 {sum(ordered) / len(ordered):.2f}{unit} / 중앙값 {median:.2f}{unit} / "
+        f"최소 {ordered[0]:.2f}{unit} / 최대 {ordered[-1]:.2f}{unit}"
+    )
+
+
+def _hour_histogram(times: List[str]) -> str:
+    """시각 목록 → 시간대별 건수 ('01시 3, 02시 1')"""
+    counts = Counter(str(value)[11:13] for value in times if value and len(str(value)) >= 13)
+    return ', '.join(f"{hour}시 {count}" for hour, count in sorted(counts.items()))
+
+
+def _kpi_sections(kpi_data: Dict[str, Any]) -> List[tuple]:
+    """항상 포함하는 KPI 섹션 (format_context_data와 같은 내용)"""
+    return [
+        ('KPI 정보', [
+            f"- 날짜: {kpi_data.get('date')}",
+            f"- 장비: {kpi_data.get('eqp_id')}",
+            f"- 라인: {kpi_data.get('line_id')}",
+            f"- 공정: {kpi_data.get('oper_id')}"
+        ]),
+        ('KPI 수치', [
+            f"- OEE: {kpi_data.get('oee_v')}% (목표: {kpi_data.get('oee_t')}%)",
+            f"- Throughput: {kpi_data.get('thp_v')}개 (목표: {kpi_data.get('thp_t')}개)",
+            f"- TAT: {kpi_data.get('tat_v')}시간 (목표: {kpi_data.get('tat_t')}시간)",
+            f"- WIP: {kpi_data.get('wip_v')}개 (목표: {kpi_data.get('wip_t')}개)",
+            f"- 양품 출하: {kpi_data.get('good_out_qty')}개"
+        ])
+    ]
+
+
+def _lot_levels(lot_data: List[Dict[str, Any]], lot_summary: Dict[str, Any]) -> Dict[str, List[str]]:
+    """로트 상태 섹션의 단계별 내용"""
+    minimal = [
+        f"- 총 로트 수: {lot_summary['total_lots']}개",
+        f"- HOLD 발생: {lot_summary['hold_count']}회"
+    ]
+    compact = minimal[:1] + [f"- 상태별 분포: {lot_summary['state_counts']}"] + minimal[1:]
+    full = list(compact)
+
+    in_cnt = [lot['in_cnt'] for lot in lot_data if isinstance(lot.get('in_cnt'), (int, float))]
+    if in_cnt:
+        full.append(f"- 투입 수량: {_stats_text(in_cnt, '개')}")
+    else:
+        full.append(f"- 평균 투입 수량: {lot_summary['avg_in_cnt']:.2f}개")
+
+    hold_hours = _hour_histogram([lot.get('event_time') for lot in lot_data if lot.get('lot_state') == 'HOLD'])
+    if hold_hours:
+        full.append(f"- 시간대별 HOLD: {hold_hours}")
+
+    return {'full': full, 'compact': compact, 'minimal': minimal}
+
+
+def _downtime_levels(downtime_info: Dict[str, Any], downtime_stats: Optional[Dict[str, Any]]) -> Dict[str, List[str]]:
+    """장비 다운타임 섹션의 단계별 내용 (겹침 제거 통계가 있으면 그 값이 총 다운타임)"""
+    if downtime_stats:
+        minimal = [
+            f"- 총 다운타임 (분석 윈도우 내, 겹침 제거): {downtime_stats['total_downtime_hours']:.2f}시간",
+            f"- 발생 횟수: {downtime_stats['downtime_count']}회"
+        ]
+        compact = list(minimal) + [
+            f"- 원본 이벤트 합계 (겹침/윈도우 밖 포함): {downtime_info['total_downtime_hours']:.2f}시간 "
+            f"({downtime_info['downtime_count']}건)"
+        ]
+        if downtime_stats['downtime_count'] > 0:
+            longest = downtime_stats['longest_outage']
+            compact += [
+                f"- 최장 다운타임: {longest['duration_hours']:.2f}시간 ({longest['start_time']} ~ {longest['end_time']})",
+                f"- MTTR: {downtime_stats['mttr_hours']:.2f}시간 / MTBF: {downtime_stats['mtbf_hours']:.2f}시간"
+            ]
+    else:
+        minimal = [
+            f"- 총 다운타임: {downtime_info['total_downtime_hours']:.2f}시간",
+            f"- 발생 횟수: {downtime_info['downtime_count']}회"
+        ]
+        compact = list(minimal)
+
+    events = downtime_info['downtime_events']
+    if events:
+        compact.append(f"- 다운타임 길이: {_stats_text([event['duration_hours'] for event in events], '시간')}")
+        compact.append(f"- 시간대별 발생: {_hour_histogram([event['start_time'] for event in events])}")
+
+    full = list(compact)
+    for event in events[:MAX_LISTED_ITEMS]:
+        full.append(f"  - {event['start_time']} ~ {event['end_time']} ({event['duration_hours']:.2f}시간)")
+    if len(events) > MAX_LISTED_ITEMS:
+        full.append(f"  - ... 외 {len(events) - MAX_LISTED_ITEMS}건")
+
+    return {'full': full, 'compact': compact, 'minimal': minimal}
+
+
+def _recipe_levels(rcp_data: List[Dict[str, Any]]) -> Dict[str, List[str]]:
+    """레시피 섹션의 단계별 내용"""
+    levels = [rcp.get('complex_level') for rcp in rcp_data if isinstance(rcp.get('complex_level'), (int, float))]
+
+    minimal = [f"- 레시피 수: {len(rcp_data)}개"]
+    compact = list(minimal)
+    if levels:
+        histogram = ', '.join(f"{level}: {count}" for level, count in sorted(Counter(levels).items()))
+        compact.append(f"- 복잡도 분포 (/10): {histogram}")
+        top = sorted(rcp_data, key=lambda rcp: rcp.get('complex_level') or 0, reverse=True)[:3]
+        top_text = ', '.join(f"{rcp.get('rcp_id')}({rcp.get('complex_level')})" for rcp in top)
+        compact.append(f"- 복잡도 상위: {top_text}")
+
+    full = [
+        f"- {rcp.get('rcp_id')}: 복잡도 {rcp.get('complex_level')}/10"
+        for rcp in rcp_data[:MAX_LISTED_ITEMS]
+    ]
+    if len(rcp_data) > MAX_LISTED_ITEMS:
+        full = compact + full + [f"- ... 외 {len(rcp_data) - MAX_LISTED_ITEMS}개"]
+
+    return {'full': full, 'compact': compact, 'minimal': minimal}
+
+
+def _render(header: str, fixed: List[tuple], sections: List[dict]) -> str:
+    """섹션 목록 → 컨텍스트 텍스트 (번호는 배치 순서대로)"""
+    blocks = [header]
+    number = 1
+
+    for title, lines in fixed + [(section['title'], section['levels'].get(section['level'])) for section in sections]:
+        if lines is None:
+            continue
+        blocks.append(f"## {number}. {title}\n" + '\n'.join(lines))
+        number += 1
+
+    return '\n\n'.join(blocks) + '\n'
+
+
+def build_context(
+    kpi_data: Dict[str, Any],
+    alarm_kpi: Optional[str] = None,
+    lot_data: Optional[List[Dict[str, Any]]] = None,
+    eqp_data: Optional[List[Dict[str, Any]]] = None,
+    rcp_data: Optional[List[Dict[str, Any]]] = None,
+    lot_summary: Optional[Dict[str, Any]] = None,
+    downtime_info: Optional[Dict[str, Any]] = None,
+    downtime_stats: Optional[Dict[str, Any]] = None,
+    token_budget: Optional[int] = None
+) -> Dict[str, Any]:
+    """
+    토큰 예산 안에서 LLM 컨텍스트를 만듭니다.
+
+    Args:
+        kpi_data: KPI 데이터
+        alarm_kpi: 알람 KPI (섹션 관련도 결정, None이면 기본 순서)
+        lot_data: 로트 데이터 (lot_summary가 없으면 집계)
+        eqp_data: 장비 데이터 (downtime_info가 없으면 집계)
+        rcp_data: 레시피 데이터
+        lot_summary: 미리 집계한 로트 요약
+        downtime_info: 미리 집계한 다운타임 정보
+        downtime_stats: 겹침 제거 다운타임 통계 (downtime_intervals.downtime_stats)
+        token_budget: 최대 추정 토큰 수 (None이면 제한 없이 상세 단계)
+
+    Returns:
+        dict:
+            - text: 컨텍스트 텍스트
+            - estimated_tokens: 추정 토큰 수
+            - token_budget: 예산
+            - within_budget: 예산 이내 여부 (KPI 섹션만으로도 넘으면 False)
+            - sections: [{'name', 'relevance', 'level'}] (배치 순서)
+    """
+    lot_data = lot_data or []
+    rcp_data = rcp_data or []
+    if lot_summary is None:
+        lot_summary = aggregate_lot_states(lot_data)
+    if downtime_info is None:
+        downtime_info = get_downtime_info(eqp_data or [])
+
+    relevance = SECTION_RELEVANCE.get(alarm_kpi, DEFAULT_RELEVANCE)
+    sections = [
+        {'name': 'lot', 'title': '로트 상태 요약', 'levels': _lot_levels(lot_data, lot_summary)},
+        {'name': 'downtime', 'title': '장비 다운타임', 'levels': _downtime_levels(downtime_info, downtime_stats)},
+        {'name': 'recipe', 'title': '레시피 정보', 'levels': _recipe_levels(rcp_data)},
+    ]
+    for section in sections:
+        section['relevance'] = relevance.get(section['name'], 1)
+        section['level'] = 'full'
+
+    # 관련도 높은 섹션부터 배치 (같으면 기존 순서)
+    sections.sort(key=lambda section: -section['relevance'])
+
+    header = "# 분석 컨텍스트 데이터"
+    fixed = _kpi_sections(kpi_data)
+    text = _render(header, fixed, sections)
+
+    # 예산 초과 시: 모든 섹션을 한 단계씩, 관련도 낮은 섹션부터 줄임
+    if token_budget is not None:
+        for level in LEVELS[1:]:
+            for section in reversed(sections):
+                if estimate_tokens(text) <= token_budget:
+                    break
+                section['level'] = level
+                text = _render(header, fixed, sections)
+
+    estimated = estimate_tokens(text)
+
+    return {
+        'text': text,
+        'estimated_tokens': estimated,
+        'token_budget': token_budget,
+        'within_budget': token_budget is None or estimated <= token_budget,
+        'sections': [
+            {'name': section['name'], 'relevance': section['relevance'], 'level': section['level']}
+            for section in sections
+        ]
+    }
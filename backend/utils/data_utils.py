@@ -2,7 +2,7 @@
 데이터 처리 및 분석 유틸리티 함수
 """
 
-from typing import Dict, List, Any, Tuple
+from typing import Dict, List, Any, Iterable, Tuple
 
 def get_latest_alarm():
     """
@@ -159,12 +159,67 @@ def calculate_kpi_gap(
     }
 
 
-def aggregate_lot_states(lot_data: List[Dict[str, Any]]) -> Dict[str, Any]:
+def generate_problem_summary(kpi_data: dict, alarm_kpi: str) -> str:
+    """
+    KPI 데이터를 바탕으로 문제 요약을 생성합니다.
+    
+    Args:
+        kpi_data: KPI 데이터
+        alarm_kpi: 문제가 된 KPI
+    
+    Returns:
+        str: 문제 요약 텍스트
+    """
+    
+    # KPI별 목표/실제값 추출
+    if alarm_kpi == 'OEE':
+        target = kpi_data.get('oee_t')
+        actual = kpi_data.get('oee_v')
+        unit = '%'
+        kpi_name = 'OEE (Overall Equipment Effectiveness)'
+    elif alarm_kpi == 'THP':
+        target = kpi_data.get('thp_t')
+        actual = kpi_data.get('thp_v')
+        unit = '개'
+        kpi_name = '처리량 (Throughput)'
+    elif alarm_kpi == 'TAT':
+        target = kpi_data.get('tat_t')
+        actual = kpi_data.get('tat_v')
+        unit = '시간'
+        kpi_name = '처리 시간 (Turn Around Time)'
+    else:  # WIP
+        target = kpi_data.get('wip_t')
+        actual = kpi_data.get('wip_v')
+        unit = '개'
+        kpi_name = '재공품 (Work In Process)'
+    
+    # 차이 계산
+    gap = actual - target
+    gap_percent = (gap / target * 100) if target != 0 else 0
+    
+    # 문제 요약 생성
+    summary = f"""
+{kpi_name} 지표에 문제가 발생했습니다.
+
+- 목표치: {target}{unit}
+- 실제치: {actual}{unit}
+- 차이: {gap:+.2f}{unit} ({gap_percent:+.1f}%)
+
+장비 {kpi_data.get('eqp_id')}에서 {kpi_data.get('date')}에 발생한 문제입니다.
+    """.strip()
+    
+    return summary
+
+
+def aggregate_lot_states(lot_data: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
     """
     로트 상태 데이터를 집계합니다.
     
+    리스트뿐 아니라 iter_lot_state 같은 이터레이터도 받으며,
+    한 번 순회하면서 누적하므로 행을 메모리에 모아 두지 않습니다.
+    
     Args:
-        lot_data: LOT_STATE 테이블 데이터 리스트
+        lot_data: LOT_STATE 테이블 데이터 (리스트 또는 이터레이터)
     
     Returns:
         Dict: 집계 결과
@@ -181,37 +236,33 @@ def aggregate_lot_states(lot_data: List[Dict[str, Any]]) -> Dict[str, Any]:
         >>> aggregate_lot_states(lot_data)
         {'total_lots': 2, 'state_counts': {'RUN': 1, 'HOLD': 1}, ...}
     """
-    if not lot_data:
-        return {
-            'total_lots': 0,
-            'state_counts': {},
-            'hold_count': 0,
-            'avg_in_cnt': 0
-        }
-    
     # 상태별 개수 집계
     state_counts = {}
+    total_lots = 0
     total_in_cnt = 0
     
-    for lot in lot_data:
+    for lot in lot_data or []:
         state = lot.get('lot_state', 'UNKNOWN')
         state_counts[state] = state_counts.get(state, 0) + 1
+        total_lots += 1
         total_in_cnt += lot.get('in_cnt', 0)
     
     return {
-        'total_lots': len(lot_data),
+        'total_lots': total_lots,
         'state_counts': state_counts,
         'hold_count': state_counts.get('HOLD', 0),
-        'avg_in_cnt': total_in_cnt / len(lot_data) if lot_data else 0
+        'avg_in_cnt': total_in_cnt / total_lots if total_lots else 0
     }
 
 
-def get_downtime_info(eqp_data: List[Dict[str, Any]]) -> Dict[str, Any]:
+def get_downtime_info(eqp_data: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
     """
     장비 다운타임 정보를 추출합니다.
     
+    리스트뿐 아니라 iter_eqp_state 같은 이터레이터도 받습니다 (한 번 순회).
+    
     Args:
-        eqp_data: EQP_STATE 테이블 데이터 리스트
+        eqp_data: EQP_STATE 테이블 데이터 (리스트 또는 이터레이터)
     
     Returns:
         Dict: 다운타임 정보
@@ -231,7 +282,7 @@ def get_downtime_info(eqp_data: List[Dict[str, Any]]) -> Dict[str, Any]:
     downtime_events = []
     total_hours = 0
     
-    for event in eqp_data:
+    for event in eqp_data or []:
         if event.get('eqp_state') == 'DOWN':
             start = event.get('event_time')
             end = event.get('end_time')
@@ -254,11 +305,56 @@ def get_downtime_info(eqp_data: List[Dict[str, Any]]) -> Dict[str, Any]:
     }
 
 
+def summarize_context_stream(
+    eqp_id: str,
+    start_time: str,
+    end_time: str,
+    page_size: int = None
+) -> Dict[str, Any]:
+    """
+    LOT_STATE / EQP_STATE를 페이지 단위로 받으면서 바로 집계합니다.
+    
+    원본 행을 리스트로 모으지 않으므로 조회 범위(행 수)와 관계없이
+    메모리 사용량이 한 페이지 크기로 일정합니다.
+    
+    Args:
+        eqp_id: 장비 ID
+        start_time: 시작 시간
+        end_time: 종료 시간
+        page_size: 페이지 크기 (None이면 SUPABASE_PAGE_SIZE)
+    
+    Returns:
+        Dict: {'lot_summary': aggregate_lot_states 결과, 'downtime_info': get_downtime_info 결과}
+    """
+    from backend.config.supabase_config import supabase_config
+    
+    lot_rows = supabase_config.iter_lot_state(
+        start_time, end_time, eqp_id,
+        columns=['lot_state', 'in_cnt'],
+        page_size=page_size
+    )
+    eqp_rows = supabase_config.iter_eqp_state(
+        start_time, end_time, eqp_id,
+        columns=['eqp_state', 'event_time', 'end_time'],
+        eqp_state='DOWN',
+        page_size=page_size,
+        overlap=True
+    )
+    
+    return {
+        'lot_summary': aggregate_lot_states(lot_rows),
+        'downtime_info': get_downtime_info(eqp_rows)
+    }
+
+
 def format_context_data(
     kpi_data: Dict[str, Any],
     lot_data: List[Dict[str, Any]],
     eqp_data: List[Dict[str, Any]],
-    rcp_data: List[Dict[str, Any]]
+    rcp_data: List[Dict[str, Any]],
+    lot_summary: Dict[str, Any] = None,
+    downtime_info: Dict[str, Any] = None,
+    downtime_stats: Dict[str, Any] = None
 ) -> str:
     """
     LLM에 제공할 컨텍스트 데이터를 포맷팅합니다.
@@ -268,15 +364,40 @@ def format_context_data(
         lot_data: 로트 데이터
         eqp_data: 장비 데이터
         rcp_data: 레시피 데이터
+        lot_summary: 미리 집계한 로트 요약 (있으면 lot_data 대신 사용)
+        downtime_info: 미리 집계한 다운타임 정보 (있으면 eqp_data 대신 사용)
+        downtime_stats: 겹침 제거/윈도우 기준 다운타임 통계 (downtime_intervals.downtime_stats)
     
     Returns:
         str: 포맷팅된 컨텍스트 문자열
     """
     # 로트 집계
-    lot_summary = aggregate_lot_states(lot_data)
+    if lot_summary is None:
+        lot_summary = aggregate_lot_states(lot_data)
     
     # 다운타임 정보
-    downtime_info = get_downtime_info(eqp_data)
+    if downtime_info is None:
+        downtime_info = get_downtime_info(eqp_data)
+    
+    # 다운타임 (겹침 제거 통계가 있으면 그 값이 총 다운타임, 이벤트 단순 합계는 원본 값으로 표시)
+    if downtime_stats:
+        downtime_text = (
+            f"- 총 다운타임 (분석 윈도우 내, 겹침 제거): {downtime_stats['total_downtime_hours']:.2f}시간"
+            f"\n- 발생 횟수: {downtime_stats['downtime_count']}회"
+            f"\n- 원본 이벤트 합계 (겹침/윈도우 밖 포함): {downtime_info['total_downtime_hours']:.2f}시간 "
+            f"({downtime_info['downtime_count']}건)"
+        )
+        if downtime_stats['downtime_count'] > 0:
+            longest = downtime_stats['longest_outage']
+            downtime_text += (
+                f"\n- 최장 다운타임: {longest['duration_hours']:.2f}시간 ({longest['start_time']} ~ {longest['end_time']})"
+                f"\n- MTTR: {downtime_stats['mttr_hours']:.2f}시간 / MTBF: {downtime_stats['mtbf_hours']:.2f}시간"
+            )
+    else:
+        downtime_text = (
+            f"- 총 다운타임: {downtime_info['total_downtime_hours']:.2f}시간"
+            f"\n- 발생 횟수: {downtime_info['downtime_count']}회"
+        )
     
     # 텍스트로 포맷팅
     context = f"""
@@ -301,8 +422,7 @@ def format_context_data(
 - HOLD 발생: {lot_summary['hold_count']}회
 
 ## 4. 장비 다운타임
-- 총 다운타임: {downtime_info['total_downtime_hours']:.2f}시간
-- 발생 횟수: {downtime_info['downtime_count']}회
+{downtime_text}
 
 ## 5. 레시피 정보
 """
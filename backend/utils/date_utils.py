@@ -2,17 +2,30 @@
 날짜 및 시간 처리 유틸리티 함수
 """
 
-from datetime import datetime, timedelta
-from typing import Tuple, Optional
+import warnings
+from datetime import datetime, timedelta, timezone
+from typing import Iterable, Tuple, Optional
+
+import numpy as np
+
+# parse_many 결과 단위 (마이크로초)
+DATETIME_DTYPE = 'datetime64[us]'
+DATETIME_MIN = np.datetime64(datetime.min, 'us')
+DATETIME_MAX = np.datetime64(datetime.max, 'us')
 
 
 def parse_datetime(date_str: str, format: str = None) -> datetime:
     """
     문자열을 datetime 객체로 변환합니다.
     
+    포맷을 지정하지 않으면 datetime.fromisoformat으로 파싱합니다 (strptime보다 빠름).
+    "2026-01-20", "2026-01-20 14:30", "2026-01-20 14:30:00" 외에
+    PostgREST가 반환하는 "2026-01-20T14:30:00", "2026-01-20T14:30:00+00:00" 형식도 받습니다.
+    타임존이 있으면 UTC 기준 naive datetime으로 바꿔 다른 시각과 비교/뺄셈할 수 있게 합니다.
+    
     Args:
         date_str: 날짜 문자열 (예: "2026-01-20" 또는 "2026-01-20 14:30")
-        format: 날짜 포맷 (None이면 자동 감지)
+        format: 날짜 포맷 (None이면 ISO 8601 자동 감지)
     
     Returns:
         datetime: datetime 객체
@@ -23,26 +36,75 @@ def parse_datetime(date_str: str, format: str = None) -> datetime:
         
         >>> parse_datetime("2026-01-20 14:30")
         datetime(2026, 1, 20, 14, 30)
+        
+        >>> parse_datetime("2026-01-20T14:30:00+09:00")
+        datetime(2026, 1, 20, 5, 30)
     """
     if format:
         # 지정된 포맷으로 파싱
         return datetime.strptime(date_str, format)
     
-    # 자동 포맷 감지
-    # "2026-01-20" 형식
-    if len(date_str) == 10 and date_str.count('-') == 2:
-        return datetime.strptime(date_str, '%Y-%m-%d')
+    try:
+        parsed = datetime.fromisoformat(date_str)
+    except (TypeError, ValueError):
+        raise ValueError(f"지원하지 않는 날짜 형식입니다: {date_str}") from None
     
-    # "2026-01-20 14:30" 형식
-    elif len(date_str) == 16 and date_str.count(':') == 1:
-        return datetime.strptime(date_str, '%Y-%m-%d %H:%M')
+    # 타임존 포함 시각은 UTC naive로 통일
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
     
-    # "2026-01-20 14:30:00" 형식
-    elif len(date_str) == 19 and date_str.count(':') == 2:
-        return datetime.strptime(date_str, '%Y-%m-%d %H:%M:%S')
+    return parsed
+
+
+def parse_many(date_strs: Iterable[Optional[str]]) -> np.ndarray:
+    """
+    시각 문자열 여러 개를 한 번에 datetime64[us] 배열로 변환합니다.
+    
+    NumPy가 C 레벨에서 일괄 파싱하므로 parse_datetime을 반복 호출하는 것보다 빠릅니다.
+    타임존이 포함된 값은 parse_datetime과 같이 UTC로 변환됩니다.
+    NumPy가 파싱하지 못하는 값이 있으면 parse_datetime으로 하나씩 변환합니다.
+    None / 빈 문자열은 NaT입니다.
     
-    else:
-        raise ValueError(f"지원하지 않는 날짜 형식입니다: {date_str}")
+    Args:
+        date_strs: 시각 문자열 목록 (리스트 또는 이터레이터)
+    
+    Returns:
+        np.ndarray: datetime64[us] 배열
+    
+    Examples:
+        >>> parse_many(["2026-01-20 14:30", "2026-01-20T15:00:00", None])
+        array(['2026-01-20T14:30:00.000000', '2026-01-20T15:00:00.000000', 'NaT'], dtype='datetime64[us]')
+    """
+    values = date_strs if isinstance(date_strs, list) else list(date_strs)
+    
+    # 타임존 파싱은 NumPy에서 지원 중단(경고) 상태라 경고를 숨김
+    # (파싱하지 못하는 값은 ValueError → 아래 하나씩 변환으로 넘어감)
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', DeprecationWarning)
+        try:
+            parsed = np.array(values, dtype=DATETIME_DTYPE)
+        except ValueError:
+            parsed = None
+    
+    # '20260120'처럼 NumPy가 연도로 읽는 값은 datetime 범위를 벗어나므로 다시 변환
+    if parsed is not None and not ((parsed < DATETIME_MIN) | (parsed > DATETIME_MAX)).any():
+        return parsed
+    
+    return np.array(
+        [parse_datetime(value) if value else None for value in values],
+        dtype=DATETIME_DTYPE
+    )
+
+
+def format_many(values: np.ndarray) -> list:
+    """
+    datetime64 배열을 'YYYY-MM-DD HH:MM:SS' 문자열 리스트로 변환합니다 (parse_many의 반대).
+    
+    Examples:
+        >>> format_many(parse_many(["2026-01-20T14:30:00"]))
+        ['2026-01-20 14:30:00']
+    """
+    return [text.replace('T', ' ') for text in np.datetime_as_string(values, unit='s').tolist()]
 
 
 def get_date_range(
@@ -0,0 +1,245 @@
+"""
+다운타임 구간 병합 (interval merge)
+
+get_downtime_info는 DOWN 이벤트 시간을 그대로 더하므로 겹치거나 중복 적재된
+EQP_STATE 구간은 두 번 계산되고, 분석 윈도우(get_time_window) 밖으로 나간 부분도 포함됩니다.
+여기서는 구간을 윈도우로 자르고 시작 시각 순으로 정렬한 뒤 겹치거나 맞닿은 구간을 합쳐
+병합 다운타임, 다운타임 횟수, MTTR / MTBF, 최장 다운타임을 계산합니다.
+
+- 정렬 O(n log n), 이미 (장비, 시작 시각) 순이면 정렬을 생략해 O(n)
+- fleet_downtime_stats는 전체 장비를 한 번의 정렬/순회로 계산
+
+사용:
+    stats = downtime_stats(eqp_data, start_time, end_time)
+    fleet = fleet_downtime_stats(eqp_rows_all_equipment, start_time, end_time)
+"""
+
+from typing import Any, Dict, Iterable, Optional
+
+import numpy as np
+
+from .date_utils import DATETIME_DTYPE, format_many, parse_many
+
+# datetime64[us] 차이 → 시간
+MICROS_PER_HOUR = 3600 * 10 ** 6
+
+
+def merge_intervals(
+    start: np.ndarray,
+    end: np.ndarray,
+    group: Optional[np.ndarray] = None
+) -> tuple:
+    """
+    같은 그룹 안에서 겹치거나 맞닿은 구간을 병합합니다.
+
+    그룹별 누적 최대 종료 시각을 구하기 위해 시각을 그룹 순번만큼 띄워
+    (그룹 순번 x 전체 범위) 한 번의 np.maximum.accumulate로 계산합니다.
+
+    Args:
+        start: 구간 시작 (datetime64)
+        end: 구간 종료 (datetime64, start 이상)
+        group: 그룹(장비) 코드 (정수 배열, None이면 전체가 한 그룹)
+
+    Returns:
+        tuple: (group, start, end) 병합된 구간 (그룹, 시작 시각 순)
+    """
+    start = np.asarray(start, dtype=DATETIME_DTYPE)
+    end = np.asarray(end, dtype=DATETIME_DTYPE)
+    group = np.zeros(start.size, dtype=np.int64) if group is None else np.asarray(group, dtype=np.int64)
+
+    if start.size == 0:
+        return group, start, end
+
+    # (그룹, 시작) 순으로 정렬 (이미 정렬돼 있으면 생략)
+    same_group = group[1:] == group[:-1]
+    if not np.all((group[1:] > group[:-1]) | (same_group & (start[1:] >= start[:-1]))):
+        order = np.lexsort((start, group))
+        group, start, end = group[order], start[order], end[order]
+        same_group = group[1:] == group[:-1]
+
+    # 그룹 경계에서 누적 최대가 이어지지 않도록 그룹마다 전체 범위만큼 띄움
+    origin = start.min()
+    rel_start = (start - origin).astype(np.int64)
+    rel_end = (end - origin).astype(np.int64)
+    span = int(rel_end.max()) + 1
+    rank = np.concatenate(([0], np.cumsum(~same_group)))
+
+    if int(rank[-1]) + 1 > np.iinfo(np.int64).max // span:
+        raise ValueError("구간 범위 x 그룹 수가 너무 커서 병합할 수 없습니다")
+
+    offset = rank * span
+    running_end = np.maximum.accumulate(rel_end + offset) - offset
+
+    # 이전 구간들의 최대 종료 시각보다 늦게 시작하거나 그룹이 바뀌면 새 구간
+    is_new = np.empty(start.size, dtype=bool)
+    is_new[0] = True
+    is_new[1:] = ~same_group | (rel_start[1:] > running_end[:-1])
+
+    first = np.flatnonzero(is_new)
+    last = np.append(first[1:], start.size) - 1
+
+    return group[first], start[first], origin + running_end[last].astype('timedelta64[us]')
+
+
+def _clip(start: np.ndarray, end: np.ndarray, window_start, window_end) -> np.ndarray:
+    """구간을 윈도우로 자르고 길이가 있는 구간의 마스크를 반환합니다 (start/end는 제자리 수정)."""
+    if window_start is not None:
+        np.maximum(start, parse_many([window_start])[0], out=start)
+    if window_end is not None:
+        np.minimum(end, parse_many([window_end])[0], out=end)
+
+    return ~np.isnat(start) & ~np.isnat(end) & (end > start)
+
+
+def _window_hours(window_start, window_end) -> Optional[float]:
+    """윈도우 길이 (시간), 시작/종료 중 하나라도 없으면 None"""
+    if window_start is None or window_end is None:
+        return None
+
+    start, end = parse_many([window_start, window_end])
+    return float((end - start).astype(np.int64)) / MICROS_PER_HOUR
+
+
+def _empty_stats(observed_hours: float) -> Dict[str, Any]:
+    """다운타임이 없을 때의 통계"""
+    return {
+        'total_downtime_hours': 0.0,
+        'raw_downtime_hours': 0.0,
+        'downtime_count': 0,
+        'event_count': 0,
+        'longest_outage': None,
+        'mttr_hours': None,
+        'mtbf_hours': None,
+        'observed_hours': observed_hours
+    }
+
+
+def fleet_downtime_stats(
+    eqp_data: Iterable[Dict[str, Any]],
+    window_start: Optional[str] = None,
+    window_end: Optional[str] = None
+) -> Dict[str, Dict[str, Any]]:
+    """
+    장비별 병합 다운타임 통계를 한 번에 계산합니다.
+
+    EQP_STATE 행 중 eqp_state == 'DOWN'이고 시작/종료 시각이 있는 구간만 사용합니다.
+    관측 시간은 윈도우가 있으면 윈도우 길이, 없으면 장비별 첫 시작 ~ 마지막 종료입니다.
+
+    Args:
+        eqp_data: EQP_STATE 행 (eqp_id, eqp_state, event_time, end_time)
+        window_start: 분석 윈도우 시작 (None이면 자르지 않음)
+        window_end: 분석 윈도우 종료 (None이면 자르지 않음)
+
+    Returns:
+        dict: {eqp_id: 통계}
+            - total_downtime_hours: 병합 다운타임 (겹침 제거, 윈도우 내)
+            - raw_downtime_hours: 윈도우로 자른 구간 길이의 단순 합 (겹침 포함)
+            - downtime_count: 병합 후 다운타임 횟수
+            - event_count: 윈도우 내 DOWN 이벤트 수
+            - longest_outage: {'start_time', 'end_time', 'duration_hours'} 또는 None
+            - mttr_hours: 평균 복구 시간 (다운타임 / 횟수)
+            - mtbf_hours: 평균 고장 간격 (가동 시간 / 횟수)
+            - observed_hours: 관측 시간
+    """
+    codes = {}
+    group = []
+    event_time = []
+    end_time = []
+
+    for event in eqp_data or []:
+        if event.get('eqp_state') == 'DOWN' and event.get('event_time') and event.get('end_time'):
+            group.append(codes.setdefault(event.get('eqp_id'), len(codes)))
+            event_time.append(event['event_time'])
+            end_time.append(event['end_time'])
+
+    window_hours = _window_hours(window_start, window_end)
+
+    start = parse_many(event_time)
+    end = parse_many(end_time)
+    valid = _clip(start, end, window_start, window_end)
+    group = np.array(group, dtype=np.int64)[valid]
+    start, end = start[valid], end[valid]
+
+    eqp_ids = list(codes)
+    n_groups = len(eqp_ids)
+
+    if start.size == 0:
+        return {eqp_id: _empty_stats(window_hours or 0.0) for eqp_id in eqp_ids}
+
+    raw_hours = np.bincount(group, weights=(end - start).astype(np.int64), minlength=n_groups) / MICROS_PER_HOUR
+    event_count = np.bincount(group, minlength=n_groups)
+
+    merged_group, merged_start, merged_end = merge_intervals(start, end, group)
+    duration = (merged_end - merged_start).astype(np.int64)
+    total_hours = np.bincount(merged_group, weights=duration, minlength=n_groups) / MICROS_PER_HOUR
+    count = np.bincount(merged_group, minlength=n_groups)
+
+    # 장비별 최장 다운타임: (그룹, 길이) 정렬 후 그룹의 마지막 (같은 길이면 먼저 시작한 구간)
+    order = np.lexsort((-np.arange(duration.size), duration, merged_group))
+    is_last = np.append(merged_group[order][1:] != merged_group[order][:-1], True)
+    longest = order[is_last]
+    longest_start = format_many(merged_start[longest])
+    longest_end = format_many(merged_end[longest])
+
+    # 관측 시간 (윈도우가 없으면 장비별 첫 시작 ~ 마지막 종료)
+    # 병합 구간은 장비 안에서 시작/종료 모두 오름차순이므로 장비별 첫/마지막 구간만 보면 됨
+    if window_hours is None:
+        first = np.flatnonzero(np.append(True, merged_group[1:] != merged_group[:-1]))
+        last = np.append(first[1:], merged_group.size) - 1
+        observed = np.zeros(n_groups)
+        observed[merged_group[first]] = (merged_end[last] - merged_start[first]).astype(np.int64) / MICROS_PER_HOUR
+    else:
+        observed = np.full(n_groups, window_hours)
+
+    results = {eqp_id: _empty_stats(float(observed[code])) for code, eqp_id in enumerate(eqp_ids)}
+
+    for position, code in enumerate(merged_group[longest].tolist()):
+        n = int(count[code])
+        stats = results[eqp_ids[code]]
+        stats.update({
+            'total_downtime_hours': float(total_hours[code]),
+            'raw_downtime_hours': float(raw_hours[code]),
+            'downtime_count': n,
+            'event_count': int(event_count[code]),
+            'longest_outage': {
+                'start_time': longest_start[position],
+                'end_time': longest_end[position],
+                'duration_hours': float(duration[longest[position]]) / MICROS_PER_HOUR
+            },
+            'mttr_hours': float(total_hours[code]) / n,
+            'mtbf_hours': max(stats['observed_hours'] - float(total_hours[code]), 0.0) / n
+        })
+
+    return results
+
+
+def downtime_stats(
+    eqp_data: Iterable[Dict[str, Any]],
+    window_start: Optional[str] = None,
+    window_end: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    한 장비의 병합 다운타임 통계를 계산합니다 (eqp_id는 보지 않음).
+
+    Args:
+        eqp_data: EQP_STATE 행 (eqp_state, event_time, end_time)
+        window_start: 분석 윈도우 시작 (예: get_time_window 결과)
+        window_end: 분석 윈도우 종료
+
+    Returns:
+        dict: fleet_downtime_stats의 장비별 통계와 같은 형식
+
+    Examples:
+        >>> eqp_data = [
+        ...     {'eqp_state': 'DOWN', 'event_time': '2026-01-20 01:00', 'end_time': '2026-01-20 03:00'},
+        ...     {'eqp_state': 'DOWN', 'event_time': '2026-01-20 02:00', 'end_time': '2026-01-20 04:00'}
+        ... ]
+        >>> downtime_stats(eqp_data)['total_downtime_hours']
+        3.0
+    """
+    rows = ({**event, 'eqp_id': None} for event in eqp_data or [])
+    stats = fleet_downtime_stats(rows, window_start, window_end)
+
+    if stats:
+        return stats[None]
+    return _empty_stats(_window_hours(window_start, window_end) or 0.0)
@@ -0,0 +1,196 @@
+"""
+임베딩 영구 캐시 (content-addressed)
+
+같은 텍스트를 다시 임베딩하지 않도록 (모델 ID, 정규화 텍스트의 SHA-256)을 키로
+Titan 임베딩을 SQLite에 float32 BLOB으로 저장합니다.
+- load_reports_to_rag 재실행, 같은 알람 재분석, verify_rag_data 반복 질문 → 임베딩 호출 0회
+- 최대 항목 수를 넘으면 마지막 사용 시각이 오래된 항목부터 제거 (LRU)
+  (히트 때마다 쓰지 않도록 last_used는 TOUCH_INTERVAL보다 오래됐을 때만 갱신)
+
+EMBEDDING_CACHE_PATH(기본 ./data/embedding_cache.db)로 위치를 지정하고,
+빈 값으로 두면 캐시를 사용하지 않습니다.
+"""
+
+import os
+import time
+import sqlite3
+import hashlib
+import threading
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+
+class EmbeddingCache:
+    """SQLite 임베딩 캐시 (스레드 안전)"""
+
+    EVICT_CHECK_INTERVAL = 100
+
+    # last_used 갱신 최소 간격 (초). 이보다 최근에 사용된 항목은 히트해도 쓰기 없음
+    TOUCH_INTERVAL = 3600
+
+    def __init__(self, db_path: str = './data/embedding_cache.db', max_entries: int = 100000):
+        """
+        Args:
+            db_path: SQLite 파일 경로
+            max_entries: 최대 항목 수 (초과 시 오래 사용되지 않은 항목부터 제거)
+        """
+        self.db_path = db_path
+        self.max_entries = max_entries
+        os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        self.conn.execute(
+            '''
+            CREATE TABLE IF NOT EXISTS embeddings (
+                model_id TEXT NOT NULL,
+                text_hash TEXT NOT NULL,
+                dim INTEGER NOT NULL,
+                vector BLOB NOT NULL,
+                last_used REAL NOT NULL,
+                PRIMARY KEY (model_id, text_hash)
+            )
+            '''
+        )
+        self.conn.execute('CREATE INDEX IF NOT EXISTS idx_embeddings_last_used ON embeddings (last_used)')
+        self.conn.commit()
+
+        # 항목 수 확인(COUNT)은 저장 EVICT_CHECK_INTERVAL회마다 한 번만 수행
+        self._sets_since_check = 0
+
+        # 통계
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def text_hash(text: str) -> str:
+        """정규화(연속 공백 축약, 앞뒤 공백 제거) 텍스트의 SHA-256"""
+        normalized = ' '.join(text.split())
+        return hashlib.sha256(normalized.encode('utf-8')).hexdigest()
+
+    def get(self, model_id: str, text: str) -> Optional[List[float]]:
+        """
+        캐시된 임베딩 조회
+
+        Args:
+            model_id: 임베딩 모델 ID
+            text: 원본 텍스트
+
+        Returns:
+            임베딩 벡터 또는 None
+        """
+        text_hash = self.text_hash(text)
+
+        with self._lock:
+            row = self.conn.execute(
+                'SELECT vector, last_used FROM embeddings WHERE model_id = ? AND text_hash = ?',
+                (model_id, text_hash)
+            ).fetchone()
+
+            if row is None:
+                self.misses += 1
+                return None
+
+            now = time.time()
+            if now - row[1] >= self.TOUCH_INTERVAL:
+                self.conn.execute(
+                    'UPDATE embeddings SET last_used = ? WHERE model_id = ? AND text_hash = ?',
+                    (now, model_id, text_hash)
+                )
+                self.conn.commit()
+            self.hits += 1
+
+        return np.frombuffer(row[0], dtype=np.float32).tolist()
+
+    def set(self, model_id: str, text: str, embedding: List[float]) -> None:
+        """
+        임베딩 저장
+
+        Args:
+            model_id: 임베딩 모델 ID
+            text: 원본 텍스트
+            embedding: 임베딩 벡터
+        """
+        vector = np.asarray(embedding, dtype=np.float32)
+
+        with self._lock:
+            self.conn.execute(
+                'INSERT OR REPLACE INTO embeddings (model_id, text_hash, dim, vector, last_used) '
+                'VALUES (?, ?, ?, ?, ?)',
+                (model_id, self.text_hash(text), vector.shape[0], vector.tobytes(), time.time())
+            )
+            self._sets_since_check += 1
+            if self._sets_since_check >= self.EVICT_CHECK_INTERVAL:
+                self._sets_since_check = 0
+                self._evict_over_limit()
+            self.conn.commit()
+
+    def clear(self) -> int:
+        """모든 임베딩 삭제. 삭제한 항목 수 반환"""
+        with self._lock:
+            cursor = self.conn.execute('DELETE FROM embeddings')
+            self.conn.commit()
+        return cursor.rowcount
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        캐시 통계
+
+        Returns:
+            항목 수, 저장 크기, 히트/미스, 히트율, 제거 수
+        """
+        with self._lock:
+            total_items, total_bytes = self.conn.execute(
+                'SELECT COUNT(*), COALESCE(SUM(LENGTH(vector)), 0) FROM embeddings'
+            ).fetchone()
+
+            lookups = self.hits + self.misses
+
+            return {
+                'total_items': total_items,
+                'total_bytes': total_bytes,
+                'max_entries': self.max_entries,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': round(self.hits / lookups, 3) if lookups else 0.0,
+                'evictions': self.evictions
+            }
+
+    def _evict_over_limit(self) -> None:
+        """한도를 넘으면 마지막 사용 시각이 오래된 항목부터 제거 (락을 잡은 상태에서 호출)"""
+        (count,) = self.conn.execute('SELECT COUNT(*) FROM embeddings').fetchone()
+        overflow = count - self.max_entries
+
+        if overflow <= 0:
+            return
+
+        # 한 번에 여유분(10%)까지 제거하여 매 저장마다 정리하지 않도록 함
+        n_delete = overflow + self.max_entries // 10
+        cursor = self.conn.execute(
+            'DELETE FROM embeddings WHERE rowid IN '
+            '(SELECT rowid FROM embeddings ORDER BY last_used LIMIT ?)',
+            (n_delete,)
+        )
+        self.evictions += cursor.rowcount
+        print(f"♻️ 임베딩 캐시 정리: {cursor.rowcount}개 제거")
+
+
+def create_embedding_cache() -> Optional[EmbeddingCache]:
+    """EMBEDDING_CACHE_PATH 설정에 맞는 임베딩 캐시를 생성합니다 (빈 값이면 None)."""
+    db_path = os.getenv('EMBEDDING_CACHE_PATH', './data/embedding_cache.db')
+
+    if not db_path:
+        return None
+
+    return EmbeddingCache(
+        db_path,
+        max_entries=int(os.getenv('EMBEDDING_CACHE_MAX_ENTRIES', '100000'))
+    )
+
+
+# 전역 임베딩 캐시
+embedding_cache = create_embedding_cache()
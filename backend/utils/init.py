@@ -4,6 +4,8 @@
 
 from .date_utils import (
     parse_datetime,
+    parse_many,
+    format_many,
     get_date_range,
     format_datetime,
     calculate_duration
@@ -19,6 +21,7 @@ from .data_utils import (
 from .prompt_templates import (
     get_root_cause_analysis_prompt,
     get_report_writer_prompt,
+    get_root_cause_and_report_prompt,
     get_question_answer_prompt
 )
 
@@ -35,6 +38,8 @@ __all__ = [
 __all__ = [
     # 날짜/시간 함수
     'parse_datetime',
+    'parse_many',
+    'format_many',
     'get_date_range',
     'format_datetime',
     'calculate_duration',
@@ -48,5 +53,6 @@ __all__ = [
     # 프롬프트 템플릿
     'get_root_cause_analysis_prompt',
     'get_report_writer_prompt',
+    'get_root_cause_and_report_prompt',
     'get_question_answer_prompt',
 ]
\ No newline at end of file
@@ -0,0 +1,177 @@
+"""
+BM25 어휘 검색 인덱스
+
+"EQP07 THP 리포트"처럼 장비 ID/KPI 같은 정확한 식별자에 의존하는 질문은
+Titan 임베딩(의미 벡터)으로는 잘 구분되지 않습니다.
+리포트 텍스트와 메타데이터(eqp_id, kpi, date)로 인메모리 역색인을 만들고
+Okapi BM25로 점수를 계산합니다.
+"""
+
+import math
+import re
+from collections import Counter, defaultdict
+from typing import Any, Dict, List, Optional, Tuple
+
+# 영문/숫자 식별자(EQP07, WIP_EXCEED, 2026-01-20), 한글 단어
+TOKEN_PATTERN = re.compile(r'\d{4}-\d{2}-\d{2}|[A-Za-z]+[A-Za-z0-9_]*|\d+(?:\.\d+)?|[가-힣]+')
+
+# 메타데이터 중 색인할 필드
+METADATA_FIELDS = ('eqp_id', 'kpi', 'date')
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    BM25용 토큰 분리
+
+    영문 식별자는 소문자로, 한글 단어는 조사가 붙어도 걸리도록
+    단어 자체와 2글자 단위(bigram)를 함께 사용합니다.
+
+    Examples:
+        >>> tokenize("EQP07에서 THP 하락")
+        ['eqp07', '에서', 'thp', '하락']
+    """
+    tokens = []
+
+    for token in TOKEN_PATTERN.findall(text or ''):
+        if '가' <= token[0] <= '힣':
+            tokens.append(token)
+            if len(token) > 2:
+                tokens.extend(token[i:i + 2] for i in range(len(token) - 1))
+        else:
+            tokens.append(token.lower())
+
+    return tokens
+
+
+def matches_filter(metadata: Dict[str, Any], where: Optional[Dict[str, Any]]) -> bool:
+    """
+    Chroma where 필터를 메타데이터에 적용합니다.
+
+    지원: {'key': value}, {'key': {'$eq' | '$ne' | '$in' | '$gte' | '$lte': ...}},
+          {'$and': [...]}, {'$or': [...]}
+    """
+    if not where:
+        return True
+
+    for key, condition in where.items():
+        if key == '$and':
+            if not all(matches_filter(metadata, sub) for sub in condition):
+                return False
+        elif key == '$or':
+            if not any(matches_filter(metadata, sub) for sub in condition):
+                return False
+        elif isinstance(condition, dict):
+            value = metadata.get(key)
+            for operator, operand in condition.items():
+                if operator == '$eq' and value != operand:
+                    return False
+                if operator == '$ne' and value == operand:
+                    return False
+                if operator == '$in' and value not in operand:
+                    return False
+                if operator == '$gte' and (value is None or value < operand):
+                    return False
+                if operator == '$lte' and (value is None or value > operand):
+                    return False
+        elif metadata.get(key) != condition:
+            return False
+
+    return True
+
+
+class BM25Index:
+    """
+    인메모리 BM25 역색인
+
+    문서는 (id, text, metadata)이며 메타데이터 식별자 필드는 본문 토큰에 더해 색인합니다.
+    """
+
+    def __init__(self, k1: float = 1.5, b: float = 0.75):
+        """
+        Args:
+            k1: 단어 빈도 포화 계수
+            b: 문서 길이 정규화 계수
+        """
+        self.k1 = k1
+        self.b = b
+
+        self.doc_ids: List[str] = []
+        self.documents: List[str] = []
+        self.metadatas: List[Dict[str, Any]] = []
+        self.doc_lengths: List[int] = []
+        self.postings: Dict[str, Dict[int, int]] = defaultdict(dict)
+        self.avg_length = 0.0
+
+        # 필드별 메타데이터 식별자 값 (소문자, 식별자 정확 일치 판단용)
+        self.identifier_values: Dict[str, set] = {field: set() for field in METADATA_FIELDS}
+
+    def build(self, ids: List[str], documents: List[str], metadatas: List[Dict[str, Any]]) -> None:
+        """
+        문서 목록으로 인덱스를 (다시) 만듭니다.
+
+        검색 중인 인덱스를 제자리에서 다시 만들면 검색 결과가 섞일 수 있으므로,
+        여러 스레드가 공유하는 인덱스는 새 BM25Index를 만든 뒤 참조를 교체하세요.
+        """
+        self.doc_ids = list(ids)
+        self.documents = list(documents)
+        self.metadatas = [metadata or {} for metadata in metadatas]
+        self.doc_lengths = []
+        self.postings = defaultdict(dict)
+        self.identifier_values = {
+            field: {str(metadata[field]).lower() for metadata in self.metadatas if metadata.get(field)}
+            for field in METADATA_FIELDS
+        }
+
+        for index, (document, metadata) in enumerate(zip(self.documents, self.metadatas)):
+            metadata_text = ' '.join(str(metadata[field]) for field in METADATA_FIELDS if metadata.get(field))
+            counts = Counter(tokenize(metadata_text) + tokenize(document))
+
+            self.doc_lengths.append(sum(counts.values()))
+            for token, count in counts.items():
+                self.postings[token][index] = count
+
+        self.avg_length = sum(self.doc_lengths) / len(self.doc_lengths) if self.doc_lengths else 0.0
+
+    def __len__(self) -> int:
+        return len(self.doc_ids)
+
+    def search(
+        self,
+        query: str,
+        n_results: int = 10,
+        where: Optional[Dict[str, Any]] = None
+    ) -> List[Tuple[int, float]]:
+        """
+        BM25 점수 상위 문서를 찾습니다.
+
+        Args:
+            query: 검색어
+            n_results: 최대 결과 수
+            where: Chroma where 형식 메타데이터 필터 (선택)
+
+        Returns:
+            List[Tuple[int, float]]: (문서 인덱스, 점수) 점수 내림차순
+        """
+        n_docs = len(self.doc_ids)
+        if n_docs == 0:
+            return []
+
+        scores: Dict[int, float] = defaultdict(float)
+
+        for token in set(tokenize(query)):
+            postings = self.postings.get(token)
+            if not postings:
+                continue
+
+            idf = math.log(1 + (n_docs - len(postings) + 0.5) / (len(postings) + 0.5))
+
+            for index, tf in postings.items():
+                length_norm = 1 - self.b + self.b * self.doc_lengths[index] / (self.avg_length or 1)
+                scores[index] += idf * tf * (self.k1 + 1) / (tf + self.k1 * length_norm)
+
+        ranked = sorted(scores.items(), key=lambda item: item[1], reverse=True)
+
+        if where:
+            ranked = [item for item in ranked if matches_filter(self.metadatas[item[0]], where)]
+
+        return ranked[:n_results]
@@ -3,16 +3,36 @@ PDF 보고서를 ChromaDB에 로드하는 스크립트
 
 사용자가 작성한 과거 알람 PDF 보고서들을 읽어서
 ChromaDB Vector Database에 저장합니다.
+
+수천 개 보고서를 적재할 수 있도록 증분/병렬로 처리합니다.
+1. 매니페스트(파일 해시/mtime)와 비교하여 새로 추가/변경된 PDF만 처리
+2. 텍스트 추출은 프로세스 풀에서 병렬 실행
+3. 섹션 청크로 나누어 스레드 풀에서 동시 임베딩 (임베딩 캐시 재사용)
+4. ChromaDB에는 배치 upsert로 저장 (중복 ID도 덮어쓰기)
+5. 폴더에서 사라진 PDF의 리포트/청크는 ChromaDB에서 삭제
+
+실행:
+    python backend/utils/load_reports_to_rag.py            # 확인 후 실행
+    python backend/utils/load_reports_to_rag.py --yes      # 확인 없이 실행 (배치/CI)
+    python backend/utils/load_reports_to_rag.py --yes --full --workers 8
 """
 
+import os
 import sys
+import json
+import time
+import hashlib
+import argparse
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
+from typing import Any, Dict, List
 import re
 
 project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
-from backend.config.chroma_config import chroma_config
+# chroma_config는 함수 안에서 import
+# (텍스트 추출 프로세스가 이 모듈을 import할 때 ChromaDB를 초기화하지 않도록)
 
 # PDF 텍스트 추출용 (이미 requirements.txt에 있음)
 try:
@@ -78,97 +98,248 @@ def parse_report_filename(filename: str) -> dict:
     }
 
 
-def load_reports_to_rag(reports_dir: str = "data/reports"):
+def file_sha256(path: Path) -> str:
+    """파일 내용의 SHA-256"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def load_manifest(manifest_path: Path) -> Dict[str, Dict[str, Any]]:
+    """적재 매니페스트 로드 ({파일명: {sha256, mtime, size, report_id}})"""
+    if not manifest_path.exists():
+        return {}
+    
+    try:
+        return json.loads(manifest_path.read_text(encoding='utf-8'))
+    except (OSError, ValueError) as e:
+        print(f"⚠️ 매니페스트를 읽지 못해 전체 적재합니다: {e}")
+        return {}
+
+
+def save_manifest(manifest_path: Path, manifest: Dict[str, Dict[str, Any]]) -> None:
+    """적재 매니페스트 저장 (임시 파일에 쓴 뒤 교체)"""
+    tmp_path = manifest_path.with_suffix('.tmp')
+    tmp_path.write_text(json.dumps(manifest, ensure_ascii=False, indent=2), encoding='utf-8')
+    os.replace(tmp_path, manifest_path)
+
+
+def find_changed_files(pdf_files: List[Path], manifest: Dict[str, Dict[str, Any]]) -> List[Dict[str, Any]]:
     """
-    reports 폴더의 모든 PDF를 ChromaDB에 로드합니다.
+    매니페스트와 비교하여 새로 추가/변경된 PDF를 찾습니다.
+    
+    크기와 mtime이 같으면 해시를 계산하지 않고 건너뛰고,
+    mtime만 바뀐 경우(복사 등) 해시가 같으면 매니페스트만 갱신합니다.
+    
+    Returns:
+        list: [{'path', 'sha256', 'mtime', 'size'}, ...]
+    """
+    changed = []
+    
+    for pdf_file in pdf_files:
+        stat = pdf_file.stat()
+        entry = manifest.get(pdf_file.name)
+        
+        if entry and entry['size'] == stat.st_size and entry['mtime'] == stat.st_mtime:
+            continue
+        
+        sha256 = file_sha256(pdf_file)
+        
+        if entry and entry['sha256'] == sha256:
+            entry['mtime'] = stat.st_mtime
+            continue
+        
+        changed.append({
+            'path': pdf_file,
+            'sha256': sha256,
+            'mtime': stat.st_mtime,
+            'size': stat.st_size
+        })
+    
+    return changed
+
+
+def load_reports_to_rag(
+    reports_dir: str = "data/reports",
+    full: bool = False,
+    workers: int = None,
+    embed_workers: int = 4,
+    batch_size: int = 64,
+    manifest_path: str = None
+) -> Dict[str, Any]:
+    """
+    reports 폴더의 PDF를 ChromaDB에 로드합니다 (새로 추가/변경된 파일만).
     
     Args:
         reports_dir: PDF 파일들이 있는 폴더 경로
+        full: True면 매니페스트를 무시하고 전체 재적재
+        workers: 텍스트 추출 프로세스 수 (None이면 CPU 코어 수)
+        embed_workers: 동시 임베딩 호출 수
+        batch_size: ChromaDB upsert 1회당 리포트 수
+        manifest_path: 매니페스트 경로 (기본: reports_dir/.ingest_manifest.json)
+    
+    Returns:
+        dict: 처리 결과 {'total', 'changed', 'saved', 'skipped', 'failed', 'deleted', 'elapsed_seconds'}
     """
+    from backend.config.chroma_config import chroma_config
     
     print("\n" + "=" * 60)
     print("📂 PDF 보고서 → ChromaDB 로드")
     print("=" * 60 + "\n")
     
+    started = time.perf_counter()
+    result = {'total': 0, 'changed': 0, 'saved': 0, 'skipped': 0, 'failed': 0, 'deleted': 0, 'elapsed_seconds': 0.0}
+    
     # reports 폴더 확인
     reports_path = Path(reports_dir)
     
     if not reports_path.exists():
         print(f"❌ 폴더가 없습니다: {reports_dir}")
         print(f"💡 먼저 폴더를 생성하세요: mkdir -p {reports_dir}")
-        return
+        return result
     
     # PDF 파일 목록 가져오기
-    pdf_files = list(reports_path.glob("*.pdf"))
+    pdf_files = sorted(reports_path.glob("*.pdf"))
+    result['total'] = len(pdf_files)
     
     if not pdf_files:
         print(f"⚠️ {reports_dir} 폴더에 PDF 파일이 없습니다.")
         print(f"💡 PDF 보고서를 작성해서 저장해주세요.")
-        return
+        return result
     
-    print(f"📄 총 {len(pdf_files)}개의 PDF 발견\n")
+    print(f"📄 총 {len(pdf_files)}개의 PDF 발견")
     
-    # 각 PDF 처리
-    success_count = 0
+    # 1. 매니페스트와 비교하여 처리 대상 선정
+    manifest_file = Path(manifest_path) if manifest_path else reports_path / '.ingest_manifest.json'
+    manifest = {} if full else load_manifest(manifest_file)
     
-    for i, pdf_file in enumerate(pdf_files, 1):
-        filename = pdf_file.name
-        print(f"[{i}/{len(pdf_files)}] {filename}")
-        
-        # 1. 파일명에서 메타데이터 추출
-        metadata_dict = parse_report_filename(filename)
+    # 폴더에서 사라진 파일은 매니페스트에서 제거 (ChromaDB 리포트는 7단계에서 삭제)
+    existing_names = {pdf_file.name for pdf_file in pdf_files}
+    removed_ids = set()
+    for name in list(manifest.keys()):
+        if name not in existing_names:
+            removed_ids.add(manifest.pop(name).get('report_id'))
+    
+    changed = find_changed_files(pdf_files, manifest)
+    result['changed'] = len(changed)
+    print(f"🆕 새로 추가/변경된 PDF: {len(changed)}개\n")
+    
+    # 2. 파일명 메타데이터 확인
+    targets = []
+    for item in changed:
+        metadata_dict = parse_report_filename(item['path'].name)
         
         if not metadata_dict:
-            print(f"  ⚠️ 파일명 형식 오류, 스킵\n")
+            print(f"  ⚠️ 파일명 형식 오류, 스킵: {item['path'].name}")
+            result['skipped'] += 1
             continue
         
-        print(f"  📅 날짜: {metadata_dict['date']}")
-        print(f"  🔧 장비: {metadata_dict['eqp_id']}")
-        print(f"  📊 KPI: {metadata_dict['kpi']}")
+        item['metadata_dict'] = metadata_dict
+        targets.append(item)
+    
+    # 3. 텍스트 추출 (프로세스 풀)
+    if targets:
+        print(f"📝 텍스트 추출 중... ({len(targets)}개, 프로세스 {workers or os.cpu_count()}개)")
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            texts = list(executor.map(
+                extract_text_from_pdf,
+                [str(item['path']) for item in targets],
+                chunksize=max(1, len(targets) // ((workers or os.cpu_count() or 1) * 4))
+            ))
         
-        # 2. PDF 텍스트 추출
-        text = extract_text_from_pdf(str(pdf_file))
+        extracted = []
+        for item, text in zip(targets, texts):
+            if not text or len(text) < 50:
+                print(f"  ⚠️ 텍스트 추출 실패 또는 내용이 너무 짧음, 스킵: {item['path'].name}")
+                result['skipped'] += 1
+                continue
+            item['text'] = text
+            extracted.append(item)
+        targets = extracted
+    
+    # 4. 섹션 청크 분할 + 임베딩 (리포트 단위 동시 호출, 임베딩 캐시 재사용)
+    reports = []
+    if targets:
+        print(f"🔄 임베딩 생성 중... ({len(targets)}개, 동시 {embed_workers}건)")
         
-        if not text or len(text) < 50:
-            print(f"  ⚠️ 텍스트 추출 실패 또는 내용이 너무 짧음, 스킵\n")
-            continue
-        
-        print(f"  📝 텍스트 추출: {len(text)}자")
+        def prepare(item: Dict[str, Any]):
+            metadata_dict = item['metadata_dict']
+            report_id = f"report_{metadata_dict['date']}_{metadata_dict['eqp_id']}_{metadata_dict['kpi']}"
+            metadata = {
+                "date": metadata_dict['date'],
+                "eqp_id": metadata_dict['eqp_id'],
+                "kpi": metadata_dict['kpi'],
+                "alarm_flag": 1,
+                "source": "pdf_report"
+            }
+            try:
+                return chroma_config.prepare_report(report_id, item['text'], metadata)
+            except Exception as e:
+                print(f"  ❌ 임베딩 실패: {item['path'].name} ({e})")
+                return None
         
-        # 3. ChromaDB에 저장
-        report_id = f"report_{metadata_dict['date']}_{metadata_dict['eqp_id']}_{metadata_dict['kpi']}"
+        with ThreadPoolExecutor(max_workers=embed_workers) as executor:
+            prepared = list(executor.map(prepare, targets))
         
-        metadata = {
-            "date": metadata_dict['date'],
-            "eqp_id": metadata_dict['eqp_id'],
-            "kpi": metadata_dict['kpi'],
-            "alarm_flag": 1,
-            "source": "pdf_report"
+        for item, report in zip(targets, prepared):
+            if report is None:
+                result['failed'] += 1
+                continue
+            
+            item['report_id'] = report['id']
+            report['item'] = item
+            reports.append(report)
+    
+    # 5. ChromaDB 배치 upsert
+    if reports:
+        print(f"💾 ChromaDB 저장 중... ({len(reports)}개, 배치 {batch_size})")
+        try:
+            result['saved'] = chroma_config.upsert_reports(
+                [{key: value for key, value in report.items() if key != 'item'} for report in reports],
+                batch_size=batch_size
+            )
+        except Exception as e:
+            print(f"❌ ChromaDB 저장 실패: {e}")
+            result['failed'] += len(reports)
+            reports = []
+    
+    # 6. 저장에 성공한 파일만 매니페스트 갱신
+    for report in reports:
+        item = report['item']
+        manifest[item['path'].name] = {
+            'sha256': item['sha256'],
+            'mtime': item['mtime'],
+            'size': item['size'],
+            'report_id': item['report_id']
         }
-        
-        success = chroma_config.add_report(
-            report_id=report_id,
-            report_text=text,
-            metadata=metadata
-        )
-        
-        if success:
-            print(f"  ✅ ChromaDB 저장 완료\n")
-            success_count += 1
-        else:
-            print(f"  ❌ ChromaDB 저장 실패\n")
+    save_manifest(manifest_file, manifest)
+    
+    # 7. 사라진 파일의 리포트/청크 삭제 (다른 파일이 같은 리포트 ID를 쓰면 유지)
+    orphan_ids = sorted(removed_ids - {entry.get('report_id') for entry in manifest.values()} - {None})
+    if orphan_ids:
+        print(f"🗑️ 폴더에서 사라진 리포트 삭제: {', '.join(orphan_ids)}")
+        result['deleted'] = sum(chroma_config.delete_report(report_id) for report_id in orphan_ids)
+    
+    result['elapsed_seconds'] = round(time.perf_counter() - started, 2)
     
     # 최종 결과
-    print("=" * 60)
-    print(f"🎉 완료! {success_count}/{len(pdf_files)}개 성공")
+    print("\n" + "=" * 60)
+    print(f"🎉 완료! 변경 {result['changed']}개 중 {result['saved']}개 저장 "
+          f"(스킵 {result['skipped']}, 실패 {result['failed']}, 삭제 {result['deleted']})")
+    print(f"⏱️ 소요 시간: {result['elapsed_seconds']}초")
     print(f"📊 ChromaDB 총 리포트: {chroma_config.count_reports()}개")
     print("=" * 60 + "\n")
+    
+    return result
 
 
 def verify_rag_data():
     """
     ChromaDB에 저장된 데이터를 확인합니다.
     """
+    from backend.config.chroma_config import chroma_config, describe_match
     
     print("\n" + "=" * 60)
     print("🔍 ChromaDB 저장 데이터 확인")
@@ -195,7 +366,7 @@ def verify_rag_data():
         for i, report in enumerate(results, 1):
             print(f"{i}. ID: {report['id']}")
             print(f"   메타데이터: {report['metadata']}")
-            print(f"   유사도: {report['distance']:.4f}")
+            print(f"   유사도: {describe_match(report)}")
             print(f"   내용 미리보기: {report['document'][:100]}...")
             print()
     else:
@@ -204,27 +375,59 @@ def verify_rag_data():
     print("=" * 60 + "\n")
 
 
-def main():
+def parse_args(argv: List[str] = None) -> argparse.Namespace:
+    """명령행 인자 파싱"""
+    parser = argparse.ArgumentParser(description="PDF 보고서를 ChromaDB에 로드합니다")
+    parser.add_argument('--reports-dir', default='data/reports', help='PDF 폴더 (기본: data/reports)')
+    parser.add_argument('--yes', '-y', action='store_true', help='확인 없이 실행')
+    parser.add_argument('--full', action='store_true', help='매니페스트를 무시하고 전체 재적재')
+    parser.add_argument('--workers', type=int, default=None, help='텍스트 추출 프로세스 수 (기본: CPU 코어 수)')
+    parser.add_argument('--embed-workers', type=int, default=4, help='동시 임베딩 호출 수 (기본: 4)')
+    parser.add_argument('--batch-size', type=int, default=64, help='upsert 배치 크기 (기본: 64)')
+    parser.add_argument('--manifest', default=None, help='매니페스트 경로 (기본: reports-dir/.ingest_manifest.json)')
+    parser.add_argument('--no-verify', action='store_true', help='적재 후 검색 확인 생략')
+    parser.add_argument('--rebuild-chunks', action='store_true', help='기존 리포트 전체를 섹션 청크로 다시 색인')
+    return parser.parse_args(argv)
+
+
+def main(argv: List[str] = None):
     """메인 함수"""
     
-    print("\n🤖 PDF 보고서 RAG 로더\n")
-    
-    print("📋 사용 방법:")
-    print("1. data/reports/ 폴더에 PDF 파일들을 넣으세요")
-    print("2. 파일명 형식: report_YYYYMMDD_EQP번호_KPI.pdf")
-    print("3. 이 스크립트를 실행하면 자동으로 ChromaDB에 저장됩니다\n")
+    args = parse_args(argv)
     
-    user_input = input("계속하시겠습니까? (y/n): ")
+    print("\n🤖 PDF 보고서 RAG 로더\n")
     
-    if user_input.lower() != 'y':
-        print("취소되었습니다.")
-        return
+    if not args.yes:
+        print("📋 사용 방법:")
+        print(f"1. {args.reports_dir}/ 폴더에 PDF 파일들을 넣으세요")
+        print("2. 파일명 형식: report_YYYYMMDD_EQP번호_KPI.pdf")
+        print("3. 이 스크립트를 실행하면 자동으로 ChromaDB에 저장됩니다")
+        print("   (확인 없이 실행하려면 --yes)\n")
+        
+        user_input = input("계속하시겠습니까? (y/n): ")
+        
+        if user_input.lower() != 'y':
+            print("취소되었습니다.")
+            return
     
     # PDF 로드
-    load_reports_to_rag()
+    load_reports_to_rag(
+        reports_dir=args.reports_dir,
+        full=args.full,
+        workers=args.workers,
+        embed_workers=args.embed_workers,
+        batch_size=args.batch_size,
+        manifest_path=args.manifest
+    )
+    
+    # 청크 인덱스 재구성 (이전 버전에서 적재한 리포트)
+    if args.rebuild_chunks:
+        from backend.config.chroma_config import chroma_config
+        chroma_config.rebuild_chunk_index(batch_size=args.batch_size)
     
     # 검증
-    verify_rag_data()
+    if not args.no_verify:
+        verify_rag_data()
 
 
 if __name__ == "__main__":
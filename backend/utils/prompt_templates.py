@@ -2,6 +2,17 @@
 LLM 프롬프트 템플릿
 """
 
+# 질문 답변 프롬프트에 넣을 참고 리포트 1개당 최대 길이 (문자)
+# 리포트 앞부분 대신 질문과 가까운 섹션 청크로 채움 (chroma_config._group_by_report)
+MAX_REPORT_CHARS = 500
+
+# 단일 호출 프롬프트 응답에서 근본 원인 JSON과 리포트를 나누는 구분선
+REPORT_MARKER = "===REPORT==="
+
+# 리포트의 마지막 필수 섹션 (단일 호출 리포트가 max_tokens에서 잘렸는지 확인용)
+REPORT_LAST_SECTION = "## 5. 예상 효과"
+
+
 def get_root_cause_analysis_prompt(context_data: str) -> str:
     """
     근본 원인 분석을 위한 프롬프트를 생성합니다.
@@ -89,6 +100,73 @@ def get_report_writer_prompt(
 """
 
 
+def get_root_cause_and_report_prompt(
+    problem_summary: str,
+    context_data: str
+) -> str:
+    """
+    근본 원인 분석과 리포트 작성을 한 번에 요청하는 프롬프트를 생성합니다.
+    
+    자동 선택(가장 높은 확률의 원인) 경로에서 Node 6 + Node 8의 두 번 호출을
+    한 번으로 줄일 때 사용합니다. 응답은 근본 원인 JSON 블록, REPORT_MARKER,
+    get_report_writer_prompt와 같은 섹션의 마크다운 리포트 순서입니다.
+    
+    Args:
+        problem_summary: 문제 요약
+        context_data: 분석 컨텍스트
+    
+    Returns:
+        str: 프롬프트 문자열
+    """
+    return f"""당신은 제조 라인 KPI 분석 및 리포트 작성 전문가입니다.
+아래 데이터를 분석하여 문제의 근본 원인을 찾고, 가장 가능성이 높은 원인으로 분석 리포트를 작성해주세요.
+
+## 문제 요약
+{problem_summary}
+
+## 원본 데이터
+{context_data}
+
+**분석 요구사항:**
+1. 가능한 근본 원인을 3~5개 제시하세요
+2. 각 원인의 가능성을 퍼센트(%)로 표시하세요
+3. 각 원인에 대한 증거/근거를 제시하세요
+4. report_cause_index에는 리포트를 작성한 원인(확률이 가장 높은 원인)의 번호(1부터)를 적으세요
+
+**리포트 작성 요구사항:**
+1. 경영진도 이해할 수 있도록 명확하게 작성
+2. 구체적인 수치와 데이터 포함
+3. 권장 조치사항 제시
+4. 예상 효과 설명
+
+**출력 형식:**
+먼저 JSON 블록을 출력하세요:
+```json
+{{
+    "problem_summary": "문제 요약",
+    "root_causes": [
+        {{
+            "cause": "원인 1",
+            "probability": 40,
+            "evidence": "근거 설명"
+        }},
+        ...
+    ],
+    "report_cause_index": 1
+}}
+```
+
+그 다음 줄에 {REPORT_MARKER} 를 한 줄로 출력하고,
+이어서 마크다운 형식으로 다음 섹션을 포함한 리포트를 작성하세요:
+- # 분석 리포트
+- ## 1. 문제 정의
+- ## 2. 근본 원인 분석
+- ## 3. 영향 분석
+- ## 4. 권장 조치사항
+- {REPORT_LAST_SECTION}
+"""
+
+
 def get_question_answer_prompt(
     question: str,
     similar_reports: list
@@ -99,6 +177,7 @@ def get_question_answer_prompt(
     Args:
         question: 사용자 질문
         similar_reports: 유사한 과거 리포트 리스트
+            (document는 질문과 관련된 섹션 청크, 청크 인덱스가 없으면 리포트 전문)
     
     Returns:
         str: 프롬프트 문자열
@@ -110,7 +189,10 @@ def get_question_answer_prompt(
         reports_text += f"**날짜:** {report['metadata'].get('date')}\n"
         reports_text += f"**장비:** {report['metadata'].get('eqp_id')}\n"
         reports_text += f"**KPI:** {report['metadata'].get('kpi')}\n"
-        reports_text += f"**내용:**\n{report['document'][:500]}...\n"
+        document = report['document']
+        if len(document) > MAX_REPORT_CHARS:
+            document = document[:MAX_REPORT_CHARS] + "..."
+        reports_text += f"**내용:**\n{document}\n"
     
     return f"""당신은 제조 라인 KPI 분석 전문가입니다.
 사용자의 질문에 과거 분석 리포트를 참고하여 답변해주세요.
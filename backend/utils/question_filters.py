@@ -0,0 +1,131 @@
+"""
+질문 메타데이터 필터 추출
+
+"EQP07 THP가 1월 26일에 떨어진 이유?"처럼 질문에 장비 ID, KPI, 날짜가 있으면
+정규식으로 뽑아 ChromaDB where 필터({'eqp_id': 'EQP07'} 등)로 바꿉니다.
+필터를 걸면 해당 장비/KPI/날짜의 리포트 안에서만 벡터 검색을 하므로
+리포트가 많아져도 검색 비용이 줄고, 다른 장비 리포트가 섞이지 않습니다.
+"""
+
+import re
+from datetime import date
+from typing import Any, Dict, List, Optional
+
+# 장비 ID (EQP7, eqp07, EQP-07)
+EQP_PATTERN = re.compile(r'(?<![A-Za-z])EQP[-_ ]?(\d{1,3})(?![0-9])', re.IGNORECASE)
+
+# KPI 이름 (WIP_EXCEED/WIP_SHORTAGE는 한글 표현도 인식, 'WIP'만 있으면 둘 다)
+KPI_PATTERN = re.compile(
+    r'(?<![A-Za-z])(OEE|THP|TAT|WIP[_ ]?EXCEED|WIP[_ ]?SHORTAGE|WIP\s*(?:초과|과다)|WIP\s*(?:부족|미달)|WIP)(?![A-Za-z])',
+    re.IGNORECASE
+)
+
+# 날짜 (2026-01-20, 2026.01.20, 2026/01/20, 20260120, 2026년 1월 20일)
+DATE_PATTERN = re.compile(
+    r'(?<!\d)(\d{4})[-./](\d{1,2})[-./](\d{1,2})(?!\d)'
+    r'|(?<!\d)(\d{4})(\d{2})(\d{2})(?!\d)'
+    r'|(\d{4})\s*년\s*(\d{1,2})\s*월\s*(\d{1,2})\s*일'
+)
+
+
+def _normalize_kpi(token: str) -> List[str]:
+    """KPI 표기를 메타데이터 값으로 변환"""
+    token = re.sub(r'[_\s]', '', token.upper())
+
+    if token in ('WIPEXCEED', 'WIP초과', 'WIP과다'):
+        return ['WIP_EXCEED']
+    if token in ('WIPSHORTAGE', 'WIP부족', 'WIP미달'):
+        return ['WIP_SHORTAGE']
+    if token == 'WIP':
+        return ['WIP_EXCEED', 'WIP_SHORTAGE']
+    return [token]
+
+
+def _parse_dates(question: str) -> List[str]:
+    """질문의 날짜를 'YYYY-MM-DD'로 변환 (존재하지 않는 날짜는 무시)"""
+    dates = []
+
+    for match in DATE_PATTERN.finditer(question):
+        year, month, day = [int(group) for group in match.groups() if group is not None]
+        try:
+            value = date(year, month, day).isoformat()
+        except ValueError:
+            continue
+        if value not in dates:
+            dates.append(value)
+
+    return dates
+
+
+def extract_question_entities(question: str) -> Dict[str, List[str]]:
+    """
+    질문에서 장비 ID, KPI, 날짜를 추출합니다.
+
+    Args:
+        question: 사용자 질문
+
+    Returns:
+        dict: {'eqp_id': [...], 'kpi': [...], 'date': [...]} (없는 항목은 빈 목록)
+
+    Examples:
+        >>> extract_question_entities("2026-01-26 eqp7 THP 하락 원인")
+        {'eqp_id': ['EQP07'], 'kpi': ['THP'], 'date': ['2026-01-26']}
+    """
+    question = question or ''
+
+    eqp_ids = []
+    for match in EQP_PATTERN.finditer(question):
+        eqp_id = f"EQP{int(match.group(1)):02d}"
+        if eqp_id not in eqp_ids:
+            eqp_ids.append(eqp_id)
+
+    kpis = []
+    for match in KPI_PATTERN.finditer(question):
+        for kpi in _normalize_kpi(match.group(1)):
+            if kpi not in kpis:
+                kpis.append(kpi)
+
+    return {
+        'eqp_id': eqp_ids,
+        'kpi': kpis,
+        'date': _parse_dates(question)
+    }
+
+
+def build_metadata_filter(entities: Dict[str, List[str]]) -> Optional[Dict[str, Any]]:
+    """
+    추출한 항목을 ChromaDB where 필터로 변환합니다.
+
+    값이 하나면 {'field': value}, 여러 개면 {'field': {'$in': [...]}},
+    조건이 둘 이상이면 '$and'로 묶습니다.
+
+    Returns:
+        dict 또는 None (조건 없음)
+    """
+    conditions = []
+
+    for field in ('eqp_id', 'kpi', 'date'):
+        values = entities.get(field) or []
+        if len(values) == 1:
+            conditions.append({field: values[0]})
+        elif values:
+            conditions.append({field: {'$in': list(values)}})
+
+    if not conditions:
+        return None
+    if len(conditions) == 1:
+        return conditions[0]
+    return {'$and': conditions}
+
+
+def extract_metadata_filter(question: str) -> Optional[Dict[str, Any]]:
+    """
+    질문을 ChromaDB where 필터로 변환합니다.
+
+    Examples:
+        >>> extract_metadata_filter("EQP07 THP 리포트")
+        {'$and': [{'eqp_id': 'EQP07'}, {'kpi': 'THP'}]}
+        >>> extract_metadata_filter("최근 장비 문제") is None
+        True
+    """
+    return build_metadata_filter(extract_question_entities(question))
@@ -0,0 +1,111 @@
+"""
+리포트 청크 분할
+
+리포트를 마크다운 섹션("## 1. 문제 정의" …) 단위로 나누어
+섹션별로 임베딩/검색할 수 있도록 합니다.
+질문과 관련된 섹션만 프롬프트에 넣으면 리포트 앞 500자를 자르는 것보다
+입력 토큰이 적고 내용도 정확합니다.
+"""
+
+import re
+from typing import Dict, List
+
+# 마크다운 제목 (#, ##, ###)
+SECTION_HEADING = re.compile(r'^#{1,3}\s+(.+?)\s*$', re.MULTILINE)
+
+# 청크 최대 길이 (문자)
+MAX_CHUNK_CHARS = 1200
+
+# 이보다 짧은 섹션은 다음 섹션과 합침 (제목만 있는 섹션 등)
+MIN_CHUNK_CHARS = 40
+
+
+def split_report_sections(text: str, max_chars: int = MAX_CHUNK_CHARS) -> List[Dict[str, str]]:
+    """
+    리포트를 마크다운 섹션 단위 청크로 나눕니다.
+
+    - 첫 제목 앞의 내용(리포트 제목 등)은 '개요' 청크
+    - max_chars를 넘는 섹션은 줄 단위로 다시 나눔
+    - 제목이 없는 텍스트는 길이 기준으로만 나눔
+
+    Args:
+        text: 리포트 전문
+        max_chars: 청크 최대 길이
+
+    Returns:
+        List[Dict]: [{'section': 섹션 제목, 'text': 청크 내용}, ...]
+
+    Examples:
+        >>> chunks = split_report_sections(report_text)
+        >>> [chunk['section'] for chunk in chunks]
+        ['개요', '1. 문제 정의', '2. 근본 원인 분석', ...]
+    """
+    text = (text or '').strip()
+    if not text:
+        return []
+
+    # 1. 제목 위치로 섹션 분리
+    headings = list(SECTION_HEADING.finditer(text))
+    sections = []
+
+    preamble = text[:headings[0].start()].strip() if headings else text
+    if preamble:
+        sections.append({'section': '개요', 'text': preamble})
+
+    for i, heading in enumerate(headings):
+        end = headings[i + 1].start() if i + 1 < len(headings) else len(text)
+        sections.append({
+            'section': heading.group(1).strip(),
+            'text': text[heading.start():end].strip()
+        })
+
+    # 2. 너무 짧은 섹션은 다음 섹션과 합침
+    merged = []
+    pending = None
+    for section in sections:
+        if pending:
+            # 짧은 섹션은 대부분 제목뿐이므로 내용이 있는 다음 섹션 제목을 사용
+            section = {'section': section['section'], 'text': pending['text'] + '\n' + section['text']}
+            pending = None
+        if len(section['text']) < MIN_CHUNK_CHARS:
+            pending = section
+        else:
+            merged.append(section)
+
+    if pending:
+        if merged:
+            merged[-1]['text'] += '\n' + pending['text']
+        else:
+            merged.append(pending)
+
+    # 3. 긴 섹션은 줄 단위로 분할
+    chunks = []
+    for section in merged:
+        for part in _split_long(section['text'], max_chars):
+            chunks.append({'section': section['section'], 'text': part})
+
+    return chunks
+
+
+def _split_long(text: str, max_chars: int) -> List[str]:
+    """max_chars를 넘는 텍스트를 줄 단위로 모아 나누고, 너무 긴 줄은 고정 길이로 자릅니다."""
+    if len(text) <= max_chars:
+        return [text]
+
+    parts = []
+    current = ''
+
+    for block in text.split('\n'):
+        # 한 줄 자체가 너무 길면 고정 길이로 자름
+        pieces = [block[i:i + max_chars] for i in range(0, len(block), max_chars)] or ['']
+
+        for piece in pieces:
+            if current and len(current) + len(piece) + 1 > max_chars:
+                parts.append(current.strip())
+                current = ''
+            current += piece + '\n'
+
+    if current.strip():
+        parts.append(current.strip())
+
+    return parts
@@ -0,0 +1,228 @@
+"""
+질문 답변 의미(임베딩) 캐시
+
+qa_cache는 질문 문자열(소문자/공백 정리)의 해시가 정확히 같을 때만 히트하므로
+"EQP01 OEE 원인?"과 "EQP01에서 OEE가 떨어진 원인은?"은 모두 Claude를 호출합니다.
+질문 임베딩을 인메모리 벡터 인덱스(정규화 행렬 × 쿼리 = 코사인 유사도)에 저장하고,
+가장 가까운 질문의 유사도가 임계값 이상이면 저장된 답변을 재사용합니다.
+
+"EQP01 OEE 원인?"과 "EQP02 OEE 원인?"처럼 장비/KPI/날짜만 다른 질문은
+임베딩이 거의 같으므로, 질문에서 추출한 항목(entities)이 정확히 같은 항목만 히트로 인정합니다.
+
+답변은 ChromaDB 리포트를 근거로 하므로, 리포트가 추가/삭제되면
+(data_version이 바뀌면) 전체 항목을 무효화합니다.
+"""
+
+import os
+import time
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+
+class SemanticCache:
+    """
+    임베딩 유사도 기반 캐시 (스레드 안전)
+
+    항목 수가 수천 개 수준이므로 별도 ANN 인덱스 없이
+    정규화된 임베딩 행렬과의 내적 한 번으로 최근접 질문을 찾습니다.
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.92,
+        ttl_seconds: int = 1800,
+        max_entries: int = 1024
+    ):
+        """
+        Args:
+            threshold: 히트로 판단할 최소 코사인 유사도
+            ttl_seconds: 항목 유효 시간 (초)
+            max_entries: 최대 항목 수 (초과 시 오래된 항목부터 제거)
+        """
+        self.threshold = threshold
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+
+        self._vectors: List[np.ndarray] = []
+        self._entries: List[Dict[str, Any]] = []
+        self._matrix: Optional[np.ndarray] = None
+        self._data_version: Any = None
+        self._lock = threading.Lock()
+
+        # 통계
+        self.lookups = 0
+        self.hits = 0
+        self.invalidations = 0
+        self.seconds_saved = 0.0
+
+    def get(
+        self,
+        embedding: List[float],
+        data_version: Any = None,
+        entities: Any = None
+    ) -> Optional[Tuple[Dict[str, Any], float]]:
+        """
+        가장 유사한 질문의 결과를 조회합니다.
+
+        Args:
+            embedding: 질문 임베딩
+            data_version: 현재 리포트 저장소 버전 (바뀌었으면 전체 무효화)
+            entities: 질문에서 추출한 항목 (예: extract_question_entities 결과)
+                저장할 때의 값과 정확히 같은 항목만 비교합니다.
+
+        Returns:
+            (저장된 State, 유사도) 또는 None
+        """
+        query = _normalize(embedding)
+
+        with self._lock:
+            self.lookups += 1
+            self._check_version(data_version)
+            self._drop_expired()
+
+            if not self._entries:
+                return None
+
+            if self._matrix is None:
+                self._matrix = np.vstack(self._vectors)
+
+            similarities = self._matrix @ query
+
+            # 장비/KPI/날짜가 다른 질문은 유사도와 관계없이 제외
+            same_entities = np.array([entry['entities'] == entities for entry in self._entries])
+            if not same_entities.any():
+                return None
+            similarities = np.where(same_entities, similarities, -np.inf)
+
+            best = int(np.argmax(similarities))
+            similarity = float(similarities[best])
+
+            if similarity < self.threshold:
+                return None
+
+            entry = self._entries[best]
+            self.hits += 1
+            self.seconds_saved += entry['duration_seconds']
+
+        print(f"✅ 의미 캐시 히트 (유사도 {similarity:.3f}): {entry['question']}")
+        return entry['data'], similarity
+
+    def set(
+        self,
+        question: str,
+        embedding: List[float],
+        data: Dict[str, Any],
+        duration_seconds: float = 0.0,
+        data_version: Any = None,
+        entities: Any = None
+    ) -> None:
+        """
+        질문 결과를 저장합니다.
+
+        Args:
+            question: 원본 질문 (로그/통계용)
+            embedding: 질문 임베딩
+            data: 저장할 State
+            duration_seconds: 이 결과를 만드는 데 걸린 시간 (히트 시 절감 시간으로 집계)
+            data_version: 결과를 만들 때의 리포트 저장소 버전
+                현재 버전과 다르면(그 사이 리포트가 바뀌었으면) 저장하지 않습니다.
+            entities: 질문에서 추출한 항목 (get과 같은 형식)
+        """
+        vector = _normalize(embedding)
+
+        with self._lock:
+            # 오래 걸린 요청이 이전 버전 결과로 최신 항목을 지우지 않도록 저장만 생략
+            if data_version is not None and self._data_version is not None and data_version != self._data_version:
+                print(f"⚠️ 리포트 버전이 바뀌어 의미 캐시 저장 생략: {question}")
+                return
+
+            self._check_version(data_version)
+            self._drop_expired()
+
+            self._vectors.append(vector)
+            self._entries.append({
+                'question': question,
+                'entities': entities,
+                'data': data,
+                'duration_seconds': duration_seconds,
+                'expires_at': time.monotonic() + self.ttl_seconds
+            })
+
+            # 한도 초과 시 오래된 항목부터 제거 (저장 순서 = 오래된 순)
+            overflow = len(self._entries) - self.max_entries
+            if overflow > 0:
+                del self._vectors[:overflow]
+                del self._entries[:overflow]
+
+            self._matrix = None
+
+    def clear(self) -> None:
+        """모든 항목 삭제"""
+        with self._lock:
+            self._clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        캐시 통계
+
+        Returns:
+            항목 수, 조회/히트 수, 히트율, 절감 시간, 무효화 횟수
+        """
+        with self._lock:
+            return {
+                'total_items': len(self._entries),
+                'threshold': self.threshold,
+                'lookups': self.lookups,
+                'hits': self.hits,
+                'hit_rate': round(self.hits / self.lookups, 3) if self.lookups else 0.0,
+                'seconds_saved': round(self.seconds_saved, 1),
+                'invalidations': self.invalidations
+            }
+
+    def _clear(self) -> None:
+        self._vectors = []
+        self._entries = []
+        self._matrix = None
+
+    def _check_version(self, data_version: Any) -> None:
+        """리포트 저장소가 바뀌었으면 전체 무효화 (락을 잡은 상태에서 호출)"""
+        if data_version is None or data_version == self._data_version:
+            return
+
+        if self._data_version is not None and self._entries:
+            print(f"🔄 리포트 변경 감지, 의미 캐시 무효화: {len(self._entries)}개")
+            self.invalidations += 1
+            self._clear()
+
+        self._data_version = data_version
+
+    def _drop_expired(self) -> None:
+        """만료 항목 제거 (락을 잡은 상태에서 호출)"""
+        now = time.monotonic()
+        expired = 0
+
+        # 저장 순서 = 만료 순서이므로 앞에서부터 확인
+        while expired < len(self._entries) and self._entries[expired]['expires_at'] < now:
+            expired += 1
+
+        if expired:
+            del self._vectors[:expired]
+            del self._entries[:expired]
+            self._matrix = None
+
+
+def _normalize(embedding: List[float]) -> np.ndarray:
+    """코사인 유사도 계산을 위해 단위 벡터로 정규화"""
+    vector = np.asarray(embedding, dtype=np.float32)
+    norm = np.linalg.norm(vector)
+    return vector / norm if norm else vector
+
+
+# 전역 의미 캐시 인스턴스 (질문 답변, 30분 유효)
+qa_semantic_cache = SemanticCache(
+    threshold=float(os.getenv('QA_SEMANTIC_THRESHOLD', '0.92')),
+    ttl_seconds=1800,
+    max_entries=int(os.getenv('QA_SEMANTIC_MAX_ENTRIES', '1024'))
+)
@@ -0,0 +1,200 @@
+"""
+Single-flight 중복 실행 방지
+
+같은 알람에 여러 운영자가 몇 초 간격으로 "AI 분석 시작"을 누르면
+캐시가 채워지기 전이라 각 요청이 전체 워크플로우(LLM 2회)를 실행합니다.
+같은 키로 진행 중인 실행이 있으면 새로 실행하지 않고 그 결과를 기다려 공유합니다.
+
+leader의 함수가 캡처한 콜백(SSE on_progress/on_token)은 leader 클라이언트 전용이므로
+isolate_callback으로 감싸 콜백 실패가 follower에게 전파되지 않게 합니다.
+leader가 publish()로 보낸 진행 이벤트는 follower의 listener에도 전달됩니다.
+"""
+
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+def isolate_callback(callback: Optional[Callable[..., None]]) -> Optional[Callable[..., None]]:
+    """
+    콜백 예외가 실행 중인 작업을 중단시키지 않도록 감쌉니다.
+
+    leader 클라이언트의 연결이 끊겨 콜백이 실패해도 작업은 끝까지 실행되고
+    follower는 정상 결과를 받습니다. 한 번 실패한 콜백은 이후 호출하지 않습니다.
+
+    Args:
+        callback: 감쌀 콜백 (None이면 None 반환)
+
+    Returns:
+        예외를 삼키는 콜백
+    """
+    if callback is None:
+        return None
+
+    failed = threading.Event()
+
+    def wrapper(*args, **kwargs) -> None:
+        if failed.is_set():
+            return
+        try:
+            callback(*args, **kwargs)
+        except Exception as e:
+            failed.set()
+            print(f"⚠️ 콜백 실패, 이후 이벤트 전송 중단: {e}")
+
+    return wrapper
+
+
+class _Call:
+    """진행 중인 실행 1건"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+        # follower 진행 이벤트 전달 (이벤트 순서를 지키도록 call 단위 잠금)
+        self.listeners: List[Callable[[Any], None]] = []
+        self.last_event: Any = None
+        self.events_lock = threading.Lock()
+
+
+class SingleFlight:
+    """
+    키별 single-flight 실행기
+
+    같은 키로 동시에 do()를 호출하면 첫 호출(leader)만 함수를 실행하고
+    나머지(follower)는 leader의 결과(또는 예외)를 그대로 받습니다.
+    실행이 끝나면 키는 해제되므로 이후 호출은 다시 실행됩니다.
+    """
+
+    def __init__(self, cost_fn: Callable[[Any], int] = None):
+        """
+        Args:
+            cost_fn: 결과 1건의 비용(예: LLM 호출 횟수)을 계산하는 함수 (선택)
+                follower가 결과를 공유할 때마다 절감 비용으로 집계합니다.
+        """
+        self.cost_fn = cost_fn
+        self._calls: Dict[str, _Call] = {}
+        self._lock = threading.Lock()
+
+        # 통계
+        self.executions = 0
+        self.coalesced = 0
+        self.cost_saved = 0
+
+    def do(
+        self,
+        key: str,
+        fn: Callable[[], Any],
+        listener: Optional[Callable[[Any], None]] = None
+    ) -> Tuple[Any, bool]:
+        """
+        키에 대해 fn을 한 번만 실행합니다.
+
+        Args:
+            key: 중복 판단 키 (예: analysis_cache.generate_key(...))
+            fn: 실행할 함수 (인자 없음)
+            listener: follower가 되었을 때 leader의 진행 이벤트(publish)를 받을 콜백 (선택)
+                합류 시점에 마지막 이벤트를 먼저 한 번 받습니다.
+
+        Returns:
+            Tuple[Any, bool]: (결과, 다른 호출의 결과를 공유했는지 여부)
+
+        Raises:
+            leader 실행 중 발생한 예외를 follower에게도 그대로 전달합니다.
+            (fn이 호출하는 leader 전용 콜백은 isolate_callback으로 감싸야 합니다)
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is None:
+                call = _Call()
+                self._calls[key] = call
+                leader = True
+                self.executions += 1
+            else:
+                leader = False
+
+        if not leader:
+            print(f"⏳ 동일 작업 실행 중, 결과 대기: {key}")
+
+            if listener is not None:
+                listener = isolate_callback(listener)
+                with call.events_lock:
+                    call.listeners.append(listener)
+                    if call.last_event is not None:
+                        listener(call.last_event)
+
+            call.done.wait()
+
+            if call.error is not None:
+                raise call.error
+
+            with self._lock:
+                self.coalesced += 1
+                if self.cost_fn:
+                    self.cost_saved += self.cost_fn(call.result)
+
+            return call.result, True
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+        return call.result, False
+
+    def publish(self, key: str, event: Any) -> None:
+        """
+        진행 중인 실행의 follower listener들에게 이벤트를 전달합니다.
+
+        leader의 fn 안에서 호출합니다. 진행 중인 실행이 없으면 무시합니다.
+
+        Args:
+            key: do()에 사용한 키
+            event: 진행 이벤트 (예: {'event': 'node_start', 'node': 'node_3', ...})
+        """
+        with self._lock:
+            call = self._calls.get(key)
+
+        if call is None:
+            return
+
+        with call.events_lock:
+            call.last_event = event
+            for listener in call.listeners:
+                listener(event)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        실행 통계
+
+        Returns:
+            실행 횟수, 공유(합류) 횟수, 절감 비용, 현재 진행 중인 키 수
+        """
+        with self._lock:
+            return {
+                'executions': self.executions,
+                'coalesced': self.coalesced,
+                'llm_calls_saved': self.cost_saved,
+                'in_flight': len(self._calls)
+            }
+
+
+def _llm_calls(state: Any) -> int:
+    """워크플로우 결과 State의 LLM 호출 횟수"""
+    if not isinstance(state, dict):
+        return 0
+    return (state.get('metadata') or {}).get('llm_calls', 0)
+
+
+# 전역 single-flight 인스턴스
+# 알람 분석 (키: analysis_cache 키와 동일)
+analysis_flight = SingleFlight(cost_fn=_llm_calls)
+
+# 질문 답변 (키: qa_cache 키와 동일)
+qa_flight = SingleFlight(cost_fn=_llm_calls)
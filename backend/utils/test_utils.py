@@ -3,14 +3,18 @@
 """
 
 import sys
+from datetime import datetime
 from pathlib import Path
 
+import numpy as np
+
 # 프로젝트 루트를 경로에 추가
 project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
 from backend.utils.date_utils import (
     parse_datetime,
+    parse_many,
     get_date_range,
     calculate_duration,
     get_time_window
@@ -20,7 +24,33 @@ from backend.utils.data_utils import (
     check_alarm_condition,
     calculate_kpi_gap,
     aggregate_lot_states,
-    get_downtime_info
+    get_downtime_info,
+    generate_problem_summary,
+    format_context_data
+)
+
+from backend.utils.prompt_templates import (
+    REPORT_MARKER,
+    MAX_REPORT_CHARS,
+    get_root_cause_and_report_prompt,
+    get_question_answer_prompt
+)
+from backend.config.chroma_config import ChromaDBConfig
+
+from backend.utils.cache import BoundedCache, DiskCacheTier
+from backend.utils.embedding_cache import EmbeddingCache
+from backend.utils.semantic_cache import SemanticCache
+from backend.utils.report_chunker import split_report_sections
+from backend.utils.lexical_index import BM25Index, tokenize
+from backend.utils.question_filters import extract_metadata_filter, extract_question_entities
+from backend.utils.single_flight import SingleFlight, isolate_callback
+from backend.utils.context_builder import build_context, estimate_tokens
+from backend.utils.downtime_intervals import downtime_stats, fleet_downtime_stats
+from backend.utils.columnar_aggregation import (
+    lot_columns,
+    eqp_columns,
+    aggregate_lot_columns,
+    downtime_from_columns
 )
 
 
@@ -37,7 +67,20 @@ def test_date_utils():
     print(f"   '2026-01-20' → {dt}")
     
     dt2 = parse_datetime("2026-01-20 14:30")
-    print(f"   '2026-01-20 14:30' → {dt2}\n")
+    print(f"   '2026-01-20 14:30' → {dt2}")
+    
+    # PostgREST 형식 (T 구분자, 타임존 → UTC naive)
+    dt3 = parse_datetime("2026-01-20T23:30:00+09:00")
+    print(f"   '2026-01-20T23:30:00+09:00' → {dt3}\n")
+    assert dt3 == datetime(2026, 1, 20, 14, 30)
+    assert parse_datetime("2026-01-20T14:30:00") == dt2
+    
+    # parse_many (일괄 변환, 값이 없으면 NaT)
+    values = ["2026-01-20 14:30", "2026-01-20T14:30:00Z", "2026-01-20 14:30:00", None]
+    parsed = parse_many(values)
+    assert parsed[:3].tolist() == [dt2] * 3
+    assert np.isnat(parsed[3])
+    assert parse_many(iter(values[:1])).tolist() == [dt2]
     
     # get_date_range 테스트
     print("2. get_date_range() 테스트")
@@ -94,6 +137,10 @@ def test_data_utils():
     print(f"   상태별: {lot_summary['state_counts']}")
     print(f"   HOLD: {lot_summary['hold_count']}회\n")
     
+    # 이터레이터(페이지 단위 조회)로 집계해도 결과가 같아야 함
+    assert aggregate_lot_states(iter(lot_data)) == lot_summary
+    assert aggregate_lot_states([]) == {'total_lots': 0, 'state_counts': {}, 'hold_count': 0, 'avg_in_cnt': 0}
+    
     # get_downtime_info 테스트
     print("4. get_downtime_info() 테스트")
     eqp_data = [
@@ -112,9 +159,583 @@ def test_data_utils():
     print(f"   총 다운타임: {downtime['total_downtime_hours']}시간")
     print(f"   발생 횟수: {downtime['downtime_count']}회\n")
     
+    assert get_downtime_info(iter(eqp_data)) == downtime
+    
     print("✅ 데이터 유틸리티 테스트 완료!\n")
 
 
+def test_columnar_aggregation():
+    """컬럼 기반 집계가 기존 함수와 같은 결과인지 테스트"""
+    
+    print("\n" + "=" * 60)
+    print("🧮 컬럼 기반 집계 테스트")
+    print("=" * 60 + "\n")
+    
+    lot_data = [
+        {'lot_state': 'WAIT', 'in_cnt': 24},
+        {'lot_state': 'RUN', 'in_cnt': 25},
+        {'lot_state': 'HOLD', 'in_cnt': 25},
+        {'in_cnt': 23},
+        {'lot_state': 'RUN', 'in_cnt': 25}
+    ]
+    expected = aggregate_lot_states(lot_data)
+    result = aggregate_lot_columns(lot_columns(lot_data))
+    print(f"   로트: {result}")
+    assert result == expected
+    assert list(result['state_counts']) == list(expected['state_counts'])
+    assert aggregate_lot_columns(lot_columns([])) == aggregate_lot_states([])
+    
+    eqp_data = [
+        {'eqp_state': 'DOWN', 'event_time': '2026-01-20 01:25', 'end_time': '2026-01-20 04:25'},
+        {'eqp_state': 'RUN', 'event_time': '2026-01-20 04:25', 'end_time': '2026-01-20 06:20'},
+        {'eqp_state': 'DOWN', 'event_time': '2026-01-20 06:20:10', 'end_time': '2026-01-20 09:20:17'},
+        {'eqp_state': 'DOWN', 'event_time': '2026-01-20 10:00', 'end_time': None},
+        {'eqp_state': 'DOWN', 'event_time': '2026-01-20T11:00:00+00:00', 'end_time': '2026-01-20T11:45:00+00:00'}
+    ]
+    expected = get_downtime_info(eqp_data)
+    result = downtime_from_columns(eqp_columns(eqp_data))
+    print(f"   다운타임: {result['total_downtime_hours']}시간, {result['downtime_count']}회")
+    assert result == expected
+    assert downtime_from_columns(eqp_columns([])) == get_downtime_info([])
+    
+    print("\n✅ 컬럼 기반 집계 테스트 완료!\n")
+
+
+def test_downtime_intervals():
+    """다운타임 구간 병합 테스트"""
+    
+    print("\n" + "=" * 60)
+    print("⛓️ 다운타임 구간 병합 테스트")
+    print("=" * 60 + "\n")
+    
+    window = ('2026-01-20 00:00:00', '2026-01-21 00:00:00')
+    eqp_data = [
+        # 윈도우 이전에 시작 (00:00부터 계산)
+        {'eqp_id': 'EQP01', 'eqp_state': 'DOWN', 'event_time': '2026-01-19 22:00', 'end_time': '2026-01-20 03:00'},
+        # 겹치는 구간 + 중복 적재
+        {'eqp_id': 'EQP01', 'eqp_state': 'DOWN', 'event_time': '2026-01-20 02:00', 'end_time': '2026-01-20 04:00'},
+        {'eqp_id': 'EQP01', 'eqp_state': 'DOWN', 'event_time': '2026-01-20 02:00', 'end_time': '2026-01-20 04:00'},
+        {'eqp_id': 'EQP01', 'eqp_state': 'RUN', 'event_time': '2026-01-20 04:00', 'end_time': '2026-01-20 10:00'},
+        {'eqp_id': 'EQP01', 'eqp_state': 'DOWN', 'event_time': '2026-01-20 10:00', 'end_time': '2026-01-20 11:00'},
+        # 다른 장비 (윈도우 이후에 끝남)
+        {'eqp_id': 'EQP02', 'eqp_state': 'DOWN', 'event_time': '2026-01-20 23:00', 'end_time': '2026-01-21 02:00'}
+    ]
+    
+    stats = downtime_stats([row for row in eqp_data if row['eqp_id'] == 'EQP01'], *window)
+    print(f"   EQP01: 병합 {stats['total_downtime_hours']}시간 / 단순 합 {stats['raw_downtime_hours']}시간")
+    print(f"   최장: {stats['longest_outage']}")
+    assert stats['total_downtime_hours'] == 5.0
+    assert stats['raw_downtime_hours'] == 8.0
+    assert stats['downtime_count'] == 2 and stats['event_count'] == 4
+    assert stats['longest_outage']['start_time'] == '2026-01-20 00:00:00'
+    assert stats['longest_outage']['duration_hours'] == 4.0
+    assert stats['mttr_hours'] == 2.5 and stats['mtbf_hours'] == 9.5
+    
+    # 전체 장비 한 번에 (장비별 계산과 같아야 함)
+    fleet = fleet_downtime_stats(eqp_data, *window)
+    assert fleet['EQP01'] == stats
+    assert fleet['EQP02']['total_downtime_hours'] == 1.0
+    
+    assert downtime_stats([], *window)['downtime_count'] == 0
+    
+    # 컨텍스트의 총 다운타임은 병합 값, 단순 합계는 원본 값으로 표시
+    down_rows = [row for row in eqp_data if row['eqp_id'] == 'EQP01' and row['eqp_state'] == 'DOWN']
+    context = format_context_data({}, [], down_rows, [], downtime_stats=stats)
+    assert '총 다운타임 (분석 윈도우 내, 겹침 제거): 5.00시간' in context
+    assert '원본 이벤트 합계 (겹침/윈도우 밖 포함): 10.00시간 (4건)' in context
+    
+    print("\n✅ 다운타임 구간 병합 테스트 완료!\n")
+
+
+def test_context_builder():
+    """토큰 예산 컨텍스트 생성 테스트"""
+    
+    print("\n" + "=" * 60)
+    print("✂️ 토큰 예산 컨텍스트 테스트")
+    print("=" * 60 + "\n")
+    
+    kpi_data = {'date': '2026-01-20', 'eqp_id': 'EQP01', 'oee_v': 53.51, 'oee_t': 70}
+    lot_data = [
+        {'lot_state': state, 'in_cnt': 25, 'event_time': f'2026-01-20 {hour:02d}:00:00'}
+        for hour in range(24) for state in ('RUN', 'HOLD', 'WAIT')
+    ]
+    eqp_data = [
+        {'eqp_state': 'DOWN', 'event_time': f'2026-01-20 {hour:02d}:00', 'end_time': f'2026-01-20 {hour:02d}:30'}
+        for hour in range(0, 24, 3)
+    ]
+    rcp_data = [{'rcp_id': f'RCP{i:02d}', 'complex_level': i % 10 + 1} for i in range(30)]
+    
+    full = build_context(kpi_data, 'OEE', lot_data, eqp_data, rcp_data)
+    print(f"   제한 없음: {full['estimated_tokens']}토큰 {full['sections']}")
+    assert full['estimated_tokens'] == estimate_tokens(full['text'])
+    # OEE는 다운타임 섹션이 먼저
+    assert [section['name'] for section in full['sections']] == ['downtime', 'lot', 'recipe']
+    assert full['text'].index('장비 다운타임') < full['text'].index('로트 상태 요약')
+    
+    budget = full['estimated_tokens'] // 2
+    reduced = build_context(kpi_data, 'OEE', lot_data, eqp_data, rcp_data, token_budget=budget)
+    print(f"   예산 {budget}: {reduced['estimated_tokens']}토큰 {reduced['sections']}")
+    assert reduced['within_budget'] and reduced['estimated_tokens'] <= budget
+    # 관련도 낮은 레시피 섹션이 가장 많이 줄어듦
+    levels = {section['name']: section['level'] for section in reduced['sections']}
+    assert levels['recipe'] != 'full'
+    
+    # KPI 섹션만으로도 예산을 넘으면 나머지 섹션은 모두 생략
+    tiny = build_context(kpi_data, 'TAT', lot_data, eqp_data, rcp_data, token_budget=10)
+    assert not tiny['within_budget']
+    assert all(section['level'] == 'omitted' for section in tiny['sections'])
+    assert 'KPI 수치' in tiny['text'] and '로트 상태' not in tiny['text']
+    
+    print("\n✅ 토큰 예산 컨텍스트 테스트 완료!\n")
+
+
+def test_single_shot_prompt():
+    """근본 원인 + 리포트 단일 호출 프롬프트 테스트"""
+    
+    print("\n" + "=" * 60)
+    print("⚡ 단일 호출 프롬프트 테스트")
+    print("=" * 60 + "\n")
+    
+    kpi_data = {'date': '2026-01-20', 'eqp_id': 'EQP01', 'oee_v': 53.5, 'oee_t': 70}
+    summary = generate_problem_summary(kpi_data, 'OEE')
+    print(f"   문제 요약:\n{summary}\n")
+    assert '목표치: 70%' in summary and '실제치: 53.5%' in summary
+    assert '-16.50%' in summary and 'EQP01' in summary
+    
+    prompt = get_root_cause_and_report_prompt(summary, '컨텍스트 데이터')
+    print(f"   프롬프트: {len(prompt)}자")
+    # JSON 블록 → 구분선 → 리포트 순서
+    assert summary in prompt and '컨텍스트 데이터' in prompt
+    assert prompt.index('report_cause_index') < prompt.index(REPORT_MARKER) < prompt.index('# 분석 리포트')
+    assert '## 5. 예상 효과' in prompt
+    
+    print("\n✅ 단일 호출 프롬프트 테스트 완료!\n")
+
+
+def test_report_chunker():
+    """리포트 섹션 청크 분할 테스트"""
+    
+    print("\n" + "=" * 60)
+    print("✂️ 리포트 청크 분할 테스트")
+    print("=" * 60 + "\n")
+    
+    report = (
+        "# EQP01 OEE 알람 분석 리포트\n\n"
+        "## 1. 문제 정의\n- 2026-01-20 EQP01 OEE 57.73% (목표 70%), 차이 -12.27%\n\n"
+        "## 2. 근본 원인 분석\n- 장비 다운타임 3시간 발생 (01:25~04:25), RCP01 HOLD\n\n"
+        "## 3. 영향 분석\n" + "- 처리량 감소로 인한 후속 공정 대기 시간 증가\n" * 60
+    )
+    
+    chunks = split_report_sections(report, max_chars=600)
+    for chunk in chunks:
+        print(f"   [{chunk['section']}] {len(chunk['text'])}자")
+    print()
+    
+    sections = [chunk['section'] for chunk in chunks]
+    assert sections[0] == '1. 문제 정의'  # 제목만 있는 섹션은 다음 섹션과 합침
+    assert '2. 근본 원인 분석' in sections
+    assert all(len(chunk['text']) <= 600 for chunk in chunks)
+    assert sections.count('3. 영향 분석') > 1
+    
+    print("✅ 리포트 청크 분할 테스트 완료!\n")
+
+
+def test_question_answer_prompt_size():
+    """질문 답변 프롬프트 크기 테스트 (청크 검색 결과 vs 리포트 앞 500자)"""
+    
+    print("\n" + "=" * 60)
+    print("📏 질문 답변 프롬프트 크기 테스트")
+    print("=" * 60 + "\n")
+    
+    reports = []
+    hits = []
+    for n in range(1, 4):
+        report = (
+            f"# EQP0{n} OEE 알람 분석 리포트\n\n"
+            f"## 1. 문제 정의\n- 2026-01-2{n} EQP0{n} OEE 57.73% (목표 70%)\n" + "- 목표 대비 미달 지속\n" * 15 + "\n"
+            f"## 2. 근본 원인 분석\n- 로더 모듈 통신 장애로 다운타임 3시간\n" + "- RCP01 HOLD 반복\n" * 15 + "\n"
+            f"## 3. 영향 분석\n" + "- 후속 공정 대기 시간 증가\n" * 20 + "\n"
+            f"## 4. 권장 조치사항\n" + "- 통신 케이블 교체 및 점검 주기 단축\n" * 10 + "\n"
+            f"## 5. 예상 효과\n- OEE 70% 회복\n"
+        )
+        metadata = {'date': f'2026-01-2{n}', 'eqp_id': f'EQP0{n}', 'kpi': 'OEE'}
+        reports.append({'id': f'report_{n}', 'document': report, 'metadata': metadata})
+        
+        # 질문과 가까운 순서: 근본 원인 → 조치 → 나머지
+        chunks = split_report_sections(report)
+        order = sorted(range(len(chunks)), key=lambda i: chunks[i]['section'][:2] not in ('2.', '4.'))
+        for rank, i in enumerate(order):
+            chunk_metadata = {**metadata, 'parent_id': f'report_{n}', 'chunk_index': i, 'section': chunks[i]['section']}
+            hits.append((f'report_{n}_chunk_{i}', chunks[i]['text'], chunk_metadata, 0.2 + rank * 0.1 + n * 0.01))
+    
+    hits.sort(key=lambda hit: hit[3])
+    grouped = ChromaDBConfig._group_by_report(hits, 3, 'distance')
+    
+    # 이전 방식: 리포트 전문의 앞 MAX_REPORT_CHARS(500)자
+    old_prompt = get_question_answer_prompt("EQP01 OEE 하락 원인은?", reports)
+    new_prompt = get_question_answer_prompt("EQP01 OEE 하락 원인은?", grouped)
+    print(f"   이전 프롬프트: {len(old_prompt)}자")
+    print(f"   청크 프롬프트: {len(new_prompt)}자\n")
+    
+    assert MAX_REPORT_CHARS <= 500
+    assert all(len(report['document']) <= MAX_REPORT_CHARS for report in grouped)
+    assert len(new_prompt) <= len(old_prompt)
+    assert "로더 모듈 통신 장애" in new_prompt  # 가장 가까운 섹션 포함
+    
+    print("✅ 질문 답변 프롬프트 크기 테스트 완료!\n")
+
+
+def test_lexical_index():
+    """BM25 어휘 인덱스 테스트"""
+    
+    print("\n" + "=" * 60)
+    print("📇 BM25 어휘 인덱스 테스트")
+    print("=" * 60 + "\n")
+    
+    assert tokenize("EQP07에서 THP 하락") == ['eqp07', '에서', 'thp', '하락']
+    
+    index = BM25Index()
+    index.build(
+        ['r1', 'r2', 'r3'],
+        [
+            '로더 모듈 통신 장애로 설비 유휴 시간 증가',
+            '챔버 온도 센서 드리프트로 공정 중단',
+            '로더 모듈 교체 후 정상화'
+        ],
+        [
+            {'eqp_id': 'EQP07', 'kpi': 'THP', 'date': '2026-01-26'},
+            {'eqp_id': 'EQP17', 'kpi': 'THP', 'date': '2026-01-27'},
+            {'eqp_id': 'EQP07', 'kpi': 'OEE', 'date': '2026-01-28'}
+        ]
+    )
+    
+    ranked = index.search("EQP07 THP 리포트", n_results=3)
+    print(f"   EQP07 THP → {[(index.doc_ids[i], round(score, 3)) for i, score in ranked]}")
+    assert index.doc_ids[ranked[0][0]] == 'r1'
+    
+    ranked = index.search("온도 센서 문제")
+    assert index.doc_ids[ranked[0][0]] == 'r2'
+    
+    # 메타데이터 필터 (Chroma where 형식)
+    ranked = index.search("로더 모듈", where={'kpi': 'OEE'})
+    assert [index.doc_ids[i] for i, _ in ranked] == ['r3']
+    ranked = index.search("로더 모듈", where={'eqp_id': {'$in': ['EQP17']}})
+    assert ranked == []
+    
+    # 식별자 값은 생성 시 한 번 계산
+    assert index.identifier_values['eqp_id'] == {'eqp07', 'eqp17'}
+    assert index.identifier_values['date'] == {'2026-01-26', '2026-01-27', '2026-01-28'}
+    
+    # 식별자 일치 결과에는 벡터 거리가 없음 (검색한 인덱스로 식별자 확인)
+    question = "EQP07 THP 하락 원인"
+    hits = [
+        (index.doc_ids[i], index.documents[i], index.metadatas[i], score)
+        for i, score in index.search(question, n_results=3)
+    ]
+    lexical_results = ChromaDBConfig._group_by_report(hits, 3, 'score')
+    exact = ChromaDBConfig._exact_identifier_matches(question, lexical_results, index)
+    assert [report['id'] for report in exact] == ['r1']
+    assert exact[0]['retrieval'] == 'exact' and 'distance' not in exact[0]
+    
+    other_index = BM25Index()
+    other_index.build(['r2'], ['챔버 온도 센서 드리프트'], [{'eqp_id': 'EQP17', 'kpi': 'THP', 'date': '2026-01-27'}])
+    assert ChromaDBConfig._exact_identifier_matches(question, lexical_results, other_index) == []
+    
+    # RRF 융합: 점수/검색 방식은 별도 필드, 거리는 벡터 결과에만
+    vector_results = [
+        {'id': 'r1', 'document': '', 'metadata': {}, 'distance': 0.4, 'retrieval': 'vector'},
+        {'id': 'r4', 'document': '', 'metadata': {}, 'distance': 0.9, 'retrieval': 'vector'}
+    ]
+    fused = {report['id']: report for report in ChromaDBConfig._fuse_results(vector_results, lexical_results, 5)}
+    print(f"   융합: {[(report_id, report['retrieval'], report.get('distance')) for report_id, report in fused.items()]}")
+    assert fused['r1']['retrieval'] == 'hybrid' and fused['r1']['distance'] == 0.4
+    assert fused['r4']['retrieval'] == 'vector'
+    assert fused['r3']['retrieval'] == 'lexical' and 'distance' not in fused['r3']
+    assert all('rrf_score' in report and 'score' not in report for report in fused.values())
+    
+    print("\n✅ BM25 어휘 인덱스 테스트 완료!\n")
+
+
+def test_question_filters():
+    """질문 메타데이터 필터 추출 테스트"""
+    
+    print("\n" + "=" * 60)
+    print("🏷️ 질문 메타데이터 필터 테스트")
+    print("=" * 60 + "\n")
+    
+    cases = [
+        ("EQP07 THP 리포트", {'$and': [{'eqp_id': 'EQP07'}, {'kpi': 'THP'}]}),
+        ("2026년 1월 20일 eqp1 OEE 원인", {'$and': [{'eqp_id': 'EQP01'}, {'kpi': 'OEE'}, {'date': '2026-01-20'}]}),
+        ("EQP01, EQP02 WIP 초과", {'$and': [{'eqp_id': {'$in': ['EQP01', 'EQP02']}}, {'kpi': 'WIP_EXCEED'}]}),
+        ("20260120 WIP 현황", {'$and': [{'kpi': {'$in': ['WIP_EXCEED', 'WIP_SHORTAGE']}}, {'date': '2026-01-20'}]}),
+        ("최근 장비 문제 원인은?", None)
+    ]
+    
+    for question, expected in cases:
+        where = extract_metadata_filter(question)
+        print(f"   {question} → {where}")
+        assert where == expected
+    
+    print("\n✅ 질문 메타데이터 필터 테스트 완료!\n")
+
+
+def test_bounded_cache():
+    """LRU + TTL 캐시 테스트"""
+    
+    import time
+    
+    print("\n" + "=" * 60)
+    print("💾 LRU + TTL 캐시 테스트")
+    print("=" * 60 + "\n")
+    
+    # 항목 수 한도: 가장 오래 사용되지 않은 항목부터 제거
+    print("1. max_entries=2 LRU 제거")
+    cache = BoundedCache(ttl_seconds=60, max_entries=2)
+    cache.set('a', {'v': 1})
+    cache.set('b', {'v': 2})
+    cache.get('a')
+    cache.set('c', {'v': 3})
+    assert cache.get('b') is None
+    assert cache.get('a') == {'v': 1}
+    stats = cache.get_stats()
+    print(f"   항목: {stats['total_items']}개, 제거: {stats['evictions']}회")
+    print(f"   히트: {stats['hits']}회, 미스: {stats['misses']}회\n")
+    assert stats['evictions'] == 1
+    
+    # 크기 한도
+    print("2. max_bytes 한도")
+    cache = BoundedCache(ttl_seconds=60, max_bytes=1000)
+    for i in range(10):
+        cache.set(f'lot{i}', {'lot_data': ['x' * 100]})
+    stats = cache.get_stats()
+    print(f"   전체 크기: {stats['total_bytes']} bytes, 항목: {stats['total_items']}개\n")
+    assert stats['total_bytes'] <= 1000
+    
+    # TTL 만료
+    print("3. TTL 만료")
+    cache = BoundedCache(ttl_seconds=0.1)
+    cache.set('old', {'v': 1})
+    time.sleep(0.2)
+    stats = cache.get_stats()
+    print(f"   만료 정리: {stats['expired_cleaned']}개\n")
+    assert stats['total_items'] == 0
+    
+    # 디스크 계층: 재시작(새 인스턴스) 후에도 조회, TTL 유지
+    print("4. 디스크 계층")
+    import os
+    import tempfile
+    db_path = os.path.join(tempfile.mkdtemp(), 'cache.db')
+    BoundedCache(ttl_seconds=60, disk_tier=DiskCacheTier(db_path)).set('alarm', {'v': 1})
+    BoundedCache(ttl_seconds=0.1, disk_tier=DiskCacheTier(db_path)).set('short', {'v': 2})
+    time.sleep(0.2)
+    restarted = BoundedCache(ttl_seconds=60, disk_tier=DiskCacheTier(db_path))
+    assert restarted.get('alarm') == {'v': 1}
+    assert restarted.get('short') is None
+    stats = restarted.get_stats()
+    print(f"   디스크 히트: {stats['disk_hits']}회, 메모리 적재: {stats['total_items']}개\n")
+    assert stats['disk_hits'] == 1 and stats['total_items'] == 1
+    
+    print("✅ LRU + TTL 캐시 테스트 완료!\n")
+
+
+def test_semantic_cache():
+    """질문 의미 캐시 테스트"""
+    
+    print("\n" + "=" * 60)
+    print("🧠 의미 캐시 테스트")
+    print("=" * 60 + "\n")
+    
+    eqp01 = extract_question_entities("EQP01 OEE 원인?")
+    eqp02 = extract_question_entities("EQP02 OEE 원인?")
+    
+    cache = SemanticCache(threshold=0.9)
+    cache.set("EQP01 OEE 원인?", [1.0, 0.0, 0.1], {'final_answer': 'A'}, duration_seconds=12.0, data_version=1, entities=eqp01)
+    
+    # 표현만 다른 질문 (유사 벡터) → 히트
+    print("1. 유사 질문 조회")
+    hit = cache.get([0.98, 0.05, 0.12], data_version=1, entities=extract_question_entities("EQP01에서 OEE가 떨어진 원인은?"))
+    assert hit is not None and hit[0]['final_answer'] == 'A'
+    print(f"   유사도: {hit[1]:.3f}\n")
+    
+    # 장비만 다른 질문 (임베딩이 같아도) → 미스
+    print("2. 장비만 다른 질문 조회")
+    assert cache.get([1.0, 0.0, 0.1], data_version=1, entities=eqp02) is None
+    print("   미스\n")
+    
+    # 다른 질문 → 미스
+    print("3. 다른 질문 조회")
+    assert cache.get([0.0, 1.0, 0.0], data_version=1, entities=eqp01) is None
+    print("   미스\n")
+    
+    # 리포트 추가 (버전 변경) → 무효화
+    print("4. 리포트 변경 후 조회")
+    assert cache.get([1.0, 0.0, 0.1], data_version=2, entities=eqp01) is None
+    
+    # 이전 버전으로 끝난 요청의 저장은 생략 (최신 항목 유지)
+    cache.set("EQP02 OEE 원인?", [1.0, 0.0, 0.1], {'final_answer': 'B'}, data_version=2, entities=eqp02)
+    cache.set("EQP01 OEE 원인?", [1.0, 0.0, 0.1], {'final_answer': 'A'}, data_version=1, entities=eqp01)
+    assert cache.get([1.0, 0.0, 0.1], data_version=2, entities=eqp02)[0]['final_answer'] == 'B'
+    
+    stats = cache.get_stats()
+    print(f"   히트율: {stats['hit_rate']}, 절감 시간: {stats['seconds_saved']}초, 무효화: {stats['invalidations']}회\n")
+    assert stats['hits'] == 2 and stats['invalidations'] == 1 and stats['total_items'] == 1
+    
+    print("✅ 의미 캐시 테스트 완료!\n")
+
+
+def test_embedding_cache():
+    """임베딩 영구 캐시 테스트"""
+    
+    import os
+    import time
+    import tempfile
+    
+    print("\n" + "=" * 60)
+    print("🧮 임베딩 캐시 테스트")
+    print("=" * 60 + "\n")
+    
+    db_path = os.path.join(tempfile.mkdtemp(), 'embeddings.db')
+    cache = EmbeddingCache(db_path, max_entries=1000)
+    
+    # 공백만 다른 텍스트는 같은 키
+    print("1. 저장 후 조회 (공백 정규화)")
+    cache.set('titan-v1', 'EQP01  OEE 하락\n', [0.5, 0.25, -1.0])
+    assert cache.get('titan-v1', 'EQP01 OEE 하락') == [0.5, 0.25, -1.0]
+    
+    # 모델이 다르면 미스
+    assert cache.get('titan-v2', 'EQP01 OEE 하락') is None
+    
+    # 재시작 후에도 조회
+    print("2. 재시작 후 조회")
+    restarted = EmbeddingCache(db_path)
+    assert restarted.get('titan-v1', 'EQP01 OEE 하락') is not None
+    
+    # 최근에 사용된 항목은 히트해도 last_used를 다시 쓰지 않음
+    print("3. last_used 갱신 간격")
+    last_used_sql = 'SELECT last_used FROM embeddings'
+    cache.conn.execute('UPDATE embeddings SET last_used = ?', (time.time() - 60,))
+    recent = cache.conn.execute(last_used_sql).fetchone()[0]
+    cache.get('titan-v1', 'EQP01 OEE 하락')
+    assert cache.conn.execute(last_used_sql).fetchone()[0] == recent
+    
+    cache.conn.execute('UPDATE embeddings SET last_used = ?', (time.time() - cache.TOUCH_INTERVAL - 1,))
+    cache.get('titan-v1', 'EQP01 OEE 하락')
+    assert cache.conn.execute(last_used_sql).fetchone()[0] > time.time() - 60
+    
+    stats = cache.get_stats()
+    print(f"   항목: {stats['total_items']}개 ({stats['total_bytes']} bytes)")
+    print(f"   히트: {stats['hits']}회, 미스: {stats['misses']}회\n")
+    
+    print("✅ 임베딩 캐시 테스트 완료!\n")
+
+
+def test_single_flight():
+    """single-flight 중복 실행 방지 테스트"""
+    
+    import time
+    import threading
+    
+    print("\n" + "=" * 60)
+    print("🔁 single-flight 테스트")
+    print("=" * 60 + "\n")
+    
+    flight = SingleFlight(cost_fn=lambda state: state['metadata']['llm_calls'])
+    executions = []
+    
+    def slow_analysis():
+        executions.append(1)
+        time.sleep(0.2)
+        return {'metadata': {'llm_calls': 2}}
+    
+    # 같은 키로 5건 동시 요청
+    print("1. 동일 키 동시 요청 5건")
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(flight.do('alarm:EQP01', slow_analysis)))
+        for _ in range(5)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    
+    stats = flight.get_stats()
+    print(f"   실제 실행: {len(executions)}회")
+    print(f"   결과 공유: {stats['coalesced']}회")
+    print(f"   절감한 LLM 호출: {stats['llm_calls_saved']}회\n")
+    
+    assert len(executions) == 1
+    assert sum(1 for _, shared in results if shared) == 4
+    assert stats['llm_calls_saved'] == 8
+    assert stats['in_flight'] == 0
+    
+    # 실행이 끝난 뒤 요청은 다시 실행
+    print("2. 완료 후 재요청")
+    flight.do('alarm:EQP01', slow_analysis)
+    print(f"   실제 실행: {len(executions)}회\n")
+    assert len(executions) == 2
+    
+    # leader 클라이언트의 콜백이 실패해도 follower는 결과를 받음
+    print("3. leader 콜백 실패")
+    
+    def closed_stream(token):
+        raise RuntimeError("client disconnected")
+    
+    def streaming_analysis():
+        on_token = isolate_callback(closed_stream)
+        time.sleep(0.1)
+        on_token("# 리포트")
+        on_token("...")
+        return {'metadata': {'llm_calls': 2}}
+    
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(flight.do('alarm:EQP02', streaming_analysis)))
+        for _ in range(3)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    
+    assert len(results) == 3
+    assert sum(1 for _, shared in results if shared) == 2
+    
+    # 합류한 요청은 leader의 진행 이벤트를 받음 (합류 시점의 마지막 이벤트부터)
+    print("4. follower 진행 이벤트")
+    leader_started = threading.Event()
+    follower_joined = threading.Event()
+    
+    def progressing_analysis():
+        flight.publish('alarm:EQP03', {'event': 'node_start', 'node': 'node_2'})
+        flight.publish('alarm:EQP03', {'event': 'node_start', 'node': 'node_3'})
+        leader_started.set()
+        follower_joined.wait(1)
+        flight.publish('alarm:EQP03', {'event': 'node_start', 'node': 'node_6'})
+        return {'metadata': {'llm_calls': 2}}
+    
+    follower_events = []
+    leader = threading.Thread(target=lambda: flight.do('alarm:EQP03', progressing_analysis))
+    leader.start()
+    leader_started.wait(1)
+    
+    def follow():
+        def listener(event):
+            follower_events.append(event['node'])
+            follower_joined.set()
+        flight.do('alarm:EQP03', slow_analysis, listener=listener)
+    
+    follower = threading.Thread(target=follow)
+    follower.start()
+    leader.join()
+    follower.join()
+    
+    print(f"   follower 이벤트: {follower_events}\n")
+    assert follower_events == ['node_3', 'node_6']
+    
+    print("✅ single-flight 테스트 완료!\n")
+
+
 def main():
     """모든 테스트 실행"""
     
@@ -122,6 +743,18 @@ def main():
     
     test_date_utils()
     test_data_utils()
+    test_columnar_aggregation()
+    test_downtime_intervals()
+    test_context_builder()
+    test_single_shot_prompt()
+    test_report_chunker()
+    test_question_answer_prompt_size()
+    test_lexical_index()
+    test_question_filters()
+    test_bounded_cache()
+    test_semantic_cache()
+    test_embedding_cache()
+    test_single_flight()
     
     print("=" * 60)
     print("🎊 모든 테스트 완료!")
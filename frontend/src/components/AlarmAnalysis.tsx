@@ -3,8 +3,8 @@
  */
 
 import React, { useState, useEffect } from 'react';
-import { getLatestAlarm, analyzeAlarm } from '../services/api';
-import { AlarmAnalyzeResponse } from '../types';
+import { getLatestAlarm, analyzeAlarmStream } from '../services/api';
+import { AlarmAnalyzeResponse, NodeProgressEvent } from '../types';
 import LoadingSpinner from './LoadingSpinner';
 import ReportViewer from './ReportViewer';
 import AnalysisProgress from './AnalysisProgress';
@@ -13,6 +13,8 @@ const AlarmAnalysis: React.FC = () => {
   const [latestAlarm, setLatestAlarm] = useState<any>(null);
   const [analysisResult, setAnalysisResult] = useState<AlarmAnalyzeResponse | null>(null);
   const [loading, setLoading] = useState(false);
+  const [currentNode, setCurrentNode] = useState<string | null>(null);
+  const [streamingReport, setStreamingReport] = useState('');
   const [error, setError] = useState<string | null>(null);
   const [showReport, setShowReport] = useState(false);
 
@@ -30,18 +32,36 @@ const AlarmAnalysis: React.FC = () => {
     }
   };
 
+  const handleProgress = (event: NodeProgressEvent) => {
+    if (event.event === 'node_start') {
+      setCurrentNode(event.node);
+    }
+  };
+
+  const handleToken = (text: string) => {
+    setStreamingReport((prev) => prev + text);
+  };
+
   const handleAnalyze = async () => {
     if (!latestAlarm) return;
 
     setLoading(true);
+    setCurrentNode(null);
+    setStreamingReport('');
     setError(null);
 
     try {
-      const result = await analyzeAlarm();
+      const result = await analyzeAlarmStream(
+        handleProgress,
+        undefined,
+        undefined,
+        undefined,
+        handleToken
+      );
       setAnalysisResult(result);
     } catch (err: any) {
       console.error('알람 분석 실패:', err);
-      setError(err.response?.data?.detail || '알람 분석에 실패했습니다.');
+      setError(err.response?.data?.detail || err.message || '알람 분석에 실패했습니다.');
     } finally {
       setLoading(false);
     }
@@ -99,7 +119,22 @@ const AlarmAnalysis: React.FC = () => {
       </div>
 
       {/* 진행 상태 (LoadingSpinner 대체) */}
-      <AnalysisProgress isAnalyzing={loading} />
+      <AnalysisProgress isAnalyzing={loading} currentNode={currentNode} />
+
+      {/* 작성 중인 리포트 (Node 8 스트리밍) */}
+      {loading && streamingReport && (
+        <div className="card">
+          <div className="card-header">
+            <h2 className="card-title">
+              <span>✍️</span>
+              리포트 작성 중
+            </h2>
+          </div>
+          <div className="card-body">
+            <ReportViewer report={streamingReport} />
+          </div>
+        </div>
+      )}
 
       {/* 에러 */}
       {error && (
@@ -3,8 +3,8 @@
  */
 
 import React, { useState } from 'react';
-import { analyzeAlarm } from '../services/api';
-import { AlarmAnalyzeResponse } from '../types';
+import { analyzeAlarmStream } from '../services/api';
+import { AlarmAnalyzeResponse, NodeProgressEvent } from '../types';
 import LoadingSpinner from './LoadingSpinner';
 import ReportViewer from './ReportViewer';
 import AnalysisProgress from './AnalysisProgress';
@@ -29,15 +29,35 @@ const AlarmHistory: React.FC = () => {
   const [selectedAlarm, setSelectedAlarm] = useState<any>(null);
   const [analysisResult, setAnalysisResult] = useState<AlarmAnalyzeResponse | null>(null);
   const [loading, setLoading] = useState(false);
+  const [currentNode, setCurrentNode] = useState<string | null>(null);
+  const [streamingReport, setStreamingReport] = useState('');
   const [showReport, setShowReport] = useState(false);
 
+  const handleProgress = (event: NodeProgressEvent) => {
+    if (event.event === 'node_start') {
+      setCurrentNode(event.node);
+    }
+  };
+
+  const handleToken = (text: string) => {
+    setStreamingReport((prev) => prev + text);
+  };
+
   const handleAnalyzeHistory = async (alarm: any) => {
     setSelectedAlarm(alarm);
     setLoading(true);
+    setCurrentNode(null);
+    setStreamingReport('');
     setShowReport(false);
 
     try {
-      const result = await analyzeAlarm(alarm.date, alarm.eqp_id, alarm.kpi);
+      const result = await analyzeAlarmStream(
+        handleProgress,
+        alarm.date,
+        alarm.eqp_id,
+        alarm.kpi,
+        handleToken
+      );
       setAnalysisResult(result);
     } catch (err: any) {
       console.error('과거 알람 분석 실패:', err);
@@ -95,7 +115,22 @@ const AlarmHistory: React.FC = () => {
       </div>
 
       {/* 로딩 */}
-      <AnalysisProgress isAnalyzing={loading} />
+      <AnalysisProgress isAnalyzing={loading} currentNode={currentNode} />
+
+      {/* 작성 중인 리포트 (Node 8 스트리밍) */}
+      {loading && streamingReport && (
+        <div className="card">
+          <div className="card-header">
+            <h2 className="card-title">
+              <span>✍️</span>
+              리포트 작성 중
+            </h2>
+          </div>
+          <div className="card-body">
+            <ReportViewer report={streamingReport} />
+          </div>
+        </div>
+      )}
 
       {/* 선택된 알람 분석 결과 */}
       {analysisResult && !loading && (
@@ -2,58 +2,26 @@
  * 분석 진행 상태 표시 컴포넌트
  */
 
-import React, { useState, useEffect } from 'react';
+import React from 'react';
 
 interface AnalysisProgressProps {
   isAnalyzing: boolean;
+  currentNode?: string | null;
 }
 
-const AnalysisProgress: React.FC<AnalysisProgressProps> = ({ isAnalyzing }) => {
-  const [currentStep, setCurrentStep] = useState(0);
-  const [progress, setProgress] = useState(0);
-
+const AnalysisProgress: React.FC<AnalysisProgressProps> = ({ isAnalyzing, currentNode }) => {
+  // 각 단계에 해당하는 워크플로우 노드 (서버 SSE node_start 이벤트 기준)
   const steps = [
-    { icon: '📊', label: 'KPI 데이터 조회', duration: 2000 },
-    { icon: '🔍', label: '컨텍스트 수집', duration: 3000 },
-    { icon: '🤖', label: 'AI 근본 원인 분석', duration: 25000 },
-    { icon: '📝', label: '리포트 생성', duration: 15000 },
-    { icon: '💾', label: 'RAG 저장', duration: 2000 },
+    { icon: '📊', label: 'KPI 데이터 조회', nodes: ['node_1', 'node_2'] },
+    { icon: '🔍', label: '컨텍스트 수집', nodes: ['node_3'] },
+    { icon: '🤖', label: 'AI 근본 원인 분석', nodes: ['node_6', 'node_7'] },
+    { icon: '📝', label: '리포트 생성', nodes: ['node_8'] },
+    { icon: '💾', label: 'RAG 저장', nodes: ['node_9'] },
   ];
 
-  useEffect(() => {
-    if (!isAnalyzing) {
-      setCurrentStep(0);
-      setProgress(0);
-      return;
-    }
-
-    let stepIndex = 0;
-    let accumulatedTime = 0;
-    const totalDuration = steps.reduce((sum, step) => sum + step.duration, 0);
-
-    const timer = setInterval(() => {
-      accumulatedTime += 100;
-      const newProgress = Math.min((accumulatedTime / totalDuration) * 100, 100);
-      setProgress(newProgress);
-
-      // 다음 단계로 이동
-      let stepDuration = 0;
-      for (let i = 0; i <= stepIndex; i++) {
-        stepDuration += steps[i].duration;
-      }
-
-      if (accumulatedTime > stepDuration && stepIndex < steps.length - 1) {
-        stepIndex++;
-        setCurrentStep(stepIndex);
-      }
-
-      if (accumulatedTime >= totalDuration) {
-        clearInterval(timer);
-      }
-    }, 100);
-
-    return () => clearInterval(timer);
-  }, [isAnalyzing]);
+  const nodeStep = steps.findIndex((step) => currentNode && step.nodes.includes(currentNode));
+  const currentStep = nodeStep >= 0 ? nodeStep : 0;
+  const progress = (currentStep / steps.length) * 100;
 
   if (!isAnalyzing) return null;
 
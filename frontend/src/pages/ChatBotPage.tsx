@@ -3,7 +3,7 @@
  */
 
 import React, { useState, useRef, useEffect } from 'react';
-import { askQuestion } from '../services/api';
+import { askQuestionStream } from '../services/api';
 import { ChatMessage } from '../types';
 import LoadingSpinner from '../components/LoadingSpinner';
 import TypingIndicator from '../components/TypingIndicator';
@@ -39,17 +39,43 @@ const ChatBotPage: React.FC = () => {
     setInput('');
     setLoading(true);
 
-    try {
-      const response = await askQuestion(input.trim());
-
-      const assistantMessage: ChatMessage = {
-        id: (Date.now() + 1).toString(),
-        role: 'assistant',
-        content: response.answer,
-        timestamp: new Date(),
-      };
+    // 답변 메시지를 먼저 만들고 토큰이 도착할 때마다 내용을 이어 붙임
+    const assistantId = (Date.now() + 1).toString();
+    let streamStarted = false;
+
+    const appendToken = (text: string) => {
+      if (!streamStarted) {
+        streamStarted = true;
+        setLoading(false);
+        setMessages((prev) => [
+          ...prev,
+          { id: assistantId, role: 'assistant', content: text, timestamp: new Date() },
+        ]);
+        return;
+      }
+      setMessages((prev) =>
+        prev.map((m) => (m.id === assistantId ? { ...m, content: m.content + text } : m))
+      );
+    };
 
-      setMessages((prev) => [...prev, assistantMessage]);
+    try {
+      const response = await askQuestionStream(input.trim(), appendToken);
+
+      // 스트림이 끝나면 최종 답변으로 정리
+      if (streamStarted) {
+        setMessages((prev) =>
+          prev.map((m) => (m.id === assistantId ? { ...m, content: response.answer } : m))
+        );
+      } else {
+        const assistantMessage: ChatMessage = {
+          id: assistantId,
+          role: 'assistant',
+          content: response.answer,
+          timestamp: new Date(),
+        };
+
+        setMessages((prev) => [...prev, assistantMessage]);
+      }
     } catch (error: any) {
       const errorMessage: ChatMessage = {
         id: (Date.now() + 1).toString(),
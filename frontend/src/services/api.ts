@@ -5,6 +5,7 @@
 import axios from 'axios';
 import {
   AlarmAnalyzeResponse,
+  NodeProgressEvent,
   QuestionResponse,
   LatestAlarmResponse,
 } from '../types';
@@ -46,6 +47,53 @@ export const analyzeAlarm = async (
   return response.data;
 };
 
+/**
+ * 알람 분석 (SSE로 노드별 진행 상황과 리포트 토큰 수신)
+ */
+export const analyzeAlarmStream = (
+  onProgress: (event: NodeProgressEvent) => void,
+  alarmDate?: string,
+  alarmEqpId?: string,
+  alarmKpi?: string,
+  onToken?: (text: string) => void
+): Promise<AlarmAnalyzeResponse> => {
+  const params = new URLSearchParams();
+  if (alarmDate) params.append('alarm_date', alarmDate);
+  if (alarmEqpId) params.append('alarm_eqp_id', alarmEqpId);
+  if (alarmKpi) params.append('alarm_kpi', alarmKpi);
+
+  return new Promise((resolve, reject) => {
+    const source = new EventSource(
+      `${API_BASE_URL}/alarm/analyze/stream?${params.toString()}`
+    );
+
+    const handleProgress = (e: MessageEvent) => {
+      const data = JSON.parse(e.data);
+      onProgress({ event: e.type as NodeProgressEvent['event'], ...data });
+    };
+
+    source.addEventListener('node_start', handleProgress as EventListener);
+    source.addEventListener('node_end', handleProgress as EventListener);
+
+    // Node 8 리포트 텍스트 조각
+    source.addEventListener('token', ((e: MessageEvent) => {
+      onToken?.(JSON.parse(e.data).text);
+    }) as EventListener);
+
+    source.addEventListener('result', ((e: MessageEvent) => {
+      source.close();
+      resolve(JSON.parse(e.data).data);
+    }) as EventListener);
+
+    source.addEventListener('error', ((e: MessageEvent) => {
+      source.close();
+      // 서버가 보낸 error 이벤트에는 data가 있고, 연결 오류에는 없음
+      const detail = e.data ? JSON.parse(e.data).detail : '서버 연결이 끊어졌습니다.';
+      reject(new Error(detail));
+    }) as EventListener);
+  });
+};
+
 /**
  * 질문 답변
  */
@@ -59,6 +107,60 @@ export const askQuestion = async (
   return response.data;
 };
 
+/**
+ * 질문 답변 (SSE로 답변 토큰 수신)
+ */
+export const askQuestionStream = async (
+  question: string,
+  onToken: (text: string) => void
+): Promise<QuestionResponse> => {
+  const response = await fetch(`${API_BASE_URL}/question/answer/stream`, {
+    method: 'POST',
+    headers: { 'Content-Type': 'application/json' },
+    body: JSON.stringify({ question }),
+  });
+
+  if (!response.ok || !response.body) {
+    throw new Error(`질문 답변 실패 (HTTP ${response.status})`);
+  }
+
+  const reader = response.body.getReader();
+  const decoder = new TextDecoder();
+  let buffer = '';
+
+  while (true) {
+    const { done, value } = await reader.read();
+    if (done) break;
+
+    buffer += decoder.decode(value, { stream: true });
+
+    // SSE 메시지는 빈 줄(\n\n)로 구분
+    let boundary = buffer.indexOf('\n\n');
+    while (boundary >= 0) {
+      const message = buffer.slice(0, boundary);
+      buffer = buffer.slice(boundary + 2);
+      boundary = buffer.indexOf('\n\n');
+
+      const eventLine = message.split('\n').find((line) => line.startsWith('event: '));
+      const dataLine = message.split('\n').find((line) => line.startsWith('data: '));
+      if (!eventLine || !dataLine) continue;
+
+      const event = eventLine.slice('event: '.length);
+      const data = JSON.parse(dataLine.slice('data: '.length));
+
+      if (event === 'token') {
+        onToken(data.text);
+      } else if (event === 'result') {
+        return data.data;
+      } else if (event === 'error') {
+        throw new Error(data.detail);
+      }
+    }
+  }
+
+  throw new Error('답변 스트림이 예기치 않게 종료되었습니다.');
+};
+
 /**
  * 헬스체크
  */
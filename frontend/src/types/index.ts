@@ -23,9 +23,21 @@ export interface AlarmAnalyzeResponse {
   processing_time?: number;
 }
 
+export interface NodeProgressEvent {
+  event: 'node_start' | 'node_end';
+  node: string;
+  elapsed_ms: number;
+  duration_ms?: number;
+  input_bytes?: number;
+  output_bytes?: number;
+  error?: string | null;
+}
+
 export interface SimilarReport {
   id: string;
-  distance: number;
+  distance?: number | null;
+  retrieval?: 'vector' | 'hybrid' | 'lexical' | 'exact' | null;
+  rrf_score?: number | null;
   metadata: {
     date: string;
     eqp_id: string;